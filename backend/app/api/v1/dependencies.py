@@ -0,0 +1,102 @@
+"""
+API v1 Dependencies
+Resolve and authorize sensors and gateways addressed in the request path
+"""
+
+from fastapi import Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.core.security import get_current_user
+from app.models.user import User
+from app.models.sensor import Sensor
+from app.api.v1.repositories.sensor_repository import SensorRepository
+from app.services.ownership import sensor_gateway_id, owns_gateway
+
+
+class OwnedSensorRef:
+    """ID and gateway ID of a sensor owned by the current user"""
+
+    def __init__(self, id: int, gateway_id: int):
+        self.id = id
+        self.gateway_id = gateway_id
+
+
+async def ensure_owned_sensor(db: AsyncSession, user: User, sensor_id: int) -> OwnedSensorRef:
+    """
+    Authorize access to a sensor through the ownership cache
+
+    Raises:
+        HTTPException: 404 if the sensor does not exist or is not the user's
+    """
+    gateway_id = await sensor_gateway_id(db, user.id, sensor_id)
+    if gateway_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Sensor not found"
+        )
+    return OwnedSensorRef(sensor_id, gateway_id)
+
+
+async def ensure_owned_gateway(db: AsyncSession, user: User, gateway_id: int) -> int:
+    """
+    Authorize access to a gateway through the ownership cache
+
+    Raises:
+        HTTPException: 404 if the gateway does not exist or is not the user's
+    """
+    if not await owns_gateway(db, user.id, gateway_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Gateway not found"
+        )
+    return gateway_id
+
+
+async def get_owned_sensor_ref(
+    sensor_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+) -> OwnedSensorRef:
+    """
+    FastAPI dependency authorizing the `{sensor_id}` path parameter
+
+    Usually answered from the ownership cache without a query; use it when
+    the route only needs the sensor's ID and gateway ID.
+    """
+    return await ensure_owned_sensor(db, current_user, sensor_id)
+
+
+async def get_owned_sensor(
+    sensor_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+) -> Sensor:
+    """
+    FastAPI dependency loading the `{sensor_id}` sensor of the current user
+
+    Sensor and gateway ownership are checked in one joined query.
+
+    Raises:
+        HTTPException: 404 if the sensor does not exist or is not the user's
+    """
+    sensors = await SensorRepository(db).get_owned_by_user([sensor_id], current_user.id)
+    if not sensors:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Sensor not found"
+        )
+    return sensors[0]
+
+
+async def get_owned_gateway_id(
+    gateway_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+) -> int:
+    """
+    FastAPI dependency authorizing the `{gateway_id}` path parameter
+
+    Usually answered from the ownership cache without a query.
+    """
+    return await ensure_owned_gateway(db, current_user, gateway_id)
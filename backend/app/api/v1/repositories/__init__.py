@@ -11,6 +11,11 @@ from app.api.v1.repositories.farmer_repository import FarmerRepository
 from app.api.v1.repositories.farm_repository import FarmRepository
 from app.api.v1.repositories.gateway_assignment_repository import GatewayAssignmentRepository
 from app.api.v1.repositories.gateway_status_history_repository import GatewayStatusHistoryRepository
+from app.api.v1.repositories.background_job_repository import BackgroundJobRepository
+from app.api.v1.repositories.measurement_type_repository import MeasurementTypeRepository
+from app.api.v1.repositories.sensor_data_daily_count_repository import SensorDataDailyCountRepository
+from app.api.v1.repositories.sensor_latest_repository import SensorLatestRepository
+
 
 __all__ = [
     "UserRepository",
@@ -21,4 +26,8 @@ __all__ = [
     "FarmRepository",
     "GatewayAssignmentRepository",
     "GatewayStatusHistoryRepository",
+    "BackgroundJobRepository",
+    "MeasurementTypeRepository",
+    "SensorDataDailyCountRepository",
+    "SensorLatestRepository",
 ]
@@ -0,0 +1,63 @@
+"""
+Background Job Repository
+Database operations for BackgroundJob model
+"""
+
+from typing import Optional
+from sqlalchemy import select, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.background_job import BackgroundJob
+from app.api.v1.repositories.base_repository import BaseRepository
+
+
+class BackgroundJobRepository(BaseRepository[BackgroundJob]):
+    """Repository for BackgroundJob model operations"""
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(BackgroundJob, db)
+
+    async def get_for_user(self, job_id: int, user_id: int) -> Optional[BackgroundJob]:
+        """
+        Get a job owned by a user
+
+        Args:
+            job_id: Job ID
+            user_id: User ID for authorization
+
+        Returns:
+            BackgroundJob instance or None
+        """
+        result = await self.db.execute(
+            select(BackgroundJob).where(
+                and_(
+                    BackgroundJob.id == job_id,
+                    BackgroundJob.user_id == user_id
+                )
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def get_active_for_target(self, kind: str, target_id: int) -> Optional[BackgroundJob]:
+        """
+        Get a pending or running job for the same target
+
+        Args:
+            kind: Job kind
+            target_id: Target entity ID
+
+        Returns:
+            BackgroundJob instance or None
+        """
+        result = await self.db.execute(
+            select(BackgroundJob)
+            .where(
+                and_(
+                    BackgroundJob.kind == kind,
+                    BackgroundJob.target_id == target_id,
+                    BackgroundJob.status.in_(["pending", "running"])
+                )
+            )
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
@@ -5,8 +5,11 @@ Abstract base class for all repositories following DRY principle
 
 from typing import Generic, TypeVar, Type, Optional, List, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, func
+from sqlalchemy import select, update, delete, func, literal_column, Select
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+import json
 import logging
 
 from app.models.base import Base
@@ -16,6 +19,20 @@ logger = logging.getLogger(__name__)
 ModelType = TypeVar("ModelType", bound=Base)
 
 
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) wrapper that keeps the statement's bound parameters"""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
 class BaseRepository(Generic[ModelType]):
     """
     Base repository with common CRUD operations
@@ -105,6 +122,32 @@ class BaseRepository(Generic[ModelType]):
             logger.error(f"Error counting {self.model.__name__}: {e}")
             raise
 
+    async def estimate_count(self, count_query: Select) -> int:
+        """
+        Estimate the result of a COUNT query from planner statistics
+
+        The count column is replaced by a constant and the query is only
+        planned, never executed, so the cost does not grow with the table.
+
+        Args:
+            count_query: select(func.count()) query with filters applied
+
+        Returns:
+            Planner row estimate
+        """
+        try:
+            rows_query = count_query.with_only_columns(
+                literal_column("1"), maintain_column_froms=True
+            )
+            result = await self.db.execute(_Explain(rows_query))
+            plan = result.scalar_one()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"])
+        except SQLAlchemyError as e:
+            logger.error(f"Error estimating {self.model.__name__} count: {e}")
+            raise
+
     async def create(self, **data) -> ModelType:
         """
         Create a new record
@@ -3,7 +3,7 @@ Gateway Repository
 Database operations for Gateway model
 """
 
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime, timedelta
 from sqlalchemy import select, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,6 +12,7 @@ from sqlalchemy.orm import selectinload
 from app.models.gateway import Gateway
 from app.models.sensor import Sensor
 from app.models.gateway_status_history import GatewayStatusHistory
+from app.models.gateway_assignment import GatewayAssignment
 from app.api.v1.repositories.base_repository import BaseRepository
 
 
@@ -79,7 +80,8 @@ class GatewayRepository(BaseRepository[Gateway]):
         self,
         user_id: int,
         status: Optional[str] = None,
-        search: Optional[str] = None
+        search: Optional[str] = None,
+        estimate: bool = False
     ) -> int:
         """
         Count gateways for a user with filters
@@ -88,6 +90,7 @@ class GatewayRepository(BaseRepository[Gateway]):
             user_id: User ID
             status: Filter by status
             search: Search in gateway name or UID
+            estimate: Return a planner estimate instead of an exact count
 
         Returns:
             Number of matching gateways
@@ -104,6 +107,9 @@ class GatewayRepository(BaseRepository[Gateway]):
                 (Gateway.gateway_uid.ilike(search_filter))
             )
 
+        if estimate:
+            return await self.estimate_count(query)
+
         result = await self.db.execute(query)
         return result.scalar_one()
 
@@ -172,6 +178,67 @@ class GatewayRepository(BaseRepository[Gateway]):
         )
         return [{"status": row.status, "count": row.count} for row in result.all()]
 
+    async def get_ids_by_user(self, user_id: int, gateway_ids: Optional[List[int]] = None) -> List[int]:
+        """
+        Get the IDs of a user's gateways
+
+        Args:
+            user_id: Owner user ID
+            gateway_ids: Only check these gateways (all of the user's if None)
+
+        Returns:
+            Owned gateway IDs
+        """
+        query = select(Gateway.id).where(Gateway.user_id == user_id)
+        if gateway_ids is not None:
+            query = query.where(Gateway.id.in_(gateway_ids))
+
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def get_owned_ids(self, user_id: int) -> List[Tuple[int, Optional[int]]]:
+        """
+        Get every gateway of a user with its sensors in one query
+
+        Args:
+            user_id: Owner user ID
+
+        Returns:
+            (gateway_id, sensor_id) pairs; sensor_id is None for gateways
+            without sensors
+        """
+        result = await self.db.execute(
+            select(Gateway.id, Sensor.id)
+            .outerjoin(Sensor, Sensor.gateway_id == Gateway.id)
+            .where(Gateway.user_id == user_id)
+        )
+        return [tuple(row) for row in result.all()]
+
+    async def get_ids_by_farm(self, farm_id: int, user_id: int) -> List[int]:
+        """
+        Get the IDs of a user's gateways actively assigned to a farm
+
+        Args:
+            farm_id: Farm ID
+            user_id: Owner user ID
+
+        Returns:
+            Gateway IDs
+        """
+        result = await self.db.execute(
+            select(Gateway.id)
+            .join(GatewayAssignment, GatewayAssignment.gateway_id == Gateway.id)
+            .where(
+                and_(
+                    Gateway.user_id == user_id,
+                    GatewayAssignment.farm_id == farm_id,
+                    GatewayAssignment.is_active == True
+                )
+            )
+            .distinct()
+        )
+        return list(result.scalars().all())
+
     async def get_offline_gateways(self, minutes: int = 5) -> List[Gateway]:
         """
         Get gateways that should be marked as offline
@@ -3,12 +3,13 @@ Gateway Status History Repository
 Database operations for GatewayStatusHistory model
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime, timedelta
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, and_, func, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.sync import SYNC_HORIZON, Watermark
 from app.models.gateway_status_history import GatewayStatusHistory
 from app.api.v1.repositories.base_repository import BaseRepository
 
@@ -25,7 +26,8 @@ class GatewayStatusHistoryRepository(BaseRepository[GatewayStatusHistory]):
         skip: int = 0,
         limit: int = 100,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        cursor: Optional[Tuple[datetime, int]] = None
     ) -> List[GatewayStatusHistory]:
         """
         Get status history for a specific gateway
@@ -36,6 +38,8 @@ class GatewayStatusHistoryRepository(BaseRepository[GatewayStatusHistory]):
             limit: Maximum number of records
             start_date: Filter records after this date
             end_date: Filter records before this date
+            cursor: (created_at, id) of the last row of the previous page;
+                when given, skip is ignored and rows after the cursor are returned
 
         Returns:
             List of GatewayStatusHistory instances
@@ -50,8 +54,15 @@ class GatewayStatusHistoryRepository(BaseRepository[GatewayStatusHistory]):
         if end_date:
             query = query.where(GatewayStatusHistory.created_at <= end_date)
 
+        if cursor:
+            query = query.where(
+                tuple_(GatewayStatusHistory.created_at, GatewayStatusHistory.id) < tuple_(*cursor)
+            )
+            skip = 0
+
         query = query.order_by(
-            GatewayStatusHistory.created_at.desc()
+            GatewayStatusHistory.created_at.desc(),
+            GatewayStatusHistory.id.desc()
         ).offset(skip).limit(limit)
 
         result = await self.db.execute(query)
@@ -61,7 +72,8 @@ class GatewayStatusHistoryRepository(BaseRepository[GatewayStatusHistory]):
         self,
         gateway_id: int,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        estimate: bool = False
     ) -> int:
         """
         Count status history records for a gateway
@@ -70,6 +82,7 @@ class GatewayStatusHistoryRepository(BaseRepository[GatewayStatusHistory]):
             gateway_id: Gateway ID
             start_date: Filter records after this date
             end_date: Filter records before this date
+            estimate: Return a planner estimate instead of an exact count
 
         Returns:
             Number of history records
@@ -84,6 +97,9 @@ class GatewayStatusHistoryRepository(BaseRepository[GatewayStatusHistory]):
         if end_date:
             query = query.where(GatewayStatusHistory.created_at <= end_date)
 
+        if estimate:
+            return await self.estimate_count(query)
+
         result = await self.db.execute(query)
         return result.scalar_one()
 
@@ -238,3 +254,48 @@ class GatewayStatusHistoryRepository(BaseRepository[GatewayStatusHistory]):
             .limit(limit)
         )
         return list(result.scalars().all())
+
+    async def get_changes_by_gateway_ids(
+        self,
+        gateway_ids: List[int],
+        since: Optional[Watermark] = None,
+        since_ts: Optional[datetime] = None,
+        limit: int = 100
+    ) -> List[Tuple[GatewayStatusHistory, int]]:
+        """
+        Get status changes added after a sync watermark, in sync order
+
+        Ordered by (xact_id, id) and limited to transactions below
+        SYNC_HORIZON, so a change committed late with a lower ID is never
+        skipped (see app.core.sync).
+
+        Args:
+            gateway_ids: List of gateway IDs
+            since: Only records after this (xact_id, id) position (the client's watermark)
+            since_ts: Only records created later (initial sync without a watermark)
+            limit: Maximum number of records
+
+        Returns:
+            List of (GatewayStatusHistory, xact_id) pairs in sync order
+            with gateway relationship loaded
+        """
+        if not gateway_ids:
+            return []
+
+        query = (
+            select(GatewayStatusHistory)
+            .options(selectinload(GatewayStatusHistory.gateway))
+            .where(GatewayStatusHistory.gateway_id.in_(gateway_ids))
+            .where(GatewayStatusHistory.xact_id < SYNC_HORIZON)
+        )
+
+        if since is not None:
+            query = query.where(tuple_(GatewayStatusHistory.xact_id, GatewayStatusHistory.id) > since)
+
+        if since_ts is not None:
+            query = query.where(GatewayStatusHistory.created_at > since_ts)
+
+        result = await self.db.execute(
+            query.order_by(GatewayStatusHistory.xact_id, GatewayStatusHistory.id).limit(limit)
+        )
+        return [(change, change.xact_id) for change in result.scalars().all()]
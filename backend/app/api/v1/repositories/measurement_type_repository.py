@@ -0,0 +1,62 @@
+"""
+Measurement Type Repository
+Database operations for MeasurementType model
+"""
+
+from typing import List, Iterable, Optional
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.measurement_type import MeasurementType
+from app.api.v1.repositories.base_repository import BaseRepository
+
+
+class MeasurementTypeRepository(BaseRepository[MeasurementType]):
+    """Repository for MeasurementType model operations"""
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(MeasurementType, db)
+
+    async def search(self, term: str, limit: int = 20) -> List[str]:
+        """
+        Find measurement type names matching a free-text term
+
+        The ILIKE predicate is served by the trigram index on name;
+        results are ranked by trigram similarity.
+
+        Args:
+            term: Free-text search term
+            limit: Maximum number of names
+
+        Returns:
+            Matching measurement type names, best match first
+        """
+        escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        result = await self.db.execute(
+            select(MeasurementType.name)
+            .where(MeasurementType.name.ilike(f"%{escaped}%"))
+            .order_by(
+                func.similarity(MeasurementType.name, term).desc(),
+                MeasurementType.name
+            )
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def register(self, names: Iterable[Optional[str]]):
+        """
+        Add measurement types that are not yet in the dictionary
+
+        Args:
+            names: Measurement type names (None values are ignored)
+        """
+        values = [{"name": name} for name in sorted({n for n in names if n})]
+        if not values:
+            return
+
+        await self.db.execute(
+            pg_insert(MeasurementType)
+            .values(values)
+            .on_conflict_do_nothing(index_elements=["name"])
+        )
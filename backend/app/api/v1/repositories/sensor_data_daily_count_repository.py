@@ -0,0 +1,74 @@
+"""
+Sensor Data Daily Count Repository
+Database operations for SensorDataDailyCount model
+"""
+
+from collections import Counter
+from datetime import date, datetime
+from typing import Dict, Iterable
+from sqlalchemy import select, func, and_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.gateway import Gateway
+from app.models.sensor_data_daily_count import SensorDataDailyCount
+from app.api.v1.repositories.base_repository import BaseRepository
+
+
+class SensorDataDailyCountRepository(BaseRepository[SensorDataDailyCount]):
+    """Repository for SensorDataDailyCount model operations"""
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(SensorDataDailyCount, db)
+
+    async def increment(self, gateway_id: int, timestamps: Iterable[datetime]):
+        """
+        Add readings to the daily counters of a gateway (committed by the caller)
+
+        Args:
+            gateway_id: Gateway ID
+            timestamps: Timestamps of the inserted readings
+        """
+        per_day = Counter(timestamp.date() for timestamp in timestamps)
+        if not per_day:
+            return
+
+        statement = pg_insert(SensorDataDailyCount).values([
+            {"gateway_id": gateway_id, "day": day, "readings": readings, "updated_at": datetime.utcnow()}
+            for day, readings in sorted(per_day.items())
+        ])
+        await self.db.execute(
+            statement.on_conflict_do_update(
+                index_elements=["gateway_id", "day"],
+                set_={
+                    "readings": SensorDataDailyCount.readings + statement.excluded.readings,
+                    "updated_at": statement.excluded.updated_at,
+                }
+            )
+        )
+
+    async def get_daily_for_user(self, user_id: int, start_day: date, end_day: date) -> Dict[date, int]:
+        """
+        Sum the counters of all gateways of a user per day
+
+        Args:
+            user_id: Owner user ID
+            start_day: First day (inclusive)
+            end_day: Last day (inclusive)
+
+        Returns:
+            Map of day to number of readings (days without readings are left out)
+        """
+        result = await self.db.execute(
+            select(SensorDataDailyCount.day, func.sum(SensorDataDailyCount.readings))
+            .join(Gateway, Gateway.id == SensorDataDailyCount.gateway_id)
+            .where(
+                and_(
+                    Gateway.user_id == user_id,
+                    SensorDataDailyCount.day >= start_day,
+                    SensorDataDailyCount.day <= end_day
+                )
+            )
+            .group_by(SensorDataDailyCount.day)
+        )
+        return {day: int(readings) for day, readings in result.all()}
@@ -3,17 +3,33 @@ Sensor Data Repository
 Database operations for SensorData model
 """
 
-from typing import Optional, List
+import asyncio
+from typing import AsyncIterator, Optional, List, Sequence, Tuple
 from datetime import datetime, timedelta
-from sqlalchemy import select, func, and_, desc, or_, cast, String
+from heapq import merge
+from itertools import islice
+from sqlalchemy import select, func, and_, desc, tuple_, bindparam, cast, Float, Interval, DateTime
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.sensor_data import SensorData
-from app.models.sensor import Sensor
+from app.core.sync import SYNC_HORIZON, Watermark
+from app.models.sensor_data import SensorData, SensorReading, READING_COLUMNS
 from app.models.gateway import Gateway
 from app.models.gateway_assignment import GatewayAssignment
 from app.models.farm import Farm
+from app.models.sensor_data_archive import SensorDataArchive
 from app.api.v1.repositories.base_repository import BaseRepository
+from app.services.sensor_data_archive import (
+    range_reaches_archive,
+    fetch_archived_rows,
+    count_archived_rows,
+    archived_statistics,
+    archived_buckets,
+    iter_archived_values,
+)
+from app.services.sensor_series import BUCKET_ORIGIN, BucketMap, merge_buckets
+
+# sensor_data columns loaded by copy_readings, in tuple order
+COPY_COLUMNS = ("sensor_id", "gateway_id", "value", "unit", "metadata", "timestamp")
 
 
 class SensorDataRepository(BaseRepository[SensorData]):
@@ -29,10 +45,14 @@ class SensorDataRepository(BaseRepository[SensorData]):
         limit: int = 100,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-        search: Optional[str] = None,
+        measurement_types: Optional[List[str]] = None,
+        value_min: Optional[float] = None,
+        value_max: Optional[float] = None,
+        tag: Optional[str] = None,
         farmer_id: Optional[int] = None,
-        farm_id: Optional[int] = None
-    ) -> List[SensorData]:
+        farm_id: Optional[int] = None,
+        cursor: Optional[Tuple[datetime, int]] = None
+    ) -> List[SensorReading]:
         """
         Get sensor data for a specific sensor
 
@@ -42,23 +62,23 @@ class SensorDataRepository(BaseRepository[SensorData]):
             limit: Maximum number of records
             start_date: Start date filter
             end_date: End date filter
-            search: Search term for measurement type, sensor name, or value
+            measurement_types: Only readings of these measurement types
+            value_min: Minimum value (inclusive)
+            value_max: Maximum value (inclusive)
+            tag: Exact source tag (e.g. "SEM225:Temperature")
             farmer_id: Filter by farmer ID
             farm_id: Filter by farm ID
+            cursor: (timestamp, id) of the last row of the previous page;
+                when given, skip is ignored and rows after the cursor are returned
 
         Returns:
-            List of SensorData instances
+            List of SensorReading rows
         """
         # Determine which joins we need
-        need_sensor_join = search is not None
         need_assignment_join = farmer_id is not None or farm_id is not None
 
         # Build base query
-        query = select(SensorData).where(SensorData.sensor_id == sensor_id)
-
-        # Join with Sensor if search is needed
-        if need_sensor_join:
-            query = query.join(Sensor, SensorData.sensor_id == Sensor.id)
+        query = select(*READING_COLUMNS).where(SensorData.sensor_id == sensor_id)
 
         # Join with GatewayAssignment and Farm if farmer_id or farm_id filter is needed
         if need_assignment_join:
@@ -77,33 +97,9 @@ class SensorDataRepository(BaseRepository[SensorData]):
         if end_date:
             query = query.where(SensorData.timestamp <= end_date)
 
-        if search:
-            search_term = f"%{search.lower()}%"
-            search_filters = []
-
-            # Search in measurement_type from metadata JSONB field (using ->> operator)
-            search_filters.append(
-                func.lower(
-                    func.coalesce(SensorData.metadata_['measurement_type'].astext, '')
-                ).like(search_term)
-            )
-
-            # Search in sensor name (if not null)
-            search_filters.append(
-                func.lower(func.coalesce(Sensor.name, '')).like(search_term)
-            )
-
-            # Search in sensor_uid
-            search_filters.append(
-                func.lower(Sensor.sensor_uid).like(search_term)
-            )
-
-            # Search in value (convert float to string)
-            search_filters.append(
-                cast(SensorData.value, String).like(search_term)
-            )
-
-            query = query.where(or_(*search_filters))
+        query = self._apply_reading_filters(
+            query, measurement_types, value_min, value_max, tag
+        )
 
         if farmer_id is not None:
             query = query.where(Farm.farmer_id == farmer_id)
@@ -111,11 +107,37 @@ class SensorDataRepository(BaseRepository[SensorData]):
         if farm_id is not None:
             query = query.where(Farm.id == farm_id)
 
-        query = query.order_by(desc(SensorData.timestamp))
-        query = query.offset(skip).limit(limit)
+        if cursor:
+            query = query.where(self._after_cursor(cursor))
+            skip = 0
 
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+        query = query.order_by(desc(SensorData.timestamp), desc(SensorData.id))
+
+        archive_paths = await self._get_archive_paths(
+            sensor_id=sensor_id,
+            start_date=start_date,
+            end_date=self._cursor_upper_bound(end_date, cursor)
+        )
+        if not archive_paths:
+            result = await self.db.execute(query.offset(skip).limit(limit))
+            return self._readings(result)
+
+        # Hot and cold rows can interleave, so take the first skip+limit of each
+        result = await self.db.execute(query.limit(skip + limit))
+        hot_rows = self._readings(result)
+        cold_rows = await fetch_archived_rows(
+            archive_paths,
+            limit=skip + limit,
+            before=cursor,
+            measurement_types=measurement_types,
+            value_min=value_min,
+            value_max=value_max,
+            tag=tag,
+            **await self._get_archive_filters(
+                sensor_id, start_date, end_date, farmer_id, farm_id
+            )
+        )
+        return self._merge_newest_first(hot_rows, cold_rows, skip, limit)
 
     async def get_by_gateway(
         self,
@@ -123,8 +145,9 @@ class SensorDataRepository(BaseRepository[SensorData]):
         skip: int = 0,
         limit: int = 100,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
-    ) -> List[SensorData]:
+        end_date: Optional[datetime] = None,
+        cursor: Optional[Tuple[datetime, int]] = None
+    ) -> List[SensorReading]:
         """
         Get sensor data for a specific gateway
 
@@ -134,11 +157,13 @@ class SensorDataRepository(BaseRepository[SensorData]):
             limit: Maximum number of records
             start_date: Start date filter
             end_date: End date filter
+            cursor: (timestamp, id) of the last row of the previous page;
+                when given, skip is ignored and rows after the cursor are returned
 
         Returns:
-            List of SensorData instances
+            List of SensorReading rows
         """
-        query = select(SensorData).where(SensorData.gateway_id == gateway_id)
+        query = select(*READING_COLUMNS).where(SensorData.gateway_id == gateway_id)
 
         if start_date:
             query = query.where(SensorData.timestamp >= start_date)
@@ -146,20 +171,91 @@ class SensorDataRepository(BaseRepository[SensorData]):
         if end_date:
             query = query.where(SensorData.timestamp <= end_date)
 
-        query = query.order_by(desc(SensorData.timestamp))
-        query = query.offset(skip).limit(limit)
+        if cursor:
+            query = query.where(self._after_cursor(cursor))
+            skip = 0
 
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+        query = query.order_by(desc(SensorData.timestamp), desc(SensorData.id))
+
+        archive_paths = await self._get_archive_paths(
+            gateway_id=gateway_id,
+            start_date=start_date,
+            end_date=self._cursor_upper_bound(end_date, cursor)
+        )
+        if not archive_paths:
+            result = await self.db.execute(query.offset(skip).limit(limit))
+            return self._readings(result)
+
+        result = await self.db.execute(query.limit(skip + limit))
+        hot_rows = self._readings(result)
+        cold_rows = await fetch_archived_rows(
+            archive_paths,
+            limit=skip + limit,
+            gateway_id=gateway_id,
+            start_date=start_date,
+            end_date=end_date,
+            before=cursor
+        )
+        return self._merge_newest_first(hot_rows, cold_rows, skip, limit)
+
+    async def get_changes_by_sensor(
+        self,
+        sensor_id: int,
+        since: Optional[Watermark] = None,
+        since_ts: Optional[datetime] = None,
+        measurement_types: Optional[List[str]] = None,
+        limit: int = 1000
+    ) -> List[Tuple[SensorReading, int]]:
+        """
+        Get readings of a sensor added after a sync watermark, in sync order
+
+        Ordered by (xact_id, id) over the (sensor_id, xact_id, id) index and
+        limited to transactions below SYNC_HORIZON, so a reading committed
+        late with a lower ID is never skipped (see app.core.sync). A poll with
+        nothing new is a single empty index range probe. Newly inserted rows
+        are never archived, so only Postgres is read.
+
+        Args:
+            sensor_id: Sensor ID
+            since: Only rows after this (xact_id, id) position (the client's watermark)
+            since_ts: Only rows with a later timestamp (initial sync without a watermark)
+            measurement_types: Only readings of these measurement types
+            limit: Maximum number of records
+
+        Returns:
+            List of (SensorReading, xact_id) pairs in sync order
+        """
+        query = (
+            select(*READING_COLUMNS, SensorData.xact_id)
+            .where(SensorData.sensor_id == sensor_id)
+            .where(SensorData.xact_id < SYNC_HORIZON)
+        )
+
+        if since is not None:
+            query = query.where(tuple_(SensorData.xact_id, SensorData.id) > since)
+
+        if since_ts is not None:
+            query = query.where(SensorData.timestamp > since_ts)
+
+        query = self._apply_reading_filters(query, measurement_types, None, None, None)
+
+        result = await self.db.execute(
+            query.order_by(SensorData.xact_id, SensorData.id).limit(limit)
+        )
+        return [(SensorReading._make(row[:-1]), row[-1]) for row in result.tuples()]
 
     async def count_by_sensor(
         self,
         sensor_id: int,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-        search: Optional[str] = None,
+        measurement_types: Optional[List[str]] = None,
+        value_min: Optional[float] = None,
+        value_max: Optional[float] = None,
+        tag: Optional[str] = None,
         farmer_id: Optional[int] = None,
-        farm_id: Optional[int] = None
+        farm_id: Optional[int] = None,
+        estimate: bool = False
     ) -> int:
         """
         Count sensor data for a sensor
@@ -168,24 +264,24 @@ class SensorDataRepository(BaseRepository[SensorData]):
             sensor_id: Sensor ID
             start_date: Start date filter
             end_date: End date filter
-            search: Search term for measurement type, sensor name, or value
+            measurement_types: Only readings of these measurement types
+            value_min: Minimum value (inclusive)
+            value_max: Maximum value (inclusive)
+            tag: Exact source tag (e.g. "SEM225:Temperature")
             farmer_id: Filter by farmer ID
             farm_id: Filter by farm ID
+            estimate: Return a planner estimate (plus archive manifest row
+                counts) instead of an exact count
 
         Returns:
             Number of matching records
         """
         # Determine which joins we need
-        need_sensor_join = search is not None
         need_assignment_join = farmer_id is not None or farm_id is not None
 
         # Build base query
         query = select(func.count()).select_from(SensorData).where(SensorData.sensor_id == sensor_id)
 
-        # Join with Sensor if search is needed
-        if need_sensor_join:
-            query = query.join(Sensor, SensorData.sensor_id == Sensor.id)
-
         # Join with GatewayAssignment and Farm if farmer_id or farm_id filter is needed
         if need_assignment_join:
             query = query.join(
@@ -203,33 +299,9 @@ class SensorDataRepository(BaseRepository[SensorData]):
         if end_date:
             query = query.where(SensorData.timestamp <= end_date)
 
-        if search:
-            search_term = f"%{search.lower()}%"
-            search_filters = []
-
-            # Search in measurement_type from metadata JSONB field (using ->> operator)
-            search_filters.append(
-                func.lower(
-                    func.coalesce(SensorData.metadata_['measurement_type'].astext, '')
-                ).like(search_term)
-            )
-
-            # Search in sensor name (if not null)
-            search_filters.append(
-                func.lower(func.coalesce(Sensor.name, '')).like(search_term)
-            )
-
-            # Search in sensor_uid
-            search_filters.append(
-                func.lower(Sensor.sensor_uid).like(search_term)
-            )
-
-            # Search in value (convert float to string)
-            search_filters.append(
-                cast(SensorData.value, String).like(search_term)
-            )
-
-            query = query.where(or_(*search_filters))
+        query = self._apply_reading_filters(
+            query, measurement_types, value_min, value_max, tag
+        )
 
         if farmer_id is not None:
             query = query.where(Farm.farmer_id == farmer_id)
@@ -237,14 +309,37 @@ class SensorDataRepository(BaseRepository[SensorData]):
         if farm_id is not None:
             query = query.where(Farm.id == farm_id)
 
+        if estimate:
+            return await self.estimate_count(query) + await self._estimate_archived_rows(
+                sensor_id=sensor_id, start_date=start_date, end_date=end_date
+            )
+
         result = await self.db.execute(query)
-        return result.scalar_one()
+        total = result.scalar_one()
+
+        archive_paths = await self._get_archive_paths(
+            sensor_id=sensor_id, start_date=start_date, end_date=end_date
+        )
+        if archive_paths:
+            total += await count_archived_rows(
+                archive_paths,
+                measurement_types=measurement_types,
+                value_min=value_min,
+                value_max=value_max,
+                tag=tag,
+                **await self._get_archive_filters(
+                    sensor_id, start_date, end_date, farmer_id, farm_id
+                )
+            )
+
+        return total
 
     async def count_by_gateway(
         self,
         gateway_id: int,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        estimate: bool = False
     ) -> int:
         """
         Count sensor data for a gateway
@@ -253,6 +348,8 @@ class SensorDataRepository(BaseRepository[SensorData]):
             gateway_id: Gateway ID
             start_date: Start date filter
             end_date: End date filter
+            estimate: Return a planner estimate (plus archive manifest row
+                counts) instead of an exact count
 
         Returns:
             Number of matching records
@@ -265,8 +362,26 @@ class SensorDataRepository(BaseRepository[SensorData]):
         if end_date:
             query = query.where(SensorData.timestamp <= end_date)
 
+        if estimate:
+            return await self.estimate_count(query) + await self._estimate_archived_rows(
+                gateway_id=gateway_id, start_date=start_date, end_date=end_date
+            )
+
         result = await self.db.execute(query)
-        return result.scalar_one()
+        total = result.scalar_one()
+
+        archive_paths = await self._get_archive_paths(
+            gateway_id=gateway_id, start_date=start_date, end_date=end_date
+        )
+        if archive_paths:
+            total += await count_archived_rows(
+                archive_paths,
+                gateway_id=gateway_id,
+                start_date=start_date,
+                end_date=end_date
+            )
+
+        return total
 
     async def get_statistics_by_sensor(
         self,
@@ -303,6 +418,17 @@ class SensorDataRepository(BaseRepository[SensorData]):
         )
 
         row = result.one_or_none()
+
+        archive_paths = await self._get_archive_paths(
+            sensor_id=sensor_id, start_date=cutoff_time
+        )
+        if archive_paths:
+            cold = await archived_statistics(
+                archive_paths, sensor_id=sensor_id, start_date=cutoff_time
+            )
+            if cold["count"]:
+                return self._combine_statistics(row, cold)
+
         if not row or row.count == 0:
             return {
                 "count": 0,
@@ -322,6 +448,178 @@ class SensorDataRepository(BaseRepository[SensorData]):
             "last_reading": row.last_reading
         }
 
+    async def get_bucketed_series(
+        self,
+        sensor_id: int,
+        bucket: timedelta,
+        start_date: datetime,
+        end_date: datetime,
+        measurement_types: Optional[List[str]] = None
+    ) -> BucketMap:
+        """
+        Aggregate readings of a sensor into fixed time buckets
+
+        Buckets are computed in the database with date_bin (and time_bucket
+        for archived days) on a shared origin, so only one row per
+        measurement and bucket leaves the database.
+
+        Args:
+            sensor_id: Sensor ID
+            bucket: Bucket width
+            start_date: Range start (inclusive)
+            end_date: Range end (exclusive)
+            measurement_types: Only these measurement types (all if None)
+
+        Returns:
+            Map of (measurement, bucket start) to [sum, min, max, count, unit]
+        """
+        measurement = func.coalesce(
+            SensorData.metadata_['measurement_type'].astext, 'Unknown'
+        ).label("measurement")
+        bucket_start = func.date_bin(
+            bindparam("bucket_width", bucket, type_=Interval),
+            SensorData.timestamp,
+            bindparam("bucket_origin", BUCKET_ORIGIN, type_=DateTime)
+        ).label("bucket")
+
+        query = (
+            select(
+                measurement,
+                bucket_start,
+                func.sum(SensorData.value),
+                func.min(SensorData.value),
+                func.max(SensorData.value),
+                func.count(),
+                func.max(SensorData.unit)
+            )
+            .where(
+                and_(
+                    SensorData.sensor_id == sensor_id,
+                    SensorData.timestamp >= start_date,
+                    SensorData.timestamp < end_date
+                )
+            )
+            .group_by("measurement", "bucket")
+        )
+        query = self._apply_reading_filters(query, measurement_types, None, None, None)
+
+        buckets: BucketMap = {}
+        result = await self.db.execute(query)
+        merge_buckets(buckets, result.all())
+
+        archive_paths = await self._get_archive_paths(
+            sensor_id=sensor_id, start_date=start_date, end_date=end_date
+        )
+        if archive_paths:
+            merge_buckets(buckets, await archived_buckets(
+                archive_paths,
+                bucket,
+                BUCKET_ORIGIN,
+                sensor_id=sensor_id,
+                start_date=start_date,
+                end_date=end_date - timedelta(microseconds=1),
+                measurement_types=measurement_types
+            ))
+
+        return buckets
+
+    async def stream_values(
+        self,
+        sensor_id: int,
+        start_date: datetime,
+        end_date: datetime,
+        measurement_types: Optional[List[str]] = None,
+        chunk_size: int = 20000
+    ) -> AsyncIterator[Sequence[Tuple]]:
+        """
+        Stream the raw readings of a sensor in chunks for downsampling
+
+        Hot rows are read through a server-side cursor and archived rows (if
+        the range reaches the archive, yielded first) file by file, so the
+        full range is never materialised. Chunks are only time ordered
+        within themselves.
+
+        Args:
+            sensor_id: Sensor ID
+            start_date: Range start (inclusive)
+            end_date: Range end (exclusive)
+            measurement_types: Only these measurement types (all if None)
+            chunk_size: Rows per chunk
+
+        Yields:
+            Lists of (measurement, epoch seconds, value, unit) tuples
+        """
+        archive_paths = await self._get_archive_paths(
+            sensor_id=sensor_id, start_date=start_date, end_date=end_date
+        )
+        if archive_paths:
+            archived = iter_archived_values(
+                archive_paths,
+                chunk_size,
+                sensor_id=sensor_id,
+                start_date=start_date,
+                end_date=end_date - timedelta(microseconds=1),
+                measurement_types=measurement_types
+            )
+            while (rows := await asyncio.to_thread(next, archived, None)) is not None:
+                yield rows
+
+        query = (
+            select(
+                func.coalesce(SensorData.metadata_['measurement_type'].astext, 'Unknown'),
+                cast(func.extract('epoch', SensorData.timestamp), Float),
+                SensorData.value,
+                SensorData.unit
+            )
+            .where(
+                and_(
+                    SensorData.sensor_id == sensor_id,
+                    SensorData.timestamp >= start_date,
+                    SensorData.timestamp < end_date
+                )
+            )
+            .order_by(SensorData.timestamp)
+            .execution_options(yield_per=chunk_size)
+        )
+        query = self._apply_reading_filters(query, measurement_types, None, None, None)
+
+        result = await self.db.stream(query)
+        async for partition in result.partitions(chunk_size):
+            yield partition
+
+    async def copy_readings(
+        self,
+        rows: Sequence[Tuple[int, int, float, Optional[str], Optional[str], datetime]]
+    ) -> int:
+        """
+        Load readings with COPY (committed by the caller)
+
+        Much cheaper per row than INSERT for large uploads; no IDs are returned.
+
+        Args:
+            rows: (sensor_id, gateway_id, value, unit, metadata JSON text, timestamp) tuples
+
+        Returns:
+            Number of rows copied
+        """
+        if not rows:
+            return 0
+
+        connection = await self.db.connection()
+        raw = await connection.get_raw_connection()
+        driver = raw.driver_connection
+        if not driver.is_in_transaction():
+            # The session's transaction begins lazily with its first statement;
+            # COPY must not run (and commit) outside of it
+            await self.db.execute(select(1))
+
+        await driver.copy_records_to_table(
+            SensorData.__tablename__,
+            records=rows,
+            columns=COPY_COLUMNS
+        )
+        return len(rows)
+
     async def delete_by_gateway(self, gateway_id: int) -> int:
         """
         Delete all sensor data for a gateway
@@ -357,3 +655,213 @@ class SensorDataRepository(BaseRepository[SensorData]):
         )
         await self.db.flush()
         return result.rowcount
+
+    async def _get_archive_paths(
+        self,
+        sensor_id: Optional[int] = None,
+        gateway_id: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[str]:
+        """
+        Get archive files that may hold readings for the given range
+
+        Args:
+            sensor_id: Sensor ID filter
+            gateway_id: Gateway ID filter
+            start_date: Start date filter
+            end_date: End date filter
+
+        Returns:
+            List of Parquet file paths (empty when the range is fully hot)
+        """
+        if not range_reaches_archive(start_date):
+            return []
+
+        query = select(SensorDataArchive.path)
+
+        if sensor_id is not None:
+            query = query.where(SensorDataArchive.sensor_ids.contains([sensor_id]))
+
+        if gateway_id is not None:
+            query = query.where(SensorDataArchive.gateway_id == gateway_id)
+
+        if start_date:
+            query = query.where(SensorDataArchive.max_timestamp >= start_date)
+
+        if end_date:
+            query = query.where(SensorDataArchive.min_timestamp <= end_date)
+
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def _estimate_archived_rows(
+        self,
+        sensor_id: Optional[int] = None,
+        gateway_id: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> int:
+        """
+        Estimate archived rows from manifest row counts without opening files
+
+        Files overlapping the range are counted in full, and for a sensor the
+        file's other sensors are spread evenly, so this is an approximation.
+        """
+        if not range_reaches_archive(start_date):
+            return 0
+
+        per_file = SensorDataArchive.row_count
+        if sensor_id is not None:
+            per_file = SensorDataArchive.row_count / func.cardinality(SensorDataArchive.sensor_ids)
+
+        query = select(func.coalesce(func.sum(per_file), 0))
+
+        if sensor_id is not None:
+            query = query.where(SensorDataArchive.sensor_ids.contains([sensor_id]))
+
+        if gateway_id is not None:
+            query = query.where(SensorDataArchive.gateway_id == gateway_id)
+
+        if start_date:
+            query = query.where(SensorDataArchive.max_timestamp >= start_date)
+
+        if end_date:
+            query = query.where(SensorDataArchive.min_timestamp <= end_date)
+
+        result = await self.db.execute(query)
+        return int(result.scalar_one())
+
+    async def _get_archive_filters(
+        self,
+        sensor_id: int,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        farmer_id: Optional[int],
+        farm_id: Optional[int]
+    ) -> dict:
+        """
+        Translate get_by_sensor filters into archive scan filters
+
+        Farm/farmer joins cannot be evaluated inside the Parquet files, so they
+        are resolved to gateway IDs against Postgres first.
+        """
+        filters = {
+            "sensor_id": sensor_id,
+            "start_date": start_date,
+            "end_date": end_date,
+        }
+
+        if farmer_id is not None or farm_id is not None:
+            query = (
+                select(GatewayAssignment.gateway_id)
+                .join(Farm, GatewayAssignment.farm_id == Farm.id)
+                .where(GatewayAssignment.is_active == True)
+            )
+            if farmer_id is not None:
+                query = query.where(Farm.farmer_id == farmer_id)
+            if farm_id is not None:
+                query = query.where(Farm.id == farm_id)
+
+            result = await self.db.execute(query)
+            filters["gateway_ids"] = list(result.scalars().all())
+
+        return filters
+
+    @staticmethod
+    def _apply_reading_filters(
+        query,
+        measurement_types: Optional[List[str]],
+        value_min: Optional[float],
+        value_max: Optional[float],
+        tag: Optional[str]
+    ):
+        """
+        Apply structured reading filters
+
+        measurement_type and tag compare the same metadata expressions that
+        the sensor_data expression indexes are built on.
+        """
+        if measurement_types is not None:
+            query = query.where(
+                SensorData.metadata_['measurement_type'].astext.in_(measurement_types)
+            )
+
+        if value_min is not None:
+            query = query.where(SensorData.value >= value_min)
+
+        if value_max is not None:
+            query = query.where(SensorData.value <= value_max)
+
+        if tag:
+            query = query.where(SensorData.metadata_['tag'].astext == tag)
+
+        return query
+
+    @staticmethod
+    def _after_cursor(cursor: Tuple[datetime, int]):
+        """
+        Keyset predicate for rows after the cursor in newest-first order
+
+        Written as a row comparison so Postgres can seek directly into the
+        (..., timestamp DESC, id DESC) indexes instead of scanning skipped rows.
+        """
+        return tuple_(SensorData.timestamp, SensorData.id) < tuple_(*cursor)
+
+    @staticmethod
+    def _cursor_upper_bound(
+        end_date: Optional[datetime],
+        cursor: Optional[Tuple[datetime, int]]
+    ) -> Optional[datetime]:
+        """Tighten end_date to the cursor timestamp for archive file pruning"""
+        if not cursor:
+            return end_date
+        if end_date is None:
+            return cursor[0]
+        return min(end_date, cursor[0])
+
+    @staticmethod
+    def _readings(result) -> List[SensorReading]:
+        """Convert a READING_COLUMNS result to SensorReading rows"""
+        return list(map(SensorReading._make, result.tuples()))
+
+    @staticmethod
+    def _merge_newest_first(
+        hot_rows: List[SensorReading],
+        cold_rows: List[SensorReading],
+        skip: int,
+        limit: int
+    ) -> List[SensorReading]:
+        """Merge two newest-first row lists and cut out the requested page"""
+        merged = merge(
+            hot_rows,
+            cold_rows,
+            key=lambda r: (r.timestamp, r.id),
+            reverse=True
+        )
+        return list(islice(merged, skip, skip + limit))
+
+    @staticmethod
+    def _combine_statistics(row, cold: dict) -> dict:
+        """Combine a Postgres statistics row with archived statistics"""
+        hot_count = row.count if row else 0
+        if not hot_count:
+            return {
+                "count": cold["count"],
+                "min_value": float(cold["min_value"]),
+                "max_value": float(cold["max_value"]),
+                "avg_value": float(cold["sum_value"]) / cold["count"],
+                "first_reading": cold["first_reading"],
+                "last_reading": cold["last_reading"]
+            }
+
+        count = hot_count + cold["count"]
+        total = float(row.avg_value) * hot_count + float(cold["sum_value"])
+        return {
+            "count": count,
+            "min_value": float(min(row.min_value, cold["min_value"])),
+            "max_value": float(max(row.max_value, cold["max_value"])),
+            "avg_value": total / count,
+            "first_reading": min(row.first_reading, cold["first_reading"]),
+            "last_reading": max(row.last_reading, cold["last_reading"])
+        }
@@ -0,0 +1,138 @@
+"""
+Sensor Latest Repository
+Database operations for SensorLatest model
+"""
+
+from datetime import datetime
+from typing import Any, Iterable, List, Optional, Tuple
+from sqlalchemy import select, and_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.gateway import Gateway
+from app.models.gateway_assignment import GatewayAssignment
+from app.models.sensor import Sensor
+from app.models.sensor_latest import SensorLatest
+from app.api.v1.repositories.base_repository import BaseRepository
+
+
+class SensorLatestRepository(BaseRepository[SensorLatest]):
+    """Repository for SensorLatest model operations"""
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(SensorLatest, db)
+
+    async def upsert(
+        self,
+        sensor_id: int,
+        gateway_id: int,
+        readings: Iterable[Tuple[Optional[str], float, Optional[str], datetime]]
+    ):
+        """
+        Store the newest reading per measurement type (committed by the caller)
+
+        Older readings never overwrite newer ones, so late or replayed
+        readings are safe to pass.
+
+        Args:
+            sensor_id: Sensor ID
+            gateway_id: Gateway ID
+            readings: (measurement_type, value, unit, timestamp) tuples
+        """
+        newest = {}
+        for measurement, value, unit, timestamp in readings:
+            measurement = measurement or "Unknown"
+            if measurement not in newest or timestamp >= newest[measurement]["timestamp"]:
+                newest[measurement] = {
+                    "sensor_id": sensor_id,
+                    "measurement_type": measurement,
+                    "gateway_id": gateway_id,
+                    "value": value,
+                    "unit": unit,
+                    "timestamp": timestamp,
+                    "updated_at": datetime.utcnow(),
+                }
+        if not newest:
+            return
+
+        statement = pg_insert(SensorLatest).values([newest[name] for name in sorted(newest)])
+        await self.db.execute(
+            statement.on_conflict_do_update(
+                index_elements=["sensor_id", "measurement_type"],
+                set_={
+                    "gateway_id": statement.excluded.gateway_id,
+                    "value": statement.excluded.value,
+                    "unit": statement.excluded.unit,
+                    "timestamp": statement.excluded.timestamp,
+                    "updated_at": statement.excluded.updated_at,
+                },
+                where=SensorLatest.timestamp <= statement.excluded.timestamp
+            )
+        )
+
+    async def get_fleet_for_user(
+        self,
+        user_id: int,
+        gateway_id: Optional[int] = None,
+        farm_id: Optional[int] = None,
+        measurement_types: Optional[List[str]] = None
+    ) -> List[Any]:
+        """
+        Get current conditions of all gateways and sensors of a user in one query
+
+        Gateways without sensors and sensors without readings are included
+        (with NULL reading columns).
+
+        Args:
+            user_id: Owner user ID
+            gateway_id: Only this gateway
+            farm_id: Only gateways actively assigned to this farm
+            measurement_types: Only these measurement types
+
+        Returns:
+            Rows ordered by gateway, sensor and measurement type
+        """
+        latest_join = SensorLatest.sensor_id == Sensor.id
+        if measurement_types is not None:
+            latest_join = and_(latest_join, SensorLatest.measurement_type.in_(measurement_types))
+
+        query = (
+            select(
+                Gateway.id.label("gateway_id"),
+                Gateway.gateway_uid,
+                Gateway.name.label("gateway_name"),
+                Gateway.status.label("gateway_status"),
+                Gateway.last_seen,
+                Sensor.id.label("sensor_id"),
+                Sensor.sensor_uid,
+                Sensor.name.label("sensor_name"),
+                Sensor.status.label("sensor_status"),
+                SensorLatest.measurement_type,
+                SensorLatest.value,
+                SensorLatest.unit,
+                SensorLatest.timestamp
+            )
+            .select_from(Gateway)
+            .outerjoin(Sensor, Sensor.gateway_id == Gateway.id)
+            .outerjoin(SensorLatest, latest_join)
+            .where(Gateway.user_id == user_id)
+            .order_by(Gateway.id, Sensor.id, SensorLatest.measurement_type)
+        )
+
+        if gateway_id is not None:
+            query = query.where(Gateway.id == gateway_id)
+
+        if farm_id is not None:
+            query = query.where(
+                Gateway.id.in_(
+                    select(GatewayAssignment.gateway_id).where(
+                        and_(
+                            GatewayAssignment.farm_id == farm_id,
+                            GatewayAssignment.is_active == True
+                        )
+                    )
+                )
+            )
+
+        result = await self.db.execute(query)
+        return list(result.all())
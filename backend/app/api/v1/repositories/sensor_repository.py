@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models.sensor import Sensor
+from app.models.gateway import Gateway
 from app.api.v1.repositories.base_repository import BaseRepository
 
 
@@ -66,7 +67,8 @@ class SensorRepository(BaseRepository[Sensor]):
     async def count_by_gateway(
         self,
         gateway_id: int,
-        sensor_type: Optional[str] = None
+        sensor_type: Optional[str] = None,
+        estimate: bool = False
     ) -> int:
         """
         Count sensors for a gateway
@@ -74,6 +76,7 @@ class SensorRepository(BaseRepository[Sensor]):
         Args:
             gateway_id: Gateway ID
             sensor_type: Filter by sensor type
+            estimate: Return a planner estimate instead of an exact count
 
         Returns:
             Number of matching sensors
@@ -83,6 +86,9 @@ class SensorRepository(BaseRepository[Sensor]):
         if sensor_type:
             query = query.where(Sensor.type == sensor_type)
 
+        if estimate:
+            return await self.estimate_count(query)
+
         result = await self.db.execute(query)
         return result.scalar_one()
 
@@ -98,6 +104,34 @@ class SensorRepository(BaseRepository[Sensor]):
         """
         return await self.exists(sensor_uid=sensor_uid)
 
+    async def get_owned_by_user(self, sensor_ids: List[int], user_id: int) -> List[Sensor]:
+        """
+        Get the sensors among `sensor_ids` whose gateway belongs to a user
+
+        Checks ownership of a whole batch in a single query.
+
+        Args:
+            sensor_ids: Sensor IDs
+            user_id: Owner user ID
+
+        Returns:
+            Owned sensors (missing or foreign IDs are left out)
+        """
+        if not sensor_ids:
+            return []
+
+        result = await self.db.execute(
+            select(Sensor)
+            .join(Gateway, Sensor.gateway_id == Gateway.id)
+            .where(
+                and_(
+                    Sensor.id.in_(sensor_ids),
+                    Gateway.user_id == user_id
+                )
+            )
+        )
+        return list(result.scalars().all())
+
     async def get_with_sensor_data(self, sensor_id: int) -> Optional[Sensor]:
         """
         Get sensor with sensor data eager loaded
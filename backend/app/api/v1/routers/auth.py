@@ -10,10 +10,11 @@ import logging
 
 from app.core.database import get_db
 from app.core.security import (
-    verify_password,
-    get_password_hash,
+    check_password,
+    hash_password,
     create_access_token,
     get_current_user,
+    invalidate_principal,
 )
 from app.core.config import get_settings
 from app.models.user import User
@@ -65,7 +66,7 @@ async def register_user(user_data: UserCreate, db: AsyncSession = Depends(get_db
         )
 
     # Hash password and create user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await hash_password(user_data.password)
 
     try:
         user = await user_repo.create(
@@ -106,7 +107,7 @@ async def login_user(credentials: UserLogin, db: AsyncSession = Depends(get_db))
     # Get user by username
     user = await user_repo.get_by_username(credentials.username)
 
-    if not user or not verify_password(credentials.password, user.password_hash):
+    if not user or not await check_password(credentials.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -222,6 +223,7 @@ async def update_own_profile(
 
     try:
         updated_user = await user_repo.update(current_user.id, **update_data)
+        await invalidate_principal(db, current_user.id)
 
         logger.info(f"User updated own profile: {updated_user.username}")
         return UserResponse.model_validate(updated_user)
@@ -257,24 +259,25 @@ async def change_password(
     user_repo = UserRepository(db)
 
     # Verify current password
-    if not verify_password(password_data.current_password, current_user.password_hash):
+    if not await check_password(password_data.current_password, current_user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect",
         )
 
     # Check if new password is same as current password
-    if verify_password(password_data.new_password, current_user.password_hash):
+    if await check_password(password_data.new_password, current_user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="New password must be different from current password",
         )
 
     # Hash new password and update
-    new_password_hash = get_password_hash(password_data.new_password)
+    new_password_hash = await hash_password(password_data.new_password)
 
     try:
         await user_repo.update(current_user.id, password_hash=new_password_hash)
+        await invalidate_principal(db, current_user.id)
 
         logger.info(f"User changed password: {current_user.username}")
         return MessageResponse(message="Password changed successfully")
@@ -0,0 +1,208 @@
+"""
+Export Router
+Bulk export of sensor data as CSV, NDJSON, Parquet or Arrow
+"""
+
+from fastapi import APIRouter, HTTPException, Depends, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+import logging
+
+from app.core.database import get_db, get_read_db
+from app.core.security import get_current_user
+from app.models.user import User
+from app.api.v1.repositories.gateway_repository import GatewayRepository
+from app.api.v1.repositories.farm_repository import FarmRepository
+from app.api.v1.dependencies import ensure_owned_gateway, ensure_owned_sensor
+from app.api.v1.schemas import JobAcceptedResponse
+from app.services.sensor_data_export import (
+    ExportFormat,
+    MEDIA_TYPES,
+    export_filename,
+    stream_export,
+    submit_export,
+)
+from app.services.series_arrow import IpcCompression
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+class ExportTarget:
+    """Validated export scope of one sensor, gateway or farm"""
+
+    def __init__(self, kind: str, target_id: int, label: str, scope: Dict[str, Any]):
+        self.kind = kind
+        self.target_id = target_id
+        self.label = label
+        self.scope = scope
+
+
+async def _resolve_target(
+    db: AsyncSession,
+    user: User,
+    sensor_id: Optional[int],
+    gateway_id: Optional[int],
+    farm_id: Optional[int]
+) -> ExportTarget:
+    """
+    Check ownership of the exported entity and build its scope
+
+    A farm exports the readings of the user's gateways actively assigned to it.
+
+    Raises:
+        HTTPException: 400 unless exactly one of sensor_id, gateway_id and
+            farm_id is given, 404 if it does not exist or is not the user's
+    """
+    if sum(value is not None for value in (sensor_id, gateway_id, farm_id)) != 1:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Specify exactly one of sensor_id, gateway_id or farm_id"
+        )
+
+    if sensor_id is not None:
+        await ensure_owned_sensor(db, user, sensor_id)
+        return ExportTarget("export_sensor", sensor_id, f"sensor-{sensor_id}", {"sensor_id": sensor_id})
+
+    if gateway_id is not None:
+        await ensure_owned_gateway(db, user, gateway_id)
+        return ExportTarget("export_gateway", gateway_id, f"gateway-{gateway_id}", {"gateway_id": gateway_id})
+
+    if not await FarmRepository(db).get_by_id(farm_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Farm not found"
+        )
+    gateway_ids = await GatewayRepository(db).get_ids_by_farm(farm_id, user.id)
+    return ExportTarget("export_farm", farm_id, f"farm-{farm_id}", {"gateway_ids": gateway_ids})
+
+
+def _resolve_dates(
+    hours: Optional[int],
+    start_date: Optional[datetime],
+    end_date: Optional[datetime]
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """Naive UTC range; start_date/end_date take precedence over hours"""
+    if start_date is None and end_date is None and hours:
+        start_date = datetime.utcnow() - timedelta(hours=hours)
+
+    # Convert to naive UTC (database uses TIMESTAMP WITHOUT TIME ZONE)
+    if start_date and start_date.tzinfo:
+        start_date = start_date.astimezone(timezone.utc).replace(tzinfo=None)
+    if end_date and end_date.tzinfo:
+        end_date = end_date.astimezone(timezone.utc).replace(tzinfo=None)
+
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start_date must not be after end_date"
+        )
+    return start_date, end_date
+
+
+@router.get(
+    "/sensor-data",
+    summary="Export Sensor Data",
+    description="Stream the readings of a sensor, gateway or farm as CSV, NDJSON, Parquet or Arrow",
+    response_class=StreamingResponse,
+)
+async def export_sensor_data(
+    sensor_id: Optional[int] = Query(None, description="Export one sensor"),
+    gateway_id: Optional[int] = Query(None, description="Export all sensors of a gateway"),
+    farm_id: Optional[int] = Query(None, description="Export the gateways assigned to a farm"),
+    hours: Optional[int] = Query(None, ge=1, le=87600, description="Last N hours of data"),
+    start_date: Optional[datetime] = Query(None, description="Start date (ISO format)"),
+    end_date: Optional[datetime] = Query(None, description="End date (ISO format)"),
+    measurement_type: Optional[List[str]] = Query(None, description="Filter by measurement type (repeatable)"),
+    format: ExportFormat = Query(ExportFormat.CSV, description="csv, ndjson, parquet or arrow"),
+    arrow_compression: IpcCompression = Query(IpcCompression.NONE, description="Arrow buffer compression: none (zero-copy), lz4 or zstd"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Stream an export of sensor readings, oldest first.
+
+    - **sensor_id** / **gateway_id** / **farm_id**: What to export (exactly one)
+    - **hours**: Last N hours (optional; default is the whole history)
+    - **start_date** / **end_date**: Range in ISO format (optional, take precedence over hours)
+    - **measurement_type**: Measurement types to include (optional, repeatable)
+    - **format**: `csv` (default), `ndjson`, `parquet` or `arrow`
+      (Arrow IPC stream, `application/vnd.apache.arrow.stream`)
+    - **arrow_compression**: `none` (default, zero-copy readable), `lz4` or
+      `zstd` buffer compression for `format=arrow`
+
+    Columns: id, sensor_id, gateway_id, timestamp, measurement_type, value,
+    unit, tag. Rows are fetched in batches and sent as they are encoded, so
+    any range can be exported; for very large ranges POST to the same path
+    to get a downloadable file from a background job instead.
+    """
+    target = await _resolve_target(db, current_user, sensor_id, gateway_id, farm_id)
+    start_date, end_date = _resolve_dates(hours, start_date, end_date)
+    filename = export_filename(target.label, start_date, end_date, format)
+
+    return StreamingResponse(
+        stream_export(target.scope, start_date, end_date, measurement_type, format, arrow_compression),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.post(
+    "/sensor-data",
+    response_model=JobAcceptedResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Start Sensor Data Export Job",
+    description="Write an export file in the background for later download"
+)
+async def create_export_job(
+    sensor_id: Optional[int] = Query(None, description="Export one sensor"),
+    gateway_id: Optional[int] = Query(None, description="Export all sensors of a gateway"),
+    farm_id: Optional[int] = Query(None, description="Export the gateways assigned to a farm"),
+    hours: Optional[int] = Query(None, ge=1, le=87600, description="Last N hours of data"),
+    start_date: Optional[datetime] = Query(None, description="Start date (ISO format)"),
+    end_date: Optional[datetime] = Query(None, description="End date (ISO format)"),
+    measurement_type: Optional[List[str]] = Query(None, description="Filter by measurement type (repeatable)"),
+    format: ExportFormat = Query(ExportFormat.CSV, description="csv, ndjson, parquet or arrow"),
+    arrow_compression: IpcCompression = Query(IpcCompression.NONE, description="Arrow buffer compression: none (zero-copy), lz4 or zstd"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Start a background export job.
+
+    Takes the same parameters as GET /exports/sensor-data. Poll
+    /jobs/{job_id} for progress; when completed, download the file from
+    /jobs/{job_id}/download. Files are kept for EXPORT_RETENTION_HOURS.
+    """
+    target = await _resolve_target(db, current_user, sensor_id, gateway_id, farm_id)
+    start_date, end_date = _resolve_dates(hours, start_date, end_date)
+
+    params = {
+        "format": format.value,
+        "arrow_compression": arrow_compression.value,
+        "start_date": start_date.isoformat() if start_date else None,
+        "end_date": end_date.isoformat() if end_date else None,
+        "measurement_types": measurement_type,
+        "filename": export_filename(target.label, start_date, end_date, format),
+    }
+    if "gateway_ids" in target.scope:
+        params["gateway_ids"] = target.scope["gateway_ids"]
+
+    try:
+        job = await submit_export(db, current_user.id, target.kind, target.target_id, params)
+
+        logger.info(f"Export job {job.id} started: {target.label}")
+
+        return JobAcceptedResponse(
+            message=f"Export of {target.label} started",
+            job_id=job.id
+        )
+
+    except Exception as e:
+        logger.error(f"Error starting export: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to start export"
+        )
@@ -9,14 +9,16 @@ from typing import Optional
 import math
 import logging
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.security import get_current_user
+from app.core.responses import NegotiatedRoute
 from app.models.user import User
 from app.models.farmer import Farmer
 from app.api.v1.repositories.farmer_repository import FarmerRepository
+from app.services.cascade_delete import submit_cascade_delete
 from app.api.v1.schemas import (
     PaginatedResponse,
-    MessageResponse,
+    JobAcceptedResponse,
 )
 from app.api.v1.schemas.farmer import (
     FarmerCreate,
@@ -25,7 +27,7 @@ from app.api.v1.schemas.farmer import (
 )
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(route_class=NegotiatedRoute)
 
 
 @router.get(
@@ -39,7 +41,7 @@ async def get_farmers(
     size: int = Query(20, ge=1, le=100, description="Items per page"),
     search: Optional[str] = Query(None, description="Search farmers by name"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get paginated list of all farmers.
@@ -198,9 +200,10 @@ async def update_farmer(
 
 @router.delete(
     "/{farmer_id}",
-    response_model=MessageResponse,
+    response_model=JobAcceptedResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Delete Farmer",
-    description="Delete a farmer and all associated farms"
+    description="Start a background job deleting a farmer and all associated farms"
 )
 async def delete_farmer(
     farmer_id: int,
@@ -210,7 +213,8 @@ async def delete_farmer(
     """
     Delete a farmer and all associated farms.
 
-    This action cannot be undone.
+    The delete runs in batches in the background; poll GET /jobs/{job_id}
+    for progress. This action cannot be undone.
     """
     farmer_repo = FarmerRepository(db)
 
@@ -226,15 +230,13 @@ async def delete_farmer(
     farmer_name = farmer.name
 
     try:
-        # Delete farmer (cascade will handle farms)
-        await farmer_repo.delete(farmer_id)
-
-        await db.commit()
+        job = await submit_cascade_delete(db, current_user.id, "delete_farmer", farmer_id)
 
-        logger.info(f"Farmer deleted: {farmer_name} by user {current_user.username}")
+        logger.info(f"Farmer delete job {job.id} started: {farmer_name} by user {current_user.username}")
 
-        return MessageResponse(
-            message=f"Farmer '{farmer_name}' deleted successfully"
+        return JobAcceptedResponse(
+            message=f"Farmer '{farmer_name}' deletion started",
+            job_id=job.id
         )
 
     except Exception as e:
@@ -9,15 +9,17 @@ from typing import Optional
 import math
 import logging
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.security import get_current_user
+from app.core.responses import NegotiatedRoute
 from app.models.user import User
 from app.models.farm import Farm
 from app.api.v1.repositories.farm_repository import FarmRepository
 from app.api.v1.repositories.farmer_repository import FarmerRepository
+from app.services.cascade_delete import submit_cascade_delete
 from app.api.v1.schemas import (
     PaginatedResponse,
-    MessageResponse,
+    JobAcceptedResponse,
 )
 from app.api.v1.schemas.farm import (
     FarmCreate,
@@ -26,7 +28,7 @@ from app.api.v1.schemas.farm import (
 )
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(route_class=NegotiatedRoute)
 
 
 @router.get(
@@ -41,7 +43,7 @@ async def get_farms(
     search: Optional[str] = Query(None, description="Search farms by name"),
     farmer_id: Optional[int] = Query(None, description="Filter by farmer ID"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get paginated list of all farms.
@@ -229,9 +231,10 @@ async def update_farm(
 
 @router.delete(
     "/{farm_id}",
-    response_model=MessageResponse,
+    response_model=JobAcceptedResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Delete Farm",
-    description="Delete a farm and all associated gateway assignments"
+    description="Start a background job deleting a farm and all associated gateway assignments"
 )
 async def delete_farm(
     farm_id: int,
@@ -241,7 +244,8 @@ async def delete_farm(
     """
     Delete a farm and all associated gateway assignments.
 
-    This action cannot be undone.
+    The delete runs in batches in the background; poll GET /jobs/{job_id}
+    for progress. This action cannot be undone.
     """
     farm_repo = FarmRepository(db)
 
@@ -257,15 +261,13 @@ async def delete_farm(
     farm_name = farm.name
 
     try:
-        # Delete farm (cascade will handle gateway assignments)
-        await farm_repo.delete(farm_id)
-
-        await db.commit()
+        job = await submit_cascade_delete(db, current_user.id, "delete_farm", farm_id)
 
-        logger.info(f"Farm deleted: {farm_name} by user {current_user.username}")
+        logger.info(f"Farm delete job {job.id} started: {farm_name} by user {current_user.username}")
 
-        return MessageResponse(
-            message=f"Farm '{farm_name}' deleted successfully"
+        return JobAcceptedResponse(
+            message=f"Farm '{farm_name}' deletion started",
+            job_id=job.id
         )
 
     except Exception as e:
@@ -0,0 +1,92 @@
+"""
+Fleet Router
+Current conditions of all gateways and sensors from the latest-value store
+"""
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, List, Optional
+import logging
+
+from app.core.database import get_read_db
+from app.core.security import get_current_user
+from app.models.user import User
+from app.api.v1.repositories.sensor_latest_repository import SensorLatestRepository
+from app.api.v1.schemas import (
+    FleetConditionsResponse,
+    GatewayConditions,
+    SensorConditions,
+    LatestReading,
+)
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+def _group_conditions(rows: List[Any]) -> List[GatewayConditions]:
+    """Nest flat gateway/sensor/reading rows (ordered by gateway and sensor)"""
+    gateways: List[GatewayConditions] = []
+
+    for row in rows:
+        if not gateways or gateways[-1].id != row.gateway_id:
+            gateways.append(GatewayConditions(
+                id=row.gateway_id,
+                gateway_uid=row.gateway_uid,
+                name=row.gateway_name,
+                status=row.gateway_status,
+                last_seen=row.last_seen,
+            ))
+        gateway = gateways[-1]
+
+        if row.sensor_id is None:
+            continue
+        if not gateway.sensors or gateway.sensors[-1].id != row.sensor_id:
+            gateway.sensors.append(SensorConditions(
+                id=row.sensor_id,
+                sensor_uid=row.sensor_uid,
+                name=row.sensor_name,
+                status=row.sensor_status,
+            ))
+
+        if row.measurement_type is not None:
+            gateway.sensors[-1].readings.append(LatestReading(
+                measurement=row.measurement_type,
+                value=row.value,
+                unit=row.unit,
+                timestamp=row.timestamp,
+            ))
+
+    return gateways
+
+
+@router.get(
+    "/conditions",
+    response_model=FleetConditionsResponse,
+    summary="Get Current Conditions",
+    description="Get the latest reading per measurement type for all sensors of the user's gateways"
+)
+async def get_current_conditions(
+    gateway_id: Optional[int] = Query(None, description="Filter by gateway ID"),
+    farm_id: Optional[int] = Query(None, description="Filter by farm (gateways actively assigned to it)"),
+    measurement: Optional[List[str]] = Query(None, description="Measurement types to include (repeatable, default: all)"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Get current conditions for dashboards and device cards.
+
+    - **gateway_id**: Only this gateway (optional)
+    - **farm_id**: Only gateways actively assigned to this farm (optional)
+    - **measurement**: Measurement types to include (optional, repeatable)
+
+    Served from the sensor_latest table (kept up to date by ingestion) in a
+    single indexed query; gateways without sensors and sensors without
+    readings are included with empty lists.
+    """
+    rows = await SensorLatestRepository(db).get_fleet_for_user(
+        user_id=current_user.id,
+        gateway_id=gateway_id,
+        farm_id=farm_id,
+        measurement_types=measurement
+    )
+    return FleetConditionsResponse(gateways=_group_conditions(rows))
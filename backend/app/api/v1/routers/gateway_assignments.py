@@ -9,8 +9,9 @@ from typing import Optional
 import math
 import logging
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.security import get_current_user
+from app.core.responses import NegotiatedRoute
 from app.models.user import User
 from app.api.v1.repositories.gateway_assignment_repository import (
     GatewayAssignmentRepository,
@@ -28,7 +29,7 @@ from app.api.v1.schemas.gateway_assignment import (
 )
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(route_class=NegotiatedRoute)
 
 
 @router.get(
@@ -44,7 +45,7 @@ async def get_assignments(
     farm_id: Optional[int] = Query(None, description="Filter by farm ID"),
     active_only: bool = Query(False, description="Show only active assignments"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get paginated list of gateway assignments.
@@ -3,20 +3,32 @@ Gateway Status History Router
 Track and query gateway status changes with async SQLAlchemy
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Query, status
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional
-from datetime import datetime
-import math
+from typing import List, Optional
+from datetime import datetime, timezone
+from functools import partial
 import logging
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.security import get_current_user
+from app.core.pagination import (
+    CountMode,
+    decode_cursor,
+    next_cursor,
+    split_page,
+    page_count,
+    resolve_total,
+)
+from app.core.sync import make_etag, etag_matches, not_modified, split_changes, decode_watermark
+from app.core.responses import NegotiatedRoute
 from app.models.user import User
 from app.api.v1.repositories.gateway_status_history_repository import GatewayStatusHistoryRepository
 from app.api.v1.repositories.gateway_repository import GatewayRepository
+from app.api.v1.dependencies import ensure_owned_gateway
 from app.api.v1.schemas import (
     PaginatedResponse,
+    SyncResponse,
     MessageResponse,
 )
 from app.api.v1.schemas.gateway_status_history import (
@@ -26,7 +38,7 @@ from app.api.v1.schemas.gateway_status_history import (
 )
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(route_class=NegotiatedRoute)
 
 
 @router.get(
@@ -41,8 +53,10 @@ async def get_gateway_status_history(
     size: int = Query(20, ge=1, le=100, description="Items per page"),
     start_date: Optional[datetime] = Query(None, description="Filter records after this date"),
     end_date: Optional[datetime] = Query(None, description="Filter records before this date"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor (overrides page)"),
+    count: CountMode = Query(CountMode.EXACT, description="How to compute total: exact, none, estimated or cached"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get paginated status history for a specific gateway.
@@ -52,38 +66,37 @@ async def get_gateway_status_history(
     - **size**: Items per page (default: 20, max: 100)
     - **start_date**: Filter records after this date (optional)
     - **end_date**: Filter records before this date (optional)
+    - **cursor**: Continue after the last row of a previous page (optional)
+    - **count**: exact (default), none, estimated or cached total
     """
-    gateway_repo = GatewayRepository(db)
+    after = decode_cursor(cursor)
+
     history_repo = GatewayStatusHistoryRepository(db)
 
     # Verify gateway exists and belongs to user
-    gateway = await gateway_repo.get_by_id(gateway_id)
-    if not gateway:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Gateway not found"
-        )
-
-    if gateway.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only view status history for your own gateways"
-        )
+    await ensure_owned_gateway(db, current_user, gateway_id)
 
     # Get paginated history
     skip = (page - 1) * size
     history = await history_repo.get_by_gateway(
         gateway_id=gateway_id,
         skip=skip,
-        limit=size,
+        limit=size + 1,
         start_date=start_date,
-        end_date=end_date
+        end_date=end_date,
+        cursor=after
     )
-
-    total = await history_repo.count_by_gateway(
-        gateway_id=gateway_id,
-        start_date=start_date,
-        end_date=end_date
+    history, has_more = split_page(history, size)
+
+    total = await resolve_total(
+        count,
+        partial(
+            history_repo.count_by_gateway,
+            gateway_id=gateway_id,
+            start_date=start_date,
+            end_date=end_date
+        ),
+        cache_key=("gateway_status_history", gateway_id, start_date, end_date)
     )
 
     return PaginatedResponse(
@@ -91,7 +104,10 @@ async def get_gateway_status_history(
         total=total,
         page=page,
         size=size,
-        pages=math.ceil(total / size) if total > 0 else 0
+        pages=page_count(total, size),
+        has_more=has_more,
+        total_is_estimate=count == CountMode.ESTIMATED,
+        next_cursor=next_cursor(history, has_more, timestamp_attr="created_at")
     )
 
 
@@ -169,22 +185,10 @@ async def get_latest_status(
     """
     Get the most recent status history entry for a gateway.
     """
-    gateway_repo = GatewayRepository(db)
     history_repo = GatewayStatusHistoryRepository(db)
 
     # Verify gateway exists and belongs to user
-    gateway = await gateway_repo.get_by_id(gateway_id)
-    if not gateway:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Gateway not found"
-        )
-
-    if gateway.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only view status history for your own gateways"
-        )
+    await ensure_owned_gateway(db, current_user, gateway_id)
 
     latest = await history_repo.get_latest_by_gateway(gateway_id)
 
@@ -207,7 +211,7 @@ async def get_uptime_statistics(
     start_date: Optional[datetime] = Query(None, description="Filter records after this date"),
     end_date: Optional[datetime] = Query(None, description="Filter records before this date"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get uptime statistics for a gateway including:
@@ -216,22 +220,10 @@ async def get_uptime_statistics(
     - Maximum uptime
     - Minimum uptime
     """
-    gateway_repo = GatewayRepository(db)
     history_repo = GatewayStatusHistoryRepository(db)
 
     # Verify gateway exists and belongs to user
-    gateway = await gateway_repo.get_by_id(gateway_id)
-    if not gateway:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Gateway not found"
-        )
-
-    if gateway.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only view statistics for your own gateways"
-        )
+    await ensure_owned_gateway(db, current_user, gateway_id)
 
     stats = await history_repo.get_uptime_statistics(
         gateway_id=gateway_id,
@@ -252,27 +244,15 @@ async def get_status_distribution(
     start_date: Optional[datetime] = Query(None, description="Filter records after this date"),
     end_date: Optional[datetime] = Query(None, description="Filter records before this date"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get status distribution for a gateway showing count of each status.
     """
-    gateway_repo = GatewayRepository(db)
     history_repo = GatewayStatusHistoryRepository(db)
 
     # Verify gateway exists and belongs to user
-    gateway = await gateway_repo.get_by_id(gateway_id)
-    if not gateway:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Gateway not found"
-        )
-
-    if gateway.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only view statistics for your own gateways"
-        )
+    await ensure_owned_gateway(db, current_user, gateway_id)
 
     distribution = await history_repo.get_status_distribution(
         gateway_id=gateway_id,
@@ -293,7 +273,7 @@ async def get_recent_changes(
     gateway_id: int,
     hours: int = Query(24, ge=1, le=168, description="Number of hours to look back"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get recent status changes for a gateway in the last N hours.
@@ -301,22 +281,10 @@ async def get_recent_changes(
     - **gateway_id**: Gateway ID (required)
     - **hours**: Number of hours to look back (default: 24, max: 168)
     """
-    gateway_repo = GatewayRepository(db)
     history_repo = GatewayStatusHistoryRepository(db)
 
     # Verify gateway exists and belongs to user
-    gateway = await gateway_repo.get_by_id(gateway_id)
-    if not gateway:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Gateway not found"
-        )
-
-    if gateway.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only view status changes for your own gateways"
-        )
+    await ensure_owned_gateway(db, current_user, gateway_id)
 
     changes = await history_repo.get_status_changes_by_gateway(
         gateway_id=gateway_id,
@@ -335,7 +303,7 @@ async def get_recent_changes(
 async def get_recent_status_changes_for_user(
     limit: int = Query(10, ge=1, le=50, description="Number of recent changes to return"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get recent status changes for all user's gateways with gateway details.
@@ -367,3 +335,70 @@ async def get_recent_status_changes_for_user(
     )
 
     return [GatewayStatusHistoryWithGateway.model_validate(c) for c in recent_changes]
+
+
+@router.get(
+    "/sync",
+    response_model=SyncResponse[GatewayStatusHistoryWithGateway],
+    summary="Sync Status Changes",
+    description="Get status changes of the user's gateways added after the client's watermark",
+    responses={304: {"description": "Nothing new since the watermark"}}
+)
+async def sync_status_changes(
+    response: Response,
+    since: Optional[str] = Query(None, description="Watermark from the previous sync"),
+    since_ts: Optional[datetime] = Query(None, description="Only changes after this time (initial sync)"),
+    gateway_id: Optional[List[int]] = Query(None, description="Limit to these gateways (repeatable)"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum changes per response"),
+    if_none_match: Optional[str] = Header(None),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Get status changes added after a watermark, in commit order.
+
+    - **since**: `watermark` of the previous response (optional)
+    - **since_ts**: Only changes newer than this timestamp; use for the
+      first sync when no watermark is known yet (optional)
+    - **gateway_id**: Gateways to include (optional, default: all of the user's)
+    - **limit**: Maximum changes per response (default: 100, max: 1000)
+
+    Rows are returned once no older write transaction is still running, so
+    no row is ever skipped. Send the previous `ETag` as `If-None-Match` to
+    get `304 Not Modified` when nothing was added.
+    """
+    gateway_repo = GatewayRepository(db)
+    history_repo = GatewayStatusHistoryRepository(db)
+
+    gateway_ids = await gateway_repo.get_ids_by_user(current_user.id, gateway_id)
+    if gateway_id is not None and len(gateway_ids) != len(set(gateway_id)):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Gateway not found"
+        )
+
+    # Convert to naive UTC (database uses TIMESTAMP WITHOUT TIME ZONE)
+    if since_ts and since_ts.tzinfo:
+        since_ts = since_ts.astimezone(timezone.utc).replace(tzinfo=None)
+
+    changes = await history_repo.get_changes_by_gateway_ids(
+        gateway_ids=gateway_ids,
+        since=decode_watermark(since),
+        since_ts=since_ts,
+        limit=limit + 1
+    )
+    changes, has_more, watermark = split_changes(changes, limit, since)
+
+    etag = make_etag(
+        ("gateway_status_history", current_user.id, tuple(sorted(gateway_ids)), since_ts, limit),
+        watermark
+    )
+    if not changes and etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+
+    return SyncResponse(
+        items=[GatewayStatusHistoryWithGateway.model_validate(c) for c in changes],
+        watermark=watermark,
+        has_more=has_more
+    )
@@ -6,26 +6,35 @@ CRUD operations for IoT gateway devices with async SQLAlchemy
 from fastapi import APIRouter, HTTPException, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
-import math
+from functools import partial
+import hashlib
 import logging
+import secrets
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.security import get_current_user
+from app.core.pagination import CountMode, split_page, page_count, resolve_total
+from app.core.responses import NegotiatedRoute
 from app.models.user import User
 from app.models.gateway import Gateway
 from app.api.v1.repositories.gateway_repository import GatewayRepository
 from app.api.v1.repositories.sensor_repository import SensorRepository
 from app.api.v1.repositories.sensor_data_repository import SensorDataRepository
+from app.api.v1.dependencies import get_owned_gateway_id
+from app.services.cascade_delete import submit_cascade_delete
+from app.services.ownership import invalidate_ownership
 from app.api.v1.schemas import (
     GatewayCreate,
     GatewayUpdate,
     GatewayResponse,
+    GatewayIngestTokenResponse,
     PaginatedResponse,
     MessageResponse,
+    JobAcceptedResponse,
 )
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(route_class=NegotiatedRoute)
 
 
 @router.get(
@@ -39,8 +48,9 @@ async def get_user_gateways(
     size: int = Query(20, ge=1, le=100, description="Items per page"),
     search: Optional[str] = Query(None, description="Search gateways by name or UID"),
     status: Optional[str] = Query(None, description="Filter by gateway status"),
+    count: CountMode = Query(CountMode.EXACT, description="How to compute total: exact, none, estimated or cached"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get paginated list of gateways for the current user.
@@ -49,6 +59,7 @@ async def get_user_gateways(
     - **size**: Items per page (default: 20, max: 100)
     - **search**: Search gateways by name or UID (optional)
     - **status**: Filter by gateway status (optional)
+    - **count**: exact (default), none, estimated or cached total
     """
     gateway_repo = GatewayRepository(db)
 
@@ -57,16 +68,22 @@ async def get_user_gateways(
     gateways = await gateway_repo.get_by_user(
         user_id=current_user.id,
         skip=skip,
-        limit=size,
+        limit=size + 1,
         status=status,
         search=search
     )
+    gateways, has_more = split_page(gateways, size)
 
     # Get total count
-    total = await gateway_repo.count_by_user(
-        user_id=current_user.id,
-        status=status,
-        search=search
+    total = await resolve_total(
+        count,
+        partial(
+            gateway_repo.count_by_user,
+            user_id=current_user.id,
+            status=status,
+            search=search
+        ),
+        cache_key=("gateways", current_user.id, status, search)
     )
 
     return PaginatedResponse(
@@ -74,7 +91,9 @@ async def get_user_gateways(
         total=total,
         page=page,
         size=size,
-        pages=math.ceil(total / size) if total > 0 else 0
+        pages=page_count(total, size),
+        has_more=has_more,
+        total_is_estimate=count == CountMode.ESTIMATED
     )
 
 
@@ -126,6 +145,7 @@ async def create_gateway(
             description=gateway_data.description,
             status=initial_status
         )
+        await invalidate_ownership(db, current_user.id)
 
         logger.info(f"Gateway created: {gateway.gateway_uid} by user {current_user.username}")
         return GatewayResponse.model_validate(gateway)
@@ -145,7 +165,7 @@ async def create_gateway(
 )
 async def get_gateway_stats(
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get overall gateway statistics including:
@@ -290,9 +310,10 @@ async def update_gateway(
 
 @router.delete(
     "/{gateway_id}",
-    response_model=MessageResponse,
+    response_model=JobAcceptedResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Delete Gateway",
-    description="Delete a gateway and all its sensor data"
+    description="Start a background job deleting a gateway and all its sensor data"
 )
 async def delete_gateway(
     gateway_id: int,
@@ -303,7 +324,8 @@ async def delete_gateway(
     Delete a gateway and all its associated sensors and sensor data.
 
     Gateway must belong to the current user.
-    This action cannot be undone.
+    The delete runs in batches in the background; poll GET /jobs/{job_id}
+    for progress. This action cannot be undone.
     """
     gateway_repo = GatewayRepository(db)
 
@@ -319,13 +341,13 @@ async def delete_gateway(
     gateway_uid = gateway.gateway_uid
 
     try:
-        # Delete gateway (cascade will handle sensors and sensor_data)
-        await gateway_repo.delete(gateway_id)
+        job = await submit_cascade_delete(db, current_user.id, "delete_gateway", gateway_id)
 
-        logger.info(f"Gateway deleted: {gateway_uid} by user {current_user.username}")
+        logger.info(f"Gateway delete job {job.id} started: {gateway_uid} by user {current_user.username}")
 
-        return MessageResponse(
-            message=f"Gateway '{gateway_uid}' deleted successfully"
+        return JobAcceptedResponse(
+            message=f"Gateway '{gateway_uid}' deletion started",
+            job_id=job.id
         )
 
     except Exception as e:
@@ -384,3 +406,38 @@ async def ping_gateway(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to ping gateway"
         )
+
+
+@router.post(
+    "/{gateway_id}/ingest-token",
+    response_model=GatewayIngestTokenResponse,
+    summary="Issue Gateway Ingestion Token",
+    description="Issue a new token for the HTTP/WebSocket ingestion front-end"
+)
+async def issue_gateway_ingest_token(
+    gateway_id: int = Depends(get_owned_gateway_id),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Issue a new ingestion token for a gateway, replacing the previous one.
+
+    Gateways that cannot reach the MQTT broker post their payloads to the
+    ingestion service with `Authorization: Bearer <token>`. Only a hash is
+    stored, so the token is shown once; the ingestion service picks up a new
+    token within seconds and stops accepting the old one within
+    GATEWAY_TOKEN_CACHE_TTL_SECONDS.
+    """
+    gateway_repo = GatewayRepository(db)
+
+    token = secrets.token_urlsafe(32)
+    gateway = await gateway_repo.update(
+        gateway_id, ingest_token_hash=hashlib.sha256(token.encode("utf-8")).hexdigest()
+    )
+
+    logger.info(f"Ingestion token issued for gateway {gateway.gateway_uid} by user {current_user.username}")
+    return GatewayIngestTokenResponse(
+        gateway_id=gateway.id,
+        gateway_uid=gateway.gateway_uid,
+        token=token
+    )
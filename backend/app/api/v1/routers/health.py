@@ -8,6 +8,8 @@ from datetime import datetime
 
 from app.core.config import get_settings
 from app.core.database import check_database_health
+from app.core.hashing import password_pool
+from app.services.hot_window import hot_window
 from app.api.v1.schemas import HealthResponse
 
 router = APIRouter()
@@ -49,6 +51,26 @@ async def health_check():
     )
 
 
+@router.get(
+    "/health/hot-window",
+    summary="Hot Window Statistics",
+    description="Memory use and hit ratio of the in-memory recent readings window",
+)
+async def hot_window_stats():
+    """In-memory hot window statistics (per API process)"""
+    return hot_window.stats()
+
+
+@router.get(
+    "/health/password-hashing",
+    summary="Password Hashing Pool Statistics",
+    description="Busy/queued workers and queue wait times of the bcrypt pool",
+)
+async def password_hashing_stats():
+    """Password hashing pool statistics (per API process)"""
+    return password_pool.stats()
+
+
 @router.get(
     "/ping",
     summary="Simple Ping",
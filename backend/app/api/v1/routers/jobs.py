@@ -0,0 +1,93 @@
+"""
+Background Job Router
+Progress of long-running operations such as cascade deletes and exports
+"""
+
+from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi.responses import FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from pathlib import Path
+
+from app.core.database import get_db
+from app.core.security import get_current_user
+from app.models.user import User
+from app.api.v1.repositories.background_job_repository import BackgroundJobRepository
+from app.api.v1.schemas import JobResponse
+from app.services.sensor_data_export import ExportFormat, MEDIA_TYPES
+
+router = APIRouter()
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobResponse,
+    summary="Get Job Status",
+    description="Get status and progress of a background job"
+)
+async def get_job(
+    job_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get a background job started by the current user.
+
+    Returns status, processed/total row counts and progress ratio.
+    """
+    job_repo = BackgroundJobRepository(db)
+    job = await job_repo.get_for_user(job_id, current_user.id)
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+
+    return JobResponse.model_validate(job)
+
+
+@router.get(
+    "/{job_id}/download",
+    response_class=FileResponse,
+    summary="Download Job Result",
+    description="Download the file written by a completed export job"
+)
+async def download_job_file(
+    job_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Download the result file of a background job started by the current user.
+
+    Returns 409 while the job is still running and 404 if it produced no
+    file or the file has expired.
+    """
+    job_repo = BackgroundJobRepository(db)
+    job = await job_repo.get_for_user(job_id, current_user.id)
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+
+    if job.status in ("pending", "running"):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Job has not finished yet"
+        )
+
+    if not job.file_path or not Path(job.file_path).is_file():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job has no file to download"
+        )
+
+    params = job.params or {}
+    export_format = ExportFormat(params.get("format", ExportFormat.CSV.value))
+    return FileResponse(
+        job.file_path,
+        media_type=MEDIA_TYPES[export_format],
+        filename=params.get("filename") or Path(job.file_path).name,
+    )
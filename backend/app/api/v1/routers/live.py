@@ -0,0 +1,165 @@
+"""
+Live Router
+Push new readings and gateway status transitions over SSE or WebSocket
+"""
+
+from fastapi import APIRouter, HTTPException, Query, Request, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
+import json
+import logging
+
+from app.core.config import get_settings
+from app.core.database import AsyncSessionLocal
+from app.core.events import event_listener
+from app.core.security import get_user_from_token
+from app.api.v1.repositories.gateway_repository import GatewayRepository
+from app.api.v1.repositories.sensor_repository import SensorRepository
+from app.services.live_events import Subscription, live_hub
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+settings = get_settings()
+
+
+def _bearer_token(authorization: Optional[str], token: Optional[str]) -> Optional[str]:
+    """Token from an Authorization header, else from the `token` query parameter"""
+    if authorization and authorization.lower().startswith("bearer "):
+        return authorization[7:]
+    return token
+
+
+async def _subscribe(
+    token: Optional[str],
+    gateway_ids: Optional[List[int]],
+    sensor_ids: Optional[List[int]]
+) -> Subscription:
+    """
+    Authenticate a client and build its subscription
+
+    Without gateway or sensor IDs the client follows all of its gateways.
+    The database session is closed before streaming starts, so open streams
+    hold no pooled connection.
+
+    Raises:
+        HTTPException: 401 for a bad token, 404 for foreign or unknown IDs
+    """
+    async with AsyncSessionLocal() as db:
+        user = await get_user_from_token(token, db) if token else None
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid authentication credentials",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        gateway_repo = GatewayRepository(db)
+        if gateway_ids is None and sensor_ids is None:
+            owned_gateways = await gateway_repo.get_ids_by_user(user.id)
+            sensors = []
+        else:
+            requested = list(dict.fromkeys(gateway_ids or []))
+            owned_gateways = await gateway_repo.get_ids_by_user(user.id, requested) if requested else []
+            sensors = await SensorRepository(db).get_owned_by_user(list(dict.fromkeys(sensor_ids or [])), user.id)
+
+            if len(owned_gateways) != len(requested) or len(sensors) != len(set(sensor_ids or [])):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Gateway or sensor not found"
+                )
+
+    return Subscription(
+        user_id=user.id,
+        gateway_ids=owned_gateways,
+        sensor_gateways={sensor.id: sensor.gateway_id for sensor in sensors},
+        maxsize=settings.LIVE_CLIENT_BUFFER_SIZE
+    )
+
+
+@router.get(
+    "/events",
+    summary="Live Events (SSE)",
+    description="Server-sent events with new readings and gateway status transitions",
+    response_class=StreamingResponse,
+)
+async def live_events(
+    request: Request,
+    gateway_id: Optional[List[int]] = Query(None, description="Gateways to follow (repeatable)"),
+    sensor_id: Optional[List[int]] = Query(None, description="Sensors to follow (repeatable)"),
+    token: Optional[str] = Query(None, description="Access token (EventSource cannot send headers)"),
+):
+    """
+    Stream live events as `text/event-stream`.
+
+    - **gateway_id** / **sensor_id**: What to follow (optional, repeatable).
+      Without either, all of the user's gateways are followed.
+    - **token**: JWT, if no Authorization header can be sent
+
+    Event types: `readings`, `gateway_status`, `dropped` (the client was too
+    slow and missed `count` events) and `reset` (the server lost its event
+    feed; refetch current state).
+    """
+    subscription = await _subscribe(
+        _bearer_token(request.headers.get("authorization"), token), gateway_id, sensor_id
+    )
+
+    async def stream():
+        live_hub.add(subscription)
+        try:
+            yield "retry: 5000\n\n"
+            while not await request.is_disconnected():
+                event = await subscription.next(timeout=settings.LIVE_KEEPALIVE_SECONDS)
+                if event is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: {event['type']}\ndata: {json.dumps(event, default=str)}\n\n"
+        finally:
+            live_hub.remove(subscription)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/ws")
+async def live_websocket(
+    websocket: WebSocket,
+    gateway_id: Optional[List[int]] = Query(None),
+    sensor_id: Optional[List[int]] = Query(None),
+    token: Optional[str] = Query(None),
+):
+    """
+    Same events as GET /live/events as JSON WebSocket messages
+
+    Authenticate with the `token` query parameter or an Authorization header.
+    """
+    try:
+        subscription = await _subscribe(
+            _bearer_token(websocket.headers.get("authorization"), token), gateway_id, sensor_id
+        )
+    except HTTPException as e:
+        await websocket.close(code=4401 if e.status_code == 401 else 4404, reason=e.detail)
+        return
+
+    await websocket.accept()
+    live_hub.add(subscription)
+    try:
+        while True:
+            event = await subscription.next(timeout=settings.LIVE_KEEPALIVE_SECONDS)
+            await websocket.send_json(event or {"type": "keep-alive"})
+    except WebSocketDisconnect:
+        pass
+    finally:
+        live_hub.remove(subscription)
+
+
+@router.get(
+    "/stats",
+    summary="Live Stream Statistics",
+    description="Connected clients of this API process and event feed status",
+)
+async def live_stats():
+    """Live stream statistics (per API process)"""
+    return {"listener_connected": event_listener.connected, **live_hub.stats()}
@@ -3,31 +3,99 @@ Sensor Management Router
 CRUD operations for sensors and sensor data with async SQLAlchemy
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Query, status
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional
-from datetime import datetime, timedelta
-import math
+from typing import Optional, List
+from datetime import datetime, timedelta, timezone
+from functools import partial
+import asyncio
 import logging
 
-from app.core.database import get_db
+from app.core.config import get_settings
+from app.core.database import ReadSessionLocal, get_db, get_read_db, client_key, read_session
 from app.core.security import get_current_user
+from app.services.sensor_series import (
+    resolve_range,
+    resolve_bucket,
+    format_bucket,
+    to_columnar,
+    bucket_grid,
+    align_on_grid,
+)
+from app.services.downsampling import SeriesMode, downsample
+from app.services.series_arrow import (
+    ARROW_OPENAPI,
+    IpcCompression,
+    aligned_batch,
+    arrow_response,
+    bucketed_batch,
+    downsampled_batch,
+)
+from app.services.hot_window import hot_window
+from app.services.bulk_ingest import BULK_OPENAPI, NDJSON_MEDIA_TYPES, ingest_bulk
+from app.core.events import READINGS_CHANNEL, encode_reading_events, publish, to_epoch
+from app.core.sync import make_etag, etag_matches, not_modified, split_changes, decode_watermark
+from app.core.responses import NegotiatedRoute, accepts_arrow, model_response
+from app.core.pagination import (
+    CountMode,
+    decode_cursor,
+    next_cursor,
+    split_page,
+    page_count,
+    resolve_total,
+)
 from app.models.user import User
-from app.api.v1.repositories.gateway_repository import GatewayRepository
+from app.models.sensor import Sensor
+from app.api.v1.dependencies import (
+    OwnedSensorRef,
+    ensure_owned_gateway,
+    get_owned_sensor,
+    get_owned_sensor_ref,
+)
 from app.api.v1.repositories.sensor_repository import SensorRepository
 from app.api.v1.repositories.sensor_data_repository import SensorDataRepository
+from app.api.v1.repositories.measurement_type_repository import MeasurementTypeRepository
+from app.api.v1.repositories.sensor_data_daily_count_repository import SensorDataDailyCountRepository
+from app.api.v1.repositories.sensor_latest_repository import SensorLatestRepository
+from app.services.cascade_delete import submit_cascade_delete
+from app.services.ownership import invalidate_ownership
 from app.api.v1.schemas import (
     SensorCreate,
     SensorUpdate,
     SensorResponse,
     SensorDataCreate,
     SensorDataResponse,
+    SensorDataBulkResponse,
+    SensorSeriesResponse,
+    SensorSeriesBatchResponse,
     PaginatedResponse,
-    MessageResponse,
+    SyncResponse,
+    JobAcceptedResponse,
 )
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(route_class=NegotiatedRoute)
+settings = get_settings()
+
+
+def _hot_window_loader(sensor_id: int):
+    """
+    Cold loader for the hot window: raw readings of a sensor since a timestamp
+
+    The window is shared by all requests of the process and only kept current
+    by notifications, so it is loaded from the primary, never from a replica
+    that may not have replayed readings already notified.
+    """
+    async def load(since: datetime):
+        async with ReadSessionLocal() as session:
+            async for rows in SensorDataRepository(session).stream_values(
+                sensor_id=sensor_id,
+                start_date=since,
+                end_date=datetime.utcnow() + timedelta(days=1),
+                chunk_size=settings.SERIES_STREAM_CHUNK_SIZE
+            ):
+                yield rows
+    return load
 
 
 @router.get(
@@ -41,8 +109,9 @@ async def get_sensors(
     size: int = Query(50, ge=1, le=100, description="Items per page"),
     gateway_id: Optional[int] = Query(None, description="Filter by gateway ID"),
     sensor_type: Optional[str] = Query(None, description="Filter by sensor type"),
+    count: CountMode = Query(CountMode.EXACT, description="How to compute total: exact, none, estimated or cached"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get paginated list of sensors.
@@ -51,31 +120,32 @@ async def get_sensors(
     - **size**: Items per page (default: 50, max: 100)
     - **gateway_id**: Filter by specific gateway ID (optional)
     - **sensor_type**: Filter by sensor type (optional)
+    - **count**: exact (default), none, estimated or cached total
     """
-    gateway_repo = GatewayRepository(db)
     sensor_repo = SensorRepository(db)
 
     # If gateway_id is provided, verify it belongs to the user
     if gateway_id:
-        gateway = await gateway_repo.get_by_id(gateway_id)
-        if not gateway or gateway.user_id != current_user.id:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Gateway not found"
-            )
+        await ensure_owned_gateway(db, current_user, gateway_id)
 
         # Get sensors for this gateway
         skip = (page - 1) * size
         sensors = await sensor_repo.get_by_gateway(
             gateway_id=gateway_id,
             skip=skip,
-            limit=size,
+            limit=size + 1,
             sensor_type=sensor_type
         )
-
-        total = await sensor_repo.count_by_gateway(
-            gateway_id=gateway_id,
-            sensor_type=sensor_type
+        sensors, has_more = split_page(sensors, size)
+
+        total = await resolve_total(
+            count,
+            partial(
+                sensor_repo.count_by_gateway,
+                gateway_id=gateway_id,
+                sensor_type=sensor_type
+            ),
+            cache_key=("sensors", gateway_id, sensor_type)
         )
     else:
         # Get all sensors for user's gateways
@@ -91,7 +161,9 @@ async def get_sensors(
         total=total,
         page=page,
         size=size,
-        pages=math.ceil(total / size) if total > 0 else 0
+        pages=page_count(total, size),
+        has_more=has_more,
+        total_is_estimate=count == CountMode.ESTIMATED
     )
 
 
@@ -116,16 +188,10 @@ async def create_sensor(
     - **type**: Sensor type (required)
     - **status**: Sensor status (default: inactive)
     """
-    gateway_repo = GatewayRepository(db)
     sensor_repo = SensorRepository(db)
 
     # Verify gateway belongs to user
-    gateway = await gateway_repo.get_by_id(sensor_data.gateway_id)
-    if not gateway or gateway.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Gateway not found"
-        )
+    await ensure_owned_gateway(db, current_user, sensor_data.gateway_id)
 
     # Check if sensor UID already exists
     if await sensor_repo.sensor_uid_exists(sensor_data.sensor_uid):
@@ -142,8 +208,9 @@ async def create_sensor(
             type=sensor_data.type,
             status=sensor_data.status.value
         )
+        await invalidate_ownership(db, current_user.id)
 
-        logger.info(f"Sensor created: {sensor.sensor_uid} for gateway {gateway.gateway_uid}")
+        logger.info(f"Sensor created: {sensor.sensor_uid} for gateway {sensor_data.gateway_id}")
         return SensorResponse.model_validate(sensor)
 
     except Exception as e:
@@ -155,40 +222,183 @@ async def create_sensor(
 
 
 @router.get(
-    "/{sensor_id}",
-    response_model=SensorResponse,
-    summary="Get Sensor",
-    description="Get a specific sensor by ID"
+    "/measurement-types",
+    response_model=List[str],
+    summary="Search Measurement Types",
+    description="Find measurement type names for sensor data filters"
 )
-async def get_sensor(
-    sensor_id: int,
+async def search_measurement_types(
+    search: str = Query(..., min_length=1, max_length=100, description="Part of a measurement type name"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of names"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
-    Get a specific sensor by ID.
+    Search the measurement type dictionary (trigram index), best match first.
 
-    Sensor's gateway must belong to the current user.
+    Use the returned names with the **measurement_type** filter of
+    `GET /sensors/{sensor_id}/data`.
     """
-    gateway_repo = GatewayRepository(db)
-    sensor_repo = SensorRepository(db)
+    return await MeasurementTypeRepository(db).search(search, limit=limit)
 
-    sensor = await sensor_repo.get_by_id(sensor_id)
 
-    if not sensor:
+@router.post(
+    "/data:bulk",
+    response_model=SensorDataBulkResponse,
+    summary="Bulk Add Sensor Data",
+    description="Upload readings of many sensors as a JSON array or NDJSON stream",
+    openapi_extra=BULK_OPENAPI
+)
+async def create_sensor_data_bulk(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Add many sensor data points at once, e.g. a backfill from an SD card.
+
+    Send a JSON array of readings, or one reading per line with
+    `Content-Type: application/x-ndjson`; either may be sent with
+    `Content-Encoding: gzip`. Each reading has the fields of
+    `POST /sensors/{sensor_id}/data` plus **sensor_id**; **gateway_id** is optional.
+
+    The body is processed as it arrives and stored in batches, one
+    transaction each. Rows that are invalid or reference sensors of other
+    users are skipped and listed in **errors** with their 1-based position
+    (array element or line). If the body breaks off or cannot be parsed,
+    the rows before are kept and **complete** is false.
+    """
+    content_type = request.headers.get("content-type", "").partition(";")[0].strip().lower()
+    content_encoding = request.headers.get("content-encoding", "identity").strip().lower()
+    if content_encoding not in ("identity", "gzip"):
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Sensor not found"
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Unsupported Content-Encoding '{content_encoding}'"
         )
 
-    # Verify gateway belongs to user
-    gateway = await gateway_repo.get_by_id(sensor.gateway_id)
-    if not gateway or gateway.user_id != current_user.id:
+    return await ingest_bulk(
+        db,
+        current_user.id,
+        request.stream(),
+        ndjson=content_type in NDJSON_MEDIA_TYPES,
+        gzipped=content_encoding == "gzip"
+    )
+
+
+@router.get(
+    "/series",
+    response_model=SensorSeriesBatchResponse,
+    summary="Get Multi-Sensor Series",
+    description="Get time-bucketed series of several sensors aligned on one bucket grid",
+    responses=ARROW_OPENAPI
+)
+async def get_sensors_series(
+    request: Request,
+    sensor_id: List[int] = Query(..., description="Sensor IDs (repeatable)"),
+    measurement: Optional[List[str]] = Query(None, description="Measurement types to include (repeatable, default: all)"),
+    bucket: Optional[str] = Query(None, description="Bucket width such as 10s, 5m, 1h or 1d (default: automatic)"),
+    start: Optional[datetime] = Query(None, description="Range start (ISO format, default: end - 24h)"),
+    end: Optional[datetime] = Query(None, description="Range end (ISO format, default: now)"),
+    arrow_compression: IpcCompression = Query(IpcCompression.NONE, description="Arrow buffer compression: none (zero-copy), lz4 or zstd"),
+    accept: Optional[str] = Header(None),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Get aggregated series of several sensors for overlay charts.
+
+    - **sensor_id**: Sensor IDs (required, repeatable)
+    - **measurement**: Measurement types to include (optional, repeatable)
+    - **bucket**: Bucket width (optional, automatic like the single sensor series)
+    - **start** / **end**: Time range (optional, default: last 24 hours)
+
+    All series share the returned `timestamps` grid: every avg/min/max/count
+    array has one entry per grid slot, with null (count 0) for empty buckets.
+    Ownership of all sensors is checked in one query and the per-sensor range
+    queries run concurrently.
+
+    With `Accept: application/vnd.apache.arrow.stream` the series come as an
+    Arrow IPC stream, one row per sensor, measurement and grid slot
+    (sensor_id, measurement, unit, timestamp, avg, min, max, count).
+    Buffers are uncompressed unless **arrow_compression** asks for lz4 or zstd.
+    """
+    sensor_ids = list(dict.fromkeys(sensor_id))
+    if len(sensor_ids) > settings.SERIES_BATCH_MAX_SENSORS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.SERIES_BATCH_MAX_SENSORS} sensors per request"
+        )
+
+    owned = await SensorRepository(db).get_owned_by_user(sensor_ids, current_user.id)
+    missing = set(sensor_ids) - {sensor.id for sensor in owned}
+    if missing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Sensor not found"
+            detail=f"Sensor not found: {', '.join(str(id) for id in sorted(missing))}"
+        )
+
+    try:
+        start, end = resolve_range(start, end)
+        bucket_width = resolve_bucket(bucket, start, end)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
 
+    # A session cannot run statements concurrently, so each range query
+    # gets its own short-lived read session from the pool
+    semaphore = asyncio.Semaphore(settings.SERIES_BATCH_CONCURRENCY)
+    client = client_key(request)
+
+    async def fetch(id: int):
+        async with semaphore, read_session(client) as session:
+            return id, await SensorDataRepository(session).get_bucketed_series(
+                sensor_id=id,
+                bucket=bucket_width,
+                start_date=start,
+                end_date=end,
+                measurement_types=measurement
+            )
+
+    buckets_by_sensor = dict(await asyncio.gather(*(fetch(id) for id in sensor_ids)))
+    grid = bucket_grid(start, end, bucket_width)
+
+    if accepts_arrow(accept):
+        return arrow_response(aligned_batch(align_on_grid(buckets_by_sensor, grid), grid), {
+            "sensor_ids": sensor_ids,
+            "start": start,
+            "end": end,
+            "bucket": format_bucket(bucket_width),
+            "bucket_seconds": int(bucket_width.total_seconds()),
+        }, arrow_compression)
+
+    return SensorSeriesBatchResponse(
+        sensor_ids=sensor_ids,
+        start=start,
+        end=end,
+        bucket=format_bucket(bucket_width),
+        bucket_seconds=int(bucket_width.total_seconds()),
+        timestamps=grid,
+        series=align_on_grid(buckets_by_sensor, grid)
+    )
+
+
+@router.get(
+    "/{sensor_id}",
+    response_model=SensorResponse,
+    summary="Get Sensor",
+    description="Get a specific sensor by ID"
+)
+async def get_sensor(
+    sensor_id: int,
+    sensor: Sensor = Depends(get_owned_sensor)
+):
+    """
+    Get a specific sensor by ID.
+
+    Sensor's gateway must belong to the current user.
+    """
     return SensorResponse.model_validate(sensor)
 
 
@@ -201,7 +411,7 @@ async def get_sensor(
 async def update_sensor(
     sensor_id: int,
     sensor_data: SensorUpdate,
-    current_user: User = Depends(get_current_user),
+    sensor: Sensor = Depends(get_owned_sensor),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -210,26 +420,8 @@ async def update_sensor(
     Only provided fields will be updated.
     Sensor's gateway must belong to the current user.
     """
-    gateway_repo = GatewayRepository(db)
     sensor_repo = SensorRepository(db)
 
-    # Check if sensor exists
-    sensor = await sensor_repo.get_by_id(sensor_id)
-
-    if not sensor:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Sensor not found"
-        )
-
-    # Verify gateway belongs to user
-    gateway = await gateway_repo.get_by_id(sensor.gateway_id)
-    if not gateway or gateway.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Sensor not found"
-        )
-
     # Prepare update data
     update_data = sensor_data.model_dump(exclude_unset=True)
 
@@ -259,12 +451,14 @@ async def update_sensor(
 
 @router.delete(
     "/{sensor_id}",
-    response_model=MessageResponse,
+    response_model=JobAcceptedResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Delete Sensor",
-    description="Delete a sensor and all its data"
+    description="Start a background job deleting a sensor and all its data"
 )
 async def delete_sensor(
     sensor_id: int,
+    sensor: Sensor = Depends(get_owned_sensor),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -272,38 +466,19 @@ async def delete_sensor(
     Delete a sensor and all its associated sensor data.
 
     Sensor's gateway must belong to the current user.
-    This action cannot be undone.
+    The delete runs in batches in the background; poll GET /jobs/{job_id}
+    for progress. This action cannot be undone.
     """
-    gateway_repo = GatewayRepository(db)
-    sensor_repo = SensorRepository(db)
-
-    # Check if sensor exists
-    sensor = await sensor_repo.get_by_id(sensor_id)
-
-    if not sensor:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Sensor not found"
-        )
-
-    # Verify gateway belongs to user
-    gateway = await gateway_repo.get_by_id(sensor.gateway_id)
-    if not gateway or gateway.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Sensor not found"
-        )
-
     sensor_uid = sensor.sensor_uid
 
     try:
-        # Delete sensor (cascade will handle sensor_data)
-        await sensor_repo.delete(sensor_id)
+        job = await submit_cascade_delete(db, current_user.id, "delete_sensor", sensor_id)
 
-        logger.info(f"Sensor deleted: {sensor_uid}")
+        logger.info(f"Sensor delete job {job.id} started: {sensor_uid}")
 
-        return MessageResponse(
-            message=f"Sensor '{sensor_uid}' deleted successfully"
+        return JobAcceptedResponse(
+            message=f"Sensor '{sensor_uid}' deletion started",
+            job_id=job.id
         )
 
     except Exception as e:
@@ -329,11 +504,17 @@ async def get_sensor_data(
     hours: Optional[int] = Query(None, ge=1, le=8760, description="Last N hours of data"),
     start_date: Optional[datetime] = Query(None, description="Start date filter (ISO format)"),
     end_date: Optional[datetime] = Query(None, description="End date filter (ISO format)"),
-    search: Optional[str] = Query(None, description="Search in measurement type, sensor name, or value"),
+    measurement_type: Optional[List[str]] = Query(None, description="Filter by measurement type (repeatable)"),
+    value_min: Optional[float] = Query(None, description="Minimum value (inclusive)"),
+    value_max: Optional[float] = Query(None, description="Maximum value (inclusive)"),
+    tag: Optional[str] = Query(None, description="Filter by exact source tag"),
+    search: Optional[str] = Query(None, description="Find measurement types by name"),
     farmer_id: Optional[int] = Query(None, description="Filter by farmer ID"),
     farm_id: Optional[int] = Query(None, description="Filter by farm ID"),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor (overrides page)"),
+    count: CountMode = Query(CountMode.EXACT, description="How to compute total: exact, none, estimated or cached"),
+    sensor: OwnedSensorRef = Depends(get_owned_sensor_ref),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get sensor data for a specific sensor.
@@ -344,32 +525,44 @@ async def get_sensor_data(
     - **hours**: Get data from last N hours (optional, max: 8760 = 1 year)
     - **start_date**: Start date filter in ISO format (optional)
     - **end_date**: End date filter in ISO format (optional)
-    - **search**: Search term for measurement type, sensor name, or value (optional)
+    - **measurement_type**: Measurement types to include, e.g. `?measurement_type=Temperature&measurement_type=Moisture` (optional)
+    - **value_min** / **value_max**: Value range, inclusive (optional)
+    - **tag**: Exact source tag such as `SEM225:Temperature` (optional)
+    - **search**: Free text matched against the measurement type dictionary;
+      readings of the matching types are returned (optional)
     - **farmer_id**: Filter by farmer ID (optional)
     - **farm_id**: Filter by farm ID (optional)
+    - **cursor**: Continue after the last row of a previous page (optional).
+      Cursor pages cost the same regardless of depth; pass the same filters as the first page.
+    - **count**: `exact` (default), `none` (skip the total, use has_more), `estimated`
+      (planner statistics) or `cached` (exact, reused for a short time)
 
     Note: If both hours and start_date/end_date are provided, start_date/end_date take precedence.
     """
-    gateway_repo = GatewayRepository(db)
-    sensor_repo = SensorRepository(db)
-    sensor_data_repo = SensorDataRepository(db)
+    after = decode_cursor(cursor)
 
-    # Check if sensor exists
-    sensor = await sensor_repo.get_by_id(sensor_id)
+    sensor_data_repo = SensorDataRepository(db)
 
-    if not sensor:
+    if value_min is not None and value_max is not None and value_min > value_max:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Sensor not found"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="value_min must not be greater than value_max"
         )
 
-    # Verify gateway belongs to user
-    gateway = await gateway_repo.get_by_id(sensor.gateway_id)
-    if not gateway or gateway.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Sensor not found"
-        )
+    # Free-text search only resolves names in the measurement type dictionary
+    measurement_types = measurement_type
+    if search:
+        matches = await MeasurementTypeRepository(db).search(search)
+        if measurement_types is not None:
+            matches = [name for name in matches if name in measurement_types]
+        measurement_types = matches
+
+    # Identify the filter combination before hours is turned into a moving start_date
+    count_key = (
+        "sensor_data", sensor_id, hours, start_date, end_date,
+        tuple(measurement_types) if measurement_types is not None else None,
+        value_min, value_max, tag, farmer_id, farm_id
+    )
 
     # Calculate date filters
     # If start_date and end_date are provided, use them
@@ -388,29 +581,109 @@ async def get_sensor_data(
     sensor_data_list = await sensor_data_repo.get_by_sensor(
         sensor_id=sensor_id,
         skip=skip,
-        limit=size,
+        limit=size + 1,
         start_date=start_date,
         end_date=end_date,
-        search=search,
+        measurement_types=measurement_types,
+        value_min=value_min,
+        value_max=value_max,
+        tag=tag,
         farmer_id=farmer_id,
-        farm_id=farm_id
+        farm_id=farm_id,
+        cursor=after
     )
+    sensor_data_list, has_more = split_page(sensor_data_list, size)
 
-    total = await sensor_data_repo.count_by_sensor(
-        sensor_id=sensor_id,
-        start_date=start_date,
-        end_date=end_date,
-        search=search,
-        farmer_id=farmer_id,
-        farm_id=farm_id
+    total = await resolve_total(
+        count,
+        partial(
+            sensor_data_repo.count_by_sensor,
+            sensor_id=sensor_id,
+            start_date=start_date,
+            end_date=end_date,
+            measurement_types=measurement_types,
+            value_min=value_min,
+            value_max=value_max,
+            tag=tag,
+            farmer_id=farmer_id,
+            farm_id=farm_id
+        ),
+        cache_key=count_key
     )
 
-    return PaginatedResponse(
-        items=[SensorDataResponse.model_validate(data) for data in sensor_data_list],
+    return model_response(PaginatedResponse[SensorDataResponse].model_construct(
+        items=[SensorDataResponse.from_reading(data) for data in sensor_data_list],
         total=total,
         page=page,
         size=size,
-        pages=math.ceil(total / size) if total > 0 else 0
+        pages=page_count(total, size),
+        has_more=has_more,
+        total_is_estimate=count == CountMode.ESTIMATED,
+        next_cursor=next_cursor(sensor_data_list, has_more)
+    ))
+
+
+@router.get(
+    "/{sensor_id}/data/sync",
+    response_model=SyncResponse[SensorDataResponse],
+    summary="Sync Sensor Data",
+    description="Get sensor readings added after the client's watermark",
+    responses={304: {"description": "Nothing new since the watermark"}}
+)
+async def sync_sensor_data(
+    sensor_id: int,
+    since: Optional[str] = Query(None, description="Watermark from the previous sync"),
+    since_ts: Optional[datetime] = Query(None, description="Only readings after this time (initial sync)"),
+    measurement_type: Optional[List[str]] = Query(None, description="Filter by measurement type (repeatable)"),
+    limit: int = Query(1000, ge=1, le=5000, description="Maximum readings per response"),
+    if_none_match: Optional[str] = Header(None),
+    sensor: OwnedSensorRef = Depends(get_owned_sensor_ref),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Get readings of a sensor added after a watermark, in commit order.
+
+    - **sensor_id**: Sensor ID (required)
+    - **since**: `watermark` of the previous response (optional)
+    - **since_ts**: Only readings newer than this timestamp; use for the
+      first sync when no watermark is known yet (optional)
+    - **measurement_type**: Measurement types to include (optional, repeatable)
+    - **limit**: Maximum readings per response (default: 1000, max: 5000)
+
+    Rows are returned once no older write transaction is still running, so
+    no row is ever skipped. Send the previous `ETag` as `If-None-Match` to
+    get `304 Not Modified` when nothing was added. When `has_more` is true, call again right away
+    with the new watermark.
+    """
+    sensor_data_repo = SensorDataRepository(db)
+
+    # Convert to naive UTC (database uses TIMESTAMP WITHOUT TIME ZONE)
+    if since_ts and since_ts.tzinfo:
+        since_ts = since_ts.astimezone(timezone.utc).replace(tzinfo=None)
+
+    rows = await sensor_data_repo.get_changes_by_sensor(
+        sensor_id=sensor_id,
+        since=decode_watermark(since),
+        since_ts=since_ts,
+        measurement_types=measurement_type,
+        limit=limit + 1
+    )
+    rows, has_more, watermark = split_changes(rows, limit, since)
+
+    etag = make_etag(
+        ("sensor_data", sensor_id, since_ts, tuple(measurement_type or ()), limit),
+        watermark
+    )
+    if not rows and etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    return model_response(
+        SyncResponse[SensorDataResponse].model_construct(
+            items=[SensorDataResponse.from_reading(row) for row in rows],
+            watermark=watermark,
+            has_more=has_more
+        ),
+        headers={"ETag": etag}
     )
 
 
@@ -424,7 +697,7 @@ async def get_sensor_data(
 async def create_sensor_data(
     sensor_id: int,
     data: SensorDataCreate,
-    current_user: User = Depends(get_current_user),
+    sensor: OwnedSensorRef = Depends(get_owned_sensor_ref),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -438,26 +711,8 @@ async def create_sensor_data(
     - **metadata**: Additional metadata as JSON (optional)
     - **timestamp**: Timestamp (optional, defaults to current time)
     """
-    gateway_repo = GatewayRepository(db)
-    sensor_repo = SensorRepository(db)
     sensor_data_repo = SensorDataRepository(db)
 
-    # Verify sensor exists
-    sensor = await sensor_repo.get_by_id(sensor_id)
-    if not sensor:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Sensor not found"
-        )
-
-    # Verify gateway belongs to user
-    gateway = await gateway_repo.get_by_id(sensor.gateway_id)
-    if not gateway or gateway.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Sensor not found"
-        )
-
     # Verify gateway_id matches if provided in data
     if data.gateway_id != sensor.gateway_id:
         raise HTTPException(
@@ -466,6 +721,9 @@ async def create_sensor_data(
         )
 
     try:
+        if data.metadata:
+            await MeasurementTypeRepository(db).register([data.metadata.get("measurement_type")])
+
         sensor_data_entry = await sensor_data_repo.create(
             sensor_id=sensor_id,
             gateway_id=data.gateway_id,
@@ -474,6 +732,21 @@ async def create_sensor_data(
             metadata=data.metadata,
             timestamp=data.timestamp or datetime.utcnow()
         )
+        await SensorDataDailyCountRepository(db).increment(
+            data.gateway_id, [sensor_data_entry.timestamp]
+        )
+        await SensorLatestRepository(db).upsert(sensor_id, data.gateway_id, [(
+            (data.metadata or {}).get("measurement_type"),
+            sensor_data_entry.value,
+            sensor_data_entry.unit,
+            sensor_data_entry.timestamp,
+        )])
+        await publish(db, READINGS_CHANNEL, encode_reading_events(sensor_id, data.gateway_id, [(
+            (data.metadata or {}).get("measurement_type"),
+            to_epoch(sensor_data_entry.timestamp),
+            sensor_data_entry.value,
+            sensor_data_entry.unit,
+        )]))
 
         return SensorDataResponse.model_validate(sensor_data_entry)
 
@@ -493,8 +766,8 @@ async def create_sensor_data(
 async def get_sensor_stats(
     sensor_id: int,
     hours: int = Query(24, ge=1, le=8760, description="Hours to analyze (default: 24)"),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    sensor: Sensor = Depends(get_owned_sensor),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get statistical summary of sensor data.
@@ -504,32 +777,18 @@ async def get_sensor_stats(
 
     Returns min, max, average, and count of sensor readings.
     """
-    gateway_repo = GatewayRepository(db)
-    sensor_repo = SensorRepository(db)
     sensor_data_repo = SensorDataRepository(db)
 
-    # Check if sensor exists
-    sensor = await sensor_repo.get_by_id(sensor_id)
-
-    if not sensor:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Sensor not found"
-        )
-
-    # Verify gateway belongs to user
-    gateway = await gateway_repo.get_by_id(sensor.gateway_id)
-    if not gateway or gateway.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Sensor not found"
-        )
-
     # Get statistics
-    stats = await sensor_data_repo.get_statistics_by_sensor(
-        sensor_id=sensor_id,
-        hours=hours
-    )
+    since = datetime.utcnow() - timedelta(hours=hours)
+    if settings.HOT_WINDOW_ENABLED and hot_window.covers(since):
+        window = await hot_window.get_window(sensor_id, _hot_window_loader(sensor_id))
+        stats = hot_window.statistics(window, since)
+    else:
+        stats = await sensor_data_repo.get_statistics_by_sensor(
+            sensor_id=sensor_id,
+            hours=hours
+        )
 
     return {
         "sensor_id": sensor_id,
@@ -538,3 +797,121 @@ async def get_sensor_stats(
         "period_hours": hours,
         "statistics": stats
     }
+
+
+@router.get(
+    "/{sensor_id}/series",
+    response_model=SensorSeriesResponse,
+    summary="Get Sensor Series",
+    description="Get time-bucketed or downsampled series per measurement type for charts",
+    responses=ARROW_OPENAPI
+)
+async def get_sensor_series(
+    sensor_id: int,
+    measurement: Optional[List[str]] = Query(None, description="Measurement types to include (repeatable, default: all)"),
+    mode: SeriesMode = Query(SeriesMode.AVG, description="avg (time buckets), lttb or minmax (downsampled raw readings)"),
+    bucket: Optional[str] = Query(None, description="Bucket width such as 10s, 5m, 1h or 1d (default: automatic, mode=avg only)"),
+    points: Optional[int] = Query(None, ge=10, description="Maximum points per measurement (lttb/minmax, default: 500)"),
+    start: Optional[datetime] = Query(None, description="Range start (ISO format, default: end - 24h)"),
+    end: Optional[datetime] = Query(None, description="Range end (ISO format, default: now)"),
+    arrow_compression: IpcCompression = Query(IpcCompression.NONE, description="Arrow buffer compression: none (zero-copy), lz4 or zstd"),
+    accept: Optional[str] = Header(None),
+    sensor: OwnedSensorRef = Depends(get_owned_sensor_ref),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Get aggregated chart series for a sensor.
+
+    - **sensor_id**: Sensor ID (required)
+    - **measurement**: Measurement types to include (optional, repeatable)
+    - **mode**: avg (default), lttb or minmax
+    - **bucket**: Bucket width (optional, mode=avg). Without it the smallest
+      standard bucket giving at most ~500 points is used.
+    - **points**: Maximum points per measurement (optional, lttb/minmax)
+    - **start** / **end**: Time range (optional, default: last 24 hours)
+
+    mode=avg: buckets are aligned to a fixed origin and computed in the
+    database. Each measurement type is returned as parallel arrays
+    (timestamps, avg, min, max, count); empty buckets are omitted.
+
+    mode=lttb / mode=minmax: raw readings are streamed and reduced to at most
+    `points` real readings per measurement (timestamps, values), keeping the
+    visual shape (LTTB) or every spike (min and max per pixel column).
+
+    With `Accept: application/vnd.apache.arrow.stream` the series come as an
+    Arrow IPC stream with one row per point (measurement, unit, timestamp and
+    avg/min/max/count or value); the other fields are schema metadata.
+    Buffers are uncompressed unless **arrow_compression** asks for lz4 or zstd.
+    """
+    sensor_data_repo = SensorDataRepository(db)
+    as_arrow = accepts_arrow(accept)
+
+    try:
+        start, end = resolve_range(start, end)
+        if mode == SeriesMode.AVG:
+            bucket_width = resolve_bucket(bucket, start, end)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    if mode != SeriesMode.AVG:
+        points = min(points or settings.SERIES_DEFAULT_POINTS, settings.SERIES_MAX_BUCKETS)
+        chunks = sensor_data_repo.stream_values(
+            sensor_id=sensor_id,
+            start_date=start,
+            end_date=end,
+            measurement_types=measurement,
+            chunk_size=settings.SERIES_STREAM_CHUNK_SIZE
+        )
+        series = await downsample(chunks, mode, points, start, end, as_arrays=as_arrow)
+        if as_arrow:
+            return arrow_response(downsampled_batch(series), {
+                "sensor_id": sensor_id,
+                "start": start,
+                "end": end,
+                "mode": mode.value,
+                "points": points,
+                "raw_count": {entry["measurement"]: entry["raw_count"] for entry in series},
+            }, arrow_compression)
+        return SensorSeriesResponse(
+            sensor_id=sensor_id,
+            start=start,
+            end=end,
+            mode=mode.value,
+            points=points,
+            series=series
+        )
+
+    if settings.HOT_WINDOW_ENABLED and hot_window.covers(start):
+        window = await hot_window.get_window(sensor_id, _hot_window_loader(sensor_id))
+        buckets = hot_window.bucketed(window, bucket_width, start, end, measurement)
+    else:
+        buckets = await sensor_data_repo.get_bucketed_series(
+            sensor_id=sensor_id,
+            bucket=bucket_width,
+            start_date=start,
+            end_date=end,
+            measurement_types=measurement
+        )
+
+    if as_arrow:
+        return arrow_response(bucketed_batch(to_columnar(buckets)), {
+            "sensor_id": sensor_id,
+            "start": start,
+            "end": end,
+            "mode": mode.value,
+            "bucket": format_bucket(bucket_width),
+            "bucket_seconds": int(bucket_width.total_seconds()),
+        }, arrow_compression)
+
+    return SensorSeriesResponse(
+        sensor_id=sensor_id,
+        start=start,
+        end=end,
+        mode=mode.value,
+        bucket=format_bucket(bucket_width),
+        bucket_seconds=int(bucket_width.total_seconds()),
+        series=to_columnar(buckets)
+    )
@@ -11,7 +11,8 @@ import logging
 from app.core.database import get_db
 from app.core.security import (
     get_current_super_admin_user,
-    get_password_hash,
+    hash_password,
+    invalidate_principal,
 )
 from app.models.user import User
 from app.api.v1.repositories.user_repository import UserRepository
@@ -135,7 +136,7 @@ async def create_user(
         )
 
     # Hash password and create user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await hash_password(user_data.password)
 
     try:
         user = await user_repo.create(
@@ -212,6 +213,7 @@ async def update_user(
 
     try:
         updated_user = await user_repo.update(user_id, **update_data)
+        await invalidate_principal(db, user_id)
 
         logger.info(f"User updated by {current_user.username}: {updated_user.username}")
         return UserResponse.model_validate(updated_user)
@@ -273,6 +275,7 @@ async def delete_user(
 
     try:
         await user_repo.delete(user_id)
+        await invalidate_principal(db, user_id)
 
         logger.info(f"User deleted by {current_user.username}: {user.username}")
         return MessageResponse(
@@ -3,7 +3,13 @@ Pydantic Schemas for API v1 Request/Response Models
 Type-safe, validated data models
 """
 
-from app.api.v1.schemas.base import BaseSchema, MessageResponse, ErrorResponse, PaginatedResponse
+from app.api.v1.schemas.base import (
+    BaseSchema,
+    MessageResponse,
+    ErrorResponse,
+    PaginatedResponse,
+    SyncResponse,
+)
 from app.api.v1.schemas.user import (
     UserRole,
     UserCreate,
@@ -18,6 +24,7 @@ from app.api.v1.schemas.gateway import (
     GatewayUpdate,
     GatewayResponse,
     GatewayStatus,
+    GatewayIngestTokenResponse,
 )
 from app.api.v1.schemas.sensor import (
     SensorCreate,
@@ -29,6 +36,9 @@ from app.api.v1.schemas.sensor_data import (
     SensorDataCreate,
     SensorDataResponse,
     SensorDataBulkCreate,
+    SensorDataBulkItem,
+    SensorDataBulkError,
+    SensorDataBulkResponse,
 )
 from app.api.v1.schemas.farmer import (
     FarmerCreate,
@@ -50,12 +60,29 @@ from app.api.v1.schemas.gateway_status_history import (
     GatewayStatusHistoryResponse,
 )
 from app.api.v1.schemas.health import HealthResponse
+from app.api.v1.schemas.series import (
+    MeasurementSeries,
+    SensorSeriesResponse,
+    AlignedSeries,
+    SensorSeriesBatchResponse,
+)
+from app.api.v1.schemas.job import (
+    JobStatus,
+    JobResponse,
+    JobAcceptedResponse,
+)
 from app.api.v1.schemas.dashboard import (
     DashboardStats,
     DashboardActivity,
     DashboardResponse,
     ActivityDataPoint,
 )
+from app.api.v1.schemas.fleet import (
+    LatestReading,
+    SensorConditions,
+    GatewayConditions,
+    FleetConditionsResponse,
+)
 
 __all__ = [
     # Base schemas
@@ -63,6 +90,7 @@ __all__ = [
     "MessageResponse",
     "ErrorResponse",
     "PaginatedResponse",
+    "SyncResponse",
     # User schemas
     "UserRole",
     "UserCreate",
@@ -76,6 +104,7 @@ __all__ = [
     "GatewayUpdate",
     "GatewayResponse",
     "GatewayStatus",
+    "GatewayIngestTokenResponse",
     # Sensor schemas
     "SensorCreate",
     "SensorUpdate",
@@ -85,6 +114,9 @@ __all__ = [
     "SensorDataCreate",
     "SensorDataResponse",
     "SensorDataBulkCreate",
+    "SensorDataBulkItem",
+    "SensorDataBulkError",
+    "SensorDataBulkResponse",
     # Farmer schemas
     "FarmerCreate",
     "FarmerUpdate",
@@ -102,9 +134,23 @@ __all__ = [
     "GatewayStatusHistoryResponse",
     # Health schemas
     "HealthResponse",
+    # Series schemas
+    "MeasurementSeries",
+    "SensorSeriesResponse",
+    "AlignedSeries",
+    "SensorSeriesBatchResponse",
+    # Background Job schemas
+    "JobStatus",
+    "JobResponse",
+    "JobAcceptedResponse",
     # Dashboard schemas
     "DashboardStats",
     "DashboardActivity",
     "DashboardResponse",
     "ActivityDataPoint",
+    # Fleet schemas
+    "LatestReading",
+    "SensorConditions",
+    "GatewayConditions",
+    "FleetConditionsResponse",
 ]
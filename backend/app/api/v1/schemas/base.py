@@ -20,10 +20,24 @@ class PaginatedResponse(BaseSchema, Generic[T]):
     """Generic paginated response wrapper"""
 
     items: List[T]
-    total: int
+    total: Optional[int] = None
     page: int
     size: int
-    pages: int
+    pages: Optional[int] = None
+    has_more: Optional[bool] = None
+    total_is_estimate: bool = False
+    next_cursor: Optional[str] = None
+
+
+class SyncResponse(BaseSchema, Generic[T]):
+    """Rows added after a sync watermark"""
+
+    items: List[T]
+    # Opaque position of the last item (or the watermark sent when nothing
+    # is new); pass it back as since on the next poll
+    watermark: Optional[str] = None
+    # More rows are waiting; poll again immediately with the new watermark
+    has_more: bool = False
 
 
 class MessageResponse(BaseSchema):
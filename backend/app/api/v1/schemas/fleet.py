@@ -0,0 +1,47 @@
+"""
+Fleet Pydantic Schemas
+Current conditions of all gateways and sensors of a user
+"""
+
+from pydantic import Field
+from typing import List, Optional
+from datetime import datetime
+
+from app.api.v1.schemas.base import BaseSchema
+
+
+class LatestReading(BaseSchema):
+    """Most recent reading of one measurement type"""
+
+    measurement: str
+    value: float
+    unit: Optional[str] = None
+    timestamp: datetime
+
+
+class SensorConditions(BaseSchema):
+    """Current readings of a sensor"""
+
+    id: int
+    sensor_uid: str
+    name: Optional[str] = None
+    status: str
+    readings: List[LatestReading] = Field(default_factory=list)
+
+
+class GatewayConditions(BaseSchema):
+    """Gateway with the current readings of its sensors"""
+
+    id: int
+    gateway_uid: str
+    name: Optional[str] = None
+    status: str
+    last_seen: Optional[datetime] = None
+    sensors: List[SensorConditions] = Field(default_factory=list)
+
+
+class FleetConditionsResponse(BaseSchema):
+    """Current conditions across a user's gateways"""
+
+    gateways: List[GatewayConditions]
+    generated_at: datetime = Field(default_factory=datetime.utcnow, description="Timestamp when data was generated")
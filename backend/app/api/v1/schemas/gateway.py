@@ -57,6 +57,14 @@ class GatewayResponse(GatewayBase):
     updated_at: datetime
 
 
+class GatewayIngestTokenResponse(BaseSchema):
+    """Newly issued ingestion token (shown once)"""
+
+    gateway_id: int
+    gateway_uid: str
+    token: str
+
+
 # class GatewayWithSensors(GatewayResponse):
     """Gateway response with sensors included"""
 
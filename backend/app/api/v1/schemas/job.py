@@ -0,0 +1,60 @@
+"""
+Background Job Pydantic Schemas
+Progress reporting for asynchronous operations
+"""
+
+from pydantic import Field, computed_field
+from typing import Optional
+from datetime import datetime
+from enum import Enum
+
+from app.api.v1.schemas.base import BaseSchema, MessageResponse
+
+
+class JobStatus(str, Enum):
+    """Background job status enumeration"""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class JobResponse(BaseSchema):
+    """Background job response schema"""
+
+    id: int
+    kind: str
+    target_id: Optional[int] = None
+    status: JobStatus
+    processed_rows: int
+    total_rows: Optional[int] = None
+    message: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    file_path: Optional[str] = Field(None, exclude=True)
+
+    @computed_field
+    @property
+    def download_url(self) -> Optional[str]:
+        """Path of the result file (relative to the API prefix) while it is available"""
+        if self.status != JobStatus.COMPLETED or not self.file_path:
+            return None
+        return f"/jobs/{self.id}/download"
+
+    @computed_field
+    @property
+    def progress(self) -> Optional[float]:
+        """Completion ratio between 0 and 1 (None while the total is unknown)"""
+        if self.status == JobStatus.COMPLETED:
+            return 1.0
+        if not self.total_rows:
+            return None
+        return min(self.processed_rows / self.total_rows, 1.0)
+
+
+class JobAcceptedResponse(MessageResponse):
+    """Response for operations that continue in a background job"""
+
+    job_id: int = Field(..., description="ID of the background job, poll /jobs/{job_id} for progress")
@@ -33,6 +33,34 @@ class SensorDataBulkCreate(BaseSchema):
     readings: List[dict[str, Any]]
 
 
+class SensorDataBulkItem(SensorDataBase):
+    """One row of POST /sensors/data:bulk"""
+
+    value: float = Field(..., allow_inf_nan=False)
+    sensor_id: int
+    gateway_id: Optional[int] = None  # Checked against the sensor's gateway when given
+    timestamp: Optional[datetime] = None  # If not provided, use current time
+
+
+class SensorDataBulkError(BaseSchema):
+    """A rejected row of a bulk upload"""
+
+    row: int  # 1-based position in the array or NDJSON stream
+    sensor_id: Optional[int] = None
+    detail: str
+
+
+class SensorDataBulkResponse(BaseSchema):
+    """Bulk upload summary"""
+
+    received: int
+    inserted: int
+    rejected: int
+    errors: List[SensorDataBulkError]
+    errors_truncated: bool = False  # More rows were rejected than listed
+    complete: bool = True  # False if the body could not be read to the end
+
+
 class SensorDataResponse(SensorDataBase):
     """Sensor data response schema"""
 
@@ -59,3 +87,13 @@ class SensorDataResponse(SensorDataBase):
             }
             return super().model_validate(obj_dict, **kwargs)
         return super().model_validate(obj, **kwargs)
+
+    @classmethod
+    def from_reading(cls, reading) -> "SensorDataResponse":
+        """
+        Build from a SensorReading without validation
+
+        Column types are already guaranteed by the database, so pages of
+        readings skip the per-field validators.
+        """
+        return cls.model_construct(**reading._asdict())
@@ -0,0 +1,66 @@
+"""
+Sensor Series Pydantic Schemas
+Compact, chart-ready time series responses
+"""
+
+from pydantic import Field
+from typing import List, Optional
+from datetime import datetime
+
+from app.api.v1.schemas.base import BaseSchema
+
+
+class MeasurementSeries(BaseSchema):
+    """
+    One measurement type as parallel arrays
+
+    mode=avg fills avg/min/max/count (one entry per bucket); the downsampling
+    modes fill values (one entry per selected reading) and raw_count.
+    """
+
+    measurement: str
+    unit: Optional[str] = None
+    timestamps: List[datetime] = Field(..., description="Bucket start times or reading times")
+    avg: Optional[List[float]] = None
+    min: Optional[List[float]] = None
+    max: Optional[List[float]] = None
+    count: Optional[List[int]] = None
+    values: Optional[List[float]] = None
+    raw_count: Optional[int] = Field(None, description="Readings considered before downsampling")
+
+
+class SensorSeriesResponse(BaseSchema):
+    """Time-bucketed series of a sensor"""
+
+    sensor_id: int
+    start: datetime
+    end: datetime
+    mode: str = Field("avg", description="avg, lttb or minmax")
+    bucket: Optional[str] = Field(None, description="Bucket width, e.g. '5m' (mode=avg only)")
+    bucket_seconds: Optional[int] = None
+    points: Optional[int] = Field(None, description="Maximum points per measurement (downsampling modes)")
+    series: List[MeasurementSeries]
+
+
+class AlignedSeries(BaseSchema):
+    """One measurement of one sensor, one entry per slot of the shared grid"""
+
+    sensor_id: int
+    measurement: str
+    unit: Optional[str] = None
+    avg: List[Optional[float]]
+    min: List[Optional[float]]
+    max: List[Optional[float]]
+    count: List[int]
+
+
+class SensorSeriesBatchResponse(BaseSchema):
+    """Time-bucketed series of several sensors on a common bucket grid"""
+
+    sensor_ids: List[int]
+    start: datetime
+    end: datetime
+    bucket: str = Field(..., description="Bucket width, e.g. '5m'")
+    bucket_seconds: int
+    timestamps: List[datetime] = Field(..., description="Shared bucket start times")
+    series: List[AlignedSeries]
@@ -10,6 +10,8 @@ from .security import (
     create_access_token,
     verify_password,
     get_password_hash,
+    check_password,
+    hash_password,
 )
 
 __all__ = [
@@ -22,4 +24,6 @@ __all__ = [
     "create_access_token",
     "verify_password",
     "get_password_hash",
+    "check_password",
+    "hash_password",
 ]
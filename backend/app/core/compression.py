@@ -0,0 +1,229 @@
+"""
+Response Compression
+gzip, Brotli or zstd response bodies, chosen from the client's Accept-Encoding
+
+Sensor data pages repeat the same keys and metadata on every row and shrink
+by an order of magnitude when compressed, which matters most for farm sites
+behind slow cellular uplinks. The middleware picks the best encoding the
+client accepts (zstd, then br, then gzip; Brotli and zstd only when their
+packages are installed) and:
+
+* leaves bodies below the size threshold alone (they fit in a packet or two);
+* skips media types that are already compressed (Parquet, Arrow IPC with
+  compressed buffers, archives, images) or long-lived (Server-Sent Events);
+* compresses streaming responses chunk by chunk, flushing after each chunk
+  so clients receive data as soon as the route produces it.
+
+Responses that could be compressed carry `Vary: Accept-Encoding`.
+"""
+
+import zlib
+from typing import Iterable, List, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+GZIP = "gzip"
+BROTLI = "br"
+ZSTD = "zstd"
+
+
+def available_encodings() -> List[str]:
+    """Encodings this process can produce, most preferred first"""
+    encodings = []
+    if zstandard is not None:
+        encodings.append(ZSTD)
+    if brotli is not None:
+        encodings.append(BROTLI)
+    encodings.append(GZIP)
+    return encodings
+
+
+def select_encoding(accept_encoding: str, encodings: Iterable[str]) -> Optional[str]:
+    """
+    Pick the response encoding for an Accept-Encoding header
+
+    Args:
+        accept_encoding: Accept-Encoding header value
+        encodings: Supported encodings, most preferred first
+
+    Returns:
+        First supported encoding the client accepts, or None
+    """
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding.strip()] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    for encoding in encodings:
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+class Compressor:
+    """Incremental compressor for one response body"""
+
+    def __init__(self, encoding: str, level: int):
+        """
+        Initialize compressor
+
+        Args:
+            encoding: gzip, br or zstd
+            level: Compression level (quality for Brotli)
+        """
+        self.encoding = encoding
+        if encoding == ZSTD:
+            self._zstd = zstandard.ZstdCompressor(level=level).compressobj()
+        elif encoding == BROTLI:
+            self._brotli = brotli.Compressor(quality=level)
+        else:
+            self._gzip = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk and flush it, so the client can decode it right away"""
+        if self.encoding == ZSTD:
+            return self._zstd.compress(data) + self._zstd.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        if self.encoding == BROTLI:
+            return self._brotli.process(data) + self._brotli.flush()
+        return self._gzip.compress(data) + self._gzip.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        """Compress the last chunk and end the stream"""
+        if self.encoding == ZSTD:
+            return self._zstd.compress(data) + self._zstd.flush()
+        if self.encoding == BROTLI:
+            return self._brotli.process(data) + self._brotli.finish()
+        return self._gzip.compress(data) + self._gzip.flush()
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing HTTP response bodies"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 5,
+        zstd_level: int = 3,
+        excluded_media_types: Iterable[str] = (),
+    ):
+        """
+        Initialize middleware
+
+        Args:
+            app: Wrapped application
+            minimum_size: Complete bodies smaller than this are sent as is
+            gzip_level: zlib level 1-9
+            brotli_quality: Brotli quality 0-11
+            zstd_level: zstd level 1-22
+            excluded_media_types: Media types never compressed; `type/*` excludes a whole type
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.levels = {GZIP: gzip_level, BROTLI: brotli_quality, ZSTD: zstd_level}
+        self.excluded_media_types = frozenset(media_type.lower() for media_type in excluded_media_types)
+        self.encodings = available_encodings()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = select_encoding(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def compressible(self, status: int, headers: Headers) -> bool:
+        """Check whether a response may be compressed at all"""
+        if status < 200 or status in (204, 206, 304):
+            return False
+        if "content-encoding" in headers or "no-transform" in headers.get("cache-control", ""):
+            return False
+        media_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+        return bool(media_type) and not (
+            media_type in self.excluded_media_types
+            or media_type.partition("/")[0] + "/*" in self.excluded_media_types
+        )
+
+
+class _CompressionResponder:
+    """Send wrapper holding back the response start until the first body chunk"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: Optional[str], send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self._start: Optional[Message] = None
+        self._compressor: Optional[Compressor] = None
+
+    async def send(self, message: Message):
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            self._start = message
+            return
+
+        if self._start is not None:
+            start, self._start = self._start, None
+            if message_type == "http.response.body":
+                for outgoing in self._begin(start, message):
+                    await self._send(outgoing)
+                return
+            await self._send(start)
+
+        if message_type == "http.response.body" and self._compressor is not None:
+            body = message.get("body", b"")
+            if message.get("more_body", False):
+                message = {**message, "body": self._compressor.compress(body) if body else b""}
+            else:
+                message = {**message, "body": self._compressor.finish(body)}
+        await self._send(message)
+
+    def _begin(self, start: Message, message: Message) -> Tuple[Message, Message]:
+        """Decide on the first body chunk; returns the start and body messages to send"""
+        headers = MutableHeaders(raw=start["headers"])
+        if not self.middleware.compressible(start["status"], headers):
+            return start, message
+
+        vary = headers.get("vary")
+        if not vary:
+            headers["Vary"] = "Accept-Encoding"
+        elif "*" not in vary and "accept-encoding" not in vary.lower():
+            headers["Vary"] = f"{vary}, Accept-Encoding"
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.encoding is None or (not more_body and len(body) < self.middleware.minimum_size):
+            return start, message
+
+        self._compressor = Compressor(self.encoding, self.middleware.levels[self.encoding])
+        headers["Content-Encoding"] = self.encoding
+        if more_body:
+            # Total size is unknown until the stream ends; sent chunked
+            del headers["Content-Length"]
+            body = self._compressor.compress(body) if body else b""
+        else:
+            body = self._compressor.finish(body)
+            headers["Content-Length"] = str(len(body))
+            self._compressor = None
+        return start, {**message, "body": body}
@@ -31,6 +31,19 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = Field(default="admin123")
     DATABASE_URL: Optional[str] = Field(default=None)
 
+    # Read Replica Configuration
+    # List, stats, series and dashboard reads use READ ONLY transactions on the
+    # comma separated DATABASE_READ_URLS (round robin), or on the primary when empty.
+    # READ_YOUR_WRITES: "off", "sticky" (a client's reads go to the primary for
+    # READ_YOUR_WRITES_SECONDS after its last write) or "lsn" (a replica is used once
+    # it has replayed the client's last write, else the primary)
+    DATABASE_READ_URLS: str = Field(default="")
+    READ_POOL_SIZE: int = Field(default=10, ge=1)
+    READ_MAX_OVERFLOW: int = Field(default=20, ge=0)
+    READ_YOUR_WRITES: str = Field(default="off")
+    READ_YOUR_WRITES_SECONDS: int = Field(default=5, ge=1)
+    READ_YOUR_WRITES_MAX_CLIENTS: int = Field(default=10000, ge=100)
+
     # JWT Configuration (SENSITIVE - from .env)
     JWT_SECRET_KEY: str = Field(..., min_length=32)
     JWT_ALGORITHM: str = Field(default="HS256")
@@ -44,6 +57,105 @@ class Settings(BaseSettings):
     # CORS Configuration (from .env)
     ALLOWED_ORIGINS: str = Field(default="*")
 
+    # Response Compression Configuration
+    # Bodies of at least COMPRESSION_MINIMUM_SIZE bytes are sent as zstd, br or
+    # gzip (best the client accepts); comma separated media types are never
+    # compressed, `type/*` excludes a whole type
+    COMPRESSION_ENABLED: bool = Field(default=True)
+    COMPRESSION_MINIMUM_SIZE: int = Field(default=1024, ge=0)
+    COMPRESSION_GZIP_LEVEL: int = Field(default=6, ge=1, le=9)
+    COMPRESSION_BROTLI_QUALITY: int = Field(default=5, ge=0, le=11)
+    COMPRESSION_ZSTD_LEVEL: int = Field(default=3, ge=1, le=22)
+    COMPRESSION_EXCLUDED_TYPES: str = Field(
+        default=(
+            "application/vnd.apache.parquet,application/vnd.apache.arrow.stream,"
+            "application/zip,application/gzip,application/zstd,text/event-stream,"
+            "image/*,audio/*,video/*"
+        )
+    )
+
+    # Cold Data Archive Configuration
+    # Closed days older than ARCHIVE_HOT_DAYS are moved from sensor_data
+    # into per gateway/day Parquet files under ARCHIVE_DIR
+    ARCHIVE_ENABLED: bool = Field(default=False)
+    ARCHIVE_DIR: str = Field(default="/var/lib/kampungtani/archive")
+    ARCHIVE_HOT_DAYS: int = Field(default=90, ge=1)
+    ARCHIVE_MAX_DAYS_PER_RUN: int = Field(default=500, ge=1)
+
+    # Background Job Configuration
+    # Cascade deletes remove child rows in batches of this size, one transaction each
+    DELETE_BATCH_SIZE: int = Field(default=5000, ge=100)
+
+    # Export Configuration
+    # Readings are streamed in batches of EXPORT_BATCH_SIZE; background exports
+    # are written to EXPORT_DIR and removed after EXPORT_RETENTION_HOURS
+    EXPORT_BATCH_SIZE: int = Field(default=10000, ge=100)
+    EXPORT_DIR: str = Field(default="/var/lib/kampungtani/exports")
+    EXPORT_RETENTION_HOURS: int = Field(default=24, ge=1)
+
+    # Bulk Ingestion Configuration
+    # POST /sensors/data:bulk stores valid rows with COPY in batches of
+    # BULK_BATCH_SIZE (one transaction each) and lists up to BULK_MAX_ERRORS rejected rows
+    BULK_BATCH_SIZE: int = Field(default=5000, ge=100)
+    BULK_MAX_ERRORS: int = Field(default=1000, ge=1)
+
+    # Password Hashing Configuration
+    # bcrypt runs on PASSWORD_HASH_WORKERS threads; calls beyond
+    # PASSWORD_HASH_MAX_QUEUE waiting ones are rejected with 503
+    PASSWORD_HASH_WORKERS: int = Field(default=2, ge=1)
+    PASSWORD_HASH_MAX_QUEUE: int = Field(default=32, ge=0)
+
+    # Authentication Cache Configuration
+    # Verified token claims are reused until the token expires (at most the
+    # claims TTL); user rows are cached per user ID and invalidated on change
+    AUTH_CLAIMS_CACHE_TTL_SECONDS: int = Field(default=300, ge=1)
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: int = Field(default=60, ge=1)
+    AUTH_CACHE_MAX_ENTRIES: int = Field(default=10000, ge=100)
+
+    # Ownership Cache Configuration
+    # Owned gateway/sensor IDs per user for authorization checks
+    OWNERSHIP_CACHE_TTL_SECONDS: int = Field(default=60, ge=1)
+    OWNERSHIP_CACHE_MAX_ENTRIES: int = Field(default=10000, ge=100)
+
+    # Pagination Configuration
+    # Totals requested with count=cached are reused for this many seconds
+    COUNT_CACHE_TTL_SECONDS: int = Field(default=30, ge=1)
+    COUNT_CACHE_MAX_ENTRIES: int = Field(default=10000, ge=100)
+
+    # Series Configuration
+    # Without an explicit bucket the smallest standard bucket giving at most
+    # SERIES_DEFAULT_POINTS buckets is used; explicit buckets are capped at SERIES_MAX_BUCKETS
+    SERIES_DEFAULT_POINTS: int = Field(default=500, ge=10)
+    SERIES_MAX_BUCKETS: int = Field(default=10000, ge=100)
+    # Raw readings are streamed in chunks of this size for lttb/minmax downsampling
+    SERIES_STREAM_CHUNK_SIZE: int = Field(default=20000, ge=1000)
+    # Batch series: sensors per request and concurrent range queries (one pooled connection each)
+    SERIES_BATCH_MAX_SENSORS: int = Field(default=20, ge=1)
+    SERIES_BATCH_CONCURRENCY: int = Field(default=4, ge=1)
+
+    # Dashboard Configuration
+    # Dashboard responses are cached per user for this many seconds
+    DASHBOARD_CACHE_TTL_SECONDS: int = Field(default=15, ge=0)
+    DASHBOARD_CACHE_MAX_ENTRIES: int = Field(default=1000, ge=10)
+    # Closed days of sensor_data_daily_counts re-checked by the nightly reconciliation
+    COUNTER_RECONCILE_DAYS: int = Field(default=8, ge=1)
+
+    # Event Configuration
+    # One LISTEN connection per API process receives reading notifications
+    EVENT_LISTENER_ENABLED: bool = Field(default=True)
+
+    # Hot Window Configuration
+    # Series and stats requests within the last HOT_WINDOW_HOURS are served from
+    # per-sensor NumPy buffers, evicted LRU above HOT_WINDOW_MAX_MB
+    HOT_WINDOW_ENABLED: bool = Field(default=True)
+    HOT_WINDOW_HOURS: int = Field(default=24, ge=1)
+    HOT_WINDOW_MAX_MB: int = Field(default=256, ge=1)
+
+    # Live Push Configuration
+    # Events buffered per SSE/WebSocket client before the oldest are dropped
+    LIVE_CLIENT_BUFFER_SIZE: int = Field(default=1000, ge=1)
+    LIVE_KEEPALIVE_SECONDS: int = Field(default=15, ge=1)
+
     @property
     def database_url(self) -> str:
         """Construct database URL from components"""
@@ -54,6 +166,15 @@ class Settings(BaseSettings):
             f"@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
         )
 
+    @property
+    def read_database_urls(self) -> List[str]:
+        """Get read replica database URLs as a list"""
+        return [
+            url.strip()
+            for url in self.DATABASE_READ_URLS.split(",")
+            if url.strip()
+        ]
+
     @property
     def cors_origins_list(self) -> List[str]:
         """Get CORS origins as a list"""
@@ -63,6 +184,15 @@ class Settings(BaseSettings):
             if origin.strip()
         ]
 
+    @property
+    def compression_excluded_types_list(self) -> List[str]:
+        """Get media types excluded from compression as a list"""
+        return [
+            media_type.strip()
+            for media_type in self.COMPRESSION_EXCLUDED_TYPES.split(",")
+            if media_type.strip()
+        ]
+
     @property
     def mqtt_topics_list(self) -> List[str]:
         """Get MQTT topics as a list"""
@@ -88,6 +218,15 @@ class Settings(BaseSettings):
             raise ValueError(f"Log level must be one of: {valid_levels}")
         return v.upper()
 
+    @field_validator("READ_YOUR_WRITES")
+    @classmethod
+    def validate_read_your_writes(cls, v: str) -> str:
+        """Validate read-your-writes mode"""
+        valid_modes = ["off", "sticky", "lsn"]
+        if v.lower() not in valid_modes:
+            raise ValueError(f"Read-your-writes mode must be one of: {valid_modes}")
+        return v.lower()
+
     class Config:
         env_file_encoding = "utf-8"
         case_sensitive = True
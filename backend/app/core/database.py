@@ -3,7 +3,11 @@ Async SQLAlchemy Database Configuration
 Clean, efficient async database management with dependency injection
 """
 
-from typing import AsyncGenerator
+import hashlib
+import itertools
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, AsyncIterator, List, Optional
+from fastapi.requests import HTTPConnection
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     async_sessionmaker,
@@ -14,6 +18,7 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, Session
 import logging
 
+from app.core.cache import TTLCache
 from app.core.config import get_settings
 from app.models.base import Base
 
@@ -54,6 +59,87 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+# Create read engines and session factories
+def get_read_engines() -> List[AsyncEngine]:
+    """
+    Create async engines for the configured read replicas
+
+    Every connection of these engines runs READ ONLY transactions.
+
+    Returns:
+        List[AsyncEngine]: One engine per URL in DATABASE_READ_URLS
+    """
+    return [
+        create_async_engine(
+            url.replace("postgresql://", "postgresql+asyncpg://"),
+            echo=settings.DEBUG,
+            pool_size=settings.READ_POOL_SIZE,
+            max_overflow=settings.READ_MAX_OVERFLOW,
+            pool_pre_ping=True,
+            pool_recycle=3600,
+            execution_options={"postgresql_readonly": True},
+        )
+        for url in settings.read_database_urls
+    ]
+
+
+def _read_sessionmaker(bind: AsyncEngine) -> async_sessionmaker:
+    return async_sessionmaker(
+        bind,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+
+
+# Reads on the primary share its pool, READ ONLY is set per connection
+ReadSessionLocal = _read_sessionmaker(engine.execution_options(postgresql_readonly=True))
+read_engines = get_read_engines()
+replicas_configured = bool(read_engines)
+_replica_sessions = itertools.cycle([_read_sessionmaker(read_engine) for read_engine in read_engines])
+
+# Clients that wrote recently -> primary WAL position after their last write
+# (None in sticky mode or while the write is in flight: read from the primary)
+recent_writes = TTLCache(
+    maxsize=settings.READ_YOUR_WRITES_MAX_CLIENTS,
+    ttl=settings.READ_YOUR_WRITES_SECONDS,
+)
+_READ_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+def on_replica(session: AsyncSession) -> bool:
+    """
+    Check whether a session reads from a replica
+
+    Shared caches must not be filled from such a session: a replica that has
+    not replayed a recent write would cache stale data for every client.
+
+    Args:
+        session: Database session
+
+    Returns:
+        True if the session is bound to a DATABASE_READ_URLS engine
+    """
+    return any(session.bind is read_engine for read_engine in read_engines)
+
+
+def client_key(connection: HTTPConnection) -> Optional[str]:
+    """
+    Identify the client of a request for read-your-writes routing
+
+    Args:
+        connection: Request or WebSocket connection
+
+    Returns:
+        Digest of the Authorization header, or None for anonymous requests
+    """
+    authorization = connection.headers.get("authorization")
+    if not authorization:
+        return None
+    return hashlib.sha256(authorization.encode("utf-8")).hexdigest()
+
+
 # Create sync engine and session factory for background jobs
 # (APScheduler and other sync background tasks need sync sessions)
 def get_sync_engine():
@@ -81,10 +167,17 @@ SessionLocal = sessionmaker(
 )
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+async def get_db(connection: HTTPConnection) -> AsyncGenerator[AsyncSession, None]:
     """
     FastAPI dependency for database session
 
+    Write requests of a client are remembered for READ_YOUR_WRITES_SECONDS
+    so get_read_db can route that client's reads to the primary (or to a
+    replica that has caught up) when read-your-writes is enabled.
+
+    Args:
+        connection: Current request (injected by FastAPI)
+
     Yields:
         AsyncSession: Database session for request handling
 
@@ -94,10 +187,25 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             result = await db.execute(select(Item))
             return result.scalars().all()
     """
+    client = None
+    if (
+        replicas_configured
+        and settings.READ_YOUR_WRITES != "off"
+        and connection.scope.get("method") not in _READ_METHODS
+    ):
+        client = client_key(connection)
+        if client:
+            recent_writes.set(client, None)
+
     async with AsyncSessionLocal() as session:
         try:
             yield session
             await session.commit()
+            if client and settings.READ_YOUR_WRITES == "lsn":
+                await _remember_write_lsn(session, client)
+            elif client:
+                # Sticky window starts again at the commit
+                recent_writes.set(client, None)
         except Exception as e:
             await session.rollback()
             logger.error(f"Database session error: {e}")
@@ -106,6 +214,80 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def _remember_write_lsn(session: AsyncSession, client: str) -> None:
+    """Store the primary WAL position after a client's committed write"""
+    try:
+        lsn = (await session.execute(text("SELECT pg_current_wal_lsn()::text"))).scalar_one()
+        recent_writes.set(client, lsn)
+    except Exception as e:
+        # The client keeps its pending entry and reads from the primary
+        logger.warning(f"Could not read WAL position after write: {e}")
+
+
+async def _replica_caught_up(session: AsyncSession, lsn: str) -> bool:
+    """Check whether a replica has replayed the WAL up to a position"""
+    try:
+        result = await session.execute(
+            text("SELECT pg_last_wal_replay_lsn() >= CAST(:lsn AS pg_lsn)"),
+            {"lsn": lsn},
+        )
+        return bool(result.scalar())
+    except Exception as e:
+        logger.warning(f"Replica WAL replay check failed: {e}")
+        return False
+
+
+@asynccontextmanager
+async def read_session(client: Optional[str] = None) -> AsyncIterator[AsyncSession]:
+    """
+    Open a session for reads in a READ ONLY transaction
+
+    Replicas are used round robin. A client that wrote within
+    READ_YOUR_WRITES_SECONDS reads from the primary ("sticky"), or from the
+    replica if it has already replayed that write ("lsn").
+    The transaction is rolled back on close; nothing is committed.
+
+    Args:
+        client: Client key of the request (see client_key), None to skip read-your-writes
+
+    Yields:
+        AsyncSession: Read-only database session
+    """
+    session_factory = next(_replica_sessions) if replicas_configured else ReadSessionLocal
+
+    if replicas_configured and client and settings.READ_YOUR_WRITES != "off":
+        lsn = recent_writes.get(client, default=False)
+        if lsn is None:
+            session_factory = ReadSessionLocal
+        elif lsn:
+            async with session_factory() as session:
+                if await _replica_caught_up(session, lsn):
+                    yield session
+                    return
+            session_factory = ReadSessionLocal
+
+    async with session_factory() as session:
+        yield session
+
+
+async def get_read_db(connection: HTTPConnection) -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency for a read-only database session
+
+    Used by list, stats, series and dashboard routes. Runs on a read
+    replica when DATABASE_READ_URLS is set, otherwise on the primary,
+    in a READ ONLY transaction that is never committed.
+
+    Args:
+        connection: Current request (injected by FastAPI)
+
+    Yields:
+        AsyncSession: Read-only database session
+    """
+    async with read_session(client_key(connection)) as session:
+        yield session
+
+
 async def init_db() -> None:
     """
     Initialize database tables
@@ -145,5 +327,7 @@ async def close_db() -> None:
     Should be called on application shutdown
     """
     await engine.dispose()
+    for read_engine in read_engines:
+        await read_engine.dispose()
     sync_engine.dispose()
     logger.info("✅ Database connections closed")
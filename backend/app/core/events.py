@@ -0,0 +1,192 @@
+"""
+Database Events
+One Postgres LISTEN connection per API process, fanned out to in-process subscribers
+
+Ingestion (and the API itself) publish new readings with pg_notify inside the
+writing transaction, so a notification is delivered exactly when its rows
+become visible. Payloads are compact JSON and split to stay below the 8000
+byte NOTIFY limit.
+"""
+
+import asyncio
+import json
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import asyncpg
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+READINGS_CHANNEL = "sensor_readings"
+# Sent by the gateways_status_notify trigger on every status transition
+GATEWAY_STATUS_CHANNEL = "gateway_status"
+# Sent by the API when a user is updated or deleted (cached principals)
+USERS_CHANNEL = "user_changes"
+# Sent when a gateway or sensor is created or deleted (cached ownership)
+OWNERSHIP_CHANNEL = "ownership_changes"
+
+# Stay well below the 8000 byte NOTIFY payload limit
+MAX_PAYLOAD_BYTES = 7500
+
+EPOCH = datetime(1970, 1, 1)
+
+# (measurement, epoch seconds, value, unit)
+ReadingEvent = Tuple[Optional[str], float, float, Optional[str]]
+
+
+def to_epoch(timestamp: datetime) -> float:
+    """Epoch seconds of a timestamp (naive timestamps are UTC)"""
+    if timestamp.tzinfo is not None:
+        return timestamp.timestamp()
+    return (timestamp - EPOCH).total_seconds()
+
+
+def encode_reading_events(sensor_id: int, gateway_id: int, readings: Iterable[ReadingEvent]) -> List[str]:
+    """
+    Encode readings of one sensor into NOTIFY payloads
+
+    Args:
+        sensor_id: Sensor ID
+        gateway_id: Gateway ID
+        readings: (measurement, epoch seconds, value, unit) tuples
+
+    Returns:
+        JSON payloads, each below MAX_PAYLOAD_BYTES
+    """
+    head = f'{{"sensor_id":{sensor_id},"gateway_id":{gateway_id},"readings":['
+    payloads: List[str] = []
+    parts: List[str] = []
+    size = len(head) + 2
+
+    for measurement, epoch, value, unit in readings:
+        part = json.dumps([measurement, round(epoch, 6), value, unit], separators=(",", ":"))
+        if parts and size + len(part) + 1 > MAX_PAYLOAD_BYTES:
+            payloads.append(head + ",".join(parts) + "]}")
+            parts, size = [], len(head) + 2
+        parts.append(part)
+        size += len(part) + 1
+
+    if parts:
+        payloads.append(head + ",".join(parts) + "]}")
+    return payloads
+
+
+async def publish(db: AsyncSession, channel: str, payloads: Iterable[str]):
+    """
+    Queue notifications on the current transaction (sent on commit)
+
+    Args:
+        db: Database session of the writing transaction
+        channel: Channel name
+        payloads: Payload strings
+    """
+    for payload in payloads:
+        await db.execute(select(func.pg_notify(channel, payload)))
+
+
+class EventListener:
+    """
+    Long-lived LISTEN connection dispatching notifications to subscribers
+
+    Subscribers are plain callables invoked on the event loop with the decoded
+    payload; they must not block. Reset callbacks run whenever the connection
+    is (re)established or lost, since notifications sent in between are gone.
+    """
+
+    def __init__(self, dsn: str, reconnect_delay: float = 5.0):
+        """
+        Initialize listener
+
+        Args:
+            dsn: Postgres connection string
+            reconnect_delay: Seconds to wait before reconnecting
+        """
+        self.dsn = dsn
+        self.reconnect_delay = reconnect_delay
+        self.connected = False
+        self._subscribers: Dict[str, List[Callable[[Dict[str, Any]], None]]] = {}
+        self._reset_callbacks: List[Callable[[], None]] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self, channel: str, callback: Callable[[Dict[str, Any]], None]):
+        """Call `callback(payload)` for every notification on a channel"""
+        self._subscribers.setdefault(channel, []).append(callback)
+
+    def on_reset(self, callback: Callable[[], None]):
+        """Call `callback()` whenever notifications may have been missed"""
+        self._reset_callbacks.append(callback)
+
+    async def start(self):
+        """Start listening in a background task"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop listening and close the connection"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _reset(self):
+        for callback in self._reset_callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Event reset callback failed: {e}")
+
+    def _dispatch(self, connection, pid, channel: str, payload: str):
+        try:
+            data = json.loads(payload)
+        except ValueError:
+            logger.warning(f"Ignoring malformed notification on {channel}")
+            return
+        for callback in self._subscribers.get(channel, ()):
+            try:
+                callback(data)
+            except Exception as e:
+                logger.error(f"Event subscriber on {channel} failed: {e}")
+
+    async def _run(self):
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                closed = asyncio.get_running_loop().create_future()
+                connection.add_termination_listener(
+                    lambda _: closed.done() or closed.set_result(None)
+                )
+                for channel in self._subscribers:
+                    await connection.add_listener(channel, self._dispatch)
+
+                self.connected = True
+                self._reset()
+                logger.info(f"✅ Listening for database events on {', '.join(self._subscribers) or 'no channels'}")
+                await closed
+                logger.warning("Database event connection closed")
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Database event listener error: {e}")
+            finally:
+                if self.connected:
+                    self.connected = False
+                    self._reset()
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+
+            await asyncio.sleep(self.reconnect_delay)
+
+
+# One listener per API process
+event_listener = EventListener(settings.database_url)
@@ -0,0 +1,130 @@
+"""
+Password Hashing Pool
+Runs bcrypt on a small dedicated thread pool instead of the event loop
+
+A bcrypt round takes a few hundred milliseconds of CPU. Called directly from
+an async handler it stalls every other request on the worker. The pool
+bounds how many hashes run at once, rejects work beyond a bounded queue
+with 503 (clients retry) and records how long calls waited for a worker.
+bcrypt releases the GIL while hashing, so threads run in parallel.
+"""
+
+import asyncio
+import statistics
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Optional
+
+from fastapi import HTTPException, status
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# Recent calls kept for the wait/run time percentiles
+SAMPLE_SIZE = 1000
+
+
+def _percentile(samples, fraction: float) -> Optional[float]:
+    """Percentile in milliseconds of a list of seconds"""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return round(ordered[min(int(len(ordered) * fraction), len(ordered) - 1)] * 1000, 1)
+
+
+class HashingPool:
+    """Bounded executor for password hashing with queue-time metrics"""
+
+    def __init__(self, workers: int, max_queue: int):
+        """
+        Initialize pool
+
+        Args:
+            workers: Hashes computed in parallel
+            max_queue: Calls allowed to wait for a worker before rejecting
+        """
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self._wait_times: Deque[float] = deque(maxlen=SAMPLE_SIZE)
+        self._run_times: Deque[float] = deque(maxlen=SAMPLE_SIZE)
+
+    async def run(self, func: Callable[..., Any], *args) -> Any:
+        """
+        Run a hashing function on the pool
+
+        Args:
+            func: Blocking function (e.g. bcrypt check or hash)
+            *args: Its arguments
+
+        Returns:
+            The function's result
+
+        Raises:
+            HTTPException: 503 when all workers are busy and the queue is full
+        """
+        with self._lock:
+            if self._pending >= self.workers + self.max_queue:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Too many concurrent sign-ins, please retry shortly",
+                    headers={"Retry-After": "1"},
+                )
+            self._pending += 1
+
+        submitted = time.perf_counter()
+
+        def job():
+            started = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                # deque.append is atomic, no lock needed from the worker thread
+                self._wait_times.append(started - submitted)
+                self._run_times.append(time.perf_counter() - started)
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, job)
+        finally:
+            with self._lock:
+                self._pending -= 1
+                self.completed += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics
+
+        Returns:
+            Dict with workers, queue limit, busy/queued counts, completed and
+            rejected calls, and wait/run time percentiles in milliseconds
+        """
+        with self._lock:
+            pending = self._pending
+        wait_times = list(self._wait_times)
+        run_times = list(self._run_times)
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "busy": min(pending, self.workers),
+            "queued": max(pending - self.workers, 0),
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "wait_ms_p50": _percentile(wait_times, 0.5),
+            "wait_ms_p95": _percentile(wait_times, 0.95),
+            "wait_ms_max": round(max(wait_times) * 1000, 1) if wait_times else None,
+            "run_ms_avg": round(statistics.fmean(run_times) * 1000, 1) if run_times else None,
+        }
+
+
+password_pool = HashingPool(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE
+)
@@ -0,0 +1,150 @@
+"""
+Pagination Helpers
+Opaque keyset cursors over (timestamp, id) and count modes for page totals
+"""
+
+import base64
+import json
+import math
+from datetime import datetime
+from enum import Enum
+from typing import Any, Awaitable, Callable, Hashable, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+
+settings = get_settings()
+
+Cursor = Tuple[datetime, int]
+
+
+class CountMode(str, Enum):
+    """How a paginated endpoint computes `total`"""
+
+    EXACT = "exact"          # COUNT(*) with the page filters
+    NONE = "none"            # no total, only has_more
+    ESTIMATED = "estimated"  # planner row estimate
+    CACHED = "cached"        # exact count, reused for COUNT_CACHE_TTL_SECONDS
+
+
+# Exact totals per filter combination for CountMode.CACHED
+count_cache = TTLCache(
+    maxsize=settings.COUNT_CACHE_MAX_ENTRIES,
+    ttl=settings.COUNT_CACHE_TTL_SECONDS
+)
+
+
+def encode_cursor(timestamp: datetime, id: int) -> str:
+    """
+    Encode the sort key of the last row of a page into an opaque cursor
+
+    Args:
+        timestamp: Timestamp of the last row
+        id: ID of the last row
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = json.dumps([timestamp.isoformat(), id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Cursor]:
+    """
+    Decode a cursor produced by encode_cursor
+
+    Args:
+        cursor: Cursor string from the client (None for the first page)
+
+    Returns:
+        (timestamp, id) tuple or None
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    if not cursor:
+        return None
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        timestamp, id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(timestamp), int(id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def next_cursor(items: list, has_more: bool, timestamp_attr: str = "timestamp") -> Optional[str]:
+    """
+    Build the cursor for the page after `items`
+
+    Args:
+        items: Rows of the current page, in sort order
+        has_more: Whether another page exists (see split_page)
+        timestamp_attr: Name of the timestamp attribute used for sorting
+
+    Returns:
+        Cursor string, or None when this is the last page
+    """
+    if not has_more or not items:
+        return None
+    last = items[-1]
+    return encode_cursor(getattr(last, timestamp_attr), last.id)
+
+
+def split_page(rows: List[Any], size: int) -> Tuple[List[Any], bool]:
+    """
+    Trim a `size + 1` row fetch to the page and report whether more rows exist
+
+    Args:
+        rows: Rows fetched with limit=size + 1
+        size: Page size
+
+    Returns:
+        (page rows, has_more)
+    """
+    return rows[:size], len(rows) > size
+
+
+def page_count(total: Optional[int], size: int) -> Optional[int]:
+    """Number of pages for a total (None when the total was skipped)"""
+    if total is None:
+        return None
+    return math.ceil(total / size) if total > 0 else 0
+
+
+async def resolve_total(
+    mode: CountMode,
+    count: Callable[..., Awaitable[int]],
+    cache_key: Hashable
+) -> Optional[int]:
+    """
+    Compute the page total according to the requested count mode
+
+    Args:
+        mode: Requested count mode
+        count: Repository count method with the page filters bound;
+            called with estimate=True for CountMode.ESTIMATED
+        cache_key: Key identifying the filter combination for CountMode.CACHED
+
+    Returns:
+        Total number of rows, or None for CountMode.NONE
+    """
+    if mode == CountMode.NONE:
+        return None
+
+    if mode == CountMode.ESTIMATED:
+        return await count(estimate=True)
+
+    if mode == CountMode.CACHED:
+        total = count_cache.get(cache_key)
+        if total is None:
+            total = await count()
+            count_cache.set(cache_key, total)
+        return total
+
+    return await count()
@@ -0,0 +1,153 @@
+"""
+Response Encoding
+Fast JSON by default, MessagePack on request
+
+Every response is encoded with orjson (the app's default_response_class).
+Routers returning list payloads use NegotiatedRoute: a client sending
+`Accept: application/msgpack` gets the same document as MessagePack, which
+is smaller and cheaper to decode for large pages. Datetimes stay ISO
+strings in both formats, so clients handle the same shapes.
+
+When a route returns a pydantic model, FastAPI dumps it to a dict, validates
+that dict again against the route's response_model and only then encodes
+it. For pages of a thousand readings that round trip costs more CPU than
+the query. Routes on hot read paths build their models without validation
+(model_construct) and return `model_response(...)`, which encodes the model
+in one pass; response_model stays declared for the OpenAPI schema.
+"""
+
+from contextvars import ContextVar
+from typing import Any, Callable, Coroutine, Dict, Optional
+
+import msgpack
+import orjson
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+# Also accepted in Accept headers
+MSGPACK_ALIASES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack")
+# Served by the series endpoints when asked for (see services.series_arrow)
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# Encoding chosen for the response of the current request
+response_media_type: ContextVar[str] = ContextVar("response_media_type", default=JSON_MEDIA_TYPE)
+
+
+def _accepts(accept: Optional[str], media_types) -> bool:
+    """Check whether an Accept header lists one of `media_types` without q=0"""
+    if not accept:
+        return False
+    for part in accept.lower().split(","):
+        media_type, _, params = part.strip().partition(";")
+        if media_type.strip() in media_types:
+            return params.replace(" ", "") not in ("q=0", "q=0.0")
+    return False
+
+
+def accepts_msgpack(accept: Optional[str]) -> bool:
+    """
+    Check whether an Accept header asks for MessagePack
+
+    Args:
+        accept: Accept header value
+
+    Returns:
+        True if a MessagePack media type is listed without q=0
+    """
+    return _accepts(accept, MSGPACK_ALIASES)
+
+
+def accepts_arrow(accept: Optional[str]) -> bool:
+    """
+    Check whether an Accept header asks for an Arrow IPC stream
+
+    Args:
+        accept: Accept header value
+
+    Returns:
+        True if ARROW_STREAM_MEDIA_TYPE is listed without q=0
+    """
+    return _accepts(accept, (ARROW_STREAM_MEDIA_TYPE,))
+
+
+def encode_json(content: Any) -> bytes:
+    """Encode JSON-compatible content with orjson"""
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+def encode_msgpack(content: Any) -> bytes:
+    """Encode JSON-compatible content as MessagePack"""
+    return msgpack.packb(content, use_bin_type=True)
+
+
+class NegotiatedResponse(Response):
+    """
+    Default response class: orjson, or MessagePack when negotiated
+
+    FastAPI passes already JSON-compatible content (datetimes as strings),
+    so both encoders see the same values.
+    """
+
+    media_type = JSON_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        if response_media_type.get() == MSGPACK_MEDIA_TYPE:
+            # Starlette sets the content-type header after render()
+            self.media_type = MSGPACK_MEDIA_TYPE
+            return encode_msgpack(content)
+        return encode_json(content)
+
+
+class NegotiatedRoute(APIRoute):
+    """Route that answers in MessagePack when the client asks for it"""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def negotiated_handler(request: Request) -> Response:
+            media_type = (
+                MSGPACK_MEDIA_TYPE if accepts_msgpack(request.headers.get("accept"))
+                else JSON_MEDIA_TYPE
+            )
+            token = response_media_type.set(media_type)
+            try:
+                response = await handler(request)
+            finally:
+                response_media_type.reset(token)
+            # Caches must keep JSON and MessagePack variants apart
+            vary = response.headers.get("Vary")
+            response.headers["Vary"] = f"{vary}, Accept" if vary else "Accept"
+            return response
+
+        return negotiated_handler
+
+
+def model_response(
+    model: BaseModel,
+    status_code: int = 200,
+    headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """
+    Encode a response model directly in the negotiated format
+
+    Args:
+        model: Response model (trusted; not validated again)
+        status_code: HTTP status code
+        headers: Extra response headers
+
+    Returns:
+        JSON or MessagePack Response
+    """
+    if response_media_type.get() == MSGPACK_MEDIA_TYPE:
+        content, media_type = encode_msgpack(model.model_dump(mode="json")), MSGPACK_MEDIA_TYPE
+    else:
+        content, media_type = model.model_dump_json().encode(), JSON_MEDIA_TYPE
+    return Response(
+        content=content,
+        status_code=status_code,
+        headers=headers,
+        media_type=media_type
+    )
@@ -8,12 +8,18 @@ from typing import Optional, Dict, Any
 from fastapi import HTTPException, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 import bcrypt
+import json
 import logging
+import time
 
+from app.core.cache import TTLCache
 from app.core.config import get_settings
 from app.core.database import get_db
+from app.core.events import USERS_CHANNEL, EventListener, publish
+from app.core.hashing import password_pool
 from app.models.user import User
 from app.api.v1.repositories.user_repository import UserRepository
 
@@ -23,6 +29,21 @@ settings = get_settings()
 # JWT token bearer
 security = HTTPBearer()
 
+# Verified token payloads keyed by token; an entry never outlives the token's exp
+claims_cache = TTLCache(
+    maxsize=settings.AUTH_CACHE_MAX_ENTRIES,
+    ttl=settings.AUTH_CLAIMS_CACHE_TTL_SECONDS
+)
+
+# Column values of authenticated users keyed by user ID, dropped on every
+# user update/delete (see invalidate_principal)
+principal_cache = TTLCache(
+    maxsize=settings.AUTH_CACHE_MAX_ENTRIES,
+    ttl=settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS
+)
+
+USER_COLUMNS = [attr.key for attr in sa_inspect(User).column_attrs]
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -67,6 +88,26 @@ def get_password_hash(password: str) -> str:
     return hashed.decode("utf-8")
 
 
+async def check_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password on the hashing pool (use from async code)
+
+    Raises:
+        HTTPException: 503 if the hashing pool is saturated
+    """
+    return await password_pool.run(verify_password, plain_password, hashed_password)
+
+
+async def hash_password(password: str) -> str:
+    """
+    Hash a password on the hashing pool (use from async code)
+
+    Raises:
+        HTTPException: 503 if the hashing pool is saturated
+    """
+    return await password_pool.run(get_password_hash, password)
+
+
 def create_access_token(
     data: Dict[str, Any], expires_delta: Optional[timedelta] = None
 ) -> str:
@@ -123,10 +164,32 @@ def verify_token(token: str) -> Dict[str, Any]:
         )
 
 
+def _cached_claims(token: str) -> Dict[str, Any]:
+    """
+    Decode a token, verifying its signature only on the first use
+
+    Raises:
+        HTTPException: If token is invalid
+    """
+    payload = claims_cache.get(token)
+    if payload is not None and payload["exp"] > time.time():
+        return payload
+
+    payload = verify_token(token)
+    remaining = payload["exp"] - time.time() if "exp" in payload else 0
+    if remaining > 0:
+        claims_cache.set(token, payload, ttl=min(remaining, settings.AUTH_CLAIMS_CACHE_TTL_SECONDS))
+    return payload
+
+
 async def get_user_from_token(token: str, db: AsyncSession) -> Optional[User]:
     """
     Get user from JWT token using async database
 
+    Decoded claims and the user's columns are cached, so a repeated request
+    with the same token neither re-verifies the signature nor queries the
+    users table. The returned User is transient (not bound to a session).
+
     Args:
         token: JWT token string
         db: Database session
@@ -135,19 +198,26 @@ async def get_user_from_token(token: str, db: AsyncSession) -> Optional[User]:
         User instance or None if not found
     """
     try:
-        payload = verify_token(token)
+        payload = _cached_claims(token)
         user_id: int = payload.get("user_id")
         username: str = payload.get("sub")
 
         if user_id is None or username is None:
             return None
 
-        # Get user from database using repository
-        user_repo = UserRepository(db)
-        user = await user_repo.get_by_id(user_id)
+        snapshot = principal_cache.get(user_id)
+        if snapshot is None:
+            # Get user from database using repository
+            user_repo = UserRepository(db)
+            user = await user_repo.get_by_id(user_id)
+            if user is None:
+                return None
+
+            snapshot = {key: getattr(user, key) for key in USER_COLUMNS}
+            principal_cache.set(user_id, snapshot)
 
-        if user and user.username == username:
-            return user
+        if snapshot["username"] == username:
+            return User(**snapshot)
 
         return None
 
@@ -156,6 +226,32 @@ async def get_user_from_token(token: str, db: AsyncSession) -> Optional[User]:
         return None
 
 
+async def invalidate_principal(db: AsyncSession, user_id: int):
+    """
+    Drop the cached principal of a user after it was updated or deleted
+
+    Clears this process' entry right away and notifies the other API
+    processes when the surrounding transaction commits.
+
+    Args:
+        db: Database session of the writing transaction
+        user_id: Changed user ID
+    """
+    principal_cache.delete(user_id)
+    await publish(db, USERS_CHANNEL, [json.dumps({"user_id": user_id})])
+
+
+def _on_user_changed(payload: Dict[str, Any]):
+    principal_cache.delete(payload.get("user_id"))
+
+
+def attach_principal_cache(listener: EventListener):
+    """Invalidate cached principals from user change notifications"""
+    listener.subscribe(USERS_CHANNEL, _on_user_changed)
+    # Changes may have been missed while disconnected
+    listener.on_reset(principal_cache.clear)
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db),
@@ -0,0 +1,138 @@
+"""
+Sync Helpers
+Watermarks and ETags for incremental "changes since" endpoints
+
+Synced tables carry `xact_id`, the ID of the transaction that inserted the
+row. Sequence IDs are taken at INSERT time, so a transaction can commit a
+lower ID after a higher one is already visible; rows are therefore synced in
+(xact_id, id) order and only below the xmin of the current snapshot
+(`SYNC_HORIZON`), i.e. from transactions older than every one still in
+flight. Every row committed later sorts after the returned ones, so a client
+that keeps polling with the returned watermark sees each row exactly once.
+A long write transaction (e.g. a bulk upload batch) holds back newer rows
+until it ends.
+
+A sync response carries the opaque (xact_id, id) position of its last row as
+the new watermark. The ETag names the request scope (resource and filters)
+together with that watermark, so a client that polls with
+`since=<watermark>` and `If-None-Match: <etag>` receives 304 Not Modified
+until a new row arrives.
+"""
+
+import base64
+import hashlib
+from typing import Any, List, Optional, Tuple
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import BigInteger, Text, cast, func
+
+# Oldest transaction ID still in flight; rows of older transactions are final
+SYNC_HORIZON = cast(
+    cast(func.pg_snapshot_xmin(func.pg_current_snapshot()), Text),
+    BigInteger,
+)
+
+Watermark = Tuple[int, int]
+
+
+def encode_watermark(xact_id: int, id: int) -> str:
+    """
+    Encode the sync position of the last row of a response
+
+    Args:
+        xact_id: Inserting transaction ID of the row
+        id: ID of the row
+
+    Returns:
+        URL-safe watermark string
+    """
+    raw = f"{xact_id}.{id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_watermark(watermark: Optional[str]) -> Optional[Watermark]:
+    """
+    Decode a watermark produced by encode_watermark
+
+    Args:
+        watermark: Watermark from the client (None for the first sync)
+
+    Returns:
+        (xact_id, id) tuple or None
+
+    Raises:
+        HTTPException: 400 if the watermark is malformed
+    """
+    if not watermark:
+        return None
+
+    try:
+        padded = watermark + "=" * (-len(watermark) % 4)
+        xact_id, id = base64.urlsafe_b64decode(padded.encode()).decode().split(".")
+        return int(xact_id), int(id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid watermark"
+        )
+
+
+def make_etag(scope: Tuple[Any, ...], watermark: Optional[str]) -> str:
+    """
+    Build the ETag of a sync response
+
+    Args:
+        scope: Resource name and every filter that shapes the response
+        watermark: Position of the newest row the response brings the client to
+
+    Returns:
+        Quoted strong ETag
+    """
+    digest = hashlib.sha1(repr(scope).encode()).hexdigest()[:16]
+    return f'"{digest}-{watermark or 0}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag
+
+    Args:
+        if_none_match: Header value (may list several tags or be "*")
+        etag: Current ETag
+
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response carrying the ETag"""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+def split_changes(
+    changes: List[Tuple[Any, int]],
+    limit: int,
+    since: Optional[str]
+) -> Tuple[List[Any], bool, Optional[str]]:
+    """
+    Trim a limit+1 fetch and compute the new watermark
+
+    Args:
+        changes: (row, xact_id) pairs in sync order, fetched with limit + 1
+        limit: Requested maximum
+        since: Watermark the client sent
+
+    Returns:
+        Tuple of (rows, has_more, watermark)
+    """
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+    if not changes:
+        return [], has_more, since
+    last, xact_id = changes[-1]
+    return [row for row, _ in changes], has_more, encode_watermark(xact_id, last.id)
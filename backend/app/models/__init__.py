@@ -12,6 +12,12 @@ from app.models.sensor import Sensor
 from app.models.sensor_data import SensorData
 from app.models.gateway_assignment import GatewayAssignment
 from app.models.gateway_status_history import GatewayStatusHistory
+from app.models.sensor_data_archive import SensorDataArchive
+from app.models.background_job import BackgroundJob
+from app.models.measurement_type import MeasurementType
+from app.models.sensor_data_daily_count import SensorDataDailyCount
+from app.models.sensor_latest import SensorLatest
+
 
 __all__ = [
     "Base",
@@ -23,4 +29,9 @@ __all__ = [
     "SensorData",
     "GatewayAssignment",
     "GatewayStatusHistory",
+    "SensorDataArchive",
+    "BackgroundJob",
+    "MeasurementType",
+    "SensorDataDailyCount",
+    "SensorLatest",
 ]
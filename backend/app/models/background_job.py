@@ -0,0 +1,57 @@
+"""
+Background Job Model
+Tracks long-running work executed outside the request cycle
+"""
+
+from datetime import datetime
+from sqlalchemy import BigInteger, String, Text, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class BackgroundJob(Base):
+    """BackgroundJob model for progress reporting of asynchronous operations"""
+
+    __tablename__ = "background_jobs"
+
+    # Primary Key
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+
+    # Foreign Keys
+    user_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+
+    # Job Information
+    kind: Mapped[str] = mapped_column(String(50), nullable=False)
+    target_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    status: Mapped[str] = mapped_column(
+        String(20),
+        default="pending",
+        nullable=False,
+        index=True
+    )
+    processed_rows: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    total_rows: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Job arguments beyond target_id (e.g. export range and format)
+    params: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    # File produced by the job (e.g. an export), removed after EXPORT_RETENTION_HOURS
+    file_path: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        nullable=False
+    )
+    started_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<BackgroundJob(id={self.id}, kind='{self.kind}', status='{self.status}')>"
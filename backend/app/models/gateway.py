@@ -51,6 +51,8 @@ class Gateway(Base):
         index=True
     )
     last_seen: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    # SHA-256 of the gateway's HTTP/WebSocket ingestion token (never the token)
+    ingest_token_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -4,7 +4,7 @@ Tracks gateway status changes and uptime
 """
 
 from datetime import datetime
-from sqlalchemy import BigInteger, String, DateTime, ForeignKey
+from sqlalchemy import BigInteger, String, DateTime, ForeignKey, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import TYPE_CHECKING
 
@@ -42,6 +42,13 @@ class GatewayStatusHistory(Base):
         index=True
     )
 
+    # Inserting transaction, set by the database (sync order, see app.core.sync)
+    xact_id: Mapped[int] = mapped_column(
+        BigInteger,
+        server_default=text("pg_current_xact_id()::text::bigint"),
+        nullable=False
+    )
+
     # Relationships
     gateway: Mapped["Gateway"] = relationship("Gateway", back_populates="status_history")
 
@@ -0,0 +1,32 @@
+"""
+Measurement Type Model
+Dictionary of measurement types seen in sensor_data metadata
+"""
+
+from datetime import datetime
+from sqlalchemy import BigInteger, String, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class MeasurementType(Base):
+    """MeasurementType model backing trigram search over measurement names"""
+
+    __tablename__ = "measurement_types"
+
+    # Primary Key
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+
+    # Measurement Information
+    name: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<MeasurementType(id={self.id}, name='{self.name}')>"
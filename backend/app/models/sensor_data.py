@@ -4,10 +4,10 @@ Represents time-series sensor readings
 """
 
 from datetime import datetime
-from sqlalchemy import BigInteger, Float, String, DateTime, ForeignKey
+from sqlalchemy import BigInteger, Float, String, DateTime, ForeignKey, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import JSONB
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional
 
 from app.models.base import Base
 
@@ -51,9 +51,45 @@ class SensorData(Base):
         index=True
     )
 
+    # Inserting transaction, set by the database (sync order, see app.core.sync)
+    xact_id: Mapped[int] = mapped_column(
+        BigInteger,
+        server_default=text("pg_current_xact_id()::text::bigint"),
+        nullable=False
+    )
+
     # Relationships
     sensor: Mapped["Sensor"] = relationship("Sensor", back_populates="sensor_data")
     gateway: Mapped["Gateway"] = relationship("Gateway", back_populates="sensor_data")
 
     def __repr__(self) -> str:
         return f"<SensorData(id={self.id}, sensor_id={self.sensor_id}, value={self.value}, timestamp={self.timestamp})>"
+
+
+class SensorReading(NamedTuple):
+    """
+    Plain sensor_data row for read-only endpoints
+
+    Selected column by column, so no ORM identity, state tracking or
+    relationship loaders are set up for each of the (many) rows of a page.
+    """
+
+    id: int
+    sensor_id: int
+    gateway_id: int
+    value: float
+    unit: Optional[str]
+    metadata: Optional[dict[str, Any]]
+    timestamp: datetime
+
+
+# Columns to select into SensorReading, in field order
+READING_COLUMNS = (
+    SensorData.id,
+    SensorData.sensor_id,
+    SensorData.gateway_id,
+    SensorData.value,
+    SensorData.unit,
+    SensorData.metadata_,
+    SensorData.timestamp,
+)
@@ -0,0 +1,46 @@
+"""
+Sensor Data Archive Model
+Manifest of cold sensor data exported to Parquet files
+"""
+
+from datetime import datetime, date
+from sqlalchemy import BigInteger, Integer, String, Date, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class SensorDataArchive(Base):
+    """SensorDataArchive model indexing one Parquet file per gateway and day"""
+
+    __tablename__ = "sensor_data_archives"
+
+    # Primary Key
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+
+    # Foreign Keys
+    gateway_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("gateways.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+
+    # Archive Information
+    day: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    path: Mapped[str] = mapped_column(String(500), nullable=False, unique=True)
+    row_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    sensor_ids: Mapped[list[int]] = mapped_column(ARRAY(BigInteger), nullable=False)
+    min_timestamp: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    max_timestamp: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<SensorDataArchive(id={self.id}, gateway_id={self.gateway_id}, day={self.day}, rows={self.row_count})>"
@@ -0,0 +1,38 @@
+"""
+Sensor Data Daily Count Model
+Incrementally maintained number of readings per gateway and day
+"""
+
+from datetime import datetime, date
+from sqlalchemy import BigInteger, Date, DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class SensorDataDailyCount(Base):
+    """SensorDataDailyCount model updated by every ingestion flush"""
+
+    __tablename__ = "sensor_data_daily_counts"
+
+    # Composite Primary Key
+    gateway_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("gateways.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    # Counter
+    readings: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    # Timestamps
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<SensorDataDailyCount(gateway_id={self.gateway_id}, day={self.day}, readings={self.readings})>"
@@ -0,0 +1,49 @@
+"""
+Sensor Latest Model
+Most recent reading per sensor and measurement type
+"""
+
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import BigInteger, String, Float, DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class SensorLatest(Base):
+    """SensorLatest model upserted by ingestion on every batch flush"""
+
+    __tablename__ = "sensor_latest"
+
+    # Composite Primary Key
+    sensor_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("sensors.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    measurement_type: Mapped[str] = mapped_column(String(100), primary_key=True)
+
+    # Foreign Keys
+    gateway_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("gateways.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+
+    # Reading
+    value: Mapped[float] = mapped_column(Float, nullable=False)
+    unit: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    timestamp: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    # Timestamps
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<SensorLatest(sensor_id={self.sensor_id}, measurement_type='{self.measurement_type}', value={self.value})>"
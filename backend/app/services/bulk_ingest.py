@@ -0,0 +1,450 @@
+"""
+Bulk Sensor Data Ingestion
+Large uploads of readings for many sensors, read and stored as a stream
+
+POST /sensors/data:bulk takes a JSON array or an NDJSON stream (optionally
+gzip encoded) of SensorDataBulkItem rows, e.g. backfills from SD cards or
+third-party loggers. The body is parsed incrementally and rows are validated
+one by one; valid rows are loaded with COPY in batches of BULK_BATCH_SIZE, one
+transaction each, so memory stays flat for millions of rows and an upload
+that fails halfway keeps the batches already stored. Every referenced sensor
+is authorized against the user's owned IDs, loaded in one query (see
+services.ownership). Invalid rows are skipped and reported by position.
+"""
+
+import codecs
+import json
+import logging
+import re
+import zlib
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import orjson
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.events import READINGS_CHANNEL, encode_reading_events, publish, to_epoch
+from app.services.ownership import OwnedIds, load_owned_ids, ownership_cache
+from app.api.v1.repositories.sensor_data_repository import SensorDataRepository
+from app.api.v1.repositories.measurement_type_repository import MeasurementTypeRepository
+from app.api.v1.repositories.sensor_data_daily_count_repository import SensorDataDailyCountRepository
+from app.api.v1.repositories.sensor_latest_repository import SensorLatestRepository
+from app.api.v1.schemas.sensor_data import (
+    SensorDataBulkItem,
+    SensorDataBulkError,
+    SensorDataBulkResponse,
+)
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+# A single line or array element larger than this ends the upload
+MAX_ROW_BYTES = 1 << 20
+# Decompressed bytes handed to the reader at a time (bounds gzip bombs)
+GUNZIP_CHUNK_BYTES = 1 << 20
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# (row number, decoded JSON value, error)
+ParsedRow = Tuple[int, Any, Optional[str]]
+
+# OpenAPI `requestBody` of the bulk route (the body is read as a stream)
+BULK_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {
+                "schema": {"type": "array", "items": SensorDataBulkItem.model_json_schema()}
+            },
+            "application/x-ndjson": {
+                "schema": {"type": "string", "description": "One SensorDataBulkItem object per line"}
+            },
+        },
+    }
+}
+
+
+class BulkFormatError(ValueError):
+    """The upload body cannot be read any further"""
+
+
+class NdjsonReader:
+    """Incremental reader of an NDJSON body; one row per non-blank line"""
+
+    def __init__(self):
+        self._rest = b""
+        self._line = 0
+        self._error: Optional[BulkFormatError] = None
+
+    def feed(self, data: bytes, final: bool = False) -> List[ParsedRow]:
+        """
+        Parse the complete lines received so far
+
+        Args:
+            data: Next part of the body
+            final: True once the body has ended
+
+        Returns:
+            Parsed rows, numbered by line
+
+        Raises:
+            BulkFormatError: A line is too long (after its preceding rows were returned)
+        """
+        if self._error is not None:
+            raise self._error
+        lines = (self._rest + data).split(b"\n")
+        self._rest = b"" if final else lines.pop()
+        if len(self._rest) > MAX_ROW_BYTES:
+            self._error = BulkFormatError(
+                f"Line {self._line + len(lines) + 1} is longer than {MAX_ROW_BYTES} bytes"
+            )
+
+        rows = []
+        for line in lines:
+            self._line += 1
+            if not line.strip():
+                continue
+            try:
+                rows.append((self._line, orjson.loads(line), None))
+            except orjson.JSONDecodeError as e:
+                rows.append((self._line, None, f"Invalid JSON: {e}"))
+        if self._error is not None and not rows:
+            raise self._error
+        return rows
+
+
+class JsonArrayReader:
+    """Incremental reader of the elements of a top-level JSON array"""
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._expect = "["  # "[", "first", "value", "," or "end"
+        self._element = 0
+        self._error: Optional[BulkFormatError] = None
+
+    def feed(self, data: bytes, final: bool = False) -> List[ParsedRow]:
+        """
+        Parse the complete elements received so far
+
+        Args:
+            data: Next part of the body
+            final: True once the body has ended
+
+        Returns:
+            Parsed rows, numbered by array position
+
+        Raises:
+            BulkFormatError: The array syntax is broken (after the elements
+                before the broken part were returned)
+        """
+        if self._error is not None:
+            raise self._error
+        try:
+            buffer = self._buffer + self._text.decode(data, final)
+        except UnicodeDecodeError:
+            raise BulkFormatError("Body is not valid UTF-8")
+
+        rows: List[ParsedRow] = []
+        try:
+            position = self._parse(buffer, final, rows)
+        except BulkFormatError as e:
+            if not rows:
+                raise
+            self._error = e
+            return rows
+        self._buffer = buffer[position:]
+        return rows
+
+    def _parse(self, buffer: str, final: bool, rows: List[ParsedRow]) -> int:
+        """Append the complete elements of `buffer` to rows; returns the position parsed up to"""
+        position = 0
+        while True:
+            position = _WHITESPACE.match(buffer, position).end()
+            if position == len(buffer):
+                if final and self._expect != "end":
+                    raise BulkFormatError("Unexpected end of JSON array")
+                break
+            char = buffer[position]
+
+            if self._expect == "[":
+                if char != "[":
+                    raise BulkFormatError("Body must be a JSON array")
+                position += 1
+                self._expect = "first"
+
+            elif self._expect in ("first", "value"):
+                if char == "]" and self._expect == "first":
+                    position += 1
+                    self._expect = "end"
+                    continue
+                try:
+                    value, end = self._decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError as e:
+                    # Most likely an element cut off at the end of this part
+                    if not final and len(buffer) - position <= MAX_ROW_BYTES:
+                        break
+                    raise BulkFormatError(f"Invalid JSON in element {self._element + 1}: {e.msg}")
+                if end == len(buffer) and not final:
+                    break  # a trailing number may continue in the next part
+                self._element += 1
+                rows.append((self._element, value, None))
+                position = end
+                self._expect = ","
+
+            elif self._expect == ",":
+                if char == ",":
+                    self._expect = "value"
+                elif char == "]":
+                    self._expect = "end"
+                else:
+                    raise BulkFormatError(f"Expected ',' or ']' after element {self._element}")
+                position += 1
+
+            else:
+                raise BulkFormatError("Unexpected data after the JSON array")
+
+        return position
+
+
+async def gunzip(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    Decompress a gzip encoded body as it arrives
+
+    Args:
+        chunks: Raw body chunks
+
+    Yields:
+        Decompressed data, at most GUNZIP_CHUNK_BYTES at a time
+    """
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    try:
+        async for chunk in chunks:
+            while chunk:
+                data = decompressor.decompress(chunk, GUNZIP_CHUNK_BYTES)
+                chunk = decompressor.unconsumed_tail
+                yield data
+        tail = decompressor.flush()
+    except zlib.error as e:
+        raise BulkFormatError(f"Invalid gzip body: {e}")
+    if tail:
+        yield tail
+
+
+def _naive_utc(timestamp: datetime) -> datetime:
+    """Timestamps are stored as naive UTC"""
+    if timestamp.tzinfo is None:
+        return timestamp
+    return timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _validation_detail(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc']) or 'row'}: {detail['msg']}"
+        for detail in error.errors(include_url=False)
+    )
+
+
+class BulkUpload:
+    """Validates rows of one upload and stores them batch by batch"""
+
+    def __init__(self, db: AsyncSession, user_id: int):
+        """
+        Initialize upload
+
+        Args:
+            db: Database session (committed once per batch)
+            user_id: Uploading user; only their sensors are accepted
+        """
+        self.db = db
+        self.user_id = user_id
+        self.received = 0
+        self.inserted = 0
+        self.rejected = 0
+        self.errors: List[SensorDataBulkError] = []
+        self.errors_truncated = False
+        self.complete = True
+        self._now = datetime.utcnow()
+        self._owned: Optional[OwnedIds] = None
+        self._reloaded = False
+        # (row, sensor_id, gateway_id, value, unit, metadata JSON, timestamp, measurement)
+        self._pending: List[tuple] = []
+
+    def reject(self, row: int, sensor_id: Optional[int], detail: str):
+        """Record a rejected row (listed up to BULK_MAX_ERRORS)"""
+        self.rejected += 1
+        if len(self.errors) < settings.BULK_MAX_ERRORS:
+            self.errors.append(SensorDataBulkError(row=row, sensor_id=sensor_id, detail=detail))
+        else:
+            self.errors_truncated = True
+
+    def abort(self, detail: str):
+        """
+        Stop the upload; rows queued for the next batch are not stored
+
+        Args:
+            detail: Reason, reported as an error after the last row read
+        """
+        self.complete = False
+        if self._pending:
+            self.rejected += len(self._pending)
+            detail = f"{detail}; rows {self._pending[0][0]}-{self._pending[-1][0]} were not stored"
+            self._pending = []
+        self.errors.append(SensorDataBulkError(row=self.received + 1, detail=detail))
+
+    async def add(self, row: int, value: Any, error: Optional[str]):
+        """
+        Validate one parsed row and queue it for the next batch
+
+        Args:
+            row: Row number
+            value: Decoded JSON value
+            error: Parse error of the row, if any
+        """
+        self.received += 1
+        if error is not None:
+            self.reject(row, None, error)
+            return
+        if not isinstance(value, dict):
+            self.reject(row, None, "Row must be a JSON object")
+            return
+
+        try:
+            item = SensorDataBulkItem.model_validate(value)
+        except ValidationError as e:
+            sensor_id = value.get("sensor_id")
+            self.reject(row, sensor_id if isinstance(sensor_id, int) else None, _validation_detail(e))
+            return
+
+        gateway_id = await self._gateway_of(item.sensor_id)
+        if gateway_id is None:
+            self.reject(row, item.sensor_id, "Sensor not found")
+            return
+        if item.gateway_id is not None and item.gateway_id != gateway_id:
+            self.reject(row, item.sensor_id, "Gateway ID mismatch")
+            return
+
+        measurement = (item.metadata or {}).get("measurement_type")
+        self._pending.append((
+            row,
+            item.sensor_id,
+            gateway_id,
+            item.value,
+            item.unit,
+            orjson.dumps(item.metadata).decode() if item.metadata is not None else None,
+            _naive_utc(item.timestamp) if item.timestamp else self._now,
+            measurement if isinstance(measurement, str) else None,
+        ))
+        if len(self._pending) >= settings.BULK_BATCH_SIZE:
+            await self.flush()
+
+    async def flush(self):
+        """Store the queued rows and their counters, latest values and events in one transaction"""
+        if not self._pending:
+            return
+        rows = self._pending
+
+        per_gateway: Dict[int, List[datetime]] = defaultdict(list)
+        per_sensor: Dict[Tuple[int, int], List[tuple]] = defaultdict(list)
+        for _, sensor_id, gateway_id, value, unit, _, timestamp, measurement in rows:
+            per_gateway[gateway_id].append(timestamp)
+            per_sensor[sensor_id, gateway_id].append((measurement, value, unit, timestamp))
+
+        await SensorDataRepository(self.db).copy_readings([row[1:7] for row in rows])
+        await MeasurementTypeRepository(self.db).register(row[7] for row in rows)
+
+        counts_repo = SensorDataDailyCountRepository(self.db)
+        for gateway_id, timestamps in per_gateway.items():
+            await counts_repo.increment(gateway_id, timestamps)
+
+        # Backfilled history is of no interest to live clients and the hot window
+        recent = datetime.utcnow() - timedelta(hours=settings.HOT_WINDOW_HOURS)
+        latest_repo = SensorLatestRepository(self.db)
+        for (sensor_id, gateway_id), readings in per_sensor.items():
+            await latest_repo.upsert(sensor_id, gateway_id, readings)
+            await publish(self.db, READINGS_CHANNEL, encode_reading_events(sensor_id, gateway_id, [
+                (measurement, to_epoch(timestamp), value, unit)
+                for measurement, value, unit, timestamp in readings
+                if timestamp >= recent
+            ]))
+
+        await self.db.commit()
+        self.inserted += len(rows)
+        self._pending = []
+
+    async def _gateway_of(self, sensor_id: int) -> Optional[int]:
+        """Gateway of an owned sensor; owned IDs are reloaded at most once per upload"""
+        owned = self._owned or ownership_cache.get(self.user_id)
+        if owned is None or (sensor_id not in owned.sensor_gateways and not self._reloaded):
+            owned = await load_owned_ids(self.db, self.user_id)
+            self._reloaded = True
+        self._owned = owned
+        return owned.sensor_gateways.get(sensor_id)
+
+    def summary(self) -> SensorDataBulkResponse:
+        """Upload summary"""
+        return SensorDataBulkResponse(
+            received=self.received,
+            inserted=self.inserted,
+            rejected=self.rejected,
+            errors=self.errors,
+            errors_truncated=self.errors_truncated,
+            complete=self.complete
+        )
+
+
+async def ingest_bulk(
+    db: AsyncSession,
+    user_id: int,
+    chunks: AsyncIterator[bytes],
+    ndjson: bool = False,
+    gzipped: bool = False
+) -> SensorDataBulkResponse:
+    """
+    Read, validate and store an uploaded body
+
+    Args:
+        db: Database session
+        user_id: Uploading user
+        chunks: Body chunks as received
+        ndjson: Body is NDJSON instead of a JSON array
+        gzipped: Body is gzip encoded
+
+    Returns:
+        Upload summary
+    """
+    upload = BulkUpload(db, user_id)
+    reader = NdjsonReader() if ndjson else JsonArrayReader()
+    if gzipped:
+        chunks = gunzip(chunks)
+
+    try:
+        try:
+            async for chunk in chunks:
+                for row, value, error in reader.feed(chunk):
+                    await upload.add(row, value, error)
+            for row, value, error in reader.feed(b"", final=True):
+                await upload.add(row, value, error)
+        except BulkFormatError as e:
+            # Rows before the broken part are still stored
+            await upload.flush()
+            upload.abort(str(e))
+        else:
+            await upload.flush()
+
+    except Exception as e:
+        # Batches committed so far are kept
+        await db.rollback()
+        logger.error(f"❌ Bulk upload of user {user_id} failed after {upload.inserted} rows: {e}")
+        upload.abort("Failed to store sensor data")
+
+    logger.info(
+        f"📦 Bulk upload of user {user_id}: {upload.inserted} stored, {upload.rejected} rejected"
+    )
+    return upload.summary()
@@ -0,0 +1,284 @@
+"""
+Cascade Delete Jobs
+Set-based, chunked deletes of gateways, sensors, farms and farmers
+
+Deleting a gateway through the ORM cascade loads every sensor_data row into
+memory first. These jobs instead delete child tables with bounded
+`DELETE ... WHERE id IN (SELECT id ... LIMIT n)` statements, each in its own
+short transaction, and record progress on the background_jobs row.
+"""
+
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from sqlalchemy import select, delete, update, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.database import SessionLocal
+from app.models.background_job import BackgroundJob
+from app.models.gateway import Gateway
+from app.models.sensor import Sensor
+from app.models.sensor_data import SensorData
+from app.models.sensor_data_archive import SensorDataArchive
+from app.models.gateway_status_history import GatewayStatusHistory
+from app.models.gateway_assignment import GatewayAssignment
+from app.models.farm import Farm
+from app.models.farmer import Farmer
+from app.api.v1.repositories.background_job_repository import BackgroundJobRepository
+from app.services.gateway_status_scheduler import run_in_background
+from app.services.ownership import invalidate_ownership_sync
+from app.services.sensor_data_archive import remove_sensor_from_archive
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+def _set_job(db: Session, job_id: int, **values):
+    """Update job columns and commit"""
+    db.execute(update(BackgroundJob).where(BackgroundJob.id == job_id).values(**values))
+    db.commit()
+
+
+def _count(db: Session, column, value) -> int:
+    """Count rows where column == value"""
+    return db.execute(select(func.count()).where(column == value)).scalar_one()
+
+
+def _delete_in_batches(db: Session, model, column, value, job_id: int) -> int:
+    """
+    Delete all rows of a child table in bounded batches
+
+    Args:
+        db: Sync database session
+        model: Model class to delete from
+        column: Foreign key column to match
+        value: Foreign key value
+        job_id: Job to report progress on
+
+    Returns:
+        Number of deleted rows
+    """
+    batch_size = settings.DELETE_BATCH_SIZE
+    deleted = 0
+
+    while True:
+        batch = (
+            select(model.id)
+            .where(column == value)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        result = db.execute(delete(model).where(model.id.in_(batch)))
+        db.execute(
+            update(BackgroundJob)
+            .where(BackgroundJob.id == job_id)
+            .values(processed_rows=BackgroundJob.processed_rows + result.rowcount)
+        )
+        db.commit()
+
+        deleted += result.rowcount
+        if result.rowcount < batch_size:
+            return deleted
+
+
+def _purge_archives(db: Session, gateway_id: int):
+    """Remove archive manifest rows and Parquet files of a gateway"""
+    paths = db.execute(
+        delete(SensorDataArchive)
+        .where(SensorDataArchive.gateway_id == gateway_id)
+        .returning(SensorDataArchive.path)
+    ).scalars().all()
+    db.commit()
+
+    for path in paths:
+        try:
+            Path(path).unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Could not remove archive file {path}: {e}")
+
+
+# ==================== PLANS ====================
+# Each plan records the total number of child rows (for progress) and runs the
+# deletes, child tables first. The parent row is removed last in a transaction
+# that also sweeps rows written while the job was running.
+
+def _delete_sensor(db: Session, job_id: int, sensor_id: int):
+    _set_job(db, job_id, total_rows=_count(db, SensorData.sensor_id, sensor_id))
+
+    _delete_in_batches(db, SensorData, SensorData.sensor_id, sensor_id, job_id)
+    # After the hot rows, so readings archived meanwhile are in the manifest by now
+    archived = remove_sensor_from_archive(db, sensor_id)
+    if archived:
+        logger.info(f"Removed {archived} archived readings of sensor {sensor_id}")
+
+    db.execute(delete(SensorData).where(SensorData.sensor_id == sensor_id))
+    db.execute(delete(Sensor).where(Sensor.id == sensor_id))
+    db.commit()
+
+
+def _delete_gateway(db: Session, job_id: int, gateway_id: int):
+    sensor_ids: List[int] = list(
+        db.execute(select(Sensor.id).where(Sensor.gateway_id == gateway_id)).scalars().all()
+    )
+
+    total = (
+        _count(db, SensorData.gateway_id, gateway_id)
+        + _count(db, GatewayStatusHistory.gateway_id, gateway_id)
+        + _count(db, GatewayAssignment.gateway_id, gateway_id)
+    )
+    _set_job(db, job_id, total_rows=total)
+
+    _delete_in_batches(db, SensorData, SensorData.gateway_id, gateway_id, job_id)
+    for sensor_id in sensor_ids:
+        # Readings of this gateway's sensors that were reported through another gateway
+        _delete_in_batches(db, SensorData, SensorData.sensor_id, sensor_id, job_id)
+    _delete_in_batches(db, GatewayStatusHistory, GatewayStatusHistory.gateway_id, gateway_id, job_id)
+    _delete_in_batches(db, GatewayAssignment, GatewayAssignment.gateway_id, gateway_id, job_id)
+    _purge_archives(db, gateway_id)
+    for sensor_id in sensor_ids:
+        # Archived under other gateways; this gateway's own files are gone by now
+        remove_sensor_from_archive(db, sensor_id)
+
+    db.execute(delete(SensorData).where(SensorData.gateway_id == gateway_id))
+    if sensor_ids:
+        db.execute(delete(SensorData).where(SensorData.sensor_id.in_(sensor_ids)))
+    db.execute(delete(GatewayStatusHistory).where(GatewayStatusHistory.gateway_id == gateway_id))
+    db.execute(delete(Sensor).where(Sensor.gateway_id == gateway_id))
+    db.execute(delete(Gateway).where(Gateway.id == gateway_id))
+    db.commit()
+
+
+def _delete_farm(db: Session, job_id: int, farm_id: int):
+    _set_job(db, job_id, total_rows=_count(db, GatewayAssignment.farm_id, farm_id))
+
+    _delete_in_batches(db, GatewayAssignment, GatewayAssignment.farm_id, farm_id, job_id)
+
+    db.execute(delete(GatewayAssignment).where(GatewayAssignment.farm_id == farm_id))
+    db.execute(delete(Farm).where(Farm.id == farm_id))
+    db.commit()
+
+
+def _delete_farmer(db: Session, job_id: int, farmer_id: int):
+    farm_ids: List[int] = list(
+        db.execute(select(Farm.id).where(Farm.farmer_id == farmer_id)).scalars().all()
+    )
+
+    total = len(farm_ids) + db.execute(
+        select(func.count())
+        .select_from(GatewayAssignment)
+        .join(Farm, GatewayAssignment.farm_id == Farm.id)
+        .where(Farm.farmer_id == farmer_id)
+    ).scalar_one()
+    _set_job(db, job_id, total_rows=total)
+
+    for farm_id in farm_ids:
+        _delete_in_batches(db, GatewayAssignment, GatewayAssignment.farm_id, farm_id, job_id)
+    _delete_in_batches(db, Farm, Farm.farmer_id, farmer_id, job_id)
+
+    db.execute(delete(Farmer).where(Farmer.id == farmer_id))
+    db.commit()
+
+
+DELETE_PLANS: Dict[str, Tuple[str, Callable[[Session, int, int], None]]] = {
+    "delete_sensor": ("Sensor", _delete_sensor),
+    "delete_gateway": ("Gateway", _delete_gateway),
+    "delete_farm": ("Farm", _delete_farm),
+    "delete_farmer": ("Farmer", _delete_farmer),
+}
+
+# Deletes that change the requesting user's owned gateway/sensor IDs
+OWNERSHIP_KINDS = ("delete_sensor", "delete_gateway")
+
+
+def run_cascade_delete(job_id: int):
+    """
+    Execute a pending cascade delete job
+    Runs on the background scheduler's thread pool with a sync session
+    """
+    db: Session = SessionLocal()
+    try:
+        job = db.get(BackgroundJob, job_id)
+        if job is None or job.status != "pending":
+            logger.warning(f"Cascade delete job {job_id} not found or already started")
+            return
+
+        label, plan = DELETE_PLANS[job.kind]
+        target_id = job.target_id
+        kind, user_id = job.kind, job.user_id
+        _set_job(db, job_id, status="running", started_at=datetime.utcnow())
+
+        logger.info(f"🗑️  Cascade delete job {job_id} started: {label} {target_id}")
+        plan(db, job_id, target_id)
+
+        if kind in OWNERSHIP_KINDS:
+            # Sent with the completion commit below
+            invalidate_ownership_sync(db, user_id)
+        _set_job(
+            db,
+            job_id,
+            status="completed",
+            finished_at=datetime.utcnow(),
+            message=f"{label} {target_id} deleted",
+        )
+        logger.info(f"✅ Cascade delete job {job_id} completed: {label} {target_id}")
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"❌ Cascade delete job {job_id} failed: {e}")
+        try:
+            _set_job(
+                db,
+                job_id,
+                status="failed",
+                finished_at=datetime.utcnow(),
+                message=str(e)[:1000],
+            )
+        except Exception as update_error:
+            logger.error(f"❌ Could not mark job {job_id} as failed: {update_error}")
+            db.rollback()
+    finally:
+        db.close()
+
+
+async def submit_cascade_delete(
+    db: AsyncSession,
+    user_id: int,
+    kind: str,
+    target_id: int
+) -> BackgroundJob:
+    """
+    Create a cascade delete job and hand it to the background scheduler
+
+    An existing pending/running job for the same target is returned instead
+    of starting a second one.
+
+    Args:
+        db: Async database session of the request
+        user_id: ID of the user requesting the delete
+        kind: One of DELETE_PLANS
+        target_id: ID of the entity to delete
+
+    Returns:
+        The BackgroundJob tracking the delete
+    """
+    job_repo = BackgroundJobRepository(db)
+
+    existing = await job_repo.get_active_for_target(kind, target_id)
+    if existing:
+        return existing
+
+    job = await job_repo.create(
+        user_id=user_id,
+        kind=kind,
+        target_id=target_id,
+        status="pending"
+    )
+    # The job row must be visible to the worker thread before it starts
+    await db.commit()
+
+    run_in_background(run_cascade_delete, job.id, name=f"{kind} {target_id}")
+    return job
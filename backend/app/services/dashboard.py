@@ -0,0 +1,143 @@
+"""
+Dashboard Aggregation
+Builds the dashboard overview in two grouped queries with a per-user cache
+
+The inventory counts (gateways, sensors, farms, farmers, assignments) come
+from one statement and the reading counts for today, the last 7 days and the
+activity chart from the per gateway/day counters maintained by ingestion
+(an index range over 7 days per gateway, independent of table size). Both run
+concurrently on their own pooled sessions. Results are cached per user for
+DASHBOARD_CACHE_TTL_SECONDS, which absorbs the periodic refetch of every open
+dashboard.
+"""
+
+import asyncio
+from datetime import datetime, date, timedelta
+from typing import Dict
+
+from sqlalchemy import select, func, and_, true
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.core.database import read_session
+from app.models.gateway import Gateway
+from app.models.sensor import Sensor
+from app.models.farm import Farm
+from app.models.farmer import Farmer
+from app.models.gateway_assignment import GatewayAssignment
+from app.api.v1.repositories.sensor_data_daily_count_repository import SensorDataDailyCountRepository
+from app.api.v1.schemas.dashboard import (
+    DashboardResponse,
+    DashboardStats,
+    DashboardActivity,
+    ActivityDataPoint,
+)
+
+settings = get_settings()
+
+ACTIVITY_DAYS = 7
+
+# Dashboard responses keyed by user ID
+dashboard_cache = TTLCache(
+    maxsize=settings.DASHBOARD_CACHE_MAX_ENTRIES,
+    ttl=settings.DASHBOARD_CACHE_TTL_SECONDS
+)
+
+
+async def _inventory_counts(user_id: int):
+    """Gateway, sensor, farm, farmer and assignment counts in one statement"""
+    owned_gateways = select(Gateway.id).where(Gateway.user_id == user_id)
+
+    gateways = select(
+        func.count(Gateway.id).label('total'),
+        func.count().filter(Gateway.status == 'online').label('active'),
+        func.count().filter(Gateway.status == 'offline').label('offline'),
+        func.count().filter(Gateway.status == 'maintenance').label('maintenance'),
+    ).where(Gateway.user_id == user_id).subquery()
+
+    sensors = select(
+        func.count(Sensor.id).label('total'),
+        func.count().filter(Sensor.status == 'active').label('active'),
+    ).join(Gateway).where(Gateway.user_id == user_id).subquery()
+
+    query = select(
+        gateways.c.total.label('total_gateways'),
+        gateways.c.active.label('active_gateways'),
+        gateways.c.offline.label('offline_gateways'),
+        gateways.c.maintenance.label('maintenance_gateways'),
+        sensors.c.total.label('total_sensors'),
+        sensors.c.active.label('active_sensors'),
+        select(func.count(Farm.id)).join(Farmer, Farmer.id == Farm.farmer_id)
+        .scalar_subquery().label('total_farms'),
+        select(func.count(Farmer.id)).scalar_subquery().label('total_farmers'),
+        select(func.count(GatewayAssignment.id)).where(
+            and_(
+                GatewayAssignment.is_active == True,
+                GatewayAssignment.gateway_id.in_(owned_gateways)
+            )
+        ).scalar_subquery().label('active_assignments'),
+    ).select_from(gateways.join(sensors, true()))
+
+    async with read_session() as session:
+        result = await session.execute(query)
+        return result.one()
+
+
+async def _reading_counts(user_id: int, first_day: date, last_day: date) -> Dict[date, int]:
+    """Readings per day from the incrementally maintained daily counters"""
+    async with read_session() as session:
+        return await SensorDataDailyCountRepository(session).get_daily_for_user(
+            user_id, first_day, last_day
+        )
+
+
+async def build_dashboard(user_id: int) -> DashboardResponse:
+    """
+    Build the dashboard of a user, served from the per-user cache when fresh
+
+    Args:
+        user_id: Current user ID
+
+    Returns:
+        Dashboard response
+    """
+    cached = dashboard_cache.get(user_id)
+    if cached is not None:
+        return cached
+
+    today = datetime.utcnow().date()
+    first_day = today - timedelta(days=ACTIVITY_DAYS - 1)
+    inventory, per_day = await asyncio.gather(
+        _inventory_counts(user_id),
+        _reading_counts(user_id, first_day, today),
+    )
+
+    activity_data = []
+    for i in range(ACTIVITY_DAYS - 1, -1, -1):
+        day = today - timedelta(days=i)
+        activity_data.append(ActivityDataPoint(
+            # Format date as "Oct 22"
+            date=day.strftime("%b %d"),
+            readings=per_day.get(day, 0)
+        ))
+
+    stats = DashboardStats(
+        total_gateways=inventory.total_gateways or 0,
+        active_gateways=inventory.active_gateways or 0,
+        offline_gateways=inventory.offline_gateways or 0,
+        maintenance_gateways=inventory.maintenance_gateways or 0,
+        total_sensors=inventory.total_sensors or 0,
+        active_sensors=inventory.active_sensors or 0,
+        total_farms=inventory.total_farms or 0,
+        total_farmers=inventory.total_farmers or 0,
+        active_assignments=inventory.active_assignments or 0,
+        today_readings_count=per_day.get(today, 0),
+        week_readings_count=sum(per_day.values()),
+    )
+
+    response = DashboardResponse(
+        stats=stats,
+        activity=DashboardActivity(data=activity_data),
+    )
+    dashboard_cache.set(user_id, response)
+    return response
@@ -0,0 +1,308 @@
+"""
+Downsampling
+Visual-fidelity reduction of raw sensor readings (LTTB and min/max per pixel)
+"""
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# LTTB chooses each output point from the candidates of this many reducer columns
+LTTB_OVERSAMPLING = 4
+
+
+class SeriesMode(str, Enum):
+    """How the series endpoint reduces readings to chart points"""
+
+    AVG = "avg"        # time buckets with avg/min/max/count (computed in the database)
+    LTTB = "lttb"      # Largest-Triangle-Three-Buckets over raw readings
+    MINMAX = "minmax"  # min and max reading per pixel column over raw readings
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Largest-Triangle-Three-Buckets downsampling
+
+    Keeps the first and last point and, for every bucket in between, the
+    point forming the largest triangle with the previously selected point
+    and the average of the next bucket.
+
+    Args:
+        x: Sorted x values (epoch seconds)
+        y: Values
+        threshold: Maximum number of points to return (>= 3)
+
+    Returns:
+        (x, y) of the selected points
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return x, y
+
+    # Bucket boundaries over the inner points [1, n - 1)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if hi <= lo:
+            hi = lo + 1
+
+        # Average of the next bucket (the last point for the final bucket)
+        if i + 2 < len(edges):
+            nlo, nhi = edges[i + 1], max(edges[i + 2], edges[i + 1] + 1)
+            avg_x = x[nlo:nhi].mean()
+            avg_y = y[nlo:nhi].mean()
+        else:
+            avg_x, avg_y = x[n - 1], y[n - 1]
+
+        area = np.abs(
+            (x[a] - avg_x) * (y[lo:hi] - y[a])
+            - (x[a] - x[lo:hi]) * (avg_y - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+
+    return x[selected], y[selected]
+
+
+class MinMaxReducer:
+    """
+    Streaming min/max-per-pixel reducer
+
+    The range is split into `pixels` equal columns; for each column the
+    lowest and highest reading (with their timestamps) are kept. Chunks may
+    arrive in any order, so only O(pixels) state is held regardless of the
+    number of readings.
+    """
+
+    def __init__(self, start: float, end: float, pixels: int):
+        """
+        Initialize reducer
+
+        Args:
+            start: Range start (epoch seconds)
+            end: Range end (epoch seconds)
+            pixels: Number of columns
+        """
+        self.start = start
+        self.pixels = pixels
+        self.width = (end - start) / pixels
+        self.min_y = np.full(pixels, np.inf)
+        self.max_y = np.full(pixels, -np.inf)
+        self.min_x = np.zeros(pixels)
+        self.max_x = np.zeros(pixels)
+        self.count = 0
+
+    def _columns(self, x: np.ndarray) -> np.ndarray:
+        """Column index of every reading (out-of-range readings go to the edge columns)"""
+        return np.clip(((x - self.start) / self.width).astype(np.int64), 0, self.pixels - 1)
+
+    @staticmethod
+    def _group_edges(column: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Masks of the first and last row of every run of a sorted column array"""
+        boundary = column[1:] != column[:-1]
+        return np.concatenate(([True], boundary)), np.concatenate((boundary, [True]))
+
+    def update(self, x: np.ndarray, y: np.ndarray):
+        """Fold a chunk of readings into the per-column extremes"""
+        if not len(x):
+            return
+        self.count += len(x)
+
+        column = self._columns(x)
+        order = np.lexsort((y, column))
+        column, x, y = column[order], x[order], y[order]
+
+        # Within each column the rows are sorted by value: first is min, last is max
+        first, last = self._group_edges(column)
+
+        cols = column[first]
+        lower = y[first] < self.min_y[cols]
+        self.min_y[cols[lower]] = y[first][lower]
+        self.min_x[cols[lower]] = x[first][lower]
+
+        cols = column[last]
+        higher = y[last] > self.max_y[cols]
+        self.max_y[cols[higher]] = y[last][higher]
+        self.max_x[cols[higher]] = x[last][higher]
+
+    def result(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the reduced points in time order
+
+        Returns:
+            (x, y) with up to two points per non-empty column
+        """
+        filled = np.isfinite(self.min_y)
+        x = np.stack((self.min_x[filled], self.max_x[filled]), axis=1)
+        y = np.stack((self.min_y[filled], self.max_y[filled]), axis=1)
+
+        # Emit the earlier extreme of each column first
+        swap = x[:, 0] > x[:, 1]
+        x[swap] = x[swap][:, ::-1]
+        y[swap] = y[swap][:, ::-1]
+
+        x, y = x.ravel(), y.ravel()
+        # Drop the duplicate when min and max are the same reading
+        keep = np.ones(len(x), dtype=bool)
+        keep[1::2] = (x[1::2] != x[0::2]) | (y[1::2] != y[0::2])
+        return x[keep], y[keep]
+
+
+class M4Reducer(MinMaxReducer):
+    """
+    Streaming first/min/max/last-per-column reducer
+
+    Besides the extremes, keeps the earliest and latest reading of every
+    column. These are the candidates LTTB picks from, so a range of any size
+    is reduced in O(pixels) memory and the first and last reading survive.
+    """
+
+    def __init__(self, start: float, end: float, pixels: int):
+        """
+        Initialize reducer
+
+        Args:
+            start: Range start (epoch seconds)
+            end: Range end (epoch seconds)
+            pixels: Number of columns
+        """
+        super().__init__(start, end, pixels)
+        self.first_x = np.full(pixels, np.inf)
+        self.first_y = np.zeros(pixels)
+        self.last_x = np.full(pixels, -np.inf)
+        self.last_y = np.zeros(pixels)
+
+    def update(self, x: np.ndarray, y: np.ndarray):
+        """Fold a chunk of readings into the per-column edges and extremes"""
+        if not len(x):
+            return
+        super().update(x, y)
+
+        column = self._columns(x)
+        order = np.lexsort((x, column))
+        column, x, y = column[order], x[order], y[order]
+
+        # Within each column the rows are sorted by time: first is earliest, last is latest
+        first, last = self._group_edges(column)
+
+        cols = column[first]
+        earlier = x[first] < self.first_x[cols]
+        self.first_x[cols[earlier]] = x[first][earlier]
+        self.first_y[cols[earlier]] = y[first][earlier]
+
+        cols = column[last]
+        later = x[last] > self.last_x[cols]
+        self.last_x[cols[later]] = x[last][later]
+        self.last_y[cols[later]] = y[last][later]
+
+    def result(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the reduced points in time order
+
+        Returns:
+            (x, y) with up to four distinct points per non-empty column
+        """
+        filled = np.isfinite(self.min_y)
+        x = np.concatenate((self.first_x[filled], self.min_x[filled], self.max_x[filled], self.last_x[filled]))
+        y = np.concatenate((self.first_y[filled], self.min_y[filled], self.max_y[filled], self.last_y[filled]))
+
+        # Columns are disjoint in time, so sorting by time keeps them in order
+        order = np.lexsort((y, x))
+        x, y = x[order], y[order]
+        keep = np.ones(len(x), dtype=bool)
+        keep[1:] = (x[1:] != x[:-1]) | (y[1:] != y[:-1])
+        return x[keep], y[keep]
+
+
+def _split_chunk(rows: Sequence[Tuple]) -> Iterable[Tuple[str, np.ndarray, np.ndarray, Optional[str]]]:
+    """Split (measurement, epoch, value, unit) rows into per-measurement arrays"""
+    names = np.array([row[0] for row in rows], dtype=object)
+    x = np.fromiter((row[1] for row in rows), dtype=np.float64, count=len(rows))
+    y = np.fromiter((row[2] for row in rows), dtype=np.float64, count=len(rows))
+    units = [row[3] for row in rows]
+
+    for name in np.unique(names):
+        mask = names == name
+        unit = next((units[i] for i in np.flatnonzero(mask) if units[i]), None)
+        yield name, x[mask], y[mask], unit
+
+
+def _to_datetime64(x: np.ndarray) -> np.ndarray:
+    """Epoch seconds to datetime64[us]"""
+    return np.round(x * 1e6).astype("datetime64[us]")
+
+
+def _to_datetimes(x: np.ndarray) -> List[datetime]:
+    """Epoch seconds to naive UTC datetimes"""
+    return _to_datetime64(x).tolist()
+
+
+async def downsample(
+    chunks: AsyncIterator[Sequence[Tuple]],
+    mode: SeriesMode,
+    points: int,
+    start: datetime,
+    end: datetime,
+    as_arrays: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Reduce streamed raw readings to at most `points` points per measurement
+
+    Args:
+        chunks: Async iterator of (measurement, epoch seconds, value, unit) row chunks
+        mode: SeriesMode.LTTB or SeriesMode.MINMAX
+        points: Maximum points per measurement
+        start: Range start (naive UTC)
+        end: Range end (naive UTC)
+        as_arrays: Keep timestamps (datetime64[us]) and values as NumPy
+            arrays instead of lists (for Arrow responses)
+
+    Returns:
+        List of MeasurementSeries-shaped dicts sorted by measurement name
+    """
+    epoch = datetime(1970, 1, 1)
+    start_s = (start - epoch).total_seconds()
+    end_s = (end - epoch).total_seconds()
+
+    units: Dict[str, Optional[str]] = {}
+    reducers: Dict[str, MinMaxReducer] = {}
+
+    async for rows in chunks:
+        if not rows:
+            continue
+        for name, x, y, unit in _split_chunk(rows):
+            units[name] = units.get(name) or unit
+            reducer = reducers.get(name)
+            if reducer is None:
+                if mode == SeriesMode.MINMAX:
+                    reducer = MinMaxReducer(start_s, end_s, max(points // 2, 1))
+                else:
+                    # Raw readings are never held: LTTB runs over per-column candidates
+                    reducer = M4Reducer(start_s, end_s, points * LTTB_OVERSAMPLING)
+                reducers[name] = reducer
+            reducer.update(x, y)
+
+    series = []
+    for name in sorted(units):
+        raw_count = reducers[name].count
+        x, y = reducers[name].result()
+        if mode == SeriesMode.LTTB:
+            x, y = lttb(x, y, points)
+
+        series.append({
+            "measurement": name,
+            "unit": units[name],
+            "timestamps": _to_datetime64(x) if as_arrays else _to_datetimes(x),
+            "values": y if as_arrays else y.tolist(),
+            "raw_count": raw_count,
+        })
+
+    return series
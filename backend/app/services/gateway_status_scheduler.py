@@ -7,14 +7,17 @@ import logging
 from datetime import datetime, timedelta
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
+from apscheduler.triggers.cron import CronTrigger
 from sqlalchemy.orm import Session
 from sqlalchemy import select, and_
 
+from app.core.config import get_settings
 from app.core.database import SessionLocal
 from app.models.gateway import Gateway
 from app.models.gateway_status_history import GatewayStatusHistory
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
 
 # Scheduler instance
 scheduler = None
@@ -101,6 +104,66 @@ def check_offline_gateways():
         db.close()
 
 
+def recover_background_jobs(before: datetime):
+    """
+    Pick up background jobs left behind by a previous process
+
+    One-off jobs only live in the scheduler's memory, so after a restart or
+    crash their rows stay pending/running and block new jobs for the same
+    target. Pending jobs never started and are submitted again; running jobs
+    were interrupted part-way and are marked failed so they can be retried.
+
+    Args:
+        before: Only jobs created before this time (UTC) belong to a previous process
+    """
+    from pathlib import Path
+    from app.models.background_job import BackgroundJob
+    from app.services.cascade_delete import DELETE_PLANS, run_cascade_delete
+    from app.services.sensor_data_export import EXPORT_KINDS, run_export
+
+    runners = {kind: run_cascade_delete for kind in DELETE_PLANS}
+    runners.update({kind: run_export for kind in EXPORT_KINDS})
+
+    db: Session = SessionLocal()
+    try:
+        jobs = db.execute(
+            select(BackgroundJob).where(
+                and_(
+                    BackgroundJob.kind.in_(list(runners)),
+                    BackgroundJob.status.in_(["pending", "running"]),
+                    BackgroundJob.created_at < before,
+                )
+            )
+        ).scalars().all()
+
+        pending = []
+        for job in jobs:
+            if job.status == "pending":
+                pending.append(job)
+                continue
+            job.status = "failed"
+            job.finished_at = datetime.utcnow()
+            job.message = "Interrupted by a server restart"
+            if job.kind in EXPORT_KINDS:
+                for partial in Path(settings.EXPORT_DIR).glob(f"export-{job.id}.*.part"):
+                    partial.unlink(missing_ok=True)
+        db.commit()
+
+        for job in pending:
+            run_in_background(runners[job.kind], job.id, name=f"{job.kind} {job.target_id}")
+
+        if jobs:
+            logger.info(
+                f"♻️  Recovered background jobs: {len(pending)} resubmitted, "
+                f"{len(jobs) - len(pending)} marked failed"
+            )
+    except Exception as e:
+        logger.error(f"❌ Error recovering background jobs: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
 def start_scheduler():
     """Start the background scheduler"""
     global scheduler
@@ -120,10 +183,74 @@ def start_scheduler():
         replace_existing=True,
     )
 
+    # Move closed days older than the hot window into Parquet archives nightly
+    if settings.ARCHIVE_ENABLED:
+        from app.services.sensor_data_archive import archive_cold_sensor_data
+
+        scheduler.add_job(
+            archive_cold_sensor_data,
+            trigger=CronTrigger(hour=2, minute=0),
+            id="archive_cold_sensor_data",
+            name="Archive cold sensor data to Parquet",
+            replace_existing=True,
+            max_instances=1,
+        )
+
+    # Repair drift of the per gateway/day reading counters
+    from app.services.reading_counters import reconcile_daily_counts
+
+    scheduler.add_job(
+        reconcile_daily_counts,
+        trigger=CronTrigger(hour=3, minute=0),
+        id="reconcile_daily_counts",
+        name="Reconcile daily reading counters",
+        replace_existing=True,
+        max_instances=1,
+    )
+
+    # Remove background export files past their retention
+    from app.services.sensor_data_export import purge_expired_exports
+
+    scheduler.add_job(
+        purge_expired_exports,
+        trigger=IntervalTrigger(hours=1),
+        id="purge_expired_exports",
+        name="Remove expired export files",
+        replace_existing=True,
+        max_instances=1,
+    )
+
+    # Resubmit or fail jobs of a previous process (on the thread pool, not at startup)
+    scheduler.add_job(
+        recover_background_jobs,
+        args=[datetime.utcnow()],
+        name="Recover background jobs",
+        misfire_grace_time=None,
+    )
+
     scheduler.start()
     logger.info("✅ Gateway status scheduler started (checking every 30 seconds)")
 
 
+def run_in_background(func, *args, name: str):
+    """
+    Run a sync function once on the scheduler's thread pool
+
+    Args:
+        func: Function to execute
+        *args: Positional arguments for the function
+        name: Human readable job name for logs
+
+    Raises:
+        RuntimeError: If the scheduler is not running
+    """
+    if scheduler is None:
+        raise RuntimeError("Background scheduler is not running")
+
+    # One-off jobs must run however long the thread pool is busy
+    scheduler.add_job(func, args=list(args), name=name, misfire_grace_time=None)
+
+
 def stop_scheduler():
     """Stop the background scheduler"""
     global scheduler
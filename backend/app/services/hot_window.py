@@ -0,0 +1,417 @@
+"""
+Hot Window
+In-memory NumPy buffers holding the last HOT_WINDOW_HOURS of readings per sensor
+
+Chart and statistics requests for recent ranges are answered from memory.
+A sensor is cold-loaded from the primary on its first request and then kept
+current by the `sensor_readings` notifications of the event listener; sensors
+nobody asks for are never loaded. Whole sensors are evicted least recently
+used first once the buffers exceed HOT_WINDOW_MAX_MB. The store only serves
+while the listener is connected and is cleared whenever notifications may
+have been missed.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.config import get_settings
+from app.core.events import READINGS_CHANNEL, EPOCH, EventListener, to_epoch
+from app.services.sensor_series import BUCKET_ORIGIN, BucketMap
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+RETENTION_SLACK = timedelta(minutes=10)
+
+# Loaded and notified timestamps of the same reading may differ in the last bit
+SAME_READING_SECONDS = 5e-7
+
+
+class RingBuffer:
+    """
+    Time-ordered readings of one sensor and measurement type
+
+    Readings live in preallocated float64 arrays between `start` and `end`.
+    Expired readings are dropped by advancing `start`; when the arrays are
+    full the live part is moved to the front (or the arrays grow), so appends
+    are amortised O(1) and every view is a contiguous, sorted slice.
+    """
+
+    __slots__ = ("t", "v", "start", "end", "unit")
+
+    def __init__(self, capacity: int = 256):
+        self.t = np.empty(capacity)
+        self.v = np.empty(capacity)
+        self.start = 0
+        self.end = 0
+        self.unit: Optional[str] = None
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    @property
+    def nbytes(self) -> int:
+        return self.t.nbytes + self.v.nbytes
+
+    def append(self, t: np.ndarray, v: np.ndarray):
+        """Append readings (sorted into place if they arrive out of order)"""
+        if not len(t):
+            return
+
+        if len(self) and t.min() < self.t[self.end - 1]:
+            # Late readings: rebuild the live part in time order
+            t = np.concatenate((self.t[self.start:self.end], t))
+            v = np.concatenate((self.v[self.start:self.end], v))
+            order = np.argsort(t, kind="stable")
+            t, v = t[order], v[order]
+            self.start = self.end = 0
+        elif len(t) > 1 and np.any(np.diff(t) < 0):
+            order = np.argsort(t, kind="stable")
+            t, v = t[order], v[order]
+
+        self._reserve(len(t))
+        self.t[self.end:self.end + len(t)] = t
+        self.v[self.end:self.end + len(t)] = v
+        self.end += len(t)
+
+    def trim(self, before: float):
+        """Drop readings older than `before` (epoch seconds)"""
+        self.start += int(np.searchsorted(self.t[self.start:self.end], before, side="left"))
+
+    def view(self, since: Optional[float] = None, until: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Readings with since <= t < until as (timestamps, values) views"""
+        t = self.t[self.start:self.end]
+        v = self.v[self.start:self.end]
+        lo = 0 if since is None else int(np.searchsorted(t, since, side="left"))
+        hi = len(t) if until is None else int(np.searchsorted(t, until, side="left"))
+        return t[lo:hi], v[lo:hi]
+
+    def _reserve(self, extra: int):
+        live = len(self)
+        if self.end + extra <= len(self.t):
+            return
+        capacity = len(self.t)
+        while live + extra > capacity:
+            capacity *= 2
+        if capacity != len(self.t):
+            t, v = np.empty(capacity), np.empty(capacity)
+        else:
+            t, v = self.t, self.v
+        t[:live] = self.t[self.start:self.end]
+        v[:live] = self.v[self.start:self.end]
+        self.t, self.v = t, v
+        self.start, self.end = 0, live
+
+
+class SensorWindow:
+    """Ring buffers of all measurement types of one sensor"""
+
+    def __init__(self):
+        self.buffers: Dict[str, RingBuffer] = {}
+        # Notifications received while the cold load is running
+        self.pending: Optional[List[Sequence]] = []
+        # Allocated bytes of all buffers (only changes when a buffer grows)
+        self.nbytes = 0
+
+    def add(self, rows: Sequence[Sequence]) -> int:
+        """Add (measurement, epoch seconds, value, unit) rows; returns the growth in bytes"""
+        before = self.nbytes
+        by_measurement: Dict[str, List[Sequence]] = {}
+        for row in rows:
+            by_measurement.setdefault(row[0] or "Unknown", []).append(row)
+
+        for measurement, items in by_measurement.items():
+            buffer = self.buffers.get(measurement)
+            if buffer is None:
+                buffer = self.buffers[measurement] = RingBuffer()
+            else:
+                self.nbytes -= buffer.nbytes
+            buffer.append(
+                np.fromiter((item[1] for item in items), dtype=np.float64, count=len(items)),
+                np.fromiter((item[2] for item in items), dtype=np.float64, count=len(items))
+            )
+            buffer.unit = buffer.unit or next((item[3] for item in items if item[3]), None)
+            self.nbytes += buffer.nbytes
+
+        return self.nbytes - before
+
+    def contains(self, row: Sequence) -> bool:
+        """Whether a (measurement, epoch seconds, value, unit) reading is already stored"""
+        buffer = self.buffers.get(row[0] or "Unknown")
+        if buffer is None:
+            return False
+        _, v = buffer.view(row[1] - SAME_READING_SECONDS, row[1] + SAME_READING_SECONDS)
+        return bool(np.any(v == row[2]))
+
+    def trim(self, before: float):
+        for buffer in self.buffers.values():
+            buffer.trim(before)
+
+    def select(self, measurement_types: Optional[List[str]]) -> Dict[str, RingBuffer]:
+        if measurement_types is None:
+            return self.buffers
+        return {name: self.buffers[name] for name in measurement_types if name in self.buffers}
+
+
+class HotWindowStore:
+    """LRU map of sensor windows fed by reading notifications"""
+
+    def __init__(self, hours: int, max_bytes: int, listener: Optional[EventListener] = None):
+        """
+        Initialize store
+
+        Args:
+            hours: Length of the window
+            max_bytes: Memory cap over all buffers
+            listener: Event listener feeding the store (required to serve)
+        """
+        self.hours = hours
+        self.max_bytes = max_bytes
+        self.listener = listener
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._windows: "OrderedDict[int, SensorWindow]" = OrderedDict()
+        self._loading: Dict[int, asyncio.Future] = {}
+        # Running total of SensorWindow.nbytes over self._windows
+        self._bytes = 0
+
+    @property
+    def available(self) -> bool:
+        """Whether the store is fed by a live notification stream"""
+        return self.listener is not None and self.listener.connected
+
+    def window_start(self) -> datetime:
+        """Oldest timestamp a request may start at to be served from memory (naive UTC)"""
+        return datetime.utcnow() - timedelta(hours=self.hours)
+
+    def retention_start(self) -> datetime:
+        """
+        Oldest timestamp kept in memory
+
+        A few minutes older than window_start so that a range computed as
+        "now - N hours" slightly before the check still falls inside.
+        """
+        return self.window_start() - RETENTION_SLACK
+
+    def covers(self, start: datetime) -> bool:
+        """
+        Whether a range starting at `start` can be served from memory
+
+        Counts a hit or a miss for the hit ratio.
+        """
+        if self.available and start >= self.window_start() - RETENTION_SLACK / 2:
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    async def get_window(
+        self,
+        sensor_id: int,
+        loader: Callable[[datetime], AsyncIterator[Sequence[Tuple]]]
+    ) -> SensorWindow:
+        """
+        Get the window of a sensor, cold-loading it on first use
+
+        Args:
+            sensor_id: Sensor ID
+            loader: Called with the window start; yields chunks of
+                (measurement, epoch seconds, value, unit) rows from the
+                primary (a lagging replica could miss readings whose
+                notifications were already delivered)
+
+        Returns:
+            Sensor window trimmed to the current window start
+        """
+        window = self._windows.get(sensor_id)
+        if window is not None and window.pending is None:
+            self._windows.move_to_end(sensor_id)
+            window.trim(to_epoch(self.retention_start()))
+            return window
+
+        loading = self._loading.get(sensor_id)
+        if loading is not None:
+            return await asyncio.shield(loading)
+
+        future = asyncio.get_running_loop().create_future()
+        self._loading[sensor_id] = future
+        window = SensorWindow()
+        self._windows[sensor_id] = window
+        try:
+            since = self.retention_start()
+            async for rows in loader(since):
+                self._add(sensor_id, window, rows)
+
+            # Apply notifications that arrived during the load. Readings
+            # committed before the load's snapshot may have been loaded too
+            # and are skipped; any other reading is kept, however old its
+            # timestamp (gateways may upload buffered readings late)
+            pending, window.pending = window.pending, None
+            for rows in pending:
+                self._add(sensor_id, window, [row for row in rows if not window.contains(row)])
+
+            window.trim(to_epoch(since))
+            self._evict(keep=sensor_id)
+            future.set_result(window)
+            return window
+
+        except BaseException as e:
+            if self._windows.get(sensor_id) is window:
+                self._drop(sensor_id)
+            future.set_exception(e)
+            # Mark the exception as retrieved when nobody else awaited it
+            future.exception()
+            raise
+        finally:
+            self._loading.pop(sensor_id, None)
+
+    def on_readings(self, payload: Dict[str, Any]):
+        """Event subscriber: add notified readings to a loaded sensor window"""
+        window = self._windows.get(payload.get("sensor_id"))
+        if window is None:
+            return
+        rows = payload.get("readings") or []
+        if window.pending is not None:
+            window.pending.append(rows)
+            return
+        self._add(payload["sensor_id"], window, rows)
+        window.trim(to_epoch(self.retention_start()))
+        self._evict(keep=payload["sensor_id"])
+
+    def reset(self):
+        """Drop all windows (notifications may have been missed)"""
+        if self._windows:
+            logger.info(f"Hot window reset ({len(self._windows)} sensors dropped)")
+        self._windows.clear()
+        self._bytes = 0
+
+    def bucketed(
+        self,
+        window: SensorWindow,
+        bucket: timedelta,
+        start: datetime,
+        end: datetime,
+        measurement_types: Optional[List[str]] = None
+    ) -> BucketMap:
+        """
+        Aggregate a sensor window into BUCKET_ORIGIN-aligned buckets
+
+        Returns:
+            Same bucket map as SensorDataRepository.get_bucketed_series
+        """
+        width = bucket.total_seconds()
+        origin = to_epoch(BUCKET_ORIGIN)
+        buckets: BucketMap = {}
+
+        for measurement, buffer in window.select(measurement_types).items():
+            t, v = buffer.view(to_epoch(start), to_epoch(end))
+            if not len(t):
+                continue
+
+            index = np.floor((t - origin) / width).astype(np.int64)
+            starts = np.concatenate(([0], np.flatnonzero(np.diff(index)) + 1))
+            sums = np.add.reduceat(v, starts)
+            mins = np.minimum.reduceat(v, starts)
+            maxs = np.maximum.reduceat(v, starts)
+            counts = np.diff(np.append(starts, len(v)))
+
+            for k, total, minimum, maximum, count in zip(
+                index[starts].tolist(), sums.tolist(), mins.tolist(), maxs.tolist(), counts.tolist()
+            ):
+                buckets[(measurement, BUCKET_ORIGIN + k * bucket)] = [total, minimum, maximum, count, buffer.unit]
+
+        return buckets
+
+    def statistics(self, window: SensorWindow, since: datetime) -> Dict[str, Any]:
+        """
+        Count, min, max, avg and first/last reading over all measurement types
+
+        Returns:
+            Same dict as SensorDataRepository.get_statistics_by_sensor
+        """
+        count, total = 0, 0.0
+        minimum = maximum = first = last = None
+
+        for buffer in window.buffers.values():
+            t, v = buffer.view(to_epoch(since))
+            if not len(t):
+                continue
+            count += len(v)
+            total += float(v.sum())
+            minimum = float(v.min()) if minimum is None else min(minimum, float(v.min()))
+            maximum = float(v.max()) if maximum is None else max(maximum, float(v.max()))
+            first = float(t[0]) if first is None else min(first, float(t[0]))
+            last = float(t[-1]) if last is None else max(last, float(t[-1]))
+
+        return {
+            "count": count,
+            "min_value": minimum,
+            "max_value": maximum,
+            "avg_value": total / count if count else None,
+            "first_reading": EPOCH + timedelta(seconds=first) if first is not None else None,
+            "last_reading": EPOCH + timedelta(seconds=last) if last is not None else None
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get store statistics
+
+        Returns:
+            Dict with availability, memory use, hits, misses and hit_ratio
+        """
+        lookups = self.hits + self.misses
+        return {
+            "enabled": settings.HOT_WINDOW_ENABLED,
+            "available": self.available,
+            "window_hours": self.hours,
+            "sensors": len(self._windows),
+            "buffers": sum(len(window.buffers) for window in self._windows.values()),
+            "readings": sum(len(b) for window in self._windows.values() for b in window.buffers.values()),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+    def _add(self, sensor_id: int, window: SensorWindow, rows: Sequence[Sequence]):
+        """Add rows to a window and count its growth if it is still stored"""
+        grown = window.add(rows)
+        if self._windows.get(sensor_id) is window:
+            self._bytes += grown
+
+    def _drop(self, sensor_id: int):
+        """Remove a stored window"""
+        self._bytes -= self._windows.pop(sensor_id).nbytes
+
+    def _evict(self, keep: Optional[int] = None):
+        """Evict least recently used sensors until under the memory cap"""
+        if self._bytes <= self.max_bytes:
+            return
+        for sensor_id in list(self._windows):
+            if self._bytes <= self.max_bytes:
+                break
+            if sensor_id == keep or sensor_id in self._loading:
+                continue
+            self._drop(sensor_id)
+            self.evictions += 1
+
+
+hot_window = HotWindowStore(
+    hours=settings.HOT_WINDOW_HOURS,
+    max_bytes=settings.HOT_WINDOW_MAX_MB * 1024 * 1024
+)
+
+
+def attach_hot_window(listener: EventListener):
+    """Feed the hot window from a listener (call before the listener starts)"""
+    hot_window.listener = listener
+    listener.subscribe(READINGS_CHANNEL, hot_window.on_readings)
+    listener.on_reset(hot_window.reset)
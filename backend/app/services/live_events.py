@@ -0,0 +1,162 @@
+"""
+Live Events
+In-memory fan-out of reading and gateway status notifications to streaming clients
+
+Every SSE or WebSocket client gets a Subscription with a bounded queue. The
+hub is fed by the process-wide event listener (one LISTEN connection), so the
+number of clients does not add database load. A slow client never blocks the
+others: when its queue is full the oldest event is dropped and the client is
+told how many events it missed.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterable, Optional, Set
+
+from app.core.config import get_settings
+from app.core.events import READINGS_CHANNEL, GATEWAY_STATUS_CHANNEL, EventListener
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class Subscription:
+    """Events for a set of gateways and sensors, buffered for one client"""
+
+    def __init__(self, user_id: int, gateway_ids: Iterable[int], sensor_gateways: Dict[int, int], maxsize: int):
+        """
+        Initialize subscription
+
+        Args:
+            user_id: Owner user ID
+            gateway_ids: Gateways whose readings and status changes are wanted
+            sensor_gateways: Sensor ID -> gateway ID of individually subscribed sensors
+            maxsize: Maximum number of buffered events
+        """
+        self.user_id = user_id
+        self.gateway_ids: Set[int] = set(gateway_ids)
+        self.sensor_ids: Set[int] = set(sensor_gateways)
+        # Status changes of the gateways the subscribed sensors are attached to
+        self.status_gateway_ids: Set[int] = self.gateway_ids | set(sensor_gateways.values())
+        self.dropped = 0
+        self._events: Deque[Dict[str, Any]] = deque(maxlen=maxsize)
+        self._ready = asyncio.Event()
+
+    def push(self, event: Dict[str, Any]):
+        """Buffer an event, dropping the oldest one when full"""
+        if len(self._events) == self._events.maxlen:
+            self.dropped += 1
+        self._events.append(event)
+        self._ready.set()
+
+    async def next(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        Wait for the next event
+
+        Args:
+            timeout: Seconds to wait
+
+        Returns:
+            Event dict, or None on timeout (send a keep-alive)
+        """
+        if not self._events:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+
+        if self.dropped:
+            dropped, self.dropped = self.dropped, 0
+            return {"type": "dropped", "count": dropped}
+        return self._events.popleft()
+
+
+class LiveHub:
+    """Routes notifications to the subscriptions interested in them"""
+
+    def __init__(self):
+        self._by_gateway: Dict[int, Set[Subscription]] = {}
+        self._by_sensor: Dict[int, Set[Subscription]] = {}
+        self._by_status_gateway: Dict[int, Set[Subscription]] = {}
+        self.subscriptions: Set[Subscription] = set()
+
+    def add(self, subscription: Subscription):
+        """Register a subscription"""
+        self.subscriptions.add(subscription)
+        for gateway_id in subscription.gateway_ids:
+            self._by_gateway.setdefault(gateway_id, set()).add(subscription)
+        for sensor_id in subscription.sensor_ids:
+            self._by_sensor.setdefault(sensor_id, set()).add(subscription)
+        for gateway_id in subscription.status_gateway_ids:
+            self._by_status_gateway.setdefault(gateway_id, set()).add(subscription)
+
+    def remove(self, subscription: Subscription):
+        """Unregister a subscription"""
+        self.subscriptions.discard(subscription)
+        for index, keys in (
+            (self._by_gateway, subscription.gateway_ids),
+            (self._by_sensor, subscription.sensor_ids),
+            (self._by_status_gateway, subscription.status_gateway_ids),
+        ):
+            for key in keys:
+                members = index.get(key)
+                if members is not None:
+                    members.discard(subscription)
+                    if not members:
+                        del index[key]
+
+    def on_readings(self, payload: Dict[str, Any]):
+        """Event subscriber for sensor_readings notifications"""
+        targets = self._by_gateway.get(payload.get("gateway_id"), set()) | \
+            self._by_sensor.get(payload.get("sensor_id"), set())
+        if not targets:
+            return
+
+        event = {
+            "type": "readings",
+            "sensor_id": payload.get("sensor_id"),
+            "gateway_id": payload.get("gateway_id"),
+            "readings": [
+                {
+                    "measurement": measurement,
+                    "timestamp": datetime.utcfromtimestamp(epoch).isoformat(),
+                    "value": value,
+                    "unit": unit,
+                }
+                for measurement, epoch, value, unit in payload.get("readings") or []
+            ],
+        }
+        for subscription in targets:
+            subscription.push(event)
+
+    def on_gateway_status(self, payload: Dict[str, Any]):
+        """Event subscriber for gateway_status notifications"""
+        event = {"type": "gateway_status", **payload}
+        for subscription in self._by_status_gateway.get(payload.get("gateway_id"), ()):
+            subscription.push(event)
+
+    def on_reset(self):
+        """Tell every client that events may have been missed (refetch)"""
+        for subscription in self.subscriptions:
+            subscription.push({"type": "reset"})
+
+    def stats(self) -> Dict[str, Any]:
+        """Number of connected clients and watched gateways/sensors"""
+        return {
+            "clients": len(self.subscriptions),
+            "gateways": len(self._by_status_gateway),
+            "sensors": len(self._by_sensor),
+        }
+
+
+live_hub = LiveHub()
+
+
+def attach_live_hub(listener: EventListener):
+    """Feed the live hub from a listener (call before the listener starts)"""
+    listener.subscribe(READINGS_CHANNEL, live_hub.on_readings)
+    listener.subscribe(GATEWAY_STATUS_CHANNEL, live_hub.on_gateway_status)
+    listener.on_reset(live_hub.on_reset)
@@ -0,0 +1,141 @@
+"""
+Ownership Cache
+Per-user sets of owned gateway and sensor IDs for authorization checks
+
+Data endpoints only need to know that a sensor or gateway belongs to the
+current user. The owned IDs of a user are loaded in one query and cached, so
+a check is usually a set lookup. Entries are always loaded from the primary,
+since a lagging replica could still list a just-deleted sensor for every
+request of the user. Only ownership is trusted from the cache:
+an ID missing from a cached set is re-checked against the database (it may
+have been created on another API process), so a stale entry never refuses a
+valid request. Creates and deletes invalidate the entry locally, and deletes
+also notify the other processes.
+"""
+
+import json
+from typing import Dict, FrozenSet, Optional
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.core.database import ReadSessionLocal, on_replica
+from app.core.events import OWNERSHIP_CHANNEL, EventListener, publish
+from app.api.v1.repositories.gateway_repository import GatewayRepository
+
+settings = get_settings()
+
+
+class OwnedIds:
+    """Gateways and sensors owned by one user"""
+
+    def __init__(self, gateway_ids: FrozenSet[int], sensor_gateways: Dict[int, int]):
+        """
+        Initialize owned IDs
+
+        Args:
+            gateway_ids: Owned gateway IDs
+            sensor_gateways: Owned sensor ID -> its gateway ID
+        """
+        self.gateway_ids = gateway_ids
+        self.sensor_gateways = sensor_gateways
+
+
+# OwnedIds keyed by user ID
+ownership_cache = TTLCache(
+    maxsize=settings.OWNERSHIP_CACHE_MAX_ENTRIES,
+    ttl=settings.OWNERSHIP_CACHE_TTL_SECONDS
+)
+
+
+async def load_owned_ids(db: AsyncSession, user_id: int) -> OwnedIds:
+    """
+    Load and cache the owned IDs of a user
+
+    Args:
+        db: Database session (a replica session is replaced by the primary)
+        user_id: User ID
+
+    Returns:
+        Fresh OwnedIds
+    """
+    if on_replica(db):
+        async with ReadSessionLocal() as primary:
+            return await load_owned_ids(primary, user_id)
+
+    pairs = await GatewayRepository(db).get_owned_ids(user_id)
+    owned = OwnedIds(
+        gateway_ids=frozenset(gateway_id for gateway_id, _ in pairs),
+        sensor_gateways={sensor_id: gateway_id for gateway_id, sensor_id in pairs if sensor_id is not None},
+    )
+    ownership_cache.set(user_id, owned)
+    return owned
+
+
+async def sensor_gateway_id(db: AsyncSession, user_id: int, sensor_id: int) -> Optional[int]:
+    """
+    Gateway ID of a sensor if the user owns it
+
+    Args:
+        db: Database session
+        user_id: User ID
+        sensor_id: Sensor ID
+
+    Returns:
+        The sensor's gateway ID, or None if missing or not owned
+    """
+    owned = ownership_cache.get(user_id)
+    if owned is None or sensor_id not in owned.sensor_gateways:
+        owned = await load_owned_ids(db, user_id)
+    return owned.sensor_gateways.get(sensor_id)
+
+
+async def owns_gateway(db: AsyncSession, user_id: int, gateway_id: int) -> bool:
+    """
+    Check whether a user owns a gateway
+
+    Args:
+        db: Database session
+        user_id: User ID
+        gateway_id: Gateway ID
+
+    Returns:
+        True if the gateway exists and belongs to the user
+    """
+    owned = ownership_cache.get(user_id)
+    if owned is None or gateway_id not in owned.gateway_ids:
+        owned = await load_owned_ids(db, user_id)
+    return gateway_id in owned.gateway_ids
+
+
+async def invalidate_ownership(db: AsyncSession, user_id: int):
+    """
+    Drop the cached IDs of a user after one of their gateways or sensors
+    was created or deleted, here and (on commit) in the other API processes
+
+    Args:
+        db: Database session of the writing transaction
+        user_id: Owner user ID
+    """
+    ownership_cache.delete(user_id)
+    await publish(db, OWNERSHIP_CHANNEL, [json.dumps({"user_id": user_id})])
+
+
+def invalidate_ownership_sync(db: Session, user_id: int):
+    """invalidate_ownership for sync sessions (background jobs)"""
+    ownership_cache.delete(user_id)
+    db.execute(select(func.pg_notify(OWNERSHIP_CHANNEL, json.dumps({"user_id": user_id}))))
+
+
+def _on_ownership_changed(payload):
+    ownership_cache.delete(payload.get("user_id"))
+
+
+def attach_ownership_cache(listener: EventListener):
+    """Invalidate cached ownership from change notifications"""
+    listener.subscribe(OWNERSHIP_CHANNEL, _on_ownership_changed)
+    # Changes may have been missed while disconnected
+    listener.on_reset(ownership_cache.clear)
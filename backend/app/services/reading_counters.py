@@ -0,0 +1,119 @@
+"""
+Reading Counters
+Reconciliation of the per gateway/day reading counters
+
+Ingestion increments sensor_data_daily_counts in the same transaction as the
+readings it inserts, so the counters are exact under normal operation. Rows
+deleted by cascade deletes, manual SQL or failed partial writes make them
+drift; this job recomputes closed days from sensor_data plus the archive
+manifest and repairs any difference. Today is left alone because it is still
+being incremented; it is reconciled once it has closed.
+"""
+
+import logging
+from datetime import datetime, date, timedelta
+from typing import Optional
+
+from sqlalchemy import select, delete, func, cast, and_, tuple_, literal, union_all, Date
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.core.config import get_settings
+from app.core.database import SessionLocal
+from app.models.sensor_data import SensorData
+from app.models.sensor_data_archive import SensorDataArchive
+from app.models.sensor_data_daily_count import SensorDataDailyCount
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+def reconcile_daily_counts(since: Optional[date] = None) -> int:
+    """
+    Recompute the daily reading counters of closed days
+
+    Args:
+        since: First day to reconcile (default: today - COUNTER_RECONCILE_DAYS).
+            Pass an early date to backfill counters for existing data.
+
+    Returns:
+        Number of counter rows that were corrected or removed
+    """
+    today = datetime.utcnow().date()
+    since = since or today - timedelta(days=settings.COUNTER_RECONCILE_DAYS)
+
+    day = cast(SensorData.timestamp, Date)
+    hot = (
+        select(SensorData.gateway_id, day.label("day"), func.count().label("readings"))
+        .where(
+            and_(
+                SensorData.timestamp >= datetime.combine(since, datetime.min.time()),
+                SensorData.timestamp < datetime.combine(today, datetime.min.time())
+            )
+        )
+        .group_by(SensorData.gateway_id, day)
+    )
+    archived = (
+        select(
+            SensorDataArchive.gateway_id,
+            SensorDataArchive.day,
+            func.sum(SensorDataArchive.row_count).label("readings")
+        )
+        .where(and_(SensorDataArchive.day >= since, SensorDataArchive.day < today))
+        .group_by(SensorDataArchive.gateway_id, SensorDataArchive.day)
+    )
+    sources = union_all(hot, archived).subquery()
+    actual = (
+        select(
+            sources.c.gateway_id,
+            sources.c.day,
+            func.sum(sources.c.readings).label("readings"),
+            literal(datetime.utcnow()).label("updated_at")
+        )
+        .group_by(sources.c.gateway_id, sources.c.day)
+    )
+
+    db = SessionLocal()
+    try:
+        upsert = pg_insert(SensorDataDailyCount).from_select(
+            ["gateway_id", "day", "readings", "updated_at"], actual
+        )
+        corrected = db.execute(
+            upsert.on_conflict_do_update(
+                index_elements=["gateway_id", "day"],
+                set_={
+                    "readings": upsert.excluded.readings,
+                    "updated_at": upsert.excluded.updated_at,
+                },
+                where=SensorDataDailyCount.readings != upsert.excluded.readings
+            )
+        ).rowcount
+
+        # Counters of days whose readings are all gone
+        removed = db.execute(
+            delete(SensorDataDailyCount).where(
+                and_(
+                    SensorDataDailyCount.day >= since,
+                    SensorDataDailyCount.day < today,
+                    tuple_(SensorDataDailyCount.gateway_id, SensorDataDailyCount.day).not_in(
+                        select(sources.c.gateway_id, sources.c.day)
+                    )
+                )
+            )
+        ).rowcount
+
+        db.commit()
+        if corrected or removed:
+            logger.warning(
+                f"Reading counters reconciled since {since}: "
+                f"{corrected} corrected, {removed} removed"
+            )
+        else:
+            logger.info(f"Reading counters since {since} are consistent")
+        return corrected + removed
+
+    except Exception as e:
+        logger.error(f"Error reconciling reading counters: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
@@ -0,0 +1,642 @@
+"""
+Sensor Data Archive
+Moves closed days of sensor_data into compressed Parquet files and reads them back
+
+Each archive file holds one gateway's readings for one UTC day and is indexed in
+the sensor_data_archives manifest table. Rows are removed from Postgres in the
+same transaction that registers the file, so every reading lives in exactly one
+place. Archived files are scanned with DuckDB so the repository layer can merge
+cold results with hot Postgres results.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from datetime import datetime, date, time, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from uuid import uuid4
+
+import duckdb
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from sqlalchemy import select, delete, func
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.database import SessionLocal
+from app.models.sensor_data import SensorData, SensorReading
+from app.models.sensor_data_archive import SensorDataArchive
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+ARCHIVE_SCHEMA = pa.schema([
+    ("id", pa.int64()),
+    ("sensor_id", pa.int64()),
+    ("gateway_id", pa.int64()),
+    ("value", pa.float64()),
+    ("unit", pa.string()),
+    ("measurement_type", pa.string()),
+    ("metadata", pa.string()),
+    ("timestamp", pa.timestamp("us")),
+])
+
+ARCHIVE_COLUMNS = (
+    SensorData.id,
+    SensorData.sensor_id,
+    SensorData.gateway_id,
+    SensorData.value,
+    SensorData.unit,
+    SensorData.metadata_,
+    SensorData.timestamp,
+)
+
+
+def get_hot_boundary() -> datetime:
+    """
+    Get the oldest timestamp that is guaranteed to still live in Postgres
+
+    Returns:
+        Start of the first day that is not eligible for archiving
+    """
+    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    return today - timedelta(days=settings.ARCHIVE_HOT_DAYS)
+
+
+def range_reaches_archive(start_date: Optional[datetime]) -> bool:
+    """
+    Check whether a query range can include archived readings
+
+    Args:
+        start_date: Lower bound of the query range (None means unbounded)
+
+    Returns:
+        True if the archive manifest has to be consulted
+    """
+    if not settings.ARCHIVE_ENABLED:
+        return False
+    return start_date is None or start_date < get_hot_boundary()
+
+
+# ==================== EXPORT ====================
+
+def _rows_to_table(rows: List[Any]) -> pa.Table:
+    """Convert sensor_data rows into an Arrow table using the archive schema"""
+    ids, sensor_ids, gateway_ids, values, units, metadata, timestamps = zip(*rows)
+    return pa.Table.from_arrays(
+        [
+            pa.array(ids, pa.int64()),
+            pa.array(sensor_ids, pa.int64()),
+            pa.array(gateway_ids, pa.int64()),
+            pa.array(values, pa.float64()),
+            pa.array(units, pa.string()),
+            pa.array([(m or {}).get("measurement_type") for m in metadata], pa.string()),
+            pa.array([json.dumps(m) if m is not None else None for m in metadata], pa.string()),
+            pa.array(timestamps, pa.timestamp("us")),
+        ],
+        schema=ARCHIVE_SCHEMA,
+    )
+
+
+def _archive_gateway_day(db: Session, gateway_id: int, day: date) -> Optional[Path]:
+    """
+    Move one gateway's readings for one day into a Parquet file
+
+    Rows are deleted with RETURNING in hourly slices and appended to the file
+    as row groups, which keeps memory bounded. The caller commits the session;
+    nothing is removed from Postgres unless the file was fully written.
+
+    Args:
+        db: Sync database session (transaction owned by the caller)
+        gateway_id: Gateway ID
+        day: UTC day to archive
+
+    Returns:
+        Path of the written file, or None if there was nothing to archive
+    """
+    directory = Path(settings.ARCHIVE_DIR) / f"gateway_id={gateway_id}"
+    directory.mkdir(parents=True, exist_ok=True)
+
+    path = directory / f"{day.isoformat()}-{uuid4().hex[:8]}.parquet"
+    tmp_path = path.with_name(path.name + ".tmp")
+
+    day_start = datetime.combine(day, time.min)
+    writer = None
+    row_count = 0
+    sensor_ids = set()
+    min_ts = max_ts = None
+
+    try:
+        for hour in range(24):
+            slice_start = day_start + timedelta(hours=hour)
+            slice_end = slice_start + timedelta(hours=1)
+
+            rows = db.execute(
+                delete(SensorData)
+                .where(
+                    SensorData.gateway_id == gateway_id,
+                    SensorData.timestamp >= slice_start,
+                    SensorData.timestamp < slice_end,
+                )
+                .returning(*ARCHIVE_COLUMNS)
+            ).all()
+
+            if not rows:
+                continue
+
+            table = _rows_to_table(rows)
+            if writer is None:
+                writer = pq.ParquetWriter(tmp_path, ARCHIVE_SCHEMA, compression="zstd")
+            writer.write_table(table)
+
+            row_count += len(rows)
+            sensor_ids.update(row.sensor_id for row in rows)
+            slice_min = min(row.timestamp for row in rows)
+            slice_max = max(row.timestamp for row in rows)
+            min_ts = slice_min if min_ts is None else min(min_ts, slice_min)
+            max_ts = slice_max if max_ts is None else max(max_ts, slice_max)
+
+        if writer is None:
+            return None
+
+        writer.close()
+        writer = None
+
+        with open(tmp_path, "rb") as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+        db.add(SensorDataArchive(
+            gateway_id=gateway_id,
+            day=day,
+            path=str(path),
+            row_count=row_count,
+            sensor_ids=sorted(sensor_ids),
+            min_timestamp=min_ts,
+            max_timestamp=max_ts,
+        ))
+        db.flush()
+        return path
+
+    except Exception:
+        if writer is not None:
+            writer.close()
+        tmp_path.unlink(missing_ok=True)
+        path.unlink(missing_ok=True)
+        raise
+
+
+def archive_cold_sensor_data():
+    """
+    Archive every closed gateway/day older than ARCHIVE_HOT_DAYS
+    This runs nightly; each gateway/day is committed in its own short transaction
+    """
+    db: Session = SessionLocal()
+    try:
+        boundary = get_hot_boundary()
+        day_column = func.date_trunc("day", SensorData.timestamp)
+
+        groups = db.execute(
+            select(SensorData.gateway_id, day_column.label("day"))
+            .where(SensorData.timestamp < boundary)
+            .group_by(SensorData.gateway_id, day_column)
+            .order_by(day_column)
+            .limit(settings.ARCHIVE_MAX_DAYS_PER_RUN)
+        ).all()
+
+        if not groups:
+            logger.debug("✅ No cold sensor data to archive")
+            return
+
+        archived_files = 0
+        for gateway_id, day in groups:
+            path = None
+            try:
+                path = _archive_gateway_day(db, gateway_id, day.date())
+                db.commit()
+                if path:
+                    archived_files += 1
+            except Exception as e:
+                db.rollback()
+                if path:
+                    path.unlink(missing_ok=True)
+                logger.error(f"❌ Error archiving gateway {gateway_id} day {day.date()}: {e}")
+
+        logger.info(f"✅ Archived {archived_files} gateway/day file(s) older than {boundary.date()}")
+
+    except Exception as e:
+        logger.error(f"❌ Error in archive_cold_sensor_data job: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+# ==================== DELETE ====================
+
+def _rewrite_without_sensor(archive: SensorDataArchive, sensor_id: int) -> Optional[Path]:
+    """
+    Write a copy of an archive file without one sensor's readings
+
+    The file is copied row group by row group (one hour slice each), so memory
+    stays bounded. The manifest row is updated in place; the caller commits.
+
+    Args:
+        archive: Manifest row of the file
+        sensor_id: Sensor whose readings are dropped
+
+    Returns:
+        Path of the new file, or None if no readings are left
+    """
+    source = pq.ParquetFile(archive.path)
+    path = Path(archive.path).with_name(f"{archive.day.isoformat()}-{uuid4().hex[:8]}.parquet")
+    tmp_path = path.with_name(path.name + ".tmp")
+
+    writer = None
+    row_count = 0
+    sensor_ids = set()
+    min_ts = max_ts = None
+
+    try:
+        for index in range(source.num_row_groups):
+            table = source.read_row_group(index)
+            table = table.filter(pc.not_equal(table["sensor_id"], sensor_id))
+            if not table.num_rows:
+                continue
+
+            if writer is None:
+                writer = pq.ParquetWriter(tmp_path, ARCHIVE_SCHEMA, compression="zstd")
+            writer.write_table(table)
+
+            row_count += table.num_rows
+            sensor_ids.update(pc.unique(table["sensor_id"]).to_pylist())
+            bounds = pc.min_max(table["timestamp"])
+            slice_min, slice_max = bounds["min"].as_py(), bounds["max"].as_py()
+            min_ts = slice_min if min_ts is None else min(min_ts, slice_min)
+            max_ts = slice_max if max_ts is None else max(max_ts, slice_max)
+
+        if writer is None:
+            return None
+
+        writer.close()
+        writer = None
+
+        with open(tmp_path, "rb") as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+        archive.path = str(path)
+        archive.row_count = row_count
+        archive.sensor_ids = sorted(sensor_ids)
+        archive.min_timestamp = min_ts
+        archive.max_timestamp = max_ts
+        return path
+
+    except Exception:
+        if writer is not None:
+            writer.close()
+        tmp_path.unlink(missing_ok=True)
+        path.unlink(missing_ok=True)
+        raise
+
+
+def remove_sensor_from_archive(db: Session, sensor_id: int) -> int:
+    """
+    Remove a deleted sensor's readings from every archive file holding them
+
+    Each affected gateway/day file is rewritten without the sensor and its
+    manifest row (row_count, sensor_ids, time bounds) updated, or removed when
+    nothing is left, in its own transaction. The old file is unlinked after
+    the commit, so a reader sees either the old or the new file.
+
+    Args:
+        db: Sync database session
+        sensor_id: Deleted sensor ID
+
+    Returns:
+        Number of archived readings removed
+    """
+    archives = db.execute(
+        select(SensorDataArchive).where(SensorDataArchive.sensor_ids.contains([sensor_id]))
+    ).scalars().all()
+
+    removed = 0
+    for archive in archives:
+        old_path, old_count = Path(archive.path), archive.row_count
+        path = None
+        try:
+            path = _rewrite_without_sensor(archive, sensor_id)
+            if path is None:
+                db.delete(archive)
+                removed += old_count
+            else:
+                removed += old_count - archive.row_count
+            db.commit()
+        except Exception:
+            db.rollback()
+            if path:
+                path.unlink(missing_ok=True)
+            raise
+
+        try:
+            old_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Could not remove archive file {old_path}: {e}")
+
+    return removed
+
+
+# ==================== READ ====================
+
+def _scan(paths: List[str]) -> str:
+    """Build a DuckDB read_parquet() call for the given files"""
+    files = ", ".join("'" + p.replace("'", "''") + "'" for p in paths)
+    return f"read_parquet([{files}])"
+
+
+def _where(
+    sensor_id: Optional[int] = None,
+    gateway_id: Optional[int] = None,
+    gateway_ids: Optional[List[int]] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    measurement_types: Optional[List[str]] = None,
+    value_min: Optional[float] = None,
+    value_max: Optional[float] = None,
+    tag: Optional[str] = None,
+    before: Optional[Tuple[datetime, int]] = None,
+) -> Tuple[str, List[Any]]:
+    """Translate repository filters into a DuckDB WHERE clause"""
+    clauses: List[str] = []
+    params: List[Any] = []
+
+    if sensor_id is not None:
+        clauses.append("sensor_id = ?")
+        params.append(sensor_id)
+
+    if gateway_id is not None:
+        clauses.append("gateway_id = ?")
+        params.append(gateway_id)
+
+    if gateway_ids is not None:
+        if not gateway_ids:
+            clauses.append("FALSE")
+        else:
+            clauses.append(f"gateway_id IN ({', '.join('?' for _ in gateway_ids)})")
+            params.extend(gateway_ids)
+
+    if start_date:
+        clauses.append("timestamp >= ?")
+        params.append(start_date)
+
+    if end_date:
+        clauses.append("timestamp <= ?")
+        params.append(end_date)
+
+    if measurement_types is not None:
+        if not measurement_types:
+            clauses.append("FALSE")
+        else:
+            clauses.append(f"measurement_type IN ({', '.join('?' for _ in measurement_types)})")
+            params.extend(measurement_types)
+
+    if value_min is not None:
+        clauses.append("value >= ?")
+        params.append(value_min)
+
+    if value_max is not None:
+        clauses.append("value <= ?")
+        params.append(value_max)
+
+    if tag:
+        clauses.append("json_extract_string(metadata, '$.tag') = ?")
+        params.append(tag)
+
+    if before:
+        # Keyset predicate: rows strictly after the cursor in newest-first order
+        clauses.append("(timestamp < ? OR (timestamp = ? AND id < ?))")
+        params.extend([before[0], before[0], before[1]])
+
+    where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+    return where, params
+
+
+def _execute(sql: str, params: List[Any]) -> List[Tuple]:
+    """Run a query on a throwaway in-memory DuckDB connection"""
+    con = duckdb.connect()
+    try:
+        return con.execute(sql, params).fetchall()
+    finally:
+        con.close()
+
+
+async def fetch_archived_rows(
+    paths: List[str],
+    limit: int,
+    offset: int = 0,
+    **filters
+) -> List[SensorReading]:
+    """
+    Read archived readings, newest first
+
+    Args:
+        paths: Archive files to scan
+        limit: Maximum number of rows
+        offset: Number of rows to skip
+        **filters: sensor_id, gateway_id, gateway_ids, start_date, end_date,
+            measurement_types, value_min, value_max, tag, before
+
+    Returns:
+        SensorReading rows
+    """
+    if not paths:
+        return []
+
+    where, params = _where(**filters)
+    sql = (
+        "SELECT id, sensor_id, gateway_id, value, unit, metadata, timestamp "
+        f"FROM {_scan(paths)}{where} "
+        "ORDER BY timestamp DESC, id DESC LIMIT ? OFFSET ?"
+    )
+    rows = await asyncio.to_thread(_execute, sql, params + [limit, offset])
+
+    return [
+        SensorReading(
+            row[0], row[1], row[2], row[3], row[4],
+            json.loads(row[5]) if row[5] else None,
+            row[6],
+        )
+        for row in rows
+    ]
+
+
+async def count_archived_rows(paths: List[str], **filters) -> int:
+    """
+    Count archived readings matching the filters
+
+    Args:
+        paths: Archive files to scan
+        **filters: sensor_id, gateway_id, gateway_ids, start_date, end_date,
+            measurement_types, value_min, value_max, tag
+
+    Returns:
+        Number of matching archived rows
+    """
+    if not paths:
+        return 0
+
+    where, params = _where(**filters)
+    rows = await asyncio.to_thread(
+        _execute, f"SELECT count(*) FROM {_scan(paths)}{where}", params
+    )
+    return rows[0][0]
+
+
+async def archived_statistics(paths: List[str], **filters) -> Dict[str, Any]:
+    """
+    Aggregate archived readings matching the filters
+
+    Args:
+        paths: Archive files to scan
+        **filters: sensor_id, gateway_id, gateway_ids, start_date, end_date,
+            measurement_types, value_min, value_max, tag
+
+    Returns:
+        Dict with count, min_value, max_value, sum_value, first_reading, last_reading
+    """
+    empty = {
+        "count": 0,
+        "min_value": None,
+        "max_value": None,
+        "sum_value": None,
+        "first_reading": None,
+        "last_reading": None,
+    }
+    if not paths:
+        return empty
+
+    where, params = _where(**filters)
+    rows = await asyncio.to_thread(
+        _execute,
+        "SELECT count(*), min(value), max(value), sum(value), min(timestamp), max(timestamp) "
+        f"FROM {_scan(paths)}{where}",
+        params,
+    )
+    count, min_value, max_value, sum_value, first_reading, last_reading = rows[0]
+    if not count:
+        return empty
+
+    return {
+        "count": count,
+        "min_value": min_value,
+        "max_value": max_value,
+        "sum_value": sum_value,
+        "first_reading": first_reading,
+        "last_reading": last_reading,
+    }
+
+
+async def archived_buckets(
+    paths: List[str],
+    bucket: timedelta,
+    origin: datetime,
+    **filters
+) -> List[Tuple]:
+    """
+    Aggregate archived readings per measurement type and time bucket
+
+    Args:
+        paths: Archive files to scan
+        bucket: Bucket width
+        origin: Bucket origin (must match the Postgres date_bin origin)
+        **filters: sensor_id, gateway_id, gateway_ids, start_date, end_date,
+            measurement_types, value_min, value_max, tag
+
+    Returns:
+        (measurement, bucket, sum, min, max, count, unit) tuples
+    """
+    if not paths:
+        return []
+
+    where, params = _where(**filters)
+    return await asyncio.to_thread(
+        _execute,
+        "SELECT coalesce(measurement_type, 'Unknown') AS measurement, "
+        "time_bucket(?, timestamp, ?) AS bucket, "
+        "sum(value), min(value), max(value), count(*), max(unit) "
+        f"FROM {_scan(paths)}{where} "
+        "GROUP BY measurement, bucket",
+        [bucket, origin] + params,
+    )
+
+
+def iter_archived_values(paths: List[str], chunk_size: int, **filters) -> Iterator[List[Tuple]]:
+    """
+    Read the raw values of archived readings file by file in chunks
+
+    Each file is sorted on its own, so chunks are time ordered within
+    themselves and memory stays bounded by chunk_size rows plus DuckDB's
+    sort of one file. Blocking; run it in a worker thread from async code.
+
+    Args:
+        paths: Archive files to scan
+        chunk_size: Rows per chunk
+        **filters: sensor_id, gateway_id, gateway_ids, start_date, end_date,
+            measurement_types, value_min, value_max, tag
+
+    Yields:
+        Lists of (measurement, epoch seconds, value, unit) tuples
+    """
+    where, params = _where(**filters)
+    con = duckdb.connect()
+    try:
+        for path in paths:
+            reader = con.execute(
+                "SELECT coalesce(measurement_type, 'Unknown'), epoch_us(timestamp) / 1e6, value, unit "
+                f"FROM {_scan([path])}{where} "
+                "ORDER BY timestamp",
+                params,
+            ).fetch_record_batch(chunk_size)
+            for batch in reader:
+                if batch.num_rows:
+                    yield list(zip(*(column.to_pylist() for column in batch.columns)))
+    finally:
+        con.close()
+
+
+def iter_archived_batches(paths: List[str], batch_size: int, **filters) -> Iterator[pa.RecordBatch]:
+    """
+    Read archived readings file by file as Arrow record batches
+
+    Each file is sorted on its own (one gateway-day), so memory stays bounded
+    by the largest file rather than the whole range. Blocking; run it in a
+    worker thread from async code.
+
+    Args:
+        paths: Archive files to scan, in the order they should be read
+        batch_size: Rows per record batch
+        **filters: sensor_id, gateway_id, gateway_ids, start_date, end_date,
+            measurement_types, value_min, value_max, tag
+
+    Yields:
+        Record batches with id, sensor_id, gateway_id, timestamp,
+        measurement_type, value, unit and tag columns
+    """
+    where, params = _where(**filters)
+    con = duckdb.connect()
+    try:
+        for path in paths:
+            reader = con.execute(
+                "SELECT id, sensor_id, gateway_id, timestamp, measurement_type, value, unit, "
+                "json_extract_string(metadata, '$.tag') AS tag "
+                f"FROM {_scan([path])}{where} "
+                "ORDER BY timestamp, id",
+                params,
+            ).fetch_record_batch(batch_size)
+            for batch in reader:
+                if batch.num_rows:
+                    yield batch
+    finally:
+        con.close()
@@ -0,0 +1,509 @@
+"""
+Sensor Data Export
+Streams the readings of a sensor, gateway or farm as CSV, NDJSON, Parquet or Arrow
+
+Readings are never collected in memory: archived days are read file by file
+as DuckDB record batches and hot rows through a server-side cursor
+(`yield_per`), and each batch is encoded and handed on before the next one is
+fetched. The same pipeline serves streaming downloads (async session) and
+background export jobs that write a file (sync session). Archived days come
+first, then Postgres; rows are time ordered within each part.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+from enum import Enum
+from pathlib import Path
+from typing import Any, AsyncIterator, BinaryIO, Dict, Iterator, List, Optional
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from sqlalchemy import select, and_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.database import SessionLocal, read_session
+from app.core.responses import ARROW_STREAM_MEDIA_TYPE
+from app.services.series_arrow import IpcCompression, ipc_write_options
+from app.models.background_job import BackgroundJob
+from app.models.sensor_data import SensorData
+from app.models.sensor_data_archive import SensorDataArchive
+from app.api.v1.repositories.background_job_repository import BackgroundJobRepository
+from app.services.gateway_status_scheduler import run_in_background
+from app.services.sensor_data_archive import range_reaches_archive, iter_archived_batches
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class ExportFormat(str, Enum):
+    """Export file format"""
+
+    CSV = "csv"
+    NDJSON = "ndjson"
+    PARQUET = "parquet"
+    ARROW = "arrow"
+
+
+MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+    ExportFormat.ARROW: ARROW_STREAM_MEDIA_TYPE,
+}
+
+EXPORT_SCHEMA = pa.schema([
+    ("id", pa.int64()),
+    ("sensor_id", pa.int64()),
+    ("gateway_id", pa.int64()),
+    ("timestamp", pa.timestamp("us")),
+    ("measurement_type", pa.string()),
+    ("value", pa.float64()),
+    ("unit", pa.string()),
+    ("tag", pa.string()),
+])
+
+# Job kind -> scope filter key of the exported entity
+EXPORT_KINDS = {
+    "export_sensor": "sensor_id",
+    "export_gateway": "gateway_id",
+    "export_farm": "gateway_ids",
+}
+
+
+# ==================== QUERIES ====================
+
+def _scope_clause(column_sensor, column_gateway, scope: Dict[str, Any]):
+    """WHERE clause selecting the exported sensor, gateway or gateways"""
+    if "sensor_id" in scope:
+        return column_sensor == scope["sensor_id"]
+    if "gateway_id" in scope:
+        return column_gateway == scope["gateway_id"]
+    return column_gateway.in_(scope["gateway_ids"])
+
+
+def export_query(
+    scope: Dict[str, Any],
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    measurement_types: Optional[List[str]]
+):
+    """
+    Build the streaming SELECT over sensor_data
+
+    Args:
+        scope: {"sensor_id": id}, {"gateway_id": id} or {"gateway_ids": [ids]}
+        start_date: Range start (inclusive)
+        end_date: Range end (inclusive)
+        measurement_types: Only these measurement types (all if None)
+
+    Returns:
+        Select statement yielding rows in EXPORT_SCHEMA column order
+    """
+    query = select(
+        SensorData.id,
+        SensorData.sensor_id,
+        SensorData.gateway_id,
+        SensorData.timestamp,
+        SensorData.metadata_['measurement_type'].astext,
+        SensorData.value,
+        SensorData.unit,
+        SensorData.metadata_['tag'].astext,
+    ).where(_scope_clause(SensorData.sensor_id, SensorData.gateway_id, scope))
+
+    if start_date:
+        query = query.where(SensorData.timestamp >= start_date)
+    if end_date:
+        query = query.where(SensorData.timestamp <= end_date)
+    if measurement_types is not None:
+        query = query.where(
+            SensorData.metadata_['measurement_type'].astext.in_(measurement_types)
+        )
+
+    return (
+        query.order_by(SensorData.timestamp, SensorData.id)
+        .execution_options(yield_per=settings.EXPORT_BATCH_SIZE)
+    )
+
+
+def archive_paths_query(
+    scope: Dict[str, Any],
+    start_date: Optional[datetime],
+    end_date: Optional[datetime]
+):
+    """Manifest lookup of the archive files overlapping the export, oldest first"""
+    if "sensor_id" in scope:
+        query = select(SensorDataArchive.path).where(
+            SensorDataArchive.sensor_ids.contains([scope["sensor_id"]])
+        )
+    else:
+        query = select(SensorDataArchive.path).where(
+            _scope_clause(None, SensorDataArchive.gateway_id, scope)
+        )
+
+    if start_date:
+        query = query.where(SensorDataArchive.max_timestamp >= start_date)
+    if end_date:
+        query = query.where(SensorDataArchive.min_timestamp <= end_date)
+
+    return query.order_by(SensorDataArchive.min_timestamp, SensorDataArchive.gateway_id)
+
+
+def _archive_filters(
+    scope: Dict[str, Any],
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    measurement_types: Optional[List[str]]
+) -> Dict[str, Any]:
+    return {
+        **scope,
+        "start_date": start_date,
+        "end_date": end_date,
+        "measurement_types": measurement_types,
+    }
+
+
+# ==================== ENCODING ====================
+
+class ChunkSink:
+    """Write-only file object whose contents are drained after every batch"""
+
+    def __init__(self):
+        self._parts: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._parts.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def writable(self) -> bool:
+        return True
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        """Return and forget everything written since the last drain"""
+        data = b"".join(self._parts)
+        self._parts = []
+        return data
+
+
+class ExportEncoder:
+    """Incremental encoder writing record batches to a binary file object"""
+
+    def __init__(
+        self,
+        export_format: ExportFormat,
+        sink: BinaryIO,
+        arrow_compression: IpcCompression = IpcCompression.NONE
+    ):
+        """
+        Initialize encoder
+
+        Args:
+            export_format: Output format
+            sink: Binary file object (a file, or a ChunkSink for streaming)
+            arrow_compression: Buffer compression of Arrow output
+        """
+        self.format = export_format
+        self.sink = sink
+        self.rows = 0
+        if export_format == ExportFormat.CSV:
+            self._writer = pa_csv.CSVWriter(sink, EXPORT_SCHEMA)
+        elif export_format == ExportFormat.PARQUET:
+            self._writer = pq.ParquetWriter(sink, EXPORT_SCHEMA, compression="zstd")
+        elif export_format == ExportFormat.ARROW:
+            # IPC stream: each batch is readable as soon as it arrives
+            self._writer = pa.ipc.new_stream(sink, EXPORT_SCHEMA, options=ipc_write_options(arrow_compression))
+        else:
+            self._writer = None
+
+    def write(self, batch: pa.RecordBatch):
+        """Encode one batch"""
+        self.rows += batch.num_rows
+        if self._writer is not None:
+            self._writer.write_batch(batch)
+            return
+
+        lines = [
+            json.dumps(row, default=lambda value: value.isoformat(), separators=(",", ":"))
+            for row in batch.to_pylist()
+        ]
+        self.sink.write(("\n".join(lines) + "\n").encode())
+
+    def close(self):
+        """Finish the output (Parquet footer, Arrow end-of-stream marker)"""
+        if self._writer is not None:
+            self._writer.close()
+
+
+def _rows_to_batch(rows) -> pa.RecordBatch:
+    """Convert sensor_data result rows into a record batch"""
+    columns = list(zip(*rows))
+    return pa.RecordBatch.from_arrays(
+        [pa.array(column, field.type) for column, field in zip(columns, EXPORT_SCHEMA)],
+        schema=EXPORT_SCHEMA,
+    )
+
+
+def _conform(batch: pa.RecordBatch) -> pa.RecordBatch:
+    """Cast an archive batch to EXPORT_SCHEMA"""
+    return pa.RecordBatch.from_arrays(
+        [batch.column(i).cast(field.type) for i, field in enumerate(EXPORT_SCHEMA)],
+        schema=EXPORT_SCHEMA,
+    )
+
+
+def export_filename(
+    label: str,
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    export_format: ExportFormat
+) -> str:
+    """File name such as `sensor-12_20250101-20250331.csv`"""
+    span = "-".join(d.strftime("%Y%m%d") for d in (start_date, end_date) if d) or "all"
+    return f"{label}_{span}.{export_format.value}"
+
+
+# ==================== STREAMING ====================
+
+async def stream_export(
+    scope: Dict[str, Any],
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    measurement_types: Optional[List[str]],
+    export_format: ExportFormat,
+    arrow_compression: IpcCompression = IpcCompression.NONE
+) -> AsyncIterator[bytes]:
+    """
+    Stream an export as encoded chunks
+
+    Opens its own session for the duration of the stream, so the request's
+    session is not held while the client downloads. Empty chunks are never
+    yielded (a zero-length chunk would end a chunked response).
+
+    Args:
+        scope: {"sensor_id": id}, {"gateway_id": id} or {"gateway_ids": [ids]}
+        start_date: Range start (inclusive)
+        end_date: Range end (inclusive)
+        measurement_types: Only these measurement types (all if None)
+        export_format: Output format
+        arrow_compression: Buffer compression of Arrow output
+
+    Yields:
+        Encoded bytes, one chunk per batch
+    """
+    sink = ChunkSink()
+    encoder = ExportEncoder(export_format, sink, arrow_compression)
+
+    async with read_session() as db:
+        if range_reaches_archive(start_date):
+            paths = list((await db.execute(
+                archive_paths_query(scope, start_date, end_date)
+            )).scalars().all())
+            batches = iter_archived_batches(
+                paths,
+                settings.EXPORT_BATCH_SIZE,
+                **_archive_filters(scope, start_date, end_date, measurement_types)
+            )
+            while (batch := await asyncio.to_thread(next, batches, None)) is not None:
+                encoder.write(_conform(batch))
+                chunk = sink.drain()
+                if chunk:
+                    yield chunk
+
+        result = await db.stream(export_query(scope, start_date, end_date, measurement_types))
+        async for rows in result.partitions():
+            encoder.write(_rows_to_batch(rows))
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+
+    encoder.close()
+    chunk = sink.drain()
+    if chunk:
+        yield chunk
+
+
+# ==================== BACKGROUND JOBS ====================
+
+def _iter_batches(db: Session, scope, start_date, end_date, measurement_types) -> Iterator[pa.RecordBatch]:
+    """Sync counterpart of the stream_export pipeline for worker threads"""
+    if range_reaches_archive(start_date):
+        paths = list(db.execute(archive_paths_query(scope, start_date, end_date)).scalars().all())
+        for batch in iter_archived_batches(
+            paths,
+            settings.EXPORT_BATCH_SIZE,
+            **_archive_filters(scope, start_date, end_date, measurement_types)
+        ):
+            yield _conform(batch)
+
+    result = db.execute(export_query(scope, start_date, end_date, measurement_types))
+    for rows in result.partitions():
+        yield _rows_to_batch(rows)
+
+
+def _set_job(db: Session, job_id: int, **values):
+    """Update job columns and commit"""
+    db.execute(update(BackgroundJob).where(BackgroundJob.id == job_id).values(**values))
+    db.commit()
+
+
+def _parse_date(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def run_export(job_id: int):
+    """
+    Execute a pending export job
+    Runs on the background scheduler's thread pool and writes
+    EXPORT_DIR/export-<job_id>.<format>. Readings are streamed on a second
+    session, since committing progress would close its server-side cursor.
+    """
+    db: Session = SessionLocal()
+    read_db: Session = SessionLocal()
+    path: Optional[Path] = None
+    try:
+        job = db.get(BackgroundJob, job_id)
+        if job is None or job.status != "pending":
+            logger.warning(f"Export job {job_id} not found or already started")
+            return
+
+        params = job.params or {}
+        key = EXPORT_KINDS[job.kind]
+        scope = {key: params["gateway_ids"] if key == "gateway_ids" else job.target_id}
+        export_format = ExportFormat(params["format"])
+        arrow_compression = IpcCompression(params.get("arrow_compression", IpcCompression.NONE.value))
+        start_date = _parse_date(params.get("start_date"))
+        end_date = _parse_date(params.get("end_date"))
+        measurement_types = params.get("measurement_types")
+
+        _set_job(db, job_id, status="running", started_at=datetime.utcnow())
+        logger.info(f"📦 Export job {job_id} started: {job.kind} {job.target_id}")
+
+        export_dir = Path(settings.EXPORT_DIR)
+        export_dir.mkdir(parents=True, exist_ok=True)
+        path = export_dir / f"export-{job_id}.{export_format.value}"
+        partial_path = path.with_suffix(path.suffix + ".part")
+
+        with open(partial_path, "wb") as file:
+            encoder = ExportEncoder(export_format, file, arrow_compression)
+            for batch in _iter_batches(read_db, scope, start_date, end_date, measurement_types):
+                encoder.write(batch)
+                _set_job(db, job_id, processed_rows=encoder.rows)
+            encoder.close()
+        os.replace(partial_path, path)
+
+        _set_job(
+            db,
+            job_id,
+            status="completed",
+            finished_at=datetime.utcnow(),
+            processed_rows=encoder.rows,
+            total_rows=encoder.rows,
+            file_path=str(path),
+            message=f"Exported {encoder.rows} readings",
+        )
+        logger.info(f"✅ Export job {job_id} completed: {encoder.rows} readings")
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"❌ Export job {job_id} failed: {e}")
+        if path is not None:
+            path.with_suffix(path.suffix + ".part").unlink(missing_ok=True)
+        try:
+            _set_job(
+                db,
+                job_id,
+                status="failed",
+                finished_at=datetime.utcnow(),
+                message=str(e)[:1000],
+            )
+        except Exception as update_error:
+            logger.error(f"❌ Could not mark job {job_id} as failed: {update_error}")
+            db.rollback()
+    finally:
+        read_db.close()
+        db.close()
+
+
+async def submit_export(
+    db: AsyncSession,
+    user_id: int,
+    kind: str,
+    target_id: int,
+    params: Dict[str, Any]
+) -> BackgroundJob:
+    """
+    Create an export job and hand it to the background scheduler
+
+    Args:
+        db: Async database session of the request
+        user_id: ID of the user requesting the export
+        kind: One of EXPORT_KINDS
+        target_id: ID of the exported sensor, gateway or farm
+        params: format, arrow_compression, start_date, end_date,
+            measurement_types (and gateway_ids for farms), JSON serialisable
+
+    Returns:
+        The BackgroundJob tracking the export
+    """
+    job = await BackgroundJobRepository(db).create(
+        user_id=user_id,
+        kind=kind,
+        target_id=target_id,
+        status="pending",
+        params=params
+    )
+    # The job row must be visible to the worker thread before it starts
+    await db.commit()
+
+    run_in_background(run_export, job.id, name=f"{kind} {target_id}")
+    return job
+
+
+def purge_expired_exports():
+    """Remove export files older than EXPORT_RETENTION_HOURS"""
+    cutoff = datetime.utcnow() - timedelta(hours=settings.EXPORT_RETENTION_HOURS)
+    db: Session = SessionLocal()
+    try:
+        expired = db.execute(
+            select(BackgroundJob.id, BackgroundJob.file_path).where(
+                and_(
+                    BackgroundJob.kind.in_(list(EXPORT_KINDS)),
+                    BackgroundJob.file_path.isnot(None),
+                    BackgroundJob.finished_at < cutoff
+                )
+            )
+        ).all()
+
+        for job_id, file_path in expired:
+            try:
+                Path(file_path).unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning(f"Could not remove export file {file_path}: {e}")
+                continue
+            _set_job(db, job_id, file_path=None, message="Export file expired")
+
+        if expired:
+            logger.info(f"🧹 Removed {len(expired)} expired export files")
+    except Exception as e:
+        db.rollback()
+        logger.error(f"❌ Export cleanup failed: {e}")
+    finally:
+        db.close()
@@ -0,0 +1,258 @@
+"""
+Sensor Series
+Bucket parsing and columnar assembly for chart series endpoints
+"""
+
+import re
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# Fixed origin so bucket boundaries are stable across requests
+BUCKET_ORIGIN = datetime(2000, 1, 1)
+
+BUCKET_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+BUCKET_PATTERN = re.compile(r"^(\d+)([smhd])$")
+
+STANDARD_BUCKETS = [
+    timedelta(seconds=10),
+    timedelta(seconds=30),
+    timedelta(minutes=1),
+    timedelta(minutes=5),
+    timedelta(minutes=15),
+    timedelta(minutes=30),
+    timedelta(hours=1),
+    timedelta(hours=3),
+    timedelta(hours=6),
+    timedelta(hours=12),
+    timedelta(days=1),
+    timedelta(days=7),
+]
+
+# (measurement, bucket start) -> [sum, min, max, count, unit]
+BucketMap = Dict[Tuple[str, datetime], List[Any]]
+
+
+def parse_bucket(value: str) -> timedelta:
+    """
+    Parse a bucket width such as '10s', '5m', '1h' or '1d'
+
+    Args:
+        value: Bucket width string
+
+    Returns:
+        Bucket width
+
+    Raises:
+        ValueError: If the format is invalid or the width is zero
+    """
+    match = BUCKET_PATTERN.match(value.strip().lower())
+    if not match or int(match.group(1)) == 0:
+        raise ValueError("bucket must look like 10s, 5m, 1h or 1d")
+    return timedelta(seconds=int(match.group(1)) * BUCKET_UNITS[match.group(2)])
+
+
+def format_bucket(bucket: timedelta) -> str:
+    """Format a bucket width using the largest whole unit"""
+    seconds = int(bucket.total_seconds())
+    for unit in ("d", "h", "m"):
+        if seconds % BUCKET_UNITS[unit] == 0:
+            return f"{seconds // BUCKET_UNITS[unit]}{unit}"
+    return f"{seconds}s"
+
+
+def auto_bucket(start: datetime, end: datetime, points: Optional[int] = None) -> timedelta:
+    """
+    Pick the smallest standard bucket that yields at most `points` buckets
+
+    Args:
+        start: Range start
+        end: Range end
+        points: Target number of buckets (default SERIES_DEFAULT_POINTS)
+
+    Returns:
+        Bucket width
+    """
+    points = points or settings.SERIES_DEFAULT_POINTS
+    span = end - start
+    for bucket in STANDARD_BUCKETS:
+        if span / bucket <= points:
+            return bucket
+    return STANDARD_BUCKETS[-1]
+
+
+def resolve_range(
+    start: Optional[datetime],
+    end: Optional[datetime],
+    default_hours: int = 24
+) -> Tuple[datetime, datetime]:
+    """
+    Normalise a requested range to naive UTC (database uses TIMESTAMP WITHOUT TIME ZONE)
+
+    Args:
+        start: Requested start (default: end - default_hours)
+        end: Requested end (default: now)
+        default_hours: Length of the default range
+
+    Returns:
+        (start, end)
+
+    Raises:
+        ValueError: If start is not before end
+    """
+    if end is None:
+        end = datetime.utcnow()
+    elif end.tzinfo:
+        end = end.replace(tzinfo=None) - (end.utcoffset() or timedelta())
+
+    if start is None:
+        start = end - timedelta(hours=default_hours)
+    elif start.tzinfo:
+        start = start.replace(tzinfo=None) - (start.utcoffset() or timedelta())
+
+    if start >= end:
+        raise ValueError("start must be before end")
+    return start, end
+
+
+def resolve_bucket(bucket: Optional[str], start: datetime, end: datetime) -> timedelta:
+    """
+    Parse an explicit bucket or pick one automatically, enforcing SERIES_MAX_BUCKETS
+
+    Raises:
+        ValueError: If the bucket is invalid or too small for the range
+    """
+    if not bucket:
+        return auto_bucket(start, end)
+
+    width = parse_bucket(bucket)
+    if (end - start) / width > settings.SERIES_MAX_BUCKETS:
+        raise ValueError(
+            f"bucket {bucket} yields more than {settings.SERIES_MAX_BUCKETS} buckets for this range"
+        )
+    return width
+
+
+def merge_buckets(target: BucketMap, rows: Iterable[Tuple]):
+    """
+    Fold (measurement, bucket, sum, min, max, count, unit) rows into a bucket map
+
+    Used to combine hot Postgres aggregates with archived aggregates for the
+    same bucket grid.
+    """
+    for measurement, bucket, total, minimum, maximum, count, unit in rows:
+        key = (measurement, bucket)
+        current = target.get(key)
+        if current is None:
+            target[key] = [float(total), float(minimum), float(maximum), int(count), unit]
+            continue
+        current[0] += float(total)
+        current[1] = min(current[1], float(minimum))
+        current[2] = max(current[2], float(maximum))
+        current[3] += int(count)
+        current[4] = current[4] or unit
+
+
+def to_columnar(buckets: BucketMap) -> List[Dict[str, Any]]:
+    """
+    Convert a bucket map into one dict of parallel arrays per measurement
+
+    Returns:
+        List of MeasurementSeries-shaped dicts sorted by measurement name
+    """
+    series: Dict[str, Dict[str, Any]] = {}
+
+    for (measurement, bucket) in sorted(buckets):
+        total, minimum, maximum, count, unit = buckets[(measurement, bucket)]
+        entry = series.get(measurement)
+        if entry is None:
+            entry = series[measurement] = {
+                "measurement": measurement,
+                "unit": unit,
+                "timestamps": [],
+                "avg": [],
+                "min": [],
+                "max": [],
+                "count": [],
+            }
+        entry["unit"] = entry["unit"] or unit
+        entry["timestamps"].append(bucket)
+        entry["avg"].append(total / count)
+        entry["min"].append(minimum)
+        entry["max"].append(maximum)
+        entry["count"].append(count)
+
+    return list(series.values())
+
+
+def bucket_grid(start: datetime, end: datetime, bucket: timedelta) -> List[datetime]:
+    """
+    List the bucket starts covering [start, end) on the BUCKET_ORIGIN grid
+
+    Args:
+        start: Range start
+        end: Range end
+        bucket: Bucket width
+
+    Returns:
+        Bucket start times in ascending order
+    """
+    first = BUCKET_ORIGIN + ((start - BUCKET_ORIGIN) // bucket) * bucket
+    grid = []
+    current = first
+    while current < end:
+        grid.append(current)
+        current += bucket
+    return grid
+
+
+def align_on_grid(
+    buckets_by_sensor: Dict[int, BucketMap],
+    grid: List[datetime]
+) -> List[Dict[str, Any]]:
+    """
+    Lay out several sensors' bucket maps on one shared time grid
+
+    Every series gets one entry per grid slot, so series can be overlaid or
+    correlated index by index. Empty buckets are None (count 0).
+
+    Args:
+        buckets_by_sensor: Bucket map per sensor ID
+        grid: Shared bucket starts (see bucket_grid)
+
+    Returns:
+        List of AlignedSeries-shaped dicts sorted by sensor ID and measurement
+    """
+    slots = {bucket: i for i, bucket in enumerate(grid)}
+    series: List[Dict[str, Any]] = []
+
+    for sensor_id in sorted(buckets_by_sensor):
+        by_measurement: Dict[str, Dict[str, Any]] = {}
+
+        for (measurement, bucket), (total, minimum, maximum, count, unit) in buckets_by_sensor[sensor_id].items():
+            slot = slots.get(bucket)
+            if slot is None:
+                continue
+            entry = by_measurement.get(measurement)
+            if entry is None:
+                entry = by_measurement[measurement] = {
+                    "sensor_id": sensor_id,
+                    "measurement": measurement,
+                    "unit": unit,
+                    "avg": [None] * len(grid),
+                    "min": [None] * len(grid),
+                    "max": [None] * len(grid),
+                    "count": [0] * len(grid),
+                }
+            entry["unit"] = entry["unit"] or unit
+            entry["avg"][slot] = total / count
+            entry["min"][slot] = minimum
+            entry["max"][slot] = maximum
+            entry["count"][slot] = count
+
+        series.extend(by_measurement[name] for name in sorted(by_measurement))
+
+    return series
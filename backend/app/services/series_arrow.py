@@ -0,0 +1,184 @@
+"""
+Series as Arrow IPC
+Sensor series in long (tidy) format as an Arrow record batch stream
+
+Analysis clients ask for `Accept: application/vnd.apache.arrow.stream` and
+load the response without parsing, e.g.
+`pyarrow.ipc.open_stream(body).read_all().to_pandas()`. Each row is one point
+of one measurement; measurement and unit are dictionary encoded and the
+response's scalar fields (sensor, range, mode, bucket) travel as schema
+metadata. Columns are assembled from the series arrays directly, without
+response models or per-point JSON values. Buffers are written uncompressed,
+so a client can map columns straight out of the body (zero-copy); clients on
+slow links may opt in to lz4 or zstd buffer compression, which costs a
+decode on read. The compression middleware leaves these responses alone.
+"""
+
+import json
+from enum import Enum
+from itertools import chain
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pyarrow as pa
+from fastapi import Response
+
+from app.core.responses import ARROW_STREAM_MEDIA_TYPE
+
+BUCKETED_SCHEMA = pa.schema([
+    ("measurement", pa.dictionary(pa.int32(), pa.string())),
+    ("unit", pa.dictionary(pa.int32(), pa.string())),
+    ("timestamp", pa.timestamp("us")),
+    ("avg", pa.float64()),
+    ("min", pa.float64()),
+    ("max", pa.float64()),
+    ("count", pa.int64()),
+])
+
+DOWNSAMPLED_SCHEMA = pa.schema([
+    ("measurement", pa.dictionary(pa.int32(), pa.string())),
+    ("unit", pa.dictionary(pa.int32(), pa.string())),
+    ("timestamp", pa.timestamp("us")),
+    ("value", pa.float64()),
+])
+
+ALIGNED_SCHEMA = pa.schema([("sensor_id", pa.int64())] + list(BUCKETED_SCHEMA))
+
+
+class IpcCompression(str, Enum):
+    """Buffer compression of Arrow IPC streams (series responses and exports)"""
+
+    NONE = "none"  # zero-copy loading on the client
+    LZ4 = "lz4"
+    ZSTD = "zstd"
+
+
+def ipc_write_options(compression: IpcCompression = IpcCompression.NONE) -> pa.ipc.IpcWriteOptions:
+    """IPC writer options for the requested buffer compression"""
+    if compression == IpcCompression.NONE:
+        return pa.ipc.IpcWriteOptions()
+    return pa.ipc.IpcWriteOptions(compression=compression.value)
+
+
+# OpenAPI `responses` entry documenting the Arrow alternative of a route
+ARROW_OPENAPI = {
+    200: {
+        "content": {ARROW_STREAM_MEDIA_TYPE: {"schema": {"type": "string", "format": "binary"}}},
+        "description": "JSON, or an Arrow IPC stream with Accept: " + ARROW_STREAM_MEDIA_TYPE,
+    }
+}
+
+
+def _labels(values: List[Optional[str]], lengths: List[int]) -> pa.DictionaryArray:
+    """Dictionary array repeating values[i] lengths[i] times"""
+    dictionary: Dict[str, int] = {}
+    # A missing unit is a null entry, not a category
+    codes = [0 if value is None else dictionary.setdefault(value, len(dictionary)) for value in values]
+    indices = np.repeat(np.array(codes, dtype=np.int32), lengths)
+    mask = np.repeat(np.array([value is None for value in values], dtype=bool), lengths)
+    return pa.DictionaryArray.from_arrays(
+        pa.array(indices, mask=mask if mask.any() else None),
+        pa.array(list(dictionary), pa.string())
+    )
+
+
+def _concat(series: List[Dict[str, Any]], key: str, type: pa.DataType) -> pa.Array:
+    """One column from the per-measurement lists (or NumPy arrays) of `key`"""
+    parts = [entry[key] for entry in series]
+    if parts and isinstance(parts[0], np.ndarray):
+        return pa.array(np.concatenate(parts), type)
+    return pa.array(list(chain.from_iterable(parts)), type)
+
+
+def bucketed_batch(series: List[Dict[str, Any]]) -> pa.RecordBatch:
+    """
+    Long-format batch of mode=avg series
+
+    Args:
+        series: MeasurementSeries-shaped dicts from to_columnar
+
+    Returns:
+        RecordBatch with BUCKETED_SCHEMA
+    """
+    lengths = [len(entry["timestamps"]) for entry in series]
+    return pa.RecordBatch.from_arrays([
+        _labels([entry["measurement"] for entry in series], lengths),
+        _labels([entry["unit"] for entry in series], lengths),
+        _concat(series, "timestamps", pa.timestamp("us")),
+        _concat(series, "avg", pa.float64()),
+        _concat(series, "min", pa.float64()),
+        _concat(series, "max", pa.float64()),
+        _concat(series, "count", pa.int64()),
+    ], schema=BUCKETED_SCHEMA)
+
+
+def downsampled_batch(series: List[Dict[str, Any]]) -> pa.RecordBatch:
+    """
+    Long-format batch of lttb/minmax series
+
+    Args:
+        series: MeasurementSeries-shaped dicts from downsample(as_arrays=True)
+
+    Returns:
+        RecordBatch with DOWNSAMPLED_SCHEMA
+    """
+    lengths = [len(entry["timestamps"]) for entry in series]
+    return pa.RecordBatch.from_arrays([
+        _labels([entry["measurement"] for entry in series], lengths),
+        _labels([entry["unit"] for entry in series], lengths),
+        _concat(series, "timestamps", pa.timestamp("us")),
+        _concat(series, "values", pa.float64()),
+    ], schema=DOWNSAMPLED_SCHEMA)
+
+
+def aligned_batch(series: List[Dict[str, Any]], grid: List) -> pa.RecordBatch:
+    """
+    Long-format batch of several sensors on a shared bucket grid
+
+    Every series contributes one row per grid slot; empty buckets have null
+    avg/min/max and count 0, as in the JSON response.
+
+    Args:
+        series: AlignedSeries-shaped dicts from align_on_grid
+        grid: Shared bucket starts
+
+    Returns:
+        RecordBatch with ALIGNED_SCHEMA
+    """
+    lengths = [len(grid)] * len(series)
+    timestamps = pa.array(grid, pa.timestamp("us"))
+    return pa.RecordBatch.from_arrays([
+        pa.array(np.repeat(np.array([entry["sensor_id"] for entry in series], dtype=np.int64), lengths)),
+        _labels([entry["measurement"] for entry in series], lengths),
+        _labels([entry["unit"] for entry in series], lengths),
+        pa.concat_arrays([timestamps] * len(series)) if series else timestamps.slice(0, 0),
+        _concat(series, "avg", pa.float64()),
+        _concat(series, "min", pa.float64()),
+        _concat(series, "max", pa.float64()),
+        _concat(series, "count", pa.int64()),
+    ], schema=ALIGNED_SCHEMA)
+
+
+def arrow_response(
+    batch: pa.RecordBatch,
+    metadata: Dict[str, Any],
+    compression: IpcCompression = IpcCompression.NONE
+) -> Response:
+    """
+    Encode a batch as an Arrow IPC stream response
+
+    Args:
+        batch: Series batch
+        metadata: Scalar response fields, stored JSON encoded as schema metadata
+        compression: Buffer compression (none keeps the body zero-copy readable)
+
+    Returns:
+        Response with ARROW_STREAM_MEDIA_TYPE
+    """
+    batch = batch.replace_schema_metadata({
+        key: json.dumps(value, default=lambda value: value.isoformat()) for key, value in metadata.items()
+    })
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, batch.schema, options=ipc_write_options(compression)) as writer:
+        writer.write_batch(batch)
+    return Response(content=sink.getvalue().to_pybytes(), media_type=ARROW_STREAM_MEDIA_TYPE)
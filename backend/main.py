@@ -22,10 +22,21 @@ from app.api.v1.routers import (
     gateway_assignments,
     gateway_status_history,
     dashboard,
+    jobs,
+    fleet,
+    live,
+    exports,
 )
+from app.core.compression import CompressionMiddleware
 from app.core.config import get_settings
 from app.core.database import check_database_health, close_db
+from app.core.events import event_listener
+from app.core.responses import NegotiatedResponse
+from app.core.security import attach_principal_cache
 from app.services.gateway_status_scheduler import start_scheduler, stop_scheduler
+from app.services.hot_window import attach_hot_window
+from app.services.live_events import attach_live_hub
+from app.services.ownership import attach_ownership_cache
 
 # Configure logging
 logging.basicConfig(
@@ -62,11 +73,23 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"❌ Failed to start scheduler: {e}")
 
+    # Listen for new readings, gateway status and user changes (feeds the
+    # in-memory hot window, live SSE/WebSocket clients and the principal cache)
+    if settings.EVENT_LISTENER_ENABLED:
+        if settings.HOT_WINDOW_ENABLED:
+            attach_hot_window(event_listener)
+        attach_live_hub(event_listener)
+        attach_principal_cache(event_listener)
+        attach_ownership_cache(event_listener)
+        await event_listener.start()
+
     yield
 
     # Shutdown
     logger.info("🛑 Shutting down Kampung Tani IoT API")
 
+    await event_listener.stop()
+
     # Stop scheduler
     try:
         stop_scheduler()
@@ -119,6 +142,7 @@ app = FastAPI(
         "url": "https://opensource.org/licenses/MIT",
     },
     lifespan=lifespan,
+    default_response_class=NegotiatedResponse,
     docs_url=settings.DOCS_URL,
     redoc_url=settings.REDOC_URL,
     openapi_url=f"{settings.API_PREFIX}/openapi.json",
@@ -133,6 +157,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress response bodies (gzip, or br/zstd when the client accepts them)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+        zstd_level=settings.COMPRESSION_ZSTD_LEVEL,
+        excluded_media_types=settings.compression_excluded_types_list,
+    )
+
 # Include API v1 routers
 app.include_router(health.router, prefix=settings.API_PREFIX, tags=["Health"])
 app.include_router(
@@ -164,6 +199,10 @@ app.include_router(
     prefix=f"{settings.API_PREFIX}/gateway-status-history",
     tags=["Gateway Status History"],
 )
+app.include_router(jobs.router, prefix=f"{settings.API_PREFIX}/jobs", tags=["Background Jobs"])
+app.include_router(fleet.router, prefix=f"{settings.API_PREFIX}/fleet", tags=["Fleet"])
+app.include_router(live.router, prefix=f"{settings.API_PREFIX}/live", tags=["Live"])
+app.include_router(exports.router, prefix=f"{settings.API_PREFIX}/exports", tags=["Exports"])
 
 
 @app.get("/", include_in_schema=False)
@@ -6,13 +6,20 @@ from unittest.mock import patch
 # Add the backend directory to the path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app import create_app
-from app.core.config import get_settings
+# Settings require a JWT secret; unit tests never issue real tokens
+os.environ.setdefault("JWT_SECRET_KEY", "unit-runs-only-jwt-key-0123456789abcdefghijk")
+
+# app.core pulls in the repositories, which import the archive service back;
+# load it first so test modules can import any service module directly
+import app.core  # noqa: E402,F401
 
 
 @pytest.fixture
 def app():
     """Create application for testing"""
+    from app import create_app
+    from app.core.config import get_settings
+
     # Use development settings for testing
     settings = get_settings()
     settings.DEBUG = True
@@ -0,0 +1,125 @@
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from app.core import security
+from app.core.events import USERS_CHANNEL
+from app.models.user import User
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    security.claims_cache.clear()
+    security.principal_cache.clear()
+    yield
+    security.claims_cache.clear()
+    security.principal_cache.clear()
+
+
+@pytest.fixture
+def users(monkeypatch):
+    """Users table stand-in counting lookups"""
+    table = {
+        1: User(id=1, username="siti", email="siti@example.com", password_hash="x", role="farmer",
+                created_at=datetime(2024, 1, 1)),
+    }
+    lookups = []
+
+    class FakeUserRepository:
+        def __init__(self, db):
+            pass
+
+        async def get_by_id(self, user_id):
+            lookups.append(user_id)
+            return table.get(user_id)
+
+    monkeypatch.setattr(security, "UserRepository", FakeUserRepository)
+    return table, lookups
+
+
+def token(user_id=1, username="siti", **kwargs):
+    return security.create_access_token({"user_id": user_id, "sub": username}, **kwargs)
+
+
+def authenticate(value):
+    return asyncio.run(security.get_user_from_token(value, db=None))
+
+
+class TestClaimsCache:
+    """Test cases for cached token verification"""
+
+    def test_signature_verified_once(self, monkeypatch):
+        """A repeated token is not decoded again"""
+        calls = []
+        verify = security.verify_token
+        monkeypatch.setattr(security, "verify_token", lambda value: calls.append(value) or verify(value))
+
+        value = token()
+        assert security._cached_claims(value)["user_id"] == 1
+        assert security._cached_claims(value)["user_id"] == 1
+        assert len(calls) == 1
+
+    def test_expired_claims_are_not_served(self):
+        """A cached payload past its exp is verified again (and rejected)"""
+        value = token(expires_delta=timedelta(seconds=-1))
+        security.claims_cache.set(value, {"user_id": 1, "sub": "siti", "exp": 0})
+        with pytest.raises(HTTPException) as exc:
+            security._cached_claims(value)
+        assert exc.value.status_code == 401
+
+    def test_invalid_token_is_not_cached(self):
+        """Bad tokens are rejected every time"""
+        with pytest.raises(HTTPException):
+            security._cached_claims("not-a-token")
+        assert security.claims_cache.get("not-a-token") is None
+
+
+class TestPrincipalCache:
+    """Test cases for cached authenticated users"""
+
+    def test_user_loaded_once(self, users):
+        """The users table is read on the first request only"""
+        _, lookups = users
+        first, second = authenticate(token()), authenticate(token())
+        assert first.id == second.id == 1
+        assert first.role == "farmer"
+        assert lookups == [1]
+
+    def test_update_notification_reloads(self, users):
+        """A user change from any process drops the cached principal"""
+        table, lookups = users
+        authenticate(token())
+        table[1].role = "admin"
+
+        security._on_user_changed({"user_id": 1})
+        assert authenticate(token()).role == "admin"
+        assert lookups == [1, 1]
+
+    def test_deleted_user_is_rejected(self, users):
+        """Once invalidated, a deleted user no longer authenticates"""
+        table, _ = users
+        authenticate(token())
+        del table[1]
+        security._on_user_changed({"user_id": 1})
+        assert authenticate(token()) is None
+
+    def test_renamed_user_old_token_is_rejected(self, users):
+        """The token's subject must match the cached username"""
+        assert authenticate(token(username="someone-else")) is None
+
+    def test_invalidate_principal_publishes(self, users, monkeypatch):
+        """Local entry is dropped and other processes are notified"""
+        published = []
+
+        async def publish(db, channel, payloads):
+            published.append((channel, list(payloads)))
+
+        monkeypatch.setattr(security, "publish", publish)
+        authenticate(token())
+        asyncio.run(security.invalidate_principal(None, 1))
+
+        assert security.principal_cache.get(1) is None
+        assert published == [(USERS_CHANNEL, [json.dumps({"user_id": 1})])]
@@ -0,0 +1,150 @@
+import asyncio
+import gzip
+import json
+
+import pytest
+
+from app.services.bulk_ingest import (
+    GUNZIP_CHUNK_BYTES,
+    MAX_ROW_BYTES,
+    BulkFormatError,
+    JsonArrayReader,
+    NdjsonReader,
+    gunzip,
+)
+
+
+def feed_all(reader, parts):
+    """Feed body parts to a reader and collect (row, value, error) tuples"""
+    rows = []
+    for part in parts[:-1]:
+        rows.extend(reader.feed(part))
+    rows.extend(reader.feed(parts[-1], final=True))
+    return rows
+
+
+def split_every(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)] or [b""]
+
+
+class TestNdjsonReader:
+    """Test cases for the incremental NDJSON reader"""
+
+    def test_lines_split_across_chunks(self):
+        """Rows are complete however the body is split"""
+        body = b'{"sensor_id": 1, "value": 1.5}\n\n{"sensor_id": 2, "value": 2}\n'
+        for size in (1, 3, 7, len(body)):
+            rows = feed_all(NdjsonReader(), split_every(body, size))
+            assert [(row, value["sensor_id"]) for row, value, _ in rows] == [(1, 1), (3, 2)]
+
+    def test_last_line_without_newline(self):
+        """The final line does not need a trailing newline"""
+        rows = feed_all(NdjsonReader(), [b'{"a": 1}\n{"a"', b': 2}'])
+        assert [value for _, value, _ in rows] == [{"a": 1}, {"a": 2}]
+
+    def test_invalid_line_is_reported_per_row(self):
+        """A broken line is an error of that row only"""
+        rows = feed_all(NdjsonReader(), [b'{"a": 1}\nnot json\n{"a": 3}\n'])
+        assert rows[0] == (1, {"a": 1}, None)
+        assert rows[1][0] == 2 and rows[1][1] is None and rows[1][2].startswith("Invalid JSON")
+        assert rows[2] == (3, {"a": 3}, None)
+
+    def test_oversize_line_after_valid_rows(self):
+        """Rows before an oversize line are returned before the error"""
+        reader = NdjsonReader()
+        rows = reader.feed(b'{"a": 1}\n' + b"x" * (MAX_ROW_BYTES + 1))
+        assert [value for _, value, _ in rows] == [{"a": 1}]
+        with pytest.raises(BulkFormatError, match="Line 2 is longer"):
+            reader.feed(b"")
+
+
+class TestJsonArrayReader:
+    """Test cases for the incremental JSON array reader"""
+
+    def test_elements_split_across_chunks(self):
+        """Elements are complete however the body is split"""
+        items = [{"sensor_id": i, "value": i / 3, "unit": "°C"} for i in range(20)]
+        body = json.dumps(items).encode()
+        for size in (1, 2, 5, 64, len(body)):
+            rows = feed_all(JsonArrayReader(), split_every(body, size))
+            assert [value for _, value, _ in rows] == items
+            assert [row for row, _, _ in rows] == list(range(1, 21))
+
+    def test_trailing_number_waits_for_next_chunk(self):
+        """A number at the end of a chunk may continue in the next one"""
+        reader = JsonArrayReader()
+        assert reader.feed(b"[12") == []
+        rows = reader.feed(b"34, 5]", final=True)
+        assert [value for _, value, _ in rows] == [1234, 5]
+
+    def test_empty_array(self):
+        """An empty array yields no rows"""
+        assert feed_all(JsonArrayReader(), [b" [ ", b"] "]) == []
+
+    def test_body_must_be_an_array(self):
+        """A top-level object is rejected"""
+        with pytest.raises(BulkFormatError, match="must be a JSON array"):
+            JsonArrayReader().feed(b'{"a": 1}', final=True)
+
+    def test_broken_array_after_valid_rows(self):
+        """Elements before a syntax error are returned, the error comes next"""
+        reader = JsonArrayReader()
+        rows = reader.feed(b'[{"a": 1}, {"a": 2} {"a": 3}]')
+        assert [value for _, value, _ in rows] == [{"a": 1}, {"a": 2}]
+        with pytest.raises(BulkFormatError, match="after element 2"):
+            reader.feed(b"", final=True)
+
+    def test_truncated_array(self):
+        """A body ending inside the array is an error"""
+        reader = JsonArrayReader()
+        rows = reader.feed(b'[{"a": 1},')
+        assert [value for _, value, _ in rows] == [{"a": 1}]
+        with pytest.raises(BulkFormatError):
+            reader.feed(b"", final=True)
+
+    def test_oversize_element(self):
+        """An element that never completes within MAX_ROW_BYTES is an error"""
+        reader = JsonArrayReader()
+        reader.feed(b'[{"a": "')
+        with pytest.raises(BulkFormatError, match="element 1"):
+            reader.feed(b"x" * (MAX_ROW_BYTES + 1))
+
+    def test_multibyte_character_split_across_chunks(self):
+        """UTF-8 sequences split between chunks are decoded correctly"""
+        body = '[{"unit": "°C"}]'.encode()
+        split = body.index("°".encode()) + 1
+        rows = feed_all(JsonArrayReader(), [body[:split], body[split:]])
+        assert rows == [(1, {"unit": "°C"}, None)]
+
+
+class TestGunzip:
+    """Test cases for streamed gzip decoding"""
+
+    @staticmethod
+    def run(chunks):
+        async def source():
+            for chunk in chunks:
+                yield chunk
+
+        async def collect():
+            return [part async for part in gunzip(source())]
+
+        return asyncio.run(collect())
+
+    def test_round_trip_in_small_chunks(self):
+        """Decompressed output matches the input however it is chunked"""
+        data = b"".join(b'{"sensor_id": %d}\n' % i for i in range(5000))
+        compressed = gzip.compress(data)
+        assert b"".join(self.run(split_every(compressed, 100))) == data
+
+    def test_output_is_bounded_per_chunk(self):
+        """A highly compressible body is handed out in bounded parts"""
+        data = b"0" * (GUNZIP_CHUNK_BYTES * 3)
+        parts = self.run([gzip.compress(data)])
+        assert b"".join(parts) == data
+        assert max(len(part) for part in parts) <= GUNZIP_CHUNK_BYTES
+
+    def test_invalid_body(self):
+        """A body that is not gzip raises BulkFormatError"""
+        with pytest.raises(BulkFormatError, match="Invalid gzip body"):
+            self.run([b"definitely not gzip"])
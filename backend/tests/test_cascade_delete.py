@@ -0,0 +1,156 @@
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+import pyarrow.parquet as pq
+import pytest
+
+from app.services import gateway_status_scheduler
+from app.services.sensor_data_archive import _rows_to_table, remove_sensor_from_archive
+
+DAY = date(2024, 3, 1)
+START = datetime(2024, 3, 1)
+
+
+class FakeResult:
+    def __init__(self, items):
+        self.items = items
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return list(self.items)
+
+
+class FakeSession:
+    """Sync session stand-in returning the given rows from every query"""
+
+    def __init__(self, items):
+        self.items = items
+        self.deleted = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.closed = False
+
+    def execute(self, statement):
+        return FakeResult(self.items)
+
+    def delete(self, item):
+        self.deleted.append(item)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+
+def write_archive(directory, rows_by_hour):
+    """Archive file with one row group per hour, as the archiver writes it"""
+    path = directory / f"{DAY.isoformat()}-00000000.parquet"
+    writer = None
+    rows = []
+    for hour_rows in rows_by_hour:
+        table = _rows_to_table(hour_rows)
+        writer = writer or pq.ParquetWriter(path, table.schema, compression="zstd")
+        writer.write_table(table)
+        rows.extend(hour_rows)
+    writer.close()
+    return SimpleNamespace(
+        path=str(path),
+        day=DAY,
+        row_count=len(rows),
+        sensor_ids=sorted({row[1] for row in rows}),
+        min_timestamp=min(row[6] for row in rows),
+        max_timestamp=max(row[6] for row in rows),
+    )
+
+
+def reading(id, sensor_id, minutes):
+    return (id, sensor_id, 1, 20.0 + id, "°C", {"measurement_type": "Temperature"}, START + timedelta(minutes=minutes))
+
+
+class TestRemoveSensorFromArchive:
+    """Test cases for deleting a sensor's archived readings"""
+
+    def test_file_is_rewritten_without_sensor(self, tmp_path):
+        """Other sensors' readings stay, the manifest row follows the new file"""
+        archive = write_archive(tmp_path, [
+            [reading(1, 7, 5), reading(2, 8, 10)],
+            [reading(3, 7, 65), reading(4, 8, 70), reading(5, 9, 80)],
+        ])
+        old_path = archive.path
+        db = FakeSession([archive])
+
+        assert remove_sensor_from_archive(db, 7) == 2
+
+        assert db.commits == 1 and not db.deleted
+        assert archive.path != old_path
+        assert not (tmp_path / old_path).exists()
+        assert archive.row_count == 3
+        assert archive.sensor_ids == [8, 9]
+        assert archive.min_timestamp == START + timedelta(minutes=10)
+        assert archive.max_timestamp == START + timedelta(minutes=80)
+
+        table = pq.read_table(archive.path)
+        assert table["id"].to_pylist() == [2, 4, 5]
+        assert table.schema.equals(_rows_to_table([reading(1, 7, 5)]).schema)
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_file_of_only_that_sensor_is_removed(self, tmp_path):
+        """A file left empty is deleted together with its manifest row"""
+        archive = write_archive(tmp_path, [[reading(1, 7, 5), reading(2, 7, 10)]])
+        db = FakeSession([archive])
+
+        assert remove_sensor_from_archive(db, 7) == 2
+
+        assert db.deleted == [archive]
+        assert db.commits == 1
+        assert not list(tmp_path.iterdir())
+
+    def test_failed_rewrite_keeps_the_old_file(self, tmp_path):
+        """Nothing is committed or removed when a file cannot be rewritten"""
+        archive = write_archive(tmp_path, [[reading(1, 7, 5), reading(2, 8, 10)]])
+        (tmp_path / "broken.parquet").write_bytes(b"not parquet")
+        broken = SimpleNamespace(**{**vars(archive), "path": str(tmp_path / "broken.parquet")})
+        db = FakeSession([broken])
+
+        with pytest.raises(Exception):
+            remove_sensor_from_archive(db, 7)
+
+        assert db.commits == 0 and db.rollbacks == 1
+        assert broken.path == str(tmp_path / "broken.parquet")
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["2024-03-01-00000000.parquet", "broken.parquet"]
+
+
+class TestRecoverBackgroundJobs:
+    """Test cases for jobs left behind by a restart"""
+
+    def test_pending_resubmitted_running_failed(self, tmp_path, monkeypatch):
+        """Pending jobs run again; interrupted ones fail and lose their partial file"""
+        pending = SimpleNamespace(id=1, kind="delete_sensor", target_id=7, status="pending")
+        running = SimpleNamespace(id=2, kind="export_sensor", target_id=7, status="running")
+        partial = tmp_path / "export-2.csv.part"
+        partial.write_text("id,value\n")
+        db = FakeSession([pending, running])
+        submitted = []
+
+        monkeypatch.setattr(gateway_status_scheduler, "SessionLocal", lambda: db)
+        monkeypatch.setattr(gateway_status_scheduler.settings, "EXPORT_DIR", str(tmp_path))
+        monkeypatch.setattr(
+            gateway_status_scheduler,
+            "run_in_background",
+            lambda func, *args, name: submitted.append((func.__name__, args))
+        )
+
+        gateway_status_scheduler.recover_background_jobs(datetime.utcnow())
+
+        assert submitted == [("run_cascade_delete", (1,))]
+        assert pending.status == "pending"
+        assert running.status == "failed"
+        assert running.message == "Interrupted by a server restart"
+        assert not partial.exists()
+        assert db.commits == 1 and db.closed
@@ -0,0 +1,96 @@
+import gzip
+import zlib
+
+import pytest
+
+from app.core.compression import (
+    BROTLI,
+    GZIP,
+    ZSTD,
+    Compressor,
+    available_encodings,
+    select_encoding,
+)
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+ALL = [ZSTD, BROTLI, GZIP]
+BODY = b'{"sensor_id":1,"measurement":"Temperature","value":25.5,"unit":"\\u00b0C"}\n' * 500
+
+
+def decompress(encoding, data):
+    if encoding == ZSTD:
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    if encoding == BROTLI:
+        return brotli.decompress(data)
+    return gzip.decompress(data)
+
+
+class TestSelectEncoding:
+    """Test cases for Accept-Encoding negotiation"""
+
+    def test_prefers_server_order(self):
+        """The first supported encoding the client accepts wins"""
+        assert select_encoding("gzip, br, zstd", ALL) == ZSTD
+        assert select_encoding("gzip, br", ALL) == BROTLI
+        assert select_encoding("gzip", ALL) == GZIP
+
+    def test_zero_quality_is_refused(self):
+        """q=0 excludes an encoding"""
+        assert select_encoding("zstd;q=0, gzip;q=0.5", ALL) == GZIP
+        assert select_encoding("gzip;q=0", [GZIP]) is None
+
+    def test_wildcard(self):
+        """* accepts every encoding not listed explicitly"""
+        assert select_encoding("*", ALL) == ZSTD
+        assert select_encoding("zstd;q=0, *", ALL) == BROTLI
+        assert select_encoding("*;q=0", ALL) is None
+
+    def test_case_and_whitespace(self):
+        """Header parsing ignores case and spacing"""
+        assert select_encoding(" GZIP ; Q=1.0 ", [GZIP]) == GZIP
+
+    def test_malformed_quality(self):
+        """An unparsable q-value counts as refused"""
+        assert select_encoding("gzip;q=abc", [GZIP]) is None
+
+    def test_no_header_value(self):
+        """An empty header accepts nothing"""
+        assert select_encoding("", ALL) is None
+
+    def test_available_encodings_end_with_gzip(self):
+        """gzip is always available and least preferred"""
+        assert available_encodings()[-1] == GZIP
+
+
+class TestCompressor:
+    """Test cases for incremental response compression"""
+
+    @pytest.mark.parametrize("encoding", available_encodings())
+    def test_round_trip(self, encoding):
+        """Chunked output decodes to the original body"""
+        compressor = Compressor(encoding, level=4)
+        chunks = [BODY[i:i + 4096] for i in range(0, len(BODY), 4096)]
+        data = b"".join(compressor.compress(chunk) for chunk in chunks[:-1])
+        data += compressor.finish(chunks[-1])
+        assert decompress(encoding, data) == BODY
+        assert len(data) < len(BODY)
+
+    def test_gzip_chunks_decode_before_finish(self):
+        """Each flushed gzip chunk is decodable without the rest of the stream"""
+        compressor = Compressor(GZIP, level=4)
+        decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        assert decoder.decompress(compressor.compress(b"first chunk")) == b"first chunk"
+        assert decoder.decompress(compressor.compress(b"second")) == b"second"
+
+    def test_empty_body(self):
+        """Finishing without data still yields a valid stream"""
+        assert gzip.decompress(Compressor(GZIP, level=4).finish()) == b""
@@ -0,0 +1,170 @@
+import asyncio
+import tracemalloc
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from app.services.downsampling import M4Reducer, MinMaxReducer, SeriesMode, downsample, lttb
+
+START = datetime(2024, 1, 1)
+START_S = (START - datetime(1970, 1, 1)).total_seconds()
+
+
+async def reading_chunks(count: int, chunk_size: int, spike_at: int = -1):
+    """(measurement, epoch, value, unit) chunks of one reading per second, newest chunk first"""
+    for chunk_start in reversed(range(0, count, chunk_size)):
+        yield [
+            ("Temperature", START_S + i, 100.0 if i == spike_at else float(i % 60), "°C")
+            for i in range(chunk_start, min(chunk_start + chunk_size, count))
+        ]
+
+
+def run_downsample(count: int, chunk_size: int, mode: SeriesMode, points: int, spike_at: int = -1):
+    end = START + timedelta(seconds=count)
+    return asyncio.run(downsample(reading_chunks(count, chunk_size, spike_at), mode, points, START, end))[0]
+
+
+class TestLttb:
+    """Test cases for Largest-Triangle-Three-Buckets downsampling"""
+
+    def test_keeps_first_and_last_point(self):
+        """The endpoints are always selected"""
+        x = np.arange(1000, dtype=float)
+        y = np.sin(x / 50)
+        rx, ry = lttb(x, y, 100)
+        assert len(rx) == 100
+        assert rx[0] == 0 and rx[-1] == 999
+        assert ry[0] == y[0] and ry[-1] == y[-1]
+
+    def test_selected_points_are_ordered_input_points(self):
+        """Output is a time-ordered subset of the input"""
+        x = np.arange(500, dtype=float)
+        y = np.random.default_rng(1).normal(size=500)
+        rx, ry = lttb(x, y, 50)
+        assert np.all(np.diff(rx) > 0)
+        assert np.array_equal(ry, y[rx.astype(int)])
+
+    def test_keeps_spike(self):
+        """A single outlier survives the reduction"""
+        x = np.arange(1000, dtype=float)
+        y = np.zeros(1000)
+        y[437] = 100.0
+        rx, ry = lttb(x, y, 20)
+        assert 437 in rx
+        assert ry.max() == 100.0
+
+    def test_threshold_not_below_length(self):
+        """Short series and tiny thresholds are returned unchanged"""
+        x = np.arange(10, dtype=float)
+        y = x * 2
+        assert lttb(x, y, 10)[0] is x
+        assert lttb(x, y, 2)[0] is x
+
+
+class TestMinMaxReducer:
+    """Test cases for the streaming min/max-per-pixel reducer"""
+
+    def test_min_and_max_per_column(self):
+        """Each column keeps its lowest and highest reading"""
+        reducer = MinMaxReducer(0, 10, pixels=2)
+        reducer.update(np.array([0.0, 1.0, 2.0, 6.0, 7.0]), np.array([5.0, 1.0, 9.0, 3.0, 4.0]))
+        x, y = reducer.result()
+        assert x.tolist() == [1.0, 2.0, 6.0, 7.0]
+        assert y.tolist() == [1.0, 9.0, 3.0, 4.0]
+        assert reducer.count == 5
+
+    def test_chunks_in_any_order(self):
+        """Splitting and reordering chunks does not change the result"""
+        rng = np.random.default_rng(7)
+        x = np.sort(rng.uniform(0, 3600, 5000))
+        y = rng.normal(size=5000)
+
+        whole = MinMaxReducer(0, 3600, pixels=60)
+        whole.update(x, y)
+        chunked = MinMaxReducer(0, 3600, pixels=60)
+        for part in reversed(np.array_split(np.arange(5000), 7)):
+            chunked.update(x[part], y[part])
+
+        for a, b in zip(whole.result(), chunked.result()):
+            assert np.array_equal(a, b)
+
+    def test_result_is_time_ordered(self):
+        """The earlier extreme of each column comes first"""
+        reducer = MinMaxReducer(0, 10, pixels=1)
+        reducer.update(np.array([1.0, 8.0]), np.array([10.0, -10.0]))
+        x, y = reducer.result()
+        assert x.tolist() == [1.0, 8.0]
+        assert y.tolist() == [10.0, -10.0]
+
+    def test_single_reading_is_not_duplicated(self):
+        """A column with one reading yields one point"""
+        reducer = MinMaxReducer(0, 10, pixels=5)
+        reducer.update(np.array([3.0]), np.array([42.0]))
+        x, y = reducer.result()
+        assert x.tolist() == [3.0]
+        assert y.tolist() == [42.0]
+
+    def test_empty(self):
+        """No readings give no points"""
+        reducer = MinMaxReducer(0, 10, pixels=5)
+        reducer.update(np.array([]), np.array([]))
+        x, y = reducer.result()
+        assert len(x) == 0 and len(y) == 0
+
+    def test_out_of_range_readings_are_clamped(self):
+        """Readings outside the range land in the edge columns"""
+        reducer = MinMaxReducer(0, 10, pixels=2)
+        reducer.update(np.array([-5.0, 15.0]), np.array([1.0, 2.0]))
+        x, _ = reducer.result()
+        assert x.tolist() == [-5.0, 15.0]
+
+
+class TestM4Reducer:
+    """Test cases for the streaming first/min/max/last reducer"""
+
+    def test_edges_and_extremes_per_column(self):
+        """Each column keeps its first, lowest, highest and last reading"""
+        reducer = M4Reducer(0, 10, pixels=1)
+        reducer.update(np.array([5.0, 1.0, 9.0]), np.array([0.0, 3.0, 4.0]))
+        reducer.update(np.array([3.0, 7.0]), np.array([8.0, 2.0]))
+        x, y = reducer.result()
+        assert x.tolist() == [1.0, 3.0, 5.0, 9.0]
+        assert y.tolist() == [3.0, 8.0, 0.0, 4.0]
+        assert reducer.count == 5
+
+    def test_size_bounded_by_columns(self):
+        """At most four points per column, whatever the input size"""
+        rng = np.random.default_rng(3)
+        reducer = M4Reducer(0, 1000, pixels=25)
+        for _ in range(20):
+            reducer.update(rng.uniform(0, 1000, 10000), rng.normal(size=10000))
+        x, _ = reducer.result()
+        assert len(x) <= 100
+        assert np.all(np.diff(x) > 0)
+
+
+class TestDownsample:
+    """Test cases for streamed series reduction"""
+
+    def test_lttb_keeps_first_last_and_spike(self):
+        """Out-of-order chunks reduce to a time-ordered series with its edges and spike"""
+        series = run_downsample(50000, 3000, SeriesMode.LTTB, 100, spike_at=31234)
+        timestamps = series["timestamps"]
+        assert len(timestamps) == 100
+        assert timestamps[0] == START
+        assert timestamps[-1] == START + timedelta(seconds=49999)
+        assert timestamps == sorted(timestamps)
+        assert max(series["values"]) == 100.0
+        assert series["raw_count"] == 50000
+
+    def test_lttb_memory_is_bounded(self):
+        """Peak memory does not grow with the number of raw readings"""
+        def peak(count):
+            tracemalloc.start()
+            run_downsample(count, 2000, SeriesMode.LTTB, 200)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            return peak
+
+        small, large = peak(50000), peak(400000)
+        assert large < small * 1.5
@@ -0,0 +1,49 @@
+import json
+from datetime import datetime, timezone
+
+from app.core.events import MAX_PAYLOAD_BYTES, encode_reading_events, to_epoch
+
+
+class TestEncodeReadingEvents:
+    """Test cases for NOTIFY payload encoding"""
+
+    def test_single_payload(self):
+        """A few readings fit one payload"""
+        payloads = encode_reading_events(3, 1, [("Temperature", 1700000000.5, 25.5, "°C")])
+        assert len(payloads) == 1
+        assert json.loads(payloads[0]) == {
+            "sensor_id": 3,
+            "gateway_id": 1,
+            "readings": [["Temperature", 1700000000.5, 25.5, "°C"]],
+        }
+
+    def test_split_below_limit(self):
+        """Many readings are split into payloads below MAX_PAYLOAD_BYTES"""
+        readings = [("Soil Moisture", 1700000000 + i / 7, i * 1.0001, "%") for i in range(2000)]
+        payloads = encode_reading_events(12, 4, readings)
+        assert len(payloads) > 1
+        assert all(len(payload.encode()) < MAX_PAYLOAD_BYTES for payload in payloads)
+
+        decoded = [json.loads(payload) for payload in payloads]
+        assert all(event["sensor_id"] == 12 and event["gateway_id"] == 4 for event in decoded)
+        values = [reading[2] for event in decoded for reading in event["readings"]]
+        assert values == [reading[2] for reading in readings]
+
+    def test_non_ascii_units_stay_below_limit(self):
+        """Payload size is counted in bytes on the wire"""
+        readings = [("Suhu Tanah °", 1700000000.0, 1.0, "°C") for _ in range(1000)]
+        payloads = encode_reading_events(1, 1, readings)
+        assert all(len(payload.encode()) < MAX_PAYLOAD_BYTES for payload in payloads)
+
+    def test_no_readings(self):
+        """Nothing to publish gives no payloads"""
+        assert encode_reading_events(1, 1, []) == []
+
+
+class TestToEpoch:
+    """Test cases for timestamp conversion"""
+
+    def test_naive_is_utc(self):
+        """Naive timestamps are read as UTC"""
+        assert to_epoch(datetime(1970, 1, 2)) == 86400
+        assert to_epoch(datetime(2024, 1, 1)) == to_epoch(datetime(2024, 1, 1, tzinfo=timezone.utc))
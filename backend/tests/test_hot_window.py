@@ -0,0 +1,162 @@
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.events import to_epoch
+from app.services.hot_window import HotWindowStore
+
+
+def listener():
+    return SimpleNamespace(connected=True)
+
+
+def recent(minutes_ago: float) -> float:
+    return to_epoch(datetime.utcnow() - timedelta(minutes=minutes_ago))
+
+
+def readings(window, measurement="Temperature"):
+    t, v = window.buffers[measurement].view()
+    return list(zip(t.tolist(), v.tolist()))
+
+
+def recomputed_bytes(store):
+    return sum(window.nbytes for window in store._windows.values())
+
+
+class TestGetWindow:
+    """Test cases for cold-loading a sensor window"""
+
+    def test_notifications_during_load_are_merged(self):
+        """Rows notified mid-load are added once, including late old readings"""
+        store = HotWindowStore(hours=24, max_bytes=1 << 30, listener=listener())
+        loaded = [("Temperature", recent(30), 20.0, "°C"), ("Temperature", recent(20), 21.0, "°C")]
+        late = ("Temperature", recent(60), 18.0, "°C")
+        new = ("Temperature", recent(1), 22.0, "°C")
+
+        async def loader(since):
+            # Committed before the snapshot (also loaded), back-filled, and after it
+            store.on_readings({"sensor_id": 1, "readings": [list(loaded[1]), list(late), list(new)]})
+            yield loaded
+
+        window = asyncio.run(store.get_window(1, loader))
+        assert readings(window) == sorted((row[1], row[2]) for row in loaded + [late, new])
+
+    def test_notifications_before_load_are_ignored(self):
+        """Sensors without a window are not tracked until they are loaded"""
+        store = HotWindowStore(hours=24, max_bytes=1 << 30, listener=listener())
+        store.on_readings({"sensor_id": 1, "readings": [["Temperature", recent(5), 1.0, None]]})
+        assert store.stats()["sensors"] == 0
+
+    def test_concurrent_requests_load_once(self):
+        """Requests arriving during a load share it"""
+        store = HotWindowStore(hours=24, max_bytes=1 << 30, listener=listener())
+        calls = []
+
+        async def loader(since):
+            calls.append(since)
+            await asyncio.sleep(0.01)
+            yield [("Temperature", recent(5), 1.0, None)]
+
+        async def both():
+            return await asyncio.gather(store.get_window(1, loader), store.get_window(1, loader))
+
+        first, second = asyncio.run(both())
+        assert first is second
+        assert len(calls) == 1
+
+    def test_failed_load_is_not_kept(self):
+        """A loader error leaves no half-loaded window behind"""
+        store = HotWindowStore(hours=24, max_bytes=1 << 30, listener=listener())
+
+        async def loader(since):
+            yield [("Temperature", recent(5), 1.0, None)]
+            raise RuntimeError("connection lost")
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(store.get_window(1, loader))
+        assert store.stats()["sensors"] == 0
+        assert store._bytes == 0
+
+
+class TestMemory:
+    """Test cases for the memory cap and byte accounting"""
+
+    def test_running_total_matches_windows(self):
+        """The byte total follows loads, notifications, evictions and resets"""
+        store = HotWindowStore(hours=24, max_bytes=40_000, listener=listener())
+
+        def loader(count):
+            async def load(since):
+                yield [("Temperature", recent(600 - i * 0.1), float(i), None) for i in range(count)]
+            return load
+
+        for sensor_id in range(1, 6):
+            asyncio.run(store.get_window(sensor_id, loader(300 * sensor_id)))
+            store.on_readings({"sensor_id": sensor_id, "readings": [["Humidity", recent(1), 1.0, "%"]]})
+            assert store._bytes == recomputed_bytes(store)
+
+        assert store.evictions > 0
+        assert store._bytes <= store.max_bytes
+        assert 5 in store._windows
+
+        store.reset()
+        assert store._bytes == 0 == recomputed_bytes(store)
+
+
+class TestQueries:
+    """Test cases for answers served from a window"""
+
+    def test_bucketed_and_statistics(self):
+        """Buckets and statistics are computed from the buffered readings"""
+        store = HotWindowStore(hours=24, max_bytes=1 << 30, listener=listener())
+        base = datetime.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(hours=2)
+        rows = [("Temperature", to_epoch(base + timedelta(minutes=m)), float(m), "°C") for m in (0, 10, 70)]
+
+        async def loader(since):
+            yield rows
+
+        window = asyncio.run(store.get_window(1, loader))
+        buckets = store.bucketed(window, timedelta(hours=1), base, base + timedelta(hours=2))
+        assert buckets[("Temperature", base)] == [10.0, 0.0, 10.0, 2, "°C"]
+        assert buckets[("Temperature", base + timedelta(hours=1))] == [70.0, 70.0, 70.0, 1, "°C"]
+
+        stats = store.statistics(window, base)
+        assert stats["count"] == 3
+        assert stats["avg_value"] == pytest.approx(80 / 3)
+        assert stats["first_reading"] == base
+
+
+class TestLoader:
+    """Test cases for the router's cold loader"""
+
+    def test_loads_from_primary(self, monkeypatch):
+        """The shared window is never filled from a replica"""
+        from app.api.v1.routers import sensors
+
+        sessions = []
+
+        class FakeRepository:
+            def __init__(self, session):
+                sessions.append(session)
+
+            async def stream_values(self, **kwargs):
+                yield [("Temperature", recent(5), 1.0, None)]
+
+        class PrimarySession:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+        monkeypatch.setattr(sensors, "ReadSessionLocal", PrimarySession)
+        monkeypatch.setattr(sensors, "read_session", None)
+        monkeypatch.setattr(sensors, "SensorDataRepository", FakeRepository)
+
+        async def load():
+            return [rows async for rows in sensors._hot_window_loader(1)(datetime.utcnow())]
+
+        assert len(asyncio.run(load())) == 1
+        assert isinstance(sessions[0], PrimarySession)
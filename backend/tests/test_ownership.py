@@ -0,0 +1,102 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.v1 import dependencies
+from app.core.events import OWNERSHIP_CHANNEL
+from app.services import ownership
+
+USER = SimpleNamespace(id=1)
+
+
+@pytest.fixture
+def owned(monkeypatch):
+    """(gateway_id, sensor_id) pairs of user 1; counts ownership queries"""
+    state = SimpleNamespace(pairs=[(10, 100), (10, 101), (11, None)], loads=0)
+
+    class FakeGatewayRepository:
+        def __init__(self, db):
+            pass
+
+        async def get_owned_ids(self, user_id):
+            state.loads += 1
+            return list(state.pairs) if user_id == USER.id else []
+
+    monkeypatch.setattr(ownership, "GatewayRepository", FakeGatewayRepository)
+    monkeypatch.setattr(ownership, "on_replica", lambda db: False)
+    monkeypatch.setattr(ownership, "ownership_cache", ownership.TTLCache(maxsize=10, ttl=60))
+    return state
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+class TestOwnershipCache:
+    """Test cases for cached ownership checks"""
+
+    def test_one_query_per_user(self, owned):
+        """Sensor and gateway checks share one cached load"""
+        assert run(ownership.sensor_gateway_id(None, USER.id, 100)) == 10
+        assert run(ownership.sensor_gateway_id(None, USER.id, 101)) == 10
+        assert run(ownership.owns_gateway(None, USER.id, 11))
+        assert owned.loads == 1
+
+    def test_miss_is_rechecked(self, owned):
+        """A sensor created after the load (maybe on another process) is found"""
+        run(ownership.owns_gateway(None, USER.id, 10))
+        owned.pairs.append((11, 102))
+        assert run(ownership.sensor_gateway_id(None, USER.id, 102)) == 11
+        assert owned.loads == 2
+
+    def test_not_owned(self, owned):
+        """Other users' and missing IDs are refused"""
+        assert run(ownership.sensor_gateway_id(None, USER.id, 999)) is None
+        assert not run(ownership.owns_gateway(None, USER.id, 12))
+        assert not run(ownership.owns_gateway(None, 2, 10))
+
+    def test_delete_notification_drops_entry(self, owned):
+        """A deleted sensor is no longer owned once the change is notified"""
+        run(ownership.owns_gateway(None, USER.id, 10))
+        owned.pairs.remove((10, 101))
+        ownership._on_ownership_changed({"user_id": USER.id})
+        assert run(ownership.sensor_gateway_id(None, USER.id, 101)) is None
+
+    def test_invalidate_publishes(self, owned, monkeypatch):
+        """Local entry is dropped and other processes are notified"""
+        published = []
+
+        async def publish(db, channel, payloads):
+            published.append((channel, list(payloads)))
+
+        monkeypatch.setattr(ownership, "publish", publish)
+        run(ownership.owns_gateway(None, USER.id, 10))
+        run(ownership.invalidate_ownership(None, USER.id))
+
+        assert ownership.ownership_cache.get(USER.id) is None
+        assert published == [(OWNERSHIP_CHANNEL, [json.dumps({"user_id": USER.id})])]
+
+
+class TestDependencies:
+    """Test cases for the path parameter authorization helpers"""
+
+    def test_owned_sensor_ref(self, owned):
+        """An owned sensor resolves to its ID and gateway ID"""
+        ref = run(dependencies.ensure_owned_sensor(None, USER, 100))
+        assert (ref.id, ref.gateway_id) == (100, 10)
+
+    def test_foreign_sensor_is_404(self, owned):
+        """Unowned sensors look like missing ones"""
+        with pytest.raises(HTTPException) as exc:
+            run(dependencies.ensure_owned_sensor(None, USER, 999))
+        assert exc.value.status_code == 404
+
+    def test_foreign_gateway_is_404(self, owned):
+        """Unowned gateways look like missing ones"""
+        assert run(dependencies.ensure_owned_gateway(None, USER, 11)) == 11
+        with pytest.raises(HTTPException) as exc:
+            run(dependencies.ensure_owned_gateway(None, USER, 12))
+        assert exc.value.status_code == 404
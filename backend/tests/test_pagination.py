@@ -0,0 +1,44 @@
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.pagination import decode_cursor, encode_cursor, split_page
+
+
+class TestCursor:
+    """Test cases for keyset cursors"""
+
+    def test_round_trip(self):
+        """A cursor decodes to the sort key it was built from"""
+        timestamp = datetime(2024, 5, 17, 8, 30, 15, 123456)
+        assert decode_cursor(encode_cursor(timestamp, 42)) == (timestamp, 42)
+
+    def test_cursor_is_url_safe(self):
+        """Cursors need no escaping in a query string"""
+        cursor = encode_cursor(datetime(2024, 1, 1), 2 ** 40)
+        assert "=" not in cursor and "+" not in cursor and "/" not in cursor
+
+    def test_no_cursor(self):
+        """Missing or empty cursors mean the first page"""
+        assert decode_cursor(None) is None
+        assert decode_cursor("") is None
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "e30", "WyJ4IiwxXQ", "WzFd"])
+    def test_malformed_cursor(self, cursor):
+        """Garbage, wrong shapes and bad timestamps are rejected with 400"""
+        with pytest.raises(HTTPException) as exc:
+            decode_cursor(cursor)
+        assert exc.value.status_code == 400
+
+
+class TestSplitPage:
+    """Test cases for limit+1 page trimming"""
+
+    def test_more_rows(self):
+        """An extra row means there is another page"""
+        assert split_page([1, 2, 3], 2) == ([1, 2], True)
+
+    def test_last_page(self):
+        """A short fetch is the last page"""
+        assert split_page([1, 2], 2) == ([1, 2], False)
@@ -0,0 +1,148 @@
+import asyncio
+import itertools
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import database
+from app.services import ownership
+
+
+class FakeSession:
+    """Async session stand-in remembering where it was opened"""
+
+    def __init__(self, name):
+        self.name = name
+        self.bind = None
+        self.committed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement, params=None):
+        return SimpleNamespace(scalar_one=lambda: "0/16B3748", scalar=lambda: True)
+
+    async def commit(self):
+        self.committed = True
+
+    async def rollback(self):
+        pass
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def routing(monkeypatch):
+    """One replica, an empty write log and the given read-your-writes mode"""
+    monkeypatch.setattr(database, "replicas_configured", True)
+    monkeypatch.setattr(database, "_replica_sessions", itertools.cycle([lambda: FakeSession("replica")]))
+    monkeypatch.setattr(database, "ReadSessionLocal", lambda: FakeSession("primary"))
+    monkeypatch.setattr(database, "AsyncSessionLocal", lambda: FakeSession("primary"))
+    monkeypatch.setattr(database, "recent_writes", database.TTLCache(maxsize=100, ttl=60))
+
+    def set_mode(mode):
+        monkeypatch.setattr(database.settings, "READ_YOUR_WRITES", mode)
+    return set_mode
+
+
+def read_from(client=None):
+    async def read():
+        async with database.read_session(client) as session:
+            return session.name
+    return asyncio.run(read())
+
+
+def write(client_header, method="POST"):
+    connection = SimpleNamespace(
+        scope={"method": method},
+        headers={"authorization": client_header},
+    )
+
+    async def run():
+        sessions = database.get_db(connection)
+        await sessions.__anext__()
+        with pytest.raises(StopAsyncIteration):
+            await sessions.__anext__()
+    asyncio.run(run())
+    return database.client_key(connection)
+
+
+class TestReadSession:
+    """Test cases for replica routing of reads"""
+
+    def test_reads_go_to_replica(self, routing):
+        """Clients without recent writes read from a replica"""
+        routing("sticky")
+        assert read_from() == "replica"
+        assert read_from("someone") == "replica"
+
+    def test_sticky_after_write(self, routing):
+        """A client's reads go to the primary after it wrote"""
+        routing("sticky")
+        client = write("Bearer a")
+        assert read_from(client) == "primary"
+        assert read_from(write("Bearer b", method="GET")) == "replica"
+
+    def test_lsn_uses_caught_up_replica(self, routing, monkeypatch):
+        """In lsn mode a replica that replayed the write is used"""
+        routing("lsn")
+        client = write("Bearer a")
+        assert database.recent_writes.get(client) == "0/16B3748"
+
+        async def caught_up(session, lsn):
+            return True
+        monkeypatch.setattr(database, "_replica_caught_up", caught_up)
+        assert read_from(client) == "replica"
+
+    def test_lsn_falls_back_to_primary(self, routing, monkeypatch):
+        """A lagging replica is not used for a client's own writes"""
+        routing("lsn")
+        client = write("Bearer a")
+
+        async def lagging(session, lsn):
+            return False
+        monkeypatch.setattr(database, "_replica_caught_up", lagging)
+        assert read_from(client) == "primary"
+
+    def test_off(self, routing):
+        """Without read-your-writes every read may use a replica"""
+        routing("off")
+        assert read_from(write("Bearer a")) == "replica"
+
+
+class TestSharedCaches:
+    """Test cases for caches shared by all clients"""
+
+    def test_on_replica(self, monkeypatch):
+        """Only sessions bound to a replica engine count as replica sessions"""
+        replica_engine = object()
+        monkeypatch.setattr(database, "read_engines", [replica_engine])
+        assert database.on_replica(SimpleNamespace(bind=replica_engine))
+        assert not database.on_replica(SimpleNamespace(bind=database.engine))
+
+    def test_ownership_is_loaded_from_primary(self, monkeypatch):
+        """A replica session never fills the ownership cache"""
+        replica, primary = FakeSession("replica"), FakeSession("primary")
+        used = []
+
+        class FakeGatewayRepository:
+            def __init__(self, session):
+                used.append(session.name)
+
+            async def get_owned_ids(self, user_id):
+                return [(1, 10), (2, None)]
+
+        monkeypatch.setattr(ownership, "GatewayRepository", FakeGatewayRepository)
+        monkeypatch.setattr(ownership, "on_replica", lambda session: session is replica)
+        monkeypatch.setattr(ownership, "ReadSessionLocal", lambda: primary)
+        monkeypatch.setattr(ownership, "ownership_cache", database.TTLCache(maxsize=10, ttl=60))
+
+        owned = asyncio.run(ownership.load_owned_ids(replica, 7))
+        assert used == ["primary"]
+        assert owned.gateway_ids == {1, 2}
+        assert owned.sensor_gateways == {10: 1}
+        assert ownership.ownership_cache.get(7) is owned
@@ -0,0 +1,159 @@
+import asyncio
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+
+import pyarrow.parquet as pq
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.models.sensor_data_archive import SensorDataArchive
+from app.services import sensor_data_archive as archive
+from app.services.sensor_data_archive import (
+    archived_buckets,
+    archived_statistics,
+    count_archived_rows,
+    fetch_archived_rows,
+    iter_archived_values,
+)
+
+DAY = date(2024, 3, 1)
+START = datetime(2024, 3, 1)
+
+Row = namedtuple("Row", "id sensor_id gateway_id value unit metadata_ timestamp")
+
+
+def row(id, sensor_id, minutes, value, measurement="Temperature", tag=None):
+    metadata = {"measurement_type": measurement}
+    if tag:
+        metadata["tag"] = tag
+    unit = "°C" if measurement == "Temperature" else "%"
+    return Row(id, sensor_id, 1, value, unit, metadata, START + timedelta(minutes=minutes))
+
+
+ROWS = [
+    row(1, 7, 5, 20.0),
+    row(2, 7, 10, 22.0, tag="SEM225:Temperature"),
+    row(3, 8, 15, 60.0, "Humidity"),
+    row(4, 7, 70, 24.0),
+    row(5, 8, 130, 65.0, "Humidity"),
+]
+
+
+class FakeSession:
+    """Sync session answering the archiver's hourly DELETE ... RETURNING"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.slice = 0
+        self.added = []
+
+    def execute(self, statement):
+        hour, self.slice = self.slice, self.slice + 1
+        start = START + timedelta(hours=hour)
+        rows = [r for r in self.rows if start <= r.timestamp < start + timedelta(hours=1)]
+        return type("Result", (), {"all": lambda self: rows})()
+
+    def add(self, item):
+        self.added.append(item)
+
+    def flush(self):
+        pass
+
+
+@pytest.fixture
+def archived(tmp_path, monkeypatch):
+    """One gateway/day archived from ROWS; returns (path, manifest row)"""
+    monkeypatch.setattr(archive.settings, "ARCHIVE_DIR", str(tmp_path))
+    db = FakeSession(ROWS)
+    path = archive._archive_gateway_day(db, 1, DAY)
+    return str(path), db.added[0]
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+class TestArchiveGatewayDay:
+    """Test cases for moving a gateway/day to Parquet"""
+
+    def test_file_and_manifest(self, archived, tmp_path):
+        """Every row lands in the file and the manifest describes it"""
+        path, manifest = archived
+        table = pq.read_table(path)
+        assert table["id"].to_pylist() == [1, 2, 3, 4, 5]
+        assert table["measurement_type"].to_pylist()[2] == "Humidity"
+        assert pq.ParquetFile(path).num_row_groups == 3
+
+        assert manifest.path == path
+        assert manifest.row_count == 5
+        assert manifest.sensor_ids == [7, 8]
+        assert manifest.min_timestamp == START + timedelta(minutes=5)
+        assert manifest.max_timestamp == START + timedelta(minutes=130)
+        assert not list(tmp_path.rglob("*.tmp"))
+
+    def test_nothing_to_archive(self, tmp_path, monkeypatch):
+        """An empty day writes no file"""
+        monkeypatch.setattr(archive.settings, "ARCHIVE_DIR", str(tmp_path))
+        db = FakeSession([])
+        assert archive._archive_gateway_day(db, 1, DAY) is None
+        assert not db.added
+        assert not list(tmp_path.rglob("*.parquet"))
+
+    def test_manifest_lookup_by_sensor_compiles(self):
+        """Sensor lookups use the PostgreSQL array containment operator"""
+        query = select(SensorDataArchive.path).where(SensorDataArchive.sensor_ids.contains([7]))
+        assert "@>" in str(query.compile(dialect=postgresql.dialect()))
+
+
+class TestArchivedReads:
+    """Test cases for reading archived readings back"""
+
+    def test_rows_newest_first_with_keyset(self, archived):
+        """Rows come back newest first and continue after a cursor"""
+        path, _ = archived
+        rows = run(fetch_archived_rows([path], limit=2, sensor_id=7))
+        assert [r.id for r in rows] == [4, 2]
+        assert rows[1].metadata == {"measurement_type": "Temperature", "tag": "SEM225:Temperature"}
+
+        rest = run(fetch_archived_rows([path], limit=10, sensor_id=7, before=(rows[-1].timestamp, rows[-1].id)))
+        assert [r.id for r in rest] == [1]
+
+    def test_filters(self, archived):
+        """Range, measurement, value and tag filters apply to archived rows"""
+        path, _ = archived
+        assert run(count_archived_rows([path])) == 5
+        assert run(count_archived_rows([path], measurement_types=["Humidity"])) == 2
+        assert run(count_archived_rows([path], measurement_types=[])) == 0
+        assert run(count_archived_rows([path], value_min=21.0, value_max=61.0)) == 3
+        assert run(count_archived_rows([path], tag="SEM225:Temperature")) == 1
+        assert run(count_archived_rows([path], start_date=START + timedelta(hours=1))) == 2
+        assert run(count_archived_rows([path], gateway_ids=[2])) == 0
+        assert run(count_archived_rows([])) == 0
+
+    def test_statistics(self, archived):
+        """Statistics aggregate the matching rows"""
+        path, _ = archived
+        stats = run(archived_statistics([path], sensor_id=7))
+        assert stats["count"] == 3
+        assert stats["min_value"] == 20.0 and stats["max_value"] == 24.0
+        assert stats["sum_value"] == 66.0
+        assert stats["first_reading"] == START + timedelta(minutes=5)
+        assert run(archived_statistics([path], sensor_id=99))["count"] == 0
+
+    def test_buckets(self, archived):
+        """Buckets are aligned on the given origin"""
+        path, _ = archived
+        buckets = run(archived_buckets([path], timedelta(hours=1), datetime(2000, 1, 1), sensor_id=7))
+        by_start = {bucket: (total, count) for _, bucket, total, _, _, count, _ in buckets}
+        assert by_start == {START: (42.0, 2), START + timedelta(hours=1): (24.0, 1)}
+
+    def test_values_in_chunks(self, archived):
+        """Raw values stream in bounded, time-ordered chunks"""
+        path, _ = archived
+        chunks = list(iter_archived_values([path], 2, sensor_id=7))
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        values = [value for chunk in chunks for _, _, value, _ in chunk]
+        assert values == [20.0, 22.0, 24.0]
+        assert chunks[0][0][0] == "Temperature"
+        assert chunks[0][0][1] == (START + timedelta(minutes=5) - datetime(1970, 1, 1)).total_seconds()
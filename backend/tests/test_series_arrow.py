@@ -0,0 +1,49 @@
+import json
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from app.services.series_arrow import IpcCompression, arrow_response, downsampled_batch
+
+SERIES = [
+    {
+        "measurement": "Temperature",
+        "unit": "°C",
+        "timestamps": np.array([0, 60_000_000, 120_000_000], dtype="datetime64[us]"),
+        "values": np.array([25.0, 25.5, 26.0]),
+    },
+    {
+        "measurement": "Humidity",
+        "unit": None,
+        "timestamps": np.array([0], dtype="datetime64[us]"),
+        "values": np.array([80.0]),
+    },
+]
+
+
+def read(body: bytes):
+    buffer = pa.py_buffer(body)
+    return buffer, pa.ipc.open_stream(buffer).read_all()
+
+
+class TestArrowResponse:
+    """Test cases for Arrow IPC series responses"""
+
+    def test_uncompressed_by_default_and_zero_copy(self):
+        """Value buffers are read in place from the response body"""
+        response = arrow_response(downsampled_batch(SERIES), {"sensor_id": 1})
+        body, table = read(response.body)
+
+        values = table.column("value").chunk(0).buffers()[1]
+        assert body.address <= values.address < body.address + body.size
+        assert table.column("value").to_pylist() == [25.0, 25.5, 26.0, 80.0]
+        assert table.column("unit").to_pylist() == ["°C"] * 3 + [None]
+        assert json.loads(table.schema.metadata[b"sensor_id"]) == 1
+
+    @pytest.mark.parametrize("compression", [IpcCompression.LZ4, IpcCompression.ZSTD])
+    def test_compression_is_opt_in(self, compression):
+        """Compressed streams decode to the same table"""
+        plain = arrow_response(downsampled_batch(SERIES), {}).body
+        compressed = arrow_response(downsampled_batch(SERIES), {}, compression).body
+        assert read(compressed)[1].equals(read(plain)[1])
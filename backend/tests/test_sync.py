@@ -0,0 +1,86 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.sync import (
+    decode_watermark,
+    encode_watermark,
+    etag_matches,
+    make_etag,
+    split_changes,
+)
+
+
+class TestWatermark:
+    """Test cases for sync watermarks"""
+
+    def test_round_trip(self):
+        """A watermark decodes to the position it was built from"""
+        assert decode_watermark(encode_watermark(2 ** 40 + 3, 17)) == (2 ** 40 + 3, 17)
+
+    def test_no_watermark(self):
+        """Missing watermarks mean a full sync"""
+        assert decode_watermark(None) is None
+        assert decode_watermark("") is None
+
+    @pytest.mark.parametrize("watermark", ["!!", "MTIz", "YS5i", "MS4yLjM"])
+    def test_malformed_watermark(self, watermark):
+        """Garbage, missing parts and non-numbers are rejected with 400"""
+        with pytest.raises(HTTPException) as exc:
+            decode_watermark(watermark)
+        assert exc.value.status_code == 400
+
+
+class TestEtag:
+    """Test cases for sync ETags"""
+
+    def test_same_scope_and_watermark(self):
+        """Identical requests at the same position share an ETag"""
+        scope = ("sensor_changes", 1, None, ("Temperature",), 500)
+        assert make_etag(scope, "abc") == make_etag(scope, "abc")
+
+    def test_differs_by_scope_and_watermark(self):
+        """Filters and position both change the ETag"""
+        etag = make_etag(("sensor_changes", 1), "abc")
+        assert etag != make_etag(("sensor_changes", 2), "abc")
+        assert etag != make_etag(("sensor_changes", 1), "abd")
+        assert etag != make_etag(("sensor_changes", 1), None)
+
+    def test_is_quoted(self):
+        """ETags are quoted strong validators"""
+        etag = make_etag(("x",), None)
+        assert etag.startswith('"') and etag.endswith('-0"')
+
+    def test_matches(self):
+        """If-None-Match accepts lists, weak tags and *"""
+        etag = make_etag(("x",), "abc")
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"other", W/{etag}', etag)
+        assert etag_matches("*", etag)
+
+    def test_does_not_match(self):
+        """Other tags or no header never match"""
+        etag = make_etag(("x",), "abc")
+        assert not etag_matches(None, etag)
+        assert not etag_matches("", etag)
+        assert not etag_matches('"other"', etag)
+
+
+class TestSplitChanges:
+    """Test cases for limit+1 change trimming"""
+
+    @staticmethod
+    def changes(*positions):
+        return [(SimpleNamespace(id=id), xact_id) for xact_id, id in positions]
+
+    def test_watermark_of_last_returned_row(self):
+        """The watermark points at the last row kept, not the extra one"""
+        rows, has_more, watermark = split_changes(self.changes((10, 5), (11, 2), (12, 9)), 2, None)
+        assert [row.id for row in rows] == [5, 2]
+        assert has_more
+        assert decode_watermark(watermark) == (11, 2)
+
+    def test_no_changes_keep_watermark(self):
+        """An empty response hands the client's watermark back"""
+        assert split_changes([], 10, "abc") == ([], False, "abc")
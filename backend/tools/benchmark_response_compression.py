@@ -0,0 +1,127 @@
+"""Benchmark response compression for slow farm-site uplinks.
+
+Synthetic mode (default) compresses JSON and MessagePack pages of sensor
+readings with each Content-Encoding and level and reports compressed size,
+compression CPU time and the estimated time to the last byte over typical
+cellular links. Transfer times come from a simple TCP model: one round trip
+for the request, then slow start from a 10 segment initial window, each round
+limited by the link's bandwidth. No database is needed.
+
+Live mode (--url) requests a running API endpoint with each Accept-Encoding
+and measures the bytes on the wire and the time to the last byte. Run it from
+a farm site, or simulate a link on the client, e.g.
+
+  tc qdisc add dev eth0 root netem delay 300ms rate 1600kbit
+
+Usage:
+  PYTHONPATH=. python tools/benchmark_response_compression.py
+  PYTHONPATH=. python tools/benchmark_response_compression.py --sizes 100,1000 --links edge,3g
+  PYTHONPATH=. python tools/benchmark_response_compression.py \\
+      --url "http://localhost:8000/api/v1/sensors/7/data?size=1000" --token "$TOKEN"
+"""
+
+import argparse
+import time
+
+import httpx
+
+from app.core.compression import BROTLI, GZIP, ZSTD, Compressor, available_encodings
+from app.core.responses import encode_msgpack, model_response
+from tools.benchmark_response_encoding import sensor_data_page
+
+# name: (downlink kbit/s, round trip ms)
+LINKS = {
+    "edge": (200, 500),
+    "3g": (1600, 300),
+    "lte-weak": (5000, 120),
+    "lte": (20000, 60),
+}
+
+SEGMENT_BYTES = 1460
+INITIAL_WINDOW = 10 * SEGMENT_BYTES
+
+LEVELS = {GZIP: (1, 6, 9), BROTLI: (1, 5, 11), ZSTD: (1, 3, 10)}
+
+
+def transfer_ms(size: int, kbps: int, rtt_ms: float) -> float:
+    """Estimated time from sending the request to the last response byte"""
+    elapsed = rtt_ms
+    window = INITIAL_WINDOW
+    remaining = size
+    while True:
+        burst = min(window, remaining)
+        remaining -= burst
+        send_ms = burst * 8 / kbps
+        if remaining <= 0:
+            return elapsed + send_ms
+        elapsed += max(send_ms, rtt_ms)
+        window *= 2
+
+
+def compress(encoding: str, level: int, body: bytes, repeat: int):
+    started = time.process_time()
+    for _ in range(repeat):
+        data = Compressor(encoding, level).finish(body)
+    return data, (time.process_time() - started) / repeat * 1000
+
+
+def run_synthetic(args):
+    links = args.links.split(",")
+    encodings = [encoding for encoding in available_encodings() if encoding in LEVELS]
+    print(f"{'page':>5} {'format':<7} {'encoding':<10} {'bytes':>9} {'cpu ms':>7} "
+          + " ".join(f"{link + ' ms':>11}" for link in links))
+
+    for size in (int(s) for s in args.sizes.split(",")):
+        page = sensor_data_page(size)
+        bodies = {
+            "json": model_response(page).body,
+            "msgpack": encode_msgpack(page.model_dump(mode="json")),
+        }
+        for body_format, body in bodies.items():
+            cases = [("identity", body, 0.0)]
+            for encoding in encodings:
+                for level in LEVELS[encoding]:
+                    data, cpu_ms = compress(encoding, level, body, args.repeat)
+                    cases.append((f"{encoding}-{level}", data, cpu_ms))
+
+            for name, data, cpu_ms in cases:
+                times = " ".join(f"{transfer_ms(len(data), *LINKS[link]):>11.0f}" for link in links)
+                print(f"{size:>5} {body_format:<7} {name:<10} {len(data):>9} {cpu_ms:>7.2f} {times}")
+
+
+def run_live(args):
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else {}
+    print(f"{'accept-encoding':<16} {'content-encoding':<17} {'wire bytes':>11} {'ms to last byte':>16}")
+    with httpx.Client(timeout=120) as client:
+        for accept_encoding in ["identity"] + available_encodings():
+            wire_bytes, timings = 0, []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                with client.stream(
+                    "GET", args.url, headers={**headers, "Accept-Encoding": accept_encoding}
+                ) as response:
+                    response.raise_for_status()
+                    wire_bytes = sum(len(chunk) for chunk in response.iter_raw())
+                    content_encoding = response.headers.get("content-encoding", "identity")
+                timings.append((time.perf_counter() - started) * 1000)
+            timings.sort()
+            print(f"{accept_encoding:<16} {content_encoding:<17} {wire_bytes:>11} "
+                  f"{timings[len(timings) // 2]:>16.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="50,100,1000", help="Comma separated page sizes")
+    parser.add_argument("--links", default=",".join(LINKS), help=f"Comma separated links of {', '.join(LINKS)}")
+    parser.add_argument("--repeat", type=int, default=20, help="Compressions (or requests) per measurement")
+    parser.add_argument("--url", help="Measure a running API endpoint instead of synthetic pages")
+    parser.add_argument("--token", help="Bearer token for --url")
+    args = parser.parse_args()
+    if args.url:
+        run_live(args)
+    else:
+        run_synthetic(args)
+
+
+if __name__ == "__main__":
+    main()
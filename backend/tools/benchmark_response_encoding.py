@@ -0,0 +1,137 @@
+"""Benchmark response encoding of paginated list payloads.
+
+Encodes synthetic pages of sensor readings and gateway status history the
+way the API does and reports CPU time per page and body size for:
+
+  json      FastAPI's previous default (response_model round trip, stdlib json)
+  orjson    response_model round trip, NegotiatedResponse (orjson)
+  msgpack   response_model round trip, NegotiatedResponse (MessagePack)
+  direct    model_response() of a model_construct page (sensor data endpoints)
+
+No database is needed.
+
+Usage:
+  PYTHONPATH=. python tools/benchmark_response_encoding.py
+  PYTHONPATH=. python tools/benchmark_response_encoding.py --sizes 50,1000 --repeat 200
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.core.responses import (
+    MSGPACK_MEDIA_TYPE,
+    NegotiatedResponse,
+    model_response,
+    response_media_type,
+)
+from app.models.sensor_data import SensorReading
+from app.api.v1.schemas import PaginatedResponse, SensorDataResponse
+from app.api.v1.schemas.gateway_status_history import GatewayStatusHistoryResponse
+
+START = datetime(2024, 1, 1)
+MEASUREMENTS = ["Temperature", "Moisture", "PH", "EC", "Nitrogen", "Phosphorus", "Potassium"]
+
+
+def sensor_data_page(size: int) -> PaginatedResponse:
+    readings = [
+        SensorReading(
+            id=n,
+            sensor_id=7,
+            gateway_id=2,
+            value=round(20 + n % 100 * 0.37, 2),
+            unit="C",
+            metadata={
+                "source": "modbus",
+                "measurement_type": MEASUREMENTS[n % len(MEASUREMENTS)],
+                "tag": f"SEM225:{MEASUREMENTS[n % len(MEASUREMENTS)]}",
+            },
+            timestamp=START + timedelta(seconds=30 * n),
+        )
+        for n in range(size)
+    ]
+    return PaginatedResponse[SensorDataResponse].model_construct(
+        items=[SensorDataResponse.from_reading(reading) for reading in readings],
+        total=size * 10, page=1, size=size, pages=10, has_more=True,
+        next_cursor="MTcwNDA2NzIwMC4wfDEyMw"
+    )
+
+
+def status_history_page(size: int) -> PaginatedResponse:
+    return PaginatedResponse[GatewayStatusHistoryResponse].model_construct(
+        items=[
+            GatewayStatusHistoryResponse(
+                id=n,
+                gateway_id=2,
+                status="online" if n % 2 else "offline",
+                uptime_seconds=3600 * n,
+                created_at=START + timedelta(minutes=5 * n),
+            )
+            for n in range(size)
+        ],
+        total=size * 10, page=1, size=size, pages=10, has_more=True
+    )
+
+
+async def via_response_model(field, model, response_class) -> bytes:
+    """What FastAPI does with a model returned from a route"""
+    content = await serialize_response(field=field, response_content=model)
+    return response_class(content).body
+
+
+async def measure(encode, repeat: int):
+    body = await encode()
+    started = time.process_time()
+    for _ in range(repeat):
+        await encode()
+    return (time.process_time() - started) / repeat * 1000, len(body)
+
+
+async def run(args):
+    payloads = (
+        ("sensor data", sensor_data_page, SensorDataResponse),
+        ("status history", status_history_page, GatewayStatusHistoryResponse),
+    )
+    print(f"{'payload':<15} {'size':>5} {'encoding':<8} {'cpu ms/page':>12} {'bytes':>9}")
+    for name, build, item_model in payloads:
+        field = create_response_field(name="response", type_=PaginatedResponse[item_model])
+        for size in (int(s) for s in args.sizes.split(",")):
+            model = build(size)
+
+            async def msgpack_encode():
+                token = response_media_type.set(MSGPACK_MEDIA_TYPE)
+                try:
+                    return await via_response_model(field, model, NegotiatedResponse)
+                finally:
+                    response_media_type.reset(token)
+
+            async def direct_encode():
+                return model_response(model).body
+
+            cases = [
+                ("json", lambda: via_response_model(field, model, JSONResponse)),
+                ("orjson", lambda: via_response_model(field, model, NegotiatedResponse)),
+                ("msgpack", msgpack_encode),
+            ]
+            if item_model is SensorDataResponse:
+                cases.append(("direct", direct_encode))
+
+            for encoding, encode in cases:
+                cpu_ms, body_size = await measure(encode, args.repeat)
+                print(f"{name:<15} {size:>5} {encoding:<8} {cpu_ms:>12.3f} {body_size:>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="20,50,100,1000", help="Comma separated page sizes")
+    parser.add_argument("--repeat", type=int, default=100, help="Encodes per measurement")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
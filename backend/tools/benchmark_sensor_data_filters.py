@@ -0,0 +1,181 @@
+"""Benchmark legacy LIKE search against structured sensor data filters.
+
+Builds a scratch copy of sensor_data (with all of its indexes) in a separate
+`bench` schema, fills it with synthetic readings and compares the query plans
+and execution times of the old `search` predicate with the indexed
+measurement_type / value range / tag filters.
+
+Usage:
+  PYTHONPATH=. python tools/benchmark_sensor_data_filters.py --rows 20000000
+  PYTHONPATH=. python tools/benchmark_sensor_data_filters.py --skip-seed
+  PYTHONPATH=. python tools/benchmark_sensor_data_filters.py --drop
+"""
+
+import argparse
+import json
+
+from sqlalchemy import text
+
+from app.core.database import sync_engine
+
+MEASUREMENTS = ["Temperature", "Moisture", "PH", "EC", "Nitrogen", "Phosphorus", "Potassium"]
+
+SETUP = [
+    "CREATE SCHEMA IF NOT EXISTS bench",
+    "DROP TABLE IF EXISTS bench.sensor_data",
+    "DROP TABLE IF EXISTS bench.sensors",
+    "CREATE TABLE bench.sensors (LIKE public.sensors INCLUDING DEFAULTS INCLUDING INDEXES)",
+    "CREATE TABLE bench.sensor_data (LIKE public.sensor_data INCLUDING DEFAULTS INCLUDING INDEXES)",
+]
+
+SEED_SENSORS = """
+INSERT INTO bench.sensors (id, gateway_id, sensor_uid, name, type, status, created_at, updated_at)
+SELECT s, 1 + s % 10, 'SEM225-' || s, 'Soil sensor ' || s, 'multi-sensor', 'active', now(), now()
+FROM generate_series(1, :sensors) AS s
+"""
+
+# One reading per (sensor, measurement) every `step` seconds, newest at now()
+SEED_READINGS = """
+INSERT INTO bench.sensor_data (id, sensor_id, gateway_id, value, unit, metadata, timestamp)
+SELECT
+    n,
+    1 + n % :sensors,
+    1 + (n % :sensors) % 10,
+    round((random() * 100)::numeric, 1),
+    '',
+    jsonb_build_object(
+        'source', 'bench',
+        'measurement_type', (:measurements)[1 + (n / :sensors) % :measurement_count],
+        'tag', 'SEM225:' || (:measurements)[1 + (n / :sensors) % :measurement_count]
+    ),
+    now() - make_interval(secs => n / (:sensors * :measurement_count) * :step)
+FROM generate_series(1, :rows) AS n
+"""
+
+PAGE = 50
+
+CASES = [
+    (
+        "measurement type: search LIKE",
+        """
+        SELECT sd.* FROM bench.sensor_data sd JOIN bench.sensors s ON sd.sensor_id = s.id
+        WHERE sd.sensor_id = :sensor_id AND (
+            lower(coalesce(sd.metadata->>'measurement_type', '')) LIKE :term
+            OR lower(coalesce(s.name, '')) LIKE :term
+            OR lower(s.sensor_uid) LIKE :term
+            OR CAST(sd.value AS VARCHAR) LIKE :term
+        )
+        ORDER BY sd.timestamp DESC, sd.id DESC LIMIT :page OFFSET :offset
+        """,
+        {"term": "%temperature%"},
+    ),
+    (
+        "measurement type: structured",
+        """
+        SELECT sd.* FROM bench.sensor_data sd
+        WHERE sd.sensor_id = :sensor_id AND sd.metadata->>'measurement_type' IN ('Temperature')
+        ORDER BY sd.timestamp DESC, sd.id DESC LIMIT :page OFFSET :offset
+        """,
+        {},
+    ),
+    (
+        "value: search LIKE",
+        """
+        SELECT sd.* FROM bench.sensor_data sd JOIN bench.sensors s ON sd.sensor_id = s.id
+        WHERE sd.sensor_id = :sensor_id AND (
+            lower(coalesce(sd.metadata->>'measurement_type', '')) LIKE :term
+            OR lower(coalesce(s.name, '')) LIKE :term
+            OR lower(s.sensor_uid) LIKE :term
+            OR CAST(sd.value AS VARCHAR) LIKE :term
+        )
+        ORDER BY sd.timestamp DESC, sd.id DESC LIMIT :page OFFSET :offset
+        """,
+        {"term": "%99.%"},
+    ),
+    (
+        "value: structured range",
+        """
+        SELECT sd.* FROM bench.sensor_data sd
+        WHERE sd.sensor_id = :sensor_id AND sd.value >= 99 AND sd.value < 100
+        ORDER BY sd.timestamp DESC, sd.id DESC LIMIT :page OFFSET :offset
+        """,
+        {},
+    ),
+    (
+        "tag: structured",
+        """
+        SELECT sd.* FROM bench.sensor_data sd
+        WHERE sd.sensor_id = :sensor_id AND sd.metadata->>'tag' = 'SEM225:Moisture'
+        ORDER BY sd.timestamp DESC, sd.id DESC LIMIT :page OFFSET :offset
+        """,
+        {},
+    ),
+]
+
+
+def seed(conn, rows: int, sensors: int, step: int):
+    for statement in SETUP:
+        conn.execute(text(statement))
+    conn.execute(text(SEED_SENSORS), {"sensors": sensors})
+    print(f"Inserting {rows:,} readings...")
+    conn.execute(
+        text(SEED_READINGS),
+        {
+            "rows": rows,
+            "sensors": sensors,
+            "measurements": MEASUREMENTS,
+            "measurement_count": len(MEASUREMENTS),
+            "step": step,
+        },
+    )
+    conn.execute(text("ANALYZE bench.sensors"))
+    conn.execute(text("ANALYZE bench.sensor_data"))
+
+
+def explain(conn, sql: str, params: dict) -> dict:
+    plan = conn.execute(
+        text("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + sql), params
+    ).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20_000_000)
+    parser.add_argument("--sensors", type=int, default=50)
+    parser.add_argument("--step", type=int, default=60, help="Seconds between readings")
+    parser.add_argument("--sensor-id", type=int, default=7)
+    parser.add_argument("--offsets", default="0,5000", help="Comma separated page offsets")
+    parser.add_argument("--skip-seed", action="store_true", help="Reuse existing bench tables")
+    parser.add_argument("--drop", action="store_true", help="Drop the bench schema and exit")
+    args = parser.parse_args()
+
+    with sync_engine.begin() as conn:
+        if args.drop:
+            conn.execute(text("DROP SCHEMA IF EXISTS bench CASCADE"))
+            print("Dropped schema bench")
+            return
+        if not args.skip_seed:
+            seed(conn, args.rows, args.sensors, args.step)
+
+    print(f"{'case':<34} {'offset':>7} {'ms':>10} {'shared hit+read':>16}  top node")
+    with sync_engine.connect() as conn:
+        for offset in (int(o) for o in args.offsets.split(",")):
+            for name, sql, extra in CASES:
+                params = {"sensor_id": args.sensor_id, "page": PAGE, "offset": offset, **extra}
+                result = explain(conn, sql, params)
+                plan = result["Plan"]
+                buffers = plan.get("Shared Hit Blocks", 0) + plan.get("Shared Read Blocks", 0)
+                node = plan["Node Type"]
+                while node == "Limit" and plan.get("Plans"):
+                    plan = plan["Plans"][0]
+                    node = plan["Node Type"] + (f" on {plan['Index Name']}" if "Index Name" in plan else "")
+                print(
+                    f"{name:<34} {offset:>7} {result['Execution Time']:>10.2f} {buffers:>16}  {node}"
+                )
+
+
+if __name__ == "__main__":
+    main()
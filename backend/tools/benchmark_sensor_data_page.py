@@ -0,0 +1,99 @@
+"""Benchmark API CPU time per page of GET /sensors/{id}/data.
+
+Compares the ORM read path (SensorData entities, model_validate per row and
+FastAPI's response_model round trip) with the column read path (SensorReading
+tuples, model_construct and direct JSON encoding). Rows are read from the
+sensor_data table of the configured database; only process CPU time is
+counted, so database server time does not skew the comparison.
+
+Usage:
+  PYTHONPATH=. python tools/benchmark_sensor_data_page.py --sensor-id 7
+  PYTHONPATH=. python tools/benchmark_sensor_data_page.py --sensor-id 7 --sizes 50,1000 --repeat 50
+"""
+
+import argparse
+import asyncio
+import time
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from sqlalchemy import select, desc
+from sqlalchemy.orm import Session
+
+from app.core.database import sync_engine
+from app.core.responses import model_response
+from app.models.sensor_data import SensorData, SensorReading, READING_COLUMNS
+from app.api.v1.schemas import PaginatedResponse, SensorDataResponse
+
+PAGE_MODEL = PaginatedResponse[SensorDataResponse]
+RESPONSE_FIELD = create_response_field(name="response", type_=PAGE_MODEL)
+
+
+def page_fields(size: int) -> dict:
+    return {"total": None, "page": 1, "size": size, "has_more": True}
+
+
+async def orm_path(sensor_id: int, size: int) -> int:
+    """Previous implementation: ORM entities and response_model validation"""
+    with Session(sync_engine) as session:
+        rows = session.execute(
+            select(SensorData)
+            .where(SensorData.sensor_id == sensor_id)
+            .order_by(desc(SensorData.timestamp), desc(SensorData.id))
+            .limit(size)
+        ).scalars().all()
+        model = PaginatedResponse(
+            items=[SensorDataResponse.model_validate(row) for row in rows],
+            **page_fields(size)
+        )
+        content = await serialize_response(field=RESPONSE_FIELD, response_content=model)
+        return len(JSONResponse(content).body)
+
+
+async def column_path(sensor_id: int, size: int) -> int:
+    """Current implementation: selected columns, no validation, one encode"""
+    with sync_engine.connect() as conn:
+        result = conn.execute(
+            select(*READING_COLUMNS)
+            .where(SensorData.sensor_id == sensor_id)
+            .order_by(desc(SensorData.timestamp), desc(SensorData.id))
+            .limit(size)
+        )
+        rows = list(map(SensorReading._make, result.tuples()))
+        model = PAGE_MODEL.model_construct(
+            items=[SensorDataResponse.from_reading(row) for row in rows],
+            **page_fields(size)
+        )
+        return len(model_response(model).body)
+
+
+async def measure(path, sensor_id: int, size: int, repeat: int):
+    await path(sensor_id, size)  # warm up connections and caches
+    started = time.process_time()
+    for _ in range(repeat):
+        body_size = await path(sensor_id, size)
+    return (time.process_time() - started) / repeat * 1000, body_size
+
+
+async def run(args):
+    print(f"{'size':>6} {'path':<8} {'cpu ms/page':>12} {'body bytes':>11}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        results = {}
+        for name, path in (("orm", orm_path), ("columns", column_path)):
+            cpu_ms, body_size = await measure(path, args.sensor_id, size, args.repeat)
+            results[name] = cpu_ms
+            print(f"{size:>6} {name:<8} {cpu_ms:>12.2f} {body_size:>11}")
+        print(f"{'':>6} {'speedup':<8} {results['orm'] / results['columns']:>11.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sensor-id", type=int, required=True)
+    parser.add_argument("--sizes", default="50,100,1000", help="Comma separated page sizes")
+    parser.add_argument("--repeat", type=int, default=20, help="Pages per measurement")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
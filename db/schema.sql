@@ -2,6 +2,9 @@
 -- DATABASE SCHEMA: KAMPOENG TANI
 -- ===========================================
 
+-- Trigram matching for measurement type search
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 -- USERS TABLE
 CREATE TABLE users (
     id BIGSERIAL PRIMARY KEY,
@@ -45,6 +48,7 @@ CREATE TABLE gateways (
     description TEXT,
     status VARCHAR(20) DEFAULT 'offline',
     last_seen TIMESTAMP,
+    ingest_token_hash VARCHAR(64),
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
@@ -80,7 +84,9 @@ CREATE TABLE sensor_data (
     value DOUBLE PRECISION NOT NULL,
     unit VARCHAR(20),
     metadata JSONB,
-    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    -- Inserting transaction; sync endpoints return rows in (xact_id, id) order
+    xact_id BIGINT NOT NULL DEFAULT pg_current_xact_id()::text::bigint
 );
 
 -- GATEWAY STATUS HISTORY TABLE
@@ -89,18 +95,148 @@ CREATE TABLE gateway_status_history (
     gateway_id BIGINT NOT NULL REFERENCES gateways(id),
     status VARCHAR(20) NOT NULL,
     uptime_seconds BIGINT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    xact_id BIGINT NOT NULL DEFAULT pg_current_xact_id()::text::bigint
+);
+
+-- SENSOR DATA ARCHIVES TABLE
+-- Manifest of cold sensor data moved to Parquet files (one file per gateway/day)
+CREATE TABLE sensor_data_archives (
+    id BIGSERIAL PRIMARY KEY,
+    gateway_id BIGINT NOT NULL REFERENCES gateways(id) ON DELETE CASCADE,
+    day DATE NOT NULL,
+    path VARCHAR(500) UNIQUE NOT NULL,
+    row_count INTEGER NOT NULL,
+    sensor_ids BIGINT[] NOT NULL,
+    min_timestamp TIMESTAMP NOT NULL,
+    max_timestamp TIMESTAMP NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Background jobs table (cascade deletes and other long-running operations)
+CREATE TABLE background_jobs (
+    id BIGSERIAL PRIMARY KEY,
+    user_id BIGINT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    kind VARCHAR(50) NOT NULL,
+    target_id BIGINT,
+    status VARCHAR(20) NOT NULL DEFAULT 'pending',
+    processed_rows BIGINT NOT NULL DEFAULT 0,
+    total_rows BIGINT,
+    message TEXT,
+    params JSONB,
+    file_path TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    started_at TIMESTAMP,
+    finished_at TIMESTAMP
+);
+
+-- Measurement types dictionary (free-text search target for sensor data filters)
+CREATE TABLE measurement_types (
+    id BIGSERIAL PRIMARY KEY,
+    name VARCHAR(100) UNIQUE NOT NULL,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Readings per gateway and day (incremented by ingestion, reconciled nightly)
+CREATE TABLE sensor_data_daily_counts (
+    gateway_id BIGINT NOT NULL REFERENCES gateways(id) ON DELETE CASCADE,
+    day DATE NOT NULL,
+    readings BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (gateway_id, day)
+);
+
+-- Latest reading per sensor and measurement type (upserted by ingestion)
+CREATE TABLE sensor_latest (
+    sensor_id BIGINT NOT NULL REFERENCES sensors(id) ON DELETE CASCADE,
+    measurement_type VARCHAR(100) NOT NULL,
+    gateway_id BIGINT NOT NULL REFERENCES gateways(id) ON DELETE CASCADE,
+    value FLOAT NOT NULL,
+    unit VARCHAR(20),
+    timestamp TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (sensor_id, measurement_type)
+);
+
 -- ===========================================
 -- INDEXES
 -- ===========================================
 CREATE INDEX idx_gateways_user_id ON gateways(user_id);
 CREATE INDEX idx_gateways_status ON gateways(status);
 CREATE INDEX idx_sensors_gateway_id ON sensors(gateway_id);
-CREATE INDEX idx_sensor_data_sensor_id_timestamp ON sensor_data(sensor_id, timestamp DESC);
-CREATE INDEX idx_sensor_data_gateway_id_timestamp ON sensor_data(gateway_id, timestamp DESC);
+CREATE INDEX idx_sensor_data_sensor_id_timestamp ON sensor_data(sensor_id, timestamp DESC, id DESC);
+CREATE INDEX idx_sensor_data_gateway_id_timestamp ON sensor_data(gateway_id, timestamp DESC, id DESC);
+CREATE INDEX idx_sensor_data_sensor_id_measurement_type_timestamp ON sensor_data(sensor_id, (metadata->>'measurement_type'), timestamp DESC, id DESC);
+CREATE INDEX idx_sensor_data_sensor_id_tag_timestamp ON sensor_data(sensor_id, (metadata->>'tag'), timestamp DESC, id DESC);
+CREATE INDEX idx_sensor_data_sensor_id_value ON sensor_data(sensor_id, value);
+CREATE INDEX idx_sensor_data_sensor_id_xact_id_id ON sensor_data(sensor_id, xact_id, id);
+CREATE INDEX idx_gateway_status_history_gateway_id_created_at ON gateway_status_history(gateway_id, created_at DESC, id DESC);
+CREATE INDEX idx_gateway_status_history_gateway_id_xact_id_id ON gateway_status_history(gateway_id, xact_id, id);
+CREATE INDEX idx_sensor_data_archives_gateway_id_day ON sensor_data_archives(gateway_id, day);
+CREATE INDEX idx_sensor_data_archives_sensor_ids ON sensor_data_archives USING GIN (sensor_ids);
+CREATE INDEX idx_background_jobs_user_id ON background_jobs(user_id);
+CREATE INDEX idx_background_jobs_kind_target_status ON background_jobs(kind, target_id, status);
+CREATE INDEX idx_sensor_latest_gateway_id ON sensor_latest(gateway_id);
+CREATE INDEX idx_measurement_types_name_trgm ON measurement_types USING GIN (name gin_trgm_ops);
+
+-- Existing databases: fill the dictionary from stored readings once
+-- INSERT INTO measurement_types (name)
+-- SELECT DISTINCT metadata->>'measurement_type' FROM sensor_data
+-- WHERE metadata->>'measurement_type' IS NOT NULL
+-- ON CONFLICT (name) DO NOTHING;
+
+-- Existing databases: backfill the daily counters once (archived days are
+-- added by reconcile_daily_counts(since=...) from the archive manifest)
+-- INSERT INTO sensor_data_daily_counts (gateway_id, day, readings)
+-- SELECT gateway_id, timestamp::date, count(*) FROM sensor_data GROUP BY 1, 2
+-- ON CONFLICT (gateway_id, day) DO UPDATE SET readings = EXCLUDED.readings;
+
+-- Existing databases: fill the latest-value store once
+-- INSERT INTO sensor_latest (sensor_id, measurement_type, gateway_id, value, unit, timestamp)
+-- SELECT DISTINCT ON (sensor_id, coalesce(metadata->>'measurement_type', 'Unknown'))
+--        sensor_id, coalesce(metadata->>'measurement_type', 'Unknown'), gateway_id, value, unit, timestamp
+-- FROM sensor_data
+-- ORDER BY sensor_id, coalesce(metadata->>'measurement_type', 'Unknown'), timestamp DESC, id DESC
+-- ON CONFLICT (sensor_id, measurement_type) DO NOTHING;
+
+
+-- ===========================================
+-- NOTIFICATIONS
+-- ===========================================
+-- Gateway status transitions for live API clients (channel gateway_status)
+CREATE FUNCTION notify_gateway_status() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('gateway_status', json_build_object(
+        'gateway_id', NEW.id,
+        'user_id', NEW.user_id,
+        'status', NEW.status,
+        'previous', OLD.status,
+        'timestamp', now() AT TIME ZONE 'UTC'
+    )::text);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER gateways_status_notify
+AFTER UPDATE OF status ON gateways
+FOR EACH ROW WHEN (OLD.status IS DISTINCT FROM NEW.status)
+EXECUTE FUNCTION notify_gateway_status();
+
+-- Existing databases: job arguments and result files (sensor data exports)
+-- ALTER TABLE background_jobs ADD COLUMN params JSONB, ADD COLUMN file_path TEXT;
+
+-- Existing databases: gateway tokens for HTTP/WebSocket ingestion
+-- ALTER TABLE gateways ADD COLUMN ingest_token_hash VARCHAR(64);
 
+-- Existing databases: sync order columns (existing rows get 0 without a table
+-- rewrite, so they sort by ID before any new row)
+-- ALTER TABLE sensor_data ADD COLUMN xact_id BIGINT NOT NULL DEFAULT 0;
+-- ALTER TABLE sensor_data ALTER COLUMN xact_id SET DEFAULT pg_current_xact_id()::text::bigint;
+-- ALTER TABLE gateway_status_history ADD COLUMN xact_id BIGINT NOT NULL DEFAULT 0;
+-- ALTER TABLE gateway_status_history ALTER COLUMN xact_id SET DEFAULT pg_current_xact_id()::text::bigint;
+-- DROP INDEX idx_sensor_data_sensor_id_id;
+-- CREATE INDEX CONCURRENTLY idx_sensor_data_sensor_id_xact_id_id ON sensor_data(sensor_id, xact_id, id);
+-- CREATE INDEX CONCURRENTLY idx_gateway_status_history_gateway_id_xact_id_id ON gateway_status_history(gateway_id, xact_id, id);
 
 -- Insert sample admin user (password: admin123 for admin)
 INSERT INTO users (username, email, password_hash, role) VALUES 
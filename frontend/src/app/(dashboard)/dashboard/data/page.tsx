@@ -18,6 +18,7 @@ import { useGateways } from '@/hooks/use-gateways';
 import {
   useSensorsByGateway,
   useSensorData,
+  useSensorSeries,
 } from '@/features/data/hooks/use-sensors';
 import { useFarmers } from '@/features/farmers/hooks/use-farmers';
 import { useFarms } from '@/features/farmers/hooks/use-farms';
@@ -121,20 +122,15 @@ export default function DataPage() {
     farm_id: farmId,
   });
 
-  // Fetch sensor data for chart (non-paginated, using same filters as table but larger size)
+  // Fetch aggregated series for charts (bucketed server-side)
   const {
-    data: chartDataResponse,
+    data: chartSeriesResponse,
     isLoading: isLoadingChartData,
     refetch: refetchChart,
-  } = useSensorData(sensorId, {
-    page: 1,
-    size: 1000, // Get more data for chart visualization
+  } = useSensorSeries(sensorId, {
     hours: calculatedHours,
-    start_date: startDate,
-    end_date: endDate,
-    search: tableSearch || undefined,
-    farmer_id: farmerId,
-    farm_id: farmId,
+    start: startDate,
+    end: endDate,
   });
 
   // Process sensor data for table display
@@ -142,20 +138,15 @@ export default function DataPage() {
     return sensorDataResponse?.items || [];
   }, [sensorDataResponse]);
 
-  // Process sensor data for chart display
-  const chartSensorReadings: SensorDataResponse[] = useMemo(() => {
-    return chartDataResponse?.items || [];
-  }, [chartDataResponse]);
+  // Process series for chart display
+  const chartSeries = useMemo(() => {
+    return chartSeriesResponse?.series || [];
+  }, [chartSeriesResponse]);
 
-  // Get all available measurement types from chart readings
+  // Get all available measurement types from the series
   const availableMeasurementTypes = useMemo(() => {
-    const types = new Set<string>();
-    chartSensorReadings.forEach((reading) => {
-      const measurementType = reading.metadata?.measurement_type || 'Unknown';
-      types.add(measurementType);
-    });
-    return Array.from(types).sort();
-  }, [chartSensorReadings]);
+    return chartSeries.map((series) => series.measurement).sort();
+  }, [chartSeries]);
 
   // Auto-select all measurement types on first load
   useMemo(() => {
@@ -167,96 +158,58 @@ export default function DataPage() {
     }
   }, [availableMeasurementTypes, selectedMeasurementTypes.length]);
 
-  // No need for client-side filtering anymore - all filtering is done by API
-
   // Prepare separate chart data for each measurement type (to avoid scale issues)
   const chartDataByType = useMemo(() => {
-    if (!chartSensorReadings.length) return {};
+    if (!chartSeriesResponse?.bucket_seconds || !chartSeries.length) return {};
 
     const dataByType: Record<
       string,
       Array<{ time: string; value: number | null; unit?: string }>
     > = {};
-
-    // Filter by selected measurement types only (time filtering is done by API)
-    const filteredReadings = chartSensorReadings.filter((reading) => {
-      const measurementType = reading.metadata?.measurement_type || 'Unknown';
-      return selectedMeasurementTypes.includes(measurementType);
-    });
-
-    // First pass: collect all data points
-    const rawDataByType: Record<
-      string,
-      Map<number, { value: number; unit?: string }>
-    > = {};
-    let minTimestamp = Infinity;
-    let maxTimestamp = -Infinity;
-
-    filteredReadings.forEach((reading) => {
-      const date = new Date(reading.timestamp);
-
-      // Round down to nearest 10-second interval
-      const seconds = date.getSeconds();
-      const roundedSeconds = Math.floor(seconds / 10) * 10;
-      date.setSeconds(roundedSeconds, 0);
-
-      const timestamp = date.getTime();
-      minTimestamp = Math.min(minTimestamp, timestamp);
-      maxTimestamp = Math.max(maxTimestamp, timestamp);
-
-      const measurementType = reading.metadata?.measurement_type || 'Unknown';
-
-      if (!rawDataByType[measurementType]) {
-        rawDataByType[measurementType] = new Map();
-      }
-
-      // Store by timestamp for easy lookup
-      rawDataByType[measurementType].set(timestamp, {
-        value: reading.value,
-        unit: reading.unit || undefined,
-      });
-    });
-
-    // Second pass: fill gaps with null for each measurement type
-    Object.keys(rawDataByType).forEach((type) => {
-      const typeData: Array<{
-        time: string;
-        value: number | null;
-        unit?: string;
-      }> = [];
-      const dataMap = rawDataByType[type];
-
-      // Generate complete timeline with 10-second intervals
-      for (let ts = minTimestamp; ts <= maxTimestamp; ts += 10000) {
-        const date = new Date(ts);
-        const time = date.toLocaleTimeString('en-US', {
-          hour: '2-digit',
-          minute: '2-digit',
-          second: '2-digit',
+    const step = chartSeriesResponse.bucket_seconds * 1000;
+
+    chartSeries
+      .filter((series) => selectedMeasurementTypes.includes(series.measurement))
+      .forEach((series) => {
+        if (!series.timestamps.length) return;
+
+        // Index bucket averages by time (timestamps are UTC without offset)
+        const avg = series.avg ?? [];
+        const values = new Map<number, number>();
+        series.timestamps.forEach((ts, i) => {
+          values.set(new Date(`${ts}Z`).getTime(), avg[i]);
         });
 
-        const dataPoint = dataMap.get(ts);
-        if (dataPoint) {
-          typeData.push({
-            time,
-            value: dataPoint.value,
-            unit: dataPoint.unit,
+        const first = new Date(`${series.timestamps[0]}Z`).getTime();
+        const last = new Date(
+          `${series.timestamps[series.timestamps.length - 1]}Z`,
+        ).getTime();
+
+        // Walk the bucket grid, filling empty buckets with null
+        const typeData: Array<{
+          time: string;
+          value: number | null;
+          unit?: string;
+        }> = [];
+        for (let ts = first; ts <= last; ts += step) {
+          const time = new Date(ts).toLocaleTimeString('en-US', {
+            hour: '2-digit',
+            minute: '2-digit',
+            second: '2-digit',
           });
-        } else {
-          // Fill gap with null
+          const value = values.get(ts);
           typeData.push({
             time,
-            value: null,
-            unit: undefined,
+            value: value ?? null,
+            unit: series.unit || undefined,
           });
         }
-      }
 
-      dataByType[type] = typeData;
-    });
+        dataByType[series.measurement] = typeData;
+      });
 
     return dataByType;
-  }, [chartSensorReadings, selectedMeasurementTypes]);
+  }, [chartSeriesResponse, chartSeries, selectedMeasurementTypes]);
 
   const handleReset = () => {
     setSelectedGateway('all');
@@ -632,7 +585,7 @@ export default function DataPage() {
       {!isLoading &&
         !isChartLoading &&
         sensorReadings.length === 0 &&
-        chartSensorReadings.length === 0 && (
+        chartSeries.length === 0 && (
           <Card>
             <CardContent className="py-8">
               <p className="text-center text-muted-foreground">
@@ -729,7 +682,7 @@ export default function DataPage() {
             <Card>
               <CardContent className="py-8">
                 <p className="text-center text-muted-foreground">
-                  {chartSensorReadings.length > 0
+                  {chartSeries.length > 0
                     ? 'No data available for selected measurement types with current filters.'
                     : 'No sensor data available with current filters. Try adjusting your date range, filters, or check if the sensor is sending data.'}
                 </p>
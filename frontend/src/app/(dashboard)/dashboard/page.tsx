@@ -10,8 +10,12 @@ import {
 } from '@/features/dashboard';
 import { useDashboard } from '@/features/dashboard/hooks/use-dashboard';
 import { useRecentStatusChanges } from '@/hooks/use-gateway-status-history';
+import { useLiveEvents } from '@/hooks/use-live-events';
 
 export default function DashboardPage() {
+  // Refresh status changes and stats as gateway events arrive
+  useLiveEvents();
+
   // Fetch dashboard data from new aggregated endpoint
   const { data: dashboardData, isLoading: isLoadingDashboard } = useDashboard();
 
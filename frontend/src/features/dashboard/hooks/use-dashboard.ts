@@ -32,6 +32,35 @@ export interface DashboardResponse {
   generated_at: string;
 }
 
+export interface LatestReading {
+  measurement: string;
+  value: number;
+  unit?: string | null;
+  timestamp: string;
+}
+
+export interface SensorConditions {
+  id: number;
+  sensor_uid: string;
+  name?: string | null;
+  status: string;
+  readings: LatestReading[];
+}
+
+export interface GatewayConditions {
+  id: number;
+  gateway_uid: string;
+  name?: string | null;
+  status: string;
+  last_seen?: string | null;
+  sensors: SensorConditions[];
+}
+
+export interface FleetConditionsResponse {
+  gateways: GatewayConditions[];
+  generated_at: string;
+}
+
 // ==================== HOOKS ====================
 
 export function useDashboard() {
@@ -45,3 +74,23 @@ export function useDashboard() {
     refetchInterval: 60000, // Auto-refetch every minute
   });
 }
+
+export function useCurrentConditions(filters?: {
+  gatewayId?: number;
+  farmId?: number;
+}) {
+  return useQuery<FleetConditionsResponse>({
+    queryKey: ["fleet", "conditions", filters],
+    queryFn: async () => {
+      const params = new URLSearchParams();
+      if (filters?.gatewayId) params.append("gateway_id", String(filters.gatewayId));
+      if (filters?.farmId) params.append("farm_id", String(filters.farmId));
+      const response = await apiClient.get<FleetConditionsResponse>(
+        `/fleet/conditions?${params}`,
+      );
+      return response.data;
+    },
+    staleTime: 15000,
+    refetchInterval: 30000,
+  });
+}
@@ -8,6 +8,9 @@ import type {
   PaginatedResponse,
   SensorDataResponse,
   SensorDataCreate,
+  SensorSeriesResponse,
+  SeriesMode,
+  SensorSeriesBatchResponse,
 } from "@/types/api";
 
 // Query Keys
@@ -24,6 +27,10 @@ export const sensorKeys = {
     [...sensorKeys.all, "data", sensorId, filters] as const,
   stats: (sensorId: number, hours?: number) =>
     [...sensorKeys.all, "stats", sensorId, hours] as const,
+  series: (sensorId: number, filters?: Record<string, unknown>) =>
+    [...sensorKeys.all, "series", sensorId, filters] as const,
+  seriesBatch: (sensorIds: number[], filters?: Record<string, unknown>) =>
+    [...sensorKeys.all, "series-batch", sensorIds, filters] as const,
 };
 
 // ==================== GET ALL SENSORS ====================
@@ -185,6 +192,83 @@ export function useSensorData(
   });
 }
 
+// ==================== GET SENSOR SERIES ====================
+export function useSensorSeries(
+  sensorId: number,
+  filters?: {
+    measurement?: string[];
+    mode?: SeriesMode;
+    bucket?: string;
+    points?: number;
+    hours?: number;
+    start?: string;
+    end?: string;
+  },
+) {
+  return useQuery({
+    queryKey: sensorKeys.series(sensorId, filters),
+    queryFn: async () => {
+      const params = new URLSearchParams();
+      filters?.measurement?.forEach((m) => params.append("measurement", m));
+      if (filters?.mode) params.append("mode", filters.mode);
+      if (filters?.bucket) params.append("bucket", filters.bucket);
+      if (filters?.points) params.append("points", String(filters.points));
+      if (filters?.start) {
+        params.append("start", filters.start);
+      } else if (filters?.hours) {
+        params.append(
+          "start",
+          new Date(Date.now() - filters.hours * 3600 * 1000).toISOString(),
+        );
+      }
+      if (filters?.end) params.append("end", filters.end);
+
+      const response = await apiClient.get<SensorSeriesResponse>(
+        `/sensors/${sensorId}/series?${params}`,
+      );
+      return response.data;
+    },
+    enabled: !!sensorId,
+  });
+}
+
+// ==================== GET MULTI-SENSOR SERIES ====================
+export function useSensorsSeries(
+  sensorIds: number[],
+  filters?: {
+    measurement?: string[];
+    bucket?: string;
+    hours?: number;
+    start?: string;
+    end?: string;
+  },
+) {
+  return useQuery({
+    queryKey: sensorKeys.seriesBatch(sensorIds, filters),
+    queryFn: async () => {
+      const params = new URLSearchParams();
+      sensorIds.forEach((id) => params.append("sensor_id", String(id)));
+      filters?.measurement?.forEach((m) => params.append("measurement", m));
+      if (filters?.bucket) params.append("bucket", filters.bucket);
+      if (filters?.start) {
+        params.append("start", filters.start);
+      } else if (filters?.hours) {
+        params.append(
+          "start",
+          new Date(Date.now() - filters.hours * 3600 * 1000).toISOString(),
+        );
+      }
+      if (filters?.end) params.append("end", filters.end);
+
+      const response = await apiClient.get<SensorSeriesBatchResponse>(
+        `/sensors/series?${params}`,
+      );
+      return response.data;
+    },
+    enabled: sensorIds.length > 0,
+  });
+}
+
 // ==================== GET SENSOR STATS ====================
 export function useSensorStats(sensorId: number, hours: number = 24) {
   return useQuery({
@@ -25,6 +25,7 @@ export function useRecentStatusChanges(limit: number = 10) {
       );
       return response.data;
     },
-    refetchInterval: 5000, // Refetch every 5 seconds for near real-time updates
+    // Live updates arrive through useLiveEvents; polling is only a fallback
+    refetchInterval: 60000,
   });
 }
@@ -0,0 +1,81 @@
+import { useEffect } from 'react';
+import { useQueryClient } from '@tanstack/react-query';
+import Cookies from 'js-cookie';
+
+const API_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:5000/api/v1';
+
+// Readings can arrive many times per second; refetch at most this often
+const READINGS_REFRESH_MS = 5000;
+
+export interface LiveReadingsEvent {
+  type: 'readings';
+  sensor_id: number;
+  gateway_id: number;
+  readings: {
+    measurement: string | null;
+    timestamp: string;
+    value: number;
+    unit: string | null;
+  }[];
+}
+
+export interface LiveGatewayStatusEvent {
+  type: 'gateway_status';
+  gateway_id: number;
+  user_id: number;
+  status: string;
+  previous: string | null;
+  timestamp: string;
+}
+
+/**
+ * Subscribe to live readings and gateway status changes (SSE) and refresh the
+ * affected queries when they arrive, instead of polling.
+ */
+export function useLiveEvents(filters?: { gatewayIds?: number[]; sensorIds?: number[] }) {
+  const queryClient = useQueryClient();
+  const gatewayIds = filters?.gatewayIds?.join(',') ?? '';
+  const sensorIds = filters?.sensorIds?.join(',') ?? '';
+
+  useEffect(() => {
+    const token = Cookies.get('token');
+    if (!token) return;
+
+    const params = new URLSearchParams({ token });
+    gatewayIds.split(',').filter(Boolean).forEach((id) => params.append('gateway_id', id));
+    sensorIds.split(',').filter(Boolean).forEach((id) => params.append('sensor_id', id));
+
+    const source = new EventSource(`${API_URL}/live/events?${params}`);
+    let readingsTimer: ReturnType<typeof setTimeout> | null = null;
+
+    const refreshStatus = () => {
+      queryClient.invalidateQueries({ queryKey: ['gateway-status-history'] });
+      queryClient.invalidateQueries({ queryKey: ['gateways'] });
+      queryClient.invalidateQueries({ queryKey: ['dashboard'] });
+    };
+    const refreshReadings = () => {
+      if (readingsTimer) return;
+      readingsTimer = setTimeout(() => {
+        readingsTimer = null;
+        queryClient.invalidateQueries({ queryKey: ['fleet', 'conditions'] });
+      }, READINGS_REFRESH_MS);
+    };
+
+    source.addEventListener('gateway_status', refreshStatus);
+    source.addEventListener('readings', refreshReadings);
+    // Events were missed (slow client or server reconnect): refetch everything
+    source.addEventListener('dropped', () => {
+      refreshStatus();
+      refreshReadings();
+    });
+    source.addEventListener('reset', () => {
+      refreshStatus();
+      refreshReadings();
+    });
+
+    return () => {
+      if (readingsTimer) clearTimeout(readingsTimer);
+      source.close();
+    };
+  }, [queryClient, gatewayIds, sensorIds]);
+}
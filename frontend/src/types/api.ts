@@ -20,10 +20,13 @@ export interface ErrorResponse {
 
 export interface PaginatedResponse<T> {
   items: T[];
-  total: number;
+  total: number | null;
   page: number;
   size: number;
-  pages: number;
+  pages: number | null;
+  has_more?: boolean | null;
+  total_is_estimate?: boolean;
+  next_cursor?: string | null;
 }
 
 // ==================== USER TYPES ====================
@@ -172,6 +175,53 @@ export interface SensorDataBulkCreate {
   readings: Record<string, unknown>[];
 }
 
+// ==================== SENSOR SERIES TYPES ====================
+
+export interface MeasurementSeries {
+  measurement: string;
+  unit?: string | null;
+  timestamps: string[];
+  avg?: number[] | null;
+  min?: number[] | null;
+  max?: number[] | null;
+  count?: number[] | null;
+  values?: number[] | null;
+  raw_count?: number | null;
+}
+
+export type SeriesMode = 'avg' | 'lttb' | 'minmax';
+
+export interface SensorSeriesResponse {
+  sensor_id: number;
+  start: string;
+  end: string;
+  mode: SeriesMode;
+  bucket?: string | null;
+  bucket_seconds?: number | null;
+  points?: number | null;
+  series: MeasurementSeries[];
+}
+
+export interface AlignedSeries {
+  sensor_id: number;
+  measurement: string;
+  unit?: string | null;
+  avg: (number | null)[];
+  min: (number | null)[];
+  max: (number | null)[];
+  count: number[];
+}
+
+export interface SensorSeriesBatchResponse {
+  sensor_ids: number[];
+  start: string;
+  end: string;
+  bucket: string;
+  bucket_seconds: number;
+  timestamps: string[];
+  series: AlignedSeries[];
+}
+
 // ==================== FARMER TYPES ====================
 
 export interface FarmerBase {
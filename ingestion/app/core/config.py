@@ -21,6 +21,18 @@ class Settings(BaseSettings):
     # Topics
     MQTT_TOPIC_PATTERN: str = Field(default="kampoengtani/+/+/data")
 
+    # HTTP/WebSocket front-end (for sites that cannot reach the MQTT broker)
+    HTTP_ENABLED: bool = Field(default=False)
+    HTTP_HOST: str = Field(default="0.0.0.0")
+    HTTP_PORT: int = Field(default=8100)
+    HTTP_MAX_PAYLOAD_BYTES: int = Field(default=262144)
+
+    # Gateway tokens are cached per gateway_uid; a rejected token is checked
+    # against the database again at most every GATEWAY_TOKEN_RECHECK_SECONDS
+    GATEWAY_TOKEN_CACHE_TTL_SECONDS: int = Field(default=300)
+    GATEWAY_TOKEN_RECHECK_SECONDS: int = Field(default=10)
+    GATEWAY_TOKEN_CACHE_MAX_ENTRIES: int = Field(default=10000)
+
     # Monitoring
     OFFLINE_THRESHOLD_MINUTES: int = Field(default=5)
 
@@ -0,0 +1,147 @@
+import json
+import threading
+from typing import Any, Dict, Optional
+
+import uvicorn
+from fastapi import FastAPI, Header, HTTPException, Request, WebSocket, WebSocketDisconnect, status
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.handlers.message_handler import MessageHandler
+from app.services.data_service import SensorGatewayMismatchError
+from app.services.gateway_token_service import gateway_tokens
+from app.utils.logger import logger
+
+# HTTP/WebSocket front-end for sites that cannot reach the MQTT broker.
+# Payloads are the same {"d": [...], "ts": ...} documents as on MQTT and go
+# through the same MessageHandler -> IngestionService pipeline.
+app = FastAPI(
+    title=f"{settings.PROJECT_NAME} HTTP",
+    version=settings.VERSION,
+    docs_url=None,
+    redoc_url=None,
+)
+
+# Set by start_http_server (shared with the MQTT client)
+message_handler: Optional[MessageHandler] = None
+
+
+def _bearer_token(authorization: Optional[str]) -> Optional[str]:
+    scheme, _, token = (authorization or "").partition(" ")
+    return token.strip() if scheme.lower() == "bearer" else None
+
+
+def _decode_payload(raw) -> Dict[str, Any]:
+    """Decode a payload document; raises ValueError if it is not a JSON object"""
+    data = json.loads(raw)
+    if not isinstance(data, dict):
+        raise ValueError("payload must be a JSON object")
+    return data
+
+
+@app.get("/health")
+def health():
+    return {"status": "ok"}
+
+
+@app.post("/ingest/{gateway_uid}/{sensor_uid}")
+async def ingest_http(
+    gateway_uid: str,
+    sensor_uid: str,
+    request: Request,
+    authorization: Optional[str] = Header(None),
+):
+    """Save one sensor payload; authenticated with `Authorization: Bearer <gateway token>`
+
+    403 if the sensor is bound to another gateway.
+    """
+    if not await run_in_threadpool(gateway_tokens.verify, gateway_uid, _bearer_token(authorization)):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid gateway token")
+
+    body = b""
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > settings.HTTP_MAX_PAYLOAD_BYTES:
+            raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="Payload too large")
+
+    try:
+        data = _decode_payload(body)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid payload: {e}")
+
+    try:
+        saved = await run_in_threadpool(message_handler.handle_payload, gateway_uid, sensor_uid, data, "http")
+    except SensorGatewayMismatchError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    return {"saved": saved}
+
+
+@app.websocket("/ingest/{gateway_uid}/ws")
+async def ingest_websocket(websocket: WebSocket, gateway_uid: str):
+    """Persistent connection of one gateway.
+
+    Authenticate with `Authorization: Bearer <gateway token>` or `?token=`.
+    Each message is a payload plus "sensor_uid" (and an optional "id",
+    echoed back); every message is answered with {"id", "saved"} or {"id", "error"}.
+    Sensors bound to another gateway are answered with an error.
+    """
+    token = _bearer_token(websocket.headers.get("authorization")) or websocket.query_params.get("token")
+    if not await run_in_threadpool(gateway_tokens.verify, gateway_uid, token):
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    logger.info(f"✓ WebSocket connected: {gateway_uid}")
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            raw = message.get("text") or message.get("bytes") or b""
+
+            try:
+                data = _decode_payload(raw)
+                sensor_uid = data.pop("sensor_uid", None)
+                if not isinstance(sensor_uid, str) or not sensor_uid:
+                    raise ValueError("sensor_uid is required")
+            except ValueError as e:
+                await websocket.send_json({"id": None, "error": f"Invalid payload: {e}"})
+                continue
+            message_id = data.pop("id", None)
+
+            # Tokens may be rotated while a connection is open (cached check)
+            if not await run_in_threadpool(gateway_tokens.verify, gateway_uid, token):
+                await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+                break
+
+            try:
+                saved = await run_in_threadpool(
+                    message_handler.handle_payload, gateway_uid, sensor_uid, data, "websocket"
+                )
+            except SensorGatewayMismatchError as e:
+                await websocket.send_json({"id": message_id, "error": str(e)})
+                continue
+            await websocket.send_json({"id": message_id, "saved": saved})
+    except WebSocketDisconnect:
+        pass
+    logger.info(f"WebSocket disconnected: {gateway_uid}")
+
+
+def start_http_server(handler: MessageHandler) -> threading.Thread:
+    """Serve the HTTP/WebSocket front-end on a background thread"""
+    global message_handler
+    message_handler = handler
+
+    server = uvicorn.Server(
+        uvicorn.Config(
+            app,
+            host=settings.HTTP_HOST,
+            port=settings.HTTP_PORT,
+            log_level=settings.LOG_LEVEL.lower(),
+            ws_max_size=settings.HTTP_MAX_PAYLOAD_BYTES,
+        )
+    )
+    thread = threading.Thread(target=server.run, name="http-ingestion", daemon=True)
+    thread.start()
+    logger.info(f"HTTP ingestion listening on {settings.HTTP_HOST}:{settings.HTTP_PORT}")
+    return thread
@@ -24,3 +24,13 @@ class MessageHandler:
             logger.error(f"✗ Error handling message from topic {topic}: {e}")
             import traceback
             logger.error(traceback.format_exc())
+
+    def handle_payload(self, gateway_uid: str, sensor_uid: str, data: dict, source: str) -> int:
+        """Save a decoded payload received over HTTP or WebSocket; returns saved readings"""
+        with get_db() as db:
+            saved_count = self.ingestion.ingest_payload(db, gateway_uid, sensor_uid, data, source)
+        if saved_count:
+            logger.info(f"✓ Processed {source} payload of {gateway_uid}/{sensor_uid}, saved {saved_count} reading(s)")
+        else:
+            logger.warning(f"⚠ No data saved from {source} payload of {gateway_uid}/{sensor_uid}")
+        return saved_count
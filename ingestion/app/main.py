@@ -2,6 +2,7 @@ import signal
 import sys
 from app.core.config import settings
 from app.core.database import test_connection
+from app.core.http_server import start_http_server
 from app.core.mqtt_client import MQTTClient
 from app.handlers.message_handler import MessageHandler
 from app.utils.logger import logger
@@ -41,16 +42,22 @@ def main():
     logger.info("Initializing message handler...")
     message_handler = MessageHandler()
 
-    # 4. Initialize MQTT client
+    # 4. Start HTTP/WebSocket front-end (same handler as MQTT)
+    http_thread = None
+    if settings.HTTP_ENABLED:
+        logger.info("Starting HTTP ingestion front-end...")
+        http_thread = start_http_server(message_handler)
+
+    # 5. Initialize MQTT client
     logger.info("Initializing MQTT client...")
     mqtt_client = MQTTClient()
     mqtt_client.set_message_handler(message_handler.handle_message)
 
-    # 5. Register signal handler (Ctrl+C)
+    # 6. Register signal handler (Ctrl+C)
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
-    # 6. Connect dan start
+    # 7. Connect dan start
     logger.info("Starting MQTT client...")
     if mqtt_client.connect():
         logger.info("=" * 60)
@@ -59,6 +66,9 @@ def main():
         logger.info("   Press Ctrl+C to stop")
         logger.info("=" * 60)
         mqtt_client.start_loop()
+    elif http_thread is not None:
+        logger.error("Failed to start MQTT client — serving HTTP ingestion only")
+        http_thread.join()
     else:
         logger.error("Failed to start MQTT client")
         sys.exit(1)
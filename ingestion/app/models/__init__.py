@@ -6,6 +6,9 @@ from .farmer import Farmer
 from .assignment import GatewayAssignment
 from .user import User
 from .gateway_status_history import GatewayStatusHistory
+from .measurement_type import MeasurementType
+from .sensor_data_daily_count import SensorDataDailyCount
+from .sensor_latest import SensorLatest
 
 __all__ = [
     "Gateway",
@@ -16,4 +19,7 @@ __all__ = [
     "GatewayAssignment",
     "User",
     "GatewayStatusHistory",
+    "MeasurementType",
+    "SensorDataDailyCount",
+    "SensorLatest",
 ]
@@ -15,6 +15,8 @@ class Gateway(Base):
     description = Column(Text)
     status = Column(String(20), default="offline")
     last_seen = Column(DateTime(timezone=True))
+    # SHA-256 of the token for the HTTP/WebSocket front-end (issued via the API)
+    ingest_token_hash = Column(String(64))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, BigInteger, String, DateTime
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class MeasurementType(Base):
+    __tablename__ = "measurement_types"
+
+    id = Column(BigInteger, primary_key=True)
+    name = Column(String(100), nullable=False, unique=True)
+    created_at = Column(DateTime, server_default=func.now())
+
+    def __repr__(self):
+        return f"<MeasurementType {self.name}>"
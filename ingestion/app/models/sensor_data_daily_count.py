@@ -0,0 +1,15 @@
+from sqlalchemy import Column, BigInteger, Date, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class SensorDataDailyCount(Base):
+    __tablename__ = "sensor_data_daily_counts"
+
+    gateway_id = Column(BigInteger, ForeignKey("gateways.id", ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    readings = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime, server_default=func.now())
+
+    def __repr__(self):
+        return f"<SensorDataDailyCount gateway={self.gateway_id} day={self.day} readings={self.readings}>"
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, BigInteger, String, Float, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class SensorLatest(Base):
+    __tablename__ = "sensor_latest"
+
+    sensor_id = Column(BigInteger, ForeignKey("sensors.id", ondelete="CASCADE"), primary_key=True)
+    measurement_type = Column(String(100), primary_key=True)
+    gateway_id = Column(BigInteger, ForeignKey("gateways.id", ondelete="CASCADE"), nullable=False)
+    value = Column(Float, nullable=False)
+    unit = Column(String(20))
+    timestamp = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, server_default=func.now())
+
+    def __repr__(self):
+        return f"<SensorLatest sensor={self.sensor_id} {self.measurement_type}={self.value}>"
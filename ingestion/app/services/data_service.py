@@ -1,19 +1,44 @@
+from sqlalchemy import text
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+import json
+from collections import Counter
+from typing import List, Dict, Any, Optional, Set
+from datetime import datetime, timezone
 from app.models.gateway import Gateway
 from app.models.sensor import Sensor
 from app.models.sensor_data import SensorData
 from app.models.farm import Farm
 from app.models.farmer import Farmer
 from app.models.gateway_status_history import GatewayStatusHistory
+from app.models.measurement_type import MeasurementType
+from app.models.sensor_data_daily_count import SensorDataDailyCount
+from app.models.sensor_latest import SensorLatest
 from app.services.assignment_service import get_active_assignment
 from app.utils.logger import logger
 
 
+# Channel the API listens on for new readings (in-memory hot window)
+READINGS_CHANNEL = "sensor_readings"
+# Stay well below the 8000 byte NOTIFY payload limit
+MAX_NOTIFY_BYTES = 7500
+
+
+class SensorGatewayMismatchError(Exception):
+    """A sensor UID was sent through a gateway the sensor is not bound to"""
+
+    def __init__(self, sensor_uid: str, gateway_uid: str):
+        super().__init__(f"Sensor {sensor_uid} does not belong to gateway {gateway_uid}")
+        self.sensor_uid = sensor_uid
+        self.gateway_uid = gateway_uid
+
+
 class DataService:
     """Database operation service"""
 
+    # Measurement types already present in the measurement_types dictionary
+    _known_measurement_types: Set[str] = set()
+
     def save_sensor_readings(
         self,
         db: Session,
@@ -21,11 +46,15 @@ class DataService:
         sensor_uid: str,
         readings: List[Dict[str, Any]],
         uptime_seconds: Optional[int] = None,
+        source: str = "mqtt",
     ) -> int:
         """
         Save data to database
 
+        source: Front-end the readings arrived through (mqtt, http or websocket)
+
         return: Data count that successfully saved into database
+        raises: SensorGatewayMismatchError if sensor_uid is bound to another gateway
         """
         try:
             # 1. Get gateway (must be pre-registered via API)
@@ -45,6 +74,13 @@ class DataService:
 
             # 3. Get or create sensor (sensor may be auto-registered on first message)
             sensor = self._get_or_create_sensor(db, gateway.id, sensor_uid, readings[0])
+            if sensor and sensor.gateway_id != gateway.id:
+                # The gateway (and its token) only vouches for its own sensors
+                logger.warning(
+                    f"Sensor {sensor_uid} is bound to gateway {sensor.gateway_id}, "
+                    f"not {gateway_uid} ({gateway.id}) — rejecting readings"
+                )
+                raise SensorGatewayMismatchError(sensor_uid, gateway_uid)
             if not sensor:
                 logger.error(f"Failed get/create sensor: {sensor_uid}")
                 return 0
@@ -76,13 +112,16 @@ class DataService:
 
             # 6. Save sensor data
             saved_count = 0
+            saved_days: Counter = Counter()
+            latest: Dict[str, Dict[str, Any]] = {}
+            events: List[list] = []
             for reading in readings:
                 try:
                     # merge metadata if parser already provided some
                     base_meta = reading.get("metadata", {}) or {}
                     base_meta.update(
                         {
-                            "source": "mqtt",
+                            "source": source,
                             "measurement_type": reading.get("sensor_type"),  # Store what type of measurement (temperature, moisture, etc.)
                             "raw_value": reading.get("raw_value"),
                             "tag": reading.get("tag"),
@@ -102,19 +141,138 @@ class DataService:
                     )
                     db.add(sensor_data)
                     saved_count += 1
+                    saved_days[self._utc_day(reading["timestamp"])] += 1
+                    self._track_latest(latest, sensor.id, gateway.id, reading)
+                    events.append([
+                        reading.get("sensor_type"),
+                        round(reading["timestamp"].timestamp(), 6),
+                        reading["value"],
+                        reading.get("unit"),
+                    ])
                 except Exception as e:
                     logger.error(f"Error saving reading: {e}")
                     continue
 
+            # 7. Register new measurement types for dictionary search
+            new_types = self._register_measurement_types(
+                db, {reading.get("sensor_type") for reading in readings}
+            )
+
+            # 8. Count the readings per day in the same transaction (dashboard stats)
+            self._increment_daily_counts(db, gateway.id, saved_days)
+
+            # 9. Keep the newest value per measurement type (current conditions)
+            self._upsert_latest(db, latest)
+
+            # 10. Announce the readings; NOTIFY is delivered when the transaction commits
+            self._notify_readings(db, sensor.id, gateway.id, events)
+
             db.commit()
+            self._known_measurement_types.update(new_types)
             logger.info(f"Saved {saved_count} readings")
             return saved_count
 
+        except SensorGatewayMismatchError:
+            db.rollback()
+            raise
         except Exception as e:
             logger.error(f"Error in save_sensor_readings: {e}")
             db.rollback()
             return 0
 
+    def _register_measurement_types(self, db: Session, names: Set[Optional[str]]) -> Set[str]:
+        """Insert measurement types not yet in the dictionary (committed by the caller)"""
+        new_types = {name for name in names if name} - self._known_measurement_types
+        if new_types:
+            db.execute(
+                pg_insert(MeasurementType)
+                .values([{"name": name} for name in sorted(new_types)])
+                .on_conflict_do_nothing(index_elements=["name"])
+            )
+        return new_types
+
+    def _increment_daily_counts(self, db: Session, gateway_id: int, per_day: Counter):
+        """Add the flushed readings to the per gateway/day counters (committed by the caller)"""
+        if not per_day:
+            return
+        statement = pg_insert(SensorDataDailyCount).values(
+            [
+                {"gateway_id": gateway_id, "day": day, "readings": count}
+                for day, count in sorted(per_day.items())
+            ]
+        )
+        db.execute(
+            statement.on_conflict_do_update(
+                index_elements=["gateway_id", "day"],
+                set_={
+                    "readings": SensorDataDailyCount.readings + statement.excluded.readings,
+                    "updated_at": datetime.utcnow(),
+                },
+            )
+        )
+
+    @staticmethod
+    def _track_latest(
+        latest: Dict[str, Dict[str, Any]], sensor_id: int, gateway_id: int, reading: Dict[str, Any]
+    ):
+        """Remember the newest reading of each measurement type in this batch"""
+        measurement = reading.get("sensor_type") or "Unknown"
+        current = latest.get(measurement)
+        if current is None or reading["timestamp"] >= current["timestamp"]:
+            latest[measurement] = {
+                "sensor_id": sensor_id,
+                "measurement_type": measurement,
+                "gateway_id": gateway_id,
+                "value": reading["value"],
+                "unit": reading.get("unit"),
+                "timestamp": reading["timestamp"],
+            }
+
+    def _upsert_latest(self, db: Session, latest: Dict[str, Dict[str, Any]]):
+        """Upsert the batch's newest readings; older readings never replace newer ones"""
+        if not latest:
+            return
+        statement = pg_insert(SensorLatest).values(
+            [latest[name] for name in sorted(latest)]
+        )
+        db.execute(
+            statement.on_conflict_do_update(
+                index_elements=["sensor_id", "measurement_type"],
+                set_={
+                    "gateway_id": statement.excluded.gateway_id,
+                    "value": statement.excluded.value,
+                    "unit": statement.excluded.unit,
+                    "timestamp": statement.excluded.timestamp,
+                    "updated_at": datetime.utcnow(),
+                },
+                where=SensorLatest.timestamp <= statement.excluded.timestamp,
+            )
+        )
+
+    def _notify_readings(self, db: Session, sensor_id: int, gateway_id: int, events: List[list]):
+        """Queue sensor_readings notifications, split below the payload limit"""
+        head = f'{{"sensor_id":{sensor_id},"gateway_id":{gateway_id},"readings":['
+        parts: List[str] = []
+        size = len(head) + 2
+        for event in events:
+            part = json.dumps(event, separators=(",", ":"))
+            if parts and size + len(part) + 1 > MAX_NOTIFY_BYTES:
+                db.execute(text("SELECT pg_notify(:channel, :payload)"),
+                           {"channel": READINGS_CHANNEL, "payload": head + ",".join(parts) + "]}"})
+                parts, size = [], len(head) + 2
+            parts.append(part)
+            size += len(part) + 1
+        if parts:
+            db.execute(text("SELECT pg_notify(:channel, :payload)"),
+                       {"channel": READINGS_CHANNEL, "payload": head + ",".join(parts) + "]}"})
+
+    @staticmethod
+    def _utc_day(timestamp: datetime):
+        """Calendar day of a reading as stored (naive timestamps are UTC)"""
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone(timezone.utc)
+        return timestamp.date()
+
     def _get_or_create_gateway(self, db: Session, gateway_uid: str) -> Gateway:
         """Get gateway, kalau tidak ada buat baru"""
         # Do NOT auto-create gateways here. Gateways must be registered via API.
@@ -127,11 +285,7 @@ class DataService:
         sensor = db.query(Sensor).filter(Sensor.sensor_uid == sensor_uid).first()
 
         if sensor:
-            # ensure sensor belongs to the gateway
-            if sensor.gateway_id != gateway_id:
-                logger.warning(
-                    f"Sensor {sensor_uid} exists but bound to gateway {sensor.gateway_id} != {gateway_id}"
-                )
+            # Callers must check sensor.gateway_id against their gateway
             return sensor
 
         # Auto-register sensor based on first message. This allows sensors to be
@@ -0,0 +1,79 @@
+import hashlib
+import hmac
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from app.core.config import settings
+from app.core.database import get_db
+from app.models.gateway import Gateway
+from app.utils.logger import logger
+
+
+def hash_token(token: str) -> str:
+    """SHA-256 hex digest stored in gateways.ingest_token_hash"""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class GatewayTokenCache:
+    """In-memory gateway_uid -> token hash map for HTTP/WebSocket authentication.
+
+    A request is usually checked without touching the database. Entries are
+    reloaded after GATEWAY_TOKEN_CACHE_TTL_SECONDS, so a rotated token takes
+    effect within that time; a token that does not match is re-checked
+    against the database (it may have just been issued), but at most every
+    GATEWAY_TOKEN_RECHECK_SECONDS per gateway so bad tokens cannot hammer it.
+    """
+
+    def __init__(self):
+        # gateway_uid -> (token hash or None, loaded at)
+        self._entries: "OrderedDict[str, Tuple[Optional[str], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def verify(self, gateway_uid: str, token: Optional[str]) -> bool:
+        """Check a presented token against the gateway's token"""
+        if not token:
+            return False
+        presented = hash_token(token)
+        now = time.monotonic()
+
+        entry = self._get(gateway_uid)
+        if entry is None or now - entry[1] >= settings.GATEWAY_TOKEN_CACHE_TTL_SECONDS:
+            entry = self._load(gateway_uid, now)
+        elif not self._matches(entry[0], presented) and now - entry[1] >= settings.GATEWAY_TOKEN_RECHECK_SECONDS:
+            entry = self._load(gateway_uid, now)
+        return self._matches(entry[0], presented)
+
+    @staticmethod
+    def _matches(expected: Optional[str], presented: str) -> bool:
+        return expected is not None and hmac.compare_digest(expected, presented)
+
+    def _get(self, gateway_uid: str) -> Optional[Tuple[Optional[str], float]]:
+        with self._lock:
+            return self._entries.get(gateway_uid)
+
+    def _load(self, gateway_uid: str, now: float) -> Tuple[Optional[str], float]:
+        """Read the token hash (None if the gateway or its token is missing) and cache it"""
+        try:
+            with get_db() as db:
+                token_hash = (
+                    db.query(Gateway.ingest_token_hash)
+                    .filter(Gateway.gateway_uid == gateway_uid)
+                    .scalar()
+                )
+        except Exception as e:
+            logger.error(f"Failed to load token of gateway {gateway_uid}: {e}")
+            return None, now
+
+        entry = (token_hash, now)
+        with self._lock:
+            self._entries[gateway_uid] = entry
+            self._entries.move_to_end(gateway_uid)
+            while len(self._entries) > settings.GATEWAY_TOKEN_CACHE_MAX_ENTRIES:
+                self._entries.popitem(last=False)
+        return entry
+
+
+# One cache per ingestion process
+gateway_tokens = GatewayTokenCache()
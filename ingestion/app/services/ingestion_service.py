@@ -4,7 +4,7 @@ from typing import Any
 from app.utils.logger import logger
 from app.parsers.sensor_data_parser import SensorDataParser
 from app.services.assignment_service import get_active_assignment
-from app.services.data_service import DataService
+from app.services.data_service import DataService, SensorGatewayMismatchError
 
 
 class IngestionService:
@@ -37,6 +37,33 @@ class IngestionService:
             sensor_uid = match.group(2)
             logger.info(f"Parsed topic - Gateway: {gateway_uid}, Sensor: {sensor_uid}")
 
+            return self.ingest_payload(db, gateway_uid, sensor_uid, data)
+
+        except json.JSONDecodeError as e:
+            logger.error(f"JSON decode error in ingestion: {e}")
+            return 0
+        except SensorGatewayMismatchError as e:
+            logger.warning(f"Rejected message on {topic}: {e}")
+            return 0
+        except Exception as e:
+            logger.error(f"Error in ingestion: {e}")
+            import traceback
+
+            logger.error(traceback.format_exc())
+            return 0
+
+    def ingest_payload(
+        self, db, gateway_uid: str, sensor_uid: str, data: dict, source: str = "mqtt"
+    ) -> int:
+        """Process a decoded `{"d": [...], "ts": ...}` payload of one sensor.
+
+        Shared by the MQTT and the HTTP/WebSocket front-ends; `source` is
+        stored in each reading's metadata.
+
+        Returns number of saved readings; raises SensorGatewayMismatchError
+        when sensor_uid is bound to another gateway.
+        """
+        try:
             # Validate assignment (ensure gateway currently assigned to a farm)
             assignment = get_active_assignment(db, gateway_uid)
             if not assignment:
@@ -65,13 +92,12 @@ class IngestionService:
 
             # Save via data service (pass uptime_seconds for status tracking)
             saved = self.data_service.save_sensor_readings(
-                db, gateway_uid, sensor_uid, parsed_readings, uptime_seconds
+                db, gateway_uid, sensor_uid, parsed_readings, uptime_seconds, source
             )
             return saved
 
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON decode error in ingestion: {e}")
-            return 0
+        except SensorGatewayMismatchError:
+            raise
         except Exception as e:
             logger.error(f"Error in ingestion: {e}")
             import traceback
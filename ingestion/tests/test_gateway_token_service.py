@@ -0,0 +1,136 @@
+from contextlib import contextmanager
+
+import pytest
+
+from app.core.config import settings
+from app.services import gateway_token_service
+from app.services.gateway_token_service import GatewayTokenCache, hash_token
+
+
+class FakeQuery:
+    def __init__(self, db):
+        self.db = db
+
+    def filter(self, *criteria):
+        return self
+
+    def scalar(self):
+        self.db.loads += 1
+        return self.db.hashes.get(self.db.gateway_uid)
+
+
+class FakeDB:
+    """Token hashes per gateway; counts how often they are read"""
+
+    def __init__(self):
+        self.hashes = {}
+        self.loads = 0
+        self.gateway_uid = None
+        self.failing = False
+
+    def query(self, column):
+        return FakeQuery(self)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def db(monkeypatch):
+    db = FakeDB()
+    cache_load = GatewayTokenCache._load
+
+    # The gateway filter is a SQL expression; record the uid being loaded instead
+    def load(self, gateway_uid, now):
+        db.gateway_uid = gateway_uid
+        return cache_load(self, gateway_uid, now)
+
+    @contextmanager
+    def get_db():
+        if db.failing:
+            raise RuntimeError("database unavailable")
+        yield db
+
+    monkeypatch.setattr(GatewayTokenCache, "_load", load)
+    monkeypatch.setattr(gateway_token_service, "get_db", get_db)
+    return db
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(gateway_token_service.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def cache(db, clock):
+    db.hashes["GW-A"] = hash_token("good")
+    return GatewayTokenCache()
+
+
+def test_valid_token_is_cached(cache, db):
+    assert cache.verify("GW-A", "good")
+    assert cache.verify("GW-A", "good")
+    assert db.loads == 1
+
+
+def test_missing_token_is_rejected_without_lookup(cache, db):
+    assert not cache.verify("GW-A", None)
+    assert not cache.verify("GW-A", "")
+    assert db.loads == 0
+
+
+def test_unknown_gateway_is_rejected(cache, db):
+    assert not cache.verify("GW-X", "good")
+    assert not cache.verify("GW-X", "good")
+    assert db.loads == 1
+
+
+def test_wrong_token_is_rechecked_at_most_every_interval(cache, db, clock):
+    assert cache.verify("GW-A", "good")
+    for _ in range(5):
+        assert not cache.verify("GW-A", "bad")
+    assert db.loads == 1
+
+    clock.now += settings.GATEWAY_TOKEN_RECHECK_SECONDS
+    assert not cache.verify("GW-A", "bad")
+    assert db.loads == 2
+
+
+def test_newly_issued_token_is_accepted_after_recheck(cache, db, clock):
+    assert cache.verify("GW-A", "good")
+    db.hashes["GW-A"] = hash_token("rotated")
+
+    clock.now += settings.GATEWAY_TOKEN_RECHECK_SECONDS
+    assert cache.verify("GW-A", "rotated")
+
+
+def test_rotated_token_expires_after_ttl(cache, db, clock):
+    assert cache.verify("GW-A", "good")
+    db.hashes["GW-A"] = hash_token("rotated")
+
+    clock.now += settings.GATEWAY_TOKEN_CACHE_TTL_SECONDS - 1
+    assert cache.verify("GW-A", "good")
+    clock.now += 1
+    assert not cache.verify("GW-A", "good")
+
+
+def test_database_error_rejects_without_caching(cache, db):
+    db.failing = True
+    assert not cache.verify("GW-A", "good")
+
+    db.failing = False
+    assert cache.verify("GW-A", "good")
+
+
+def test_cache_is_bounded(cache, db, monkeypatch):
+    monkeypatch.setattr(settings, "GATEWAY_TOKEN_CACHE_MAX_ENTRIES", 2)
+    for uid in ("GW-A", "GW-B", "GW-C"):
+        cache.verify(uid, "good")
+    assert list(cache._entries) == ["GW-B", "GW-C"]
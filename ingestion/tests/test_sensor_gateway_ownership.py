@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core import http_server
+from app.services.data_service import DataService, SensorGatewayMismatchError
+
+GATEWAY = SimpleNamespace(id=1, gateway_uid="GW-A", status="online")
+FOREIGN_SENSOR = SimpleNamespace(id=7, gateway_id=2, sensor_uid="SEM225-B")
+READINGS = [{"sensor_type": "Temperature", "value": 25.0}]
+
+
+class FakeSession:
+    def __init__(self):
+        self.rolled_back = False
+
+    def rollback(self):
+        self.rolled_back = True
+
+
+class FakeHandler:
+    def handle_payload(self, gateway_uid, sensor_uid, data, source):
+        raise SensorGatewayMismatchError(sensor_uid, gateway_uid)
+
+
+@pytest.fixture
+def service(monkeypatch):
+    service = DataService()
+    monkeypatch.setattr(service, "_get_gateway", lambda db, uid: GATEWAY)
+    monkeypatch.setattr(service, "_get_or_create_sensor", lambda db, gateway_id, uid, reading: FOREIGN_SENSOR)
+    return service
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(http_server.gateway_tokens, "verify", lambda gateway_uid, token: token == "good")
+    monkeypatch.setattr(http_server, "message_handler", FakeHandler())
+    return TestClient(http_server.app)
+
+
+def test_sensor_of_other_gateway_is_rejected(service):
+    db = FakeSession()
+    with pytest.raises(SensorGatewayMismatchError):
+        service.save_sensor_readings(db, "GW-A", "SEM225-B", READINGS, source="http")
+    assert db.rolled_back
+
+
+def test_http_ingest_returns_403(client):
+    response = client.post(
+        "/ingest/GW-A/SEM225-B",
+        json={"d": [{"tag": "SEM225:Temperature", "value": 250}]},
+        headers={"Authorization": "Bearer good"},
+    )
+    assert response.status_code == 403
+
+
+def test_websocket_ingest_answers_with_error(client):
+    with client.websocket_connect("/ingest/GW-A/ws?token=good") as websocket:
+        websocket.send_json({"id": 1, "sensor_uid": "SEM225-B", "d": []})
+        reply = websocket.receive_json()
+    assert reply["id"] == 1
+    assert "does not belong" in reply["error"]